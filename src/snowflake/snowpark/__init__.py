@@ -13,7 +13,9 @@ __all__ = [
     "Column",
     "CaseExpr",
     "Row",
+    "RowSet",
     "Session",
+    "SessionPool",
     "FileOperation",
     "PutResult",
     "GetResult",
@@ -36,6 +38,7 @@ __all__ = [
     "QueryRecord",
     "QueryHistory",
     "AsyncJob",
+    "AsyncJobGroup",
 ]
 
 
@@ -44,7 +47,7 @@ from snowflake.snowpark.version import VERSION
 __version__ = ".".join(str(x) for x in VERSION if x is not None)
 
 
-from snowflake.snowpark.async_job import AsyncJob
+from snowflake.snowpark.async_job import AsyncJob, AsyncJobGroup
 from snowflake.snowpark.column import CaseExpr, Column
 from snowflake.snowpark.dataframe import DataFrame
 from snowflake.snowpark.dataframe_analytics_functions import DataFrameAnalyticsFunctions
@@ -58,8 +61,9 @@ from snowflake.snowpark.relational_grouped_dataframe import (
     GroupingSets,
     RelationalGroupedDataFrame,
 )
-from snowflake.snowpark.row import Row
+from snowflake.snowpark.row import Row, RowSet
 from snowflake.snowpark.session import Session
+from snowflake.snowpark.session_pool import SessionPool
 from snowflake.snowpark.table import (
     DeleteResult,
     MergeResult,
@@ -4,7 +4,7 @@
 #
 import uuid
 from collections import Counter, defaultdict
-from typing import TYPE_CHECKING, DefaultDict, Dict, Optional, Union
+from typing import TYPE_CHECKING, DefaultDict, Dict, List, Optional, Tuple, Union
 
 import snowflake.snowpark
 from snowflake.snowpark._internal.analyzer.analyzer_utils import (
@@ -164,6 +164,27 @@ class Analyzer:
         self.generated_alias_maps = {}
         self.subquery_plans = []
         self.alias_maps_to_use: Optional[Dict[uuid.UUID, str]] = None
+        # Memo of the logical plans resolved during the current (outermost) call
+        # of resolve(), keyed by the id of the logical plan. A logical plan can be
+        # shared by several parents (e.g., self-join or self-union), so without
+        # this memo a shared subtree would be resolved once per path to it.
+        # Besides the resolved plan, we also keep the subquery plans and generated
+        # alias maps left by resolve(), so a reused node has the same side effects
+        # on the analyzer as a freshly resolved one.
+        self._resolved_plans: Optional[
+            Dict[
+                int,
+                Tuple[
+                    LogicalPlan,
+                    SnowflakePlan,
+                    List[SnowflakePlan],
+                    Dict[uuid.UUID, str],
+                ],
+            ]
+        ] = None
+        self.resolved_plan_count = 0
+        self.reused_plan_count = 0
+        self.inferred_attributes_count = 0
 
     def analyze(
         self,
@@ -706,17 +727,41 @@ class Analyzer:
             )
 
     def resolve(self, logical_plan: LogicalPlan) -> SnowflakePlan:
-        self.subquery_plans = []
-        self.generated_alias_maps = {}
+        is_outermost_resolve = self._resolved_plans is None
+        if is_outermost_resolve:
+            self._resolved_plans = {}
+        try:
+            memo = self._resolved_plans.get(id(logical_plan))
+            if memo is not None:
+                _, result, subquery_plans, generated_alias_maps = memo
+                self.subquery_plans = list(subquery_plans)
+                self.generated_alias_maps = dict(generated_alias_maps)
+                self.reused_plan_count += 1
+                return result
 
-        result = self.do_resolve(logical_plan)
+            self.subquery_plans = []
+            self.generated_alias_maps = {}
 
-        result.add_aliases(self.generated_alias_maps)
+            result = self.do_resolve(logical_plan)
 
-        if self.subquery_plans:
-            result = result.with_subqueries(self.subquery_plans)
+            result.add_aliases(self.generated_alias_maps)
 
-        return result
+            if self.subquery_plans:
+                result = result.with_subqueries(self.subquery_plans)
+
+            # keep a reference to the logical plan so its id can't be reused
+            # by another object before the memo is dropped
+            self._resolved_plans[id(logical_plan)] = (
+                logical_plan,
+                result,
+                list(self.subquery_plans),
+                dict(self.generated_alias_maps),
+            )
+            self.resolved_plan_count += 1
+            return result
+        finally:
+            if is_outermost_resolve:
+                self._resolved_plans = None
 
     def do_resolve(self, logical_plan: LogicalPlan) -> SnowflakePlan:
         resolved_children = {}
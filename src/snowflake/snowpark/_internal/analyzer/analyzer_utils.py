@@ -119,6 +119,7 @@ TYPE = " TYPE "
 EQUALS = " = "
 LOCATION = " LOCATION "
 FILE_FORMAT = " FILE_FORMAT "
+STAGE = " STAGE "
 FORMAT_NAME = " FORMAT_NAME "
 COPY = " COPY "
 REG_EXP = " REGEXP "
@@ -918,6 +919,27 @@ def drop_file_format_if_exists_statement(format_name: str) -> str:
     return DROP + FILE + FORMAT + IF + EXISTS + format_name
 
 
+def create_temp_stage_statement(
+    stage_name: str,
+    *,
+    use_scoped_temp_objects: bool = False,
+    is_generated: bool = False,
+) -> str:
+    return (
+        CREATE
+        + get_temp_type_for_object(use_scoped_temp_objects, is_generated)
+        + STAGE
+        + IF
+        + NOT
+        + EXISTS
+        + stage_name
+    )
+
+
+def drop_stage_if_exists_statement(stage_name: str) -> str:
+    return DROP + STAGE + IF + EXISTS + stage_name
+
+
 def select_from_path_with_format_statement(
     project: List[str], path: str, format_name: str, pattern: Optional[str]
 ) -> str:
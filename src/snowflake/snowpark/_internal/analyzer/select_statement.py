@@ -260,6 +260,27 @@ class Selectable(LogicalPlan, ABC):
             self._snowflake_plan.api_calls = self.api_calls
         return self._snowflake_plan
 
+    def infer_attributes(self) -> Optional[List[Attribute]]:
+        """Returns the output attributes of this query if they can be derived on the client side
+        from the known attributes of its subqueries, otherwise returns None."""
+        return None
+
+    def get_known_attributes(self) -> Optional[List[Attribute]]:
+        """Returns the output attributes of this query if they are known without a describe query,
+        i.e., they were already retrieved, they can be inferred from the attributes of the subqueries,
+        or the schema query was already described in this session. Otherwise returns None."""
+        if (
+            self._snowflake_plan is not None
+            and "attributes" in self._snowflake_plan.__dict__
+        ):
+            return self._snowflake_plan.attributes
+        attributes = self.infer_attributes()
+        if attributes is None:
+            attributes = self.analyzer.session._get_cached_result_attributes(
+                self.schema_query
+            )
+        return attributes
+
     @property
     def column_states(self) -> ColumnStateDict:
         """A dictionary that contains the column states of a query.
@@ -437,6 +458,9 @@ class SelectStatement(Selectable):
         self._schema_query = schema_query
         self._projection_in_str = None
         self._query_params = None
+        # A query with the same output attributes as this query, set when a filter, sort or limit
+        # is flattened into a copy of that query
+        self._same_attributes_as: Optional[Selectable] = None
         self.expr_to_alias.update(self.from_.expr_to_alias)
         self.df_aliased_col_name_to_real_col_name.update(
             self.from_.df_aliased_col_name_to_real_col_name
@@ -488,6 +512,55 @@ class SelectStatement(Selectable):
         self._column_states = copy(value)
         self._column_states.projection = [copy(attr) for attr in value.projection]
 
+    def infer_attributes(self) -> Optional[List[Attribute]]:
+        if self._same_attributes_as is not None:
+            return self._same_attributes_as.get_known_attributes()
+        from_attributes = self.from_.get_known_attributes()
+        if from_attributes is None:
+            return None
+        # a WHERE, ORDER BY or LIMIT clause doesn't change the output attributes
+        if not self.projection:
+            return from_attributes
+        from_attributes_by_name = {attr.name: attr for attr in from_attributes}
+        if len(from_attributes_by_name) != len(from_attributes):
+            return None
+        # Only projections of columns of the subquery, which may be renamed, are inferred,
+        # because the type of other expressions is decided by Snowflake
+        attributes = []
+        projection_sqls = []
+        for exp in self.projection:
+            if (
+                isinstance(exp, UnresolvedAlias)
+                and isinstance(exp.child, Star)
+                and not exp.child.expressions
+                and not exp.child.df_alias
+            ):
+                attributes.extend(from_attributes)
+                projection_sqls.append(analyzer_utils.STAR)
+                continue
+            child = exp.child if isinstance(exp, (Alias, UnresolvedAlias)) else exp
+            if isinstance(child, Attribute):
+                child_sql = snowflake.snowpark._internal.utils.quote_name(child.name)
+            elif isinstance(child, UnresolvedAttribute) and not child.df_alias:
+                child_sql = child.name
+            else:
+                return None
+            from_attr = from_attributes_by_name.get(child_sql)
+            if from_attr is None:
+                return None
+            if isinstance(exp, Alias):
+                name = snowflake.snowpark._internal.utils.quote_name(exp.name)
+                projection_sqls.append(analyzer_utils.alias_expression(child_sql, name))
+            else:
+                name = child_sql
+                projection_sqls.append(child_sql)
+            attributes.append(Attribute(name, from_attr.datatype, from_attr.nullable))
+        # the column names above must be the ones in the generated SQL, which may be different
+        # if the analyzer replaced a column with its alias in the subquery
+        if analyzer_utils.COMMA.join(projection_sqls) != self.projection_in_str:
+            return None
+        return attributes
+
     @property
     def has_clause_using_columns(self) -> bool:
         return any(
@@ -597,6 +670,7 @@ class SelectStatement(Selectable):
                 # They shouldn't share the same snowflake_plan.
                 # Setting it to None so the new._snowflake_plan will be created later.
             )
+            new._same_attributes_as = self
             new.expr_to_alias = copy(
                 self.expr_to_alias
             )  # use copy because we don't want two plans to share the same list. If one mutates, the other ones won't be impacted.
@@ -705,6 +779,7 @@ class SelectStatement(Selectable):
             new.post_actions = new.from_.post_actions
             new.column_states = self.column_states
             new.where = And(self.where, col) if self.where is not None else col
+            new._same_attributes_as = self
         else:
             new = SelectStatement(
                 from_=self.to_subqueryable(), where=col, analyzer=self.analyzer
@@ -727,6 +802,7 @@ class SelectStatement(Selectable):
             new.post_actions = new.from_.post_actions
             new.order_by = cols + (self.order_by or [])
             new.column_states = self.column_states
+            new._same_attributes_as = self
         else:
             new = SelectStatement(
                 from_=self.to_subqueryable(),
@@ -811,6 +887,7 @@ class SelectStatement(Selectable):
             new.limit_ = min(self.limit_, n) if self.limit_ else n
             new.offset = offset or self.offset
             new.column_states = self.column_states
+            new._same_attributes_as = self
             new.pre_actions = new.from_.pre_actions
             new.post_actions = new.from_.post_actions
         return new
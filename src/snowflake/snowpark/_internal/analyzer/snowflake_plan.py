@@ -18,6 +18,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
 )
 
@@ -35,6 +36,7 @@ if TYPE_CHECKING:
 
 import snowflake.connector
 import snowflake.snowpark
+from snowflake.connector.options import installed_pandas
 from snowflake.snowpark._internal.analyzer.analyzer_utils import (
     aggregate_statement,
     attribute_to_schema_string,
@@ -46,8 +48,10 @@ from snowflake.snowpark._internal.analyzer.analyzer_utils import (
     create_or_replace_view_statement,
     create_table_as_select_statement,
     create_table_statement,
+    create_temp_stage_statement,
     delete_statement,
     drop_file_format_if_exists_statement,
+    drop_stage_if_exists_statement,
     drop_table_if_exists_statement,
     file_operation_statement,
     filter_statement,
@@ -93,6 +97,8 @@ from snowflake.snowpark._internal.utils import (
     generate_random_alphanumeric,
     get_copy_into_table_options,
     is_sql_select_statement,
+    normalize_local_file,
+    normalize_remote_file_or_dir,
     random_name_for_temp_object,
 )
 from snowflake.snowpark.row import Row
@@ -276,7 +282,9 @@ class SnowflakePlan(LogicalPlan):
         new_post_actions = [*self.post_actions]
         api_calls = [*self.api_calls]
 
+        add_chain_dependencies(pre_queries)
         for plan in subquery_plans:
+            add_chain_dependencies(plan.queries[:-1])
             for query in plan.queries[:-1]:
                 if query not in pre_queries:
                     pre_queries.append(query)
@@ -299,9 +307,26 @@ class SnowflakePlan(LogicalPlan):
             df_aliased_col_name_to_real_col_name=self.df_aliased_col_name_to_real_col_name,
         )
 
+    def with_session(
+        self, session: "snowflake.snowpark.session.Session"
+    ) -> "SnowflakePlan":
+        """Returns a copy of this plan which runs its queries and post actions in ``session``."""
+        plan = copy.copy(self)
+        plan.session = session
+        return plan
+
     @cached_property
     def attributes(self) -> List[Attribute]:
-        output = analyze_attributes(self.schema_query, self.session)
+        output = None
+        if isinstance(
+            self.source_plan,
+            snowflake.snowpark._internal.analyzer.select_statement.Selectable,
+        ):
+            output = self.source_plan.infer_attributes()
+            if output is not None:
+                self.source_plan.analyzer.inferred_attributes_count += 1
+        if output is None:
+            output = analyze_attributes(self.schema_query, self.session)
         # No simplifier case relies on this schema_query change to update SHOW TABLES to a nested sql friendly query.
         if not self.schema_query or not self.session.sql_simplifier_enabled:
             self.schema_query = schema_value_statement(output)
@@ -437,6 +462,9 @@ class SnowflakePlanBuilder:
     ) -> SnowflakePlan:
         select_left = self.add_result_scan_if_not_select(left)
         select_right = self.add_result_scan_if_not_select(right)
+        # the queries of the two children don't depend on each other
+        add_chain_dependencies(select_left.queries[:-1])
+        add_chain_dependencies(select_right.queries[:-1])
         queries = (
             select_left.queries[:-1]
             + select_right.queries[:-1]
@@ -517,21 +545,72 @@ class SnowflakePlanBuilder:
             use_scoped_temp_objects=self.session._use_scoped_temp_objects,
             is_generated=True,
         )
-        insert_stmt = batch_insert_into_statement(
-            temp_table_name, [attr.name for attr in attributes]
-        )
         select_stmt = project_statement([], temp_table_name)
         drop_table_stmt = drop_table_if_exists_statement(temp_table_name)
         schema_query = schema_query or schema_value_statement(attributes)
-        queries = [
-            Query(create_table_stmt, is_ddl_on_temp_object=True),
-            BatchInsertQuery(insert_stmt, data),
-            Query(select_stmt),
-        ]
+        post_actions = [Query(drop_table_stmt, is_ddl_on_temp_object=True)]
+        upload_threshold = self.session.create_dataframe_upload_threshold
+        if (
+            installed_pandas
+            and upload_threshold is not None
+            and len(attributes) * len(data) >= upload_threshold
+        ):
+            # Serializing the values to a Parquet file and copying the file into the table is
+            # much faster than binding every value of every row for large data
+            temp_stage_name = random_name_for_temp_object(TempObjectType.STAGE)
+            stage_location = f"@{temp_stage_name}"
+            file_name = f"{temp_table_name}.parquet"
+            upload_stmt = file_operation_statement(
+                "put",
+                normalize_local_file(file_name),
+                normalize_remote_file_or_dir(stage_location),
+                {"AUTO_COMPRESS": False, "OVERWRITE": True},
+            )
+            queries = [
+                Query(create_table_stmt, is_ddl_on_temp_object=True),
+                Query(
+                    create_temp_stage_statement(
+                        temp_stage_name,
+                        use_scoped_temp_objects=self.session._use_scoped_temp_objects,
+                        is_generated=True,
+                    ),
+                    is_ddl_on_temp_object=True,
+                ),
+                BulkUploadQuery(
+                    upload_stmt, data, attributes, stage_location, file_name
+                ),
+                Query(
+                    copy_into_table(
+                        temp_table_name,
+                        stage_location,
+                        "PARQUET",
+                        {},
+                        {"MATCH_BY_COLUMN_NAME": "CASE_SENSITIVE", "PURGE": True},
+                        None,
+                        files=[file_name],
+                    )
+                ),
+                Query(select_stmt),
+            ]
+            post_actions.append(
+                Query(
+                    drop_stage_if_exists_statement(temp_stage_name),
+                    is_ddl_on_temp_object=True,
+                )
+            )
+        else:
+            insert_stmt = batch_insert_into_statement(
+                temp_table_name, [attr.name for attr in attributes]
+            )
+            queries = [
+                Query(create_table_stmt, is_ddl_on_temp_object=True),
+                BatchInsertQuery(insert_stmt, data),
+                Query(select_stmt),
+            ]
         return SnowflakePlan(
             queries=queries,
             schema_query=schema_query,
-            post_actions=[Query(drop_table_stmt, is_ddl_on_temp_object=True)],
+            post_actions=post_actions,
             session=self.session,
             source_plan=source_plan,
         )
@@ -663,7 +742,7 @@ class SnowflakePlanBuilder:
         )
         column_definition = re.sub(
             hidden_column_pattern,
-            lambda match: f"\"COL{match.group(1)}\"",
+            lambda match: f'"COL{match.group(1)}"',
             column_definition_with_hidden_columns,
         )
 
@@ -1300,6 +1379,7 @@ class Query:
         query_id_place_holder: Optional[str] = None,
         is_ddl_on_temp_object: bool = False,
         params: Optional[Sequence[Any]] = None,
+        depends_on: Optional[Set[str]] = None,
     ) -> None:
         self.sql = sql
         self.query_id_place_holder = (
@@ -1309,6 +1389,9 @@ class Query:
         )
         self.is_ddl_on_temp_object = is_ddl_on_temp_object
         self.params = params or []
+        # The query id place holders of the queries that must be executed before this query.
+        # None means that this query depends on all queries before it in the plan.
+        self.depends_on = depends_on
 
     def __repr__(self) -> str:
         return (
@@ -1328,6 +1411,40 @@ class Query:
         )
 
 
+def add_chain_dependencies(queries: List[Query]) -> None:
+    """Makes the dependencies of the queries explicit before they are combined with the
+    queries of another plan: a query without explicit dependencies depends on all queries
+    before it in ``queries``."""
+    for i, query in enumerate(queries):
+        if query.depends_on is None:
+            query.depends_on = {q.query_id_place_holder for q in queries[:i]}
+
+
+def get_query_dependencies(
+    queries: List[Query],
+) -> Tuple[List[Query], List[Set[int]]]:
+    """Returns the distinct queries in ``queries`` and the dependency graph between them,
+    which is the indices of the distinct queries that must be executed before each distinct
+    query. A query that is equal to an earlier query is only executed once."""
+    distinct_queries, dependencies = [], []
+    index_of_place_holder = {}
+    for query in queries:
+        place_holder = query.query_id_place_holder
+        index = index_of_place_holder.get(place_holder)
+        if index is not None and distinct_queries[index] == query:
+            continue
+        num_queries = len(distinct_queries)
+        if query.depends_on is None or any(
+            p not in index_of_place_holder for p in query.depends_on
+        ):
+            dependencies.append(set(range(num_queries)))
+        else:
+            dependencies.append({index_of_place_holder[p] for p in query.depends_on})
+        index_of_place_holder[place_holder] = num_queries
+        distinct_queries.append(query)
+    return distinct_queries, dependencies
+
+
 class BatchInsertQuery(Query):
     def __init__(
         self,
@@ -1336,3 +1453,21 @@ class BatchInsertQuery(Query):
     ) -> None:
         super().__init__(sql)
         self.rows = rows
+
+
+class BulkUploadQuery(BatchInsertQuery):
+    """Uploads the rows to a stage as a Parquet file named ``file_name``.
+    ``sql`` is the PUT command used for the upload."""
+
+    def __init__(
+        self,
+        sql: str,
+        rows: List[Row],
+        attributes: List[Attribute],
+        stage_location: str,
+        file_name: str,
+    ) -> None:
+        super().__init__(sql, rows)
+        self.attributes = attributes
+        self.stage_location = stage_location
+        self.file_name = file_name
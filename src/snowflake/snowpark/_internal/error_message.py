@@ -3,10 +3,11 @@
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
 
-from typing import Optional
+from typing import Dict, Optional
 
 from snowflake.connector import OperationalError, ProgrammingError
 from snowflake.snowpark.exceptions import (
+    SnowparkAsyncJobGroupException,
     SnowparkColumnException,
     SnowparkCreateDynamicTableException,
     SnowparkCreateViewException,
@@ -430,6 +431,24 @@ class SnowparkClientExceptionMessages:
             error_code="1411",
         )
 
+    @staticmethod
+    def SERVER_FAILED_FETCH_ARROW(message: str) -> SnowparkFetchDataException:
+        return SnowparkFetchDataException(
+            f"Failed to fetch a pyarrow Table. The error is: {message}",
+            error_code="1412",
+        )
+
+    @staticmethod
+    def SERVER_ASYNC_JOB_GROUP_FAILED(
+        errors: Dict[int, Exception], num_jobs: int
+    ) -> SnowparkAsyncJobGroupException:
+        index, first_error = min(errors.items(), key=lambda item: item[0])
+        return SnowparkAsyncJobGroupException(
+            f"{len(errors)} of {num_jobs} jobs failed. The error of job {index} is: {first_error!r}",
+            error_code="1413",
+            errors=errors,
+        )
+
     # General Error codes 15XX
 
     @staticmethod
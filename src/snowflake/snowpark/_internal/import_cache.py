@@ -0,0 +1,195 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from logging import getLogger
+from typing import Dict, Optional, Set, Tuple
+
+from snowflake.snowpark._internal.utils import calculate_checksum
+
+_logger = getLogger(__name__)
+
+_IMPORT_CACHE_VERSION = 1
+
+
+def get_fingerprint(path: str) -> str:
+    """Returns a digest of the size and modification time of a local file, or of all files
+    in a local directory, which changes whenever a file is modified, added or removed."""
+    if os.path.isfile(path):
+        stat = os.stat(path)
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        if "__pycache__" in dirnames:
+            dirnames.remove("__pycache__")
+        rel_dirpath = os.path.relpath(dirpath, path)
+        entries.append((rel_dirpath, None, None))
+        for filename in sorted(filenames):
+            stat = os.stat(os.path.join(dirpath, filename))
+            entries.append(
+                (os.path.join(rel_dirpath, filename), stat.st_size, stat.st_mtime_ns)
+            )
+    return hashlib.sha256(repr(entries).encode("utf-8")).hexdigest()
+
+
+class ImportCache:
+    """
+    A manifest of the local imports of UDFs and stored procedures. It keeps the checksum of
+    each local file or directory, which is only computed again when the size or modification
+    time of a file changes, and the stage files that are known to exist because they were listed
+    or uploaded. An import whose checksum and stage file are both cached is resolved without
+    listing the stage, zipping the import or uploading it. It also keeps the stage files of the
+    generated handler files that were uploaded, so a UDF with the same handler code reuses them.
+
+    If ``path`` is set, the manifest is loaded from and saved to this JSON file, so it is shared
+    by the sessions using the same file.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self._lock = threading.RLock()
+        # key of an import -> (fingerprint, checksum)
+        self._checksums: Dict[str, Tuple[str, str]] = {}
+        self._stage_files: Set[str] = set()
+        # key of a generated handler file -> (stage file, handler module)
+        self._uploaded_code: Dict[str, Tuple[str, str]] = {}
+        self.path: Optional[str] = None
+        self.set_path(path)
+
+    @staticmethod
+    def _get_stage_file_key(stage_file: str, context: Tuple[Optional[str], ...]) -> str:
+        # an unqualified stage name depends on the current database and schema
+        return json.dumps([stage_file, *context], default=str)
+
+    def set_path(self, path: Optional[str]) -> None:
+        """Sets the file where the manifest is saved. Entries already in the file
+        are merged with the entries in memory."""
+        with self._lock:
+            self.path = os.path.abspath(path) if path else None
+            if self.path:
+                self._load()
+                self._save()
+
+    def get_checksum(
+        self,
+        path: str,
+        leading_path: Optional[str] = None,
+        chunk_size: int = 8192,
+        whole_file_hash: bool = False,
+    ) -> str:
+        """Returns the same value as :func:`calculate_checksum`, which is only computed
+        if the file or directory changed since it was last computed."""
+        key = json.dumps([path, leading_path, chunk_size, whole_file_hash])
+        fingerprint = get_fingerprint(path)
+        with self._lock:
+            cached = self._checksums.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        checksum = calculate_checksum(
+            path,
+            additional_info=leading_path,
+            chunk_size=chunk_size,
+            whole_file_hash=whole_file_hash,
+        )
+        with self._lock:
+            self._checksums[key] = (fingerprint, checksum)
+            self._save()
+        return checksum
+
+    def contains_stage_file(
+        self, stage_file: str, context: Tuple[Optional[str], ...] = ()
+    ) -> bool:
+        with self._lock:
+            return self._get_stage_file_key(stage_file, context) in self._stage_files
+
+    def add_stage_file(
+        self, stage_file: str, context: Tuple[Optional[str], ...] = ()
+    ) -> None:
+        key = self._get_stage_file_key(stage_file, context)
+        with self._lock:
+            if key not in self._stage_files:
+                self._stage_files.add(key)
+                self._save()
+
+    def get_uploaded_code(
+        self, checksum: str, stage: str, context: Tuple[Optional[str], ...] = ()
+    ) -> Optional[Tuple[str, str]]:
+        """Returns the stage file and the handler module of a generated handler file
+        with the given checksum that was uploaded to ``stage``, or None."""
+        with self._lock:
+            return self._uploaded_code.get(
+                self._get_stage_file_key(checksum + stage, context)
+            )
+
+    def add_uploaded_code(
+        self,
+        checksum: str,
+        stage: str,
+        stage_file: str,
+        handler_module: str,
+        context: Tuple[Optional[str], ...] = (),
+    ) -> None:
+        with self._lock:
+            self._uploaded_code[self._get_stage_file_key(checksum + stage, context)] = (
+                stage_file,
+                handler_module,
+            )
+            self._save()
+
+    def remove_uploaded_code(self, stage_file: str) -> None:
+        with self._lock:
+            keys = [k for k, v in self._uploaded_code.items() if v[0] == stage_file]
+            for key in keys:
+                self._uploaded_code.pop(key)
+            if keys:
+                self._save()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._checksums.clear()
+            self._stage_files.clear()
+            self._uploaded_code.clear()
+            self._save()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                content = json.load(f)
+            if content.get("version") != _IMPORT_CACHE_VERSION:
+                return
+            for key, (fingerprint, checksum) in content["checksums"].items():
+                self._checksums.setdefault(key, (fingerprint, checksum))
+            self._stage_files.update(content["stage_files"])
+            for key, (stage_file, handler_module) in content.get(
+                "uploaded_code", {}
+            ).items():
+                self._uploaded_code.setdefault(key, (stage_file, handler_module))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, KeyError) as ex:
+            _logger.debug("Failed to load the import cache from %s: %s", self.path, ex)
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        content = {
+            "version": _IMPORT_CACHE_VERSION,
+            "checksums": self._checksums,
+            "stage_files": sorted(self._stage_files),
+            "uploaded_code": self._uploaded_code,
+        }
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # write to a temporary file first, so other sessions never read a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(content, f)
+            os.replace(tmp_path, self.path)
+        except OSError as ex:
+            _logger.debug("Failed to save the import cache to %s: %s", self.path, ex)
@@ -0,0 +1,188 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from logging import getLogger
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+_logger = getLogger(__name__)
+
+DEFAULT_PACKAGE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+_PACKAGE_VERSIONS_FILE = "package_versions.json"
+_ENVIRONMENTS_DIRECTORY = "environments"
+_FRAGMENTS_DIRECTORY = "fragments"
+
+
+class CachedEnvironment(NamedTuple):
+    # the requirements of the dependencies that are available in Snowflake
+    dependencies: List[str]
+    has_native_packages: bool
+
+
+def get_environment_key(environment_signature: str) -> str:
+    """Packages installed by pip depend on the local Python version and platform."""
+    return hashlib.sha1(
+        f"{environment_signature}|{sys.version_info[0]}.{sys.version_info[1]}|{sys.platform}".encode()
+    ).hexdigest()
+
+
+class PackageCache:
+    """
+    A cache of package resolution results in a local directory, which is shared by
+    the sessions and processes using the same directory:
+
+    - the versions of packages available in Snowflake, keyed by the account and the package table,
+    - the zip files of the packages unavailable in Snowflake that were installed by pip, and
+      the requirements of their dependencies available in Snowflake, keyed by the signature
+      of the requested packages, the Python version and the platform, and
+    - the zip fragments of single packages installed by pip, keyed by their content, which
+      are reused to zip other environments containing the same packages.
+
+    Entries older than ``ttl_seconds`` are ignored, so new versions of packages are found again.
+    """
+
+    def __init__(
+        self, directory: str, ttl_seconds: int = DEFAULT_PACKAGE_CACHE_TTL_SECONDS
+    ) -> None:
+        if ttl_seconds < 0:
+            raise ValueError("ttl_seconds must be a non-negative integer")
+        self.directory = os.path.abspath(directory)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        os.makedirs(
+            os.path.join(self.directory, _ENVIRONMENTS_DIRECTORY), exist_ok=True
+        )
+        os.makedirs(self.fragments_directory, exist_ok=True)
+
+    @property
+    def fragments_directory(self) -> str:
+        return os.path.join(self.directory, _FRAGMENTS_DIRECTORY)
+
+    def _is_expired(self, timestamp: float) -> bool:
+        return time.time() - timestamp > self.ttl_seconds
+
+    def _load_package_versions(self) -> Dict[str, Dict[str, list]]:
+        try:
+            with open(
+                os.path.join(self.directory, _PACKAGE_VERSIONS_FILE), encoding="utf-8"
+            ) as f:
+                content = json.load(f)
+            return content if isinstance(content, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as ex:
+            _logger.debug("Failed to load the cached package versions: %s", ex)
+            return {}
+
+    def get_package_versions(
+        self, package_table_key: str, package_names: List[str]
+    ) -> Dict[str, Optional[List[str]]]:
+        """Returns the cached versions of the given packages that haven't expired. The versions of
+        a package are None if it is not available in Snowflake."""
+        with self._lock:
+            cached = self._load_package_versions().get(package_table_key, {})
+        result = {}
+        for name in package_names:
+            entry = cached.get(name)
+            if entry is not None and not self._is_expired(entry[0]):
+                result[name] = entry[1]
+        return result
+
+    def put_package_versions(
+        self,
+        package_table_key: str,
+        package_versions: Dict[str, Optional[List[str]]],
+    ) -> None:
+        now = time.time()
+        with self._lock:
+            content = self._load_package_versions()
+            cached = content.setdefault(package_table_key, {})
+            for name, versions in package_versions.items():
+                cached[name] = [now, versions]
+            try:
+                self._write_json(_PACKAGE_VERSIONS_FILE, content)
+            except OSError as ex:
+                _logger.debug("Failed to cache package versions: %s", ex)
+
+    def _get_environment_paths(self, environment_signature: str) -> Tuple[str, str]:
+        key = get_environment_key(environment_signature)
+        prefix = os.path.join(self.directory, _ENVIRONMENTS_DIRECTORY, key)
+        return f"{prefix}.zip", f"{prefix}.json"
+
+    def get_environment(
+        self, environment_signature: str, zip_path: str
+    ) -> Optional[CachedEnvironment]:
+        """Copies the cached zip file of the packages with the given signature to ``zip_path``,
+        and returns their dependencies, or returns None if they are not cached."""
+        cached_zip_path, metadata_path = self._get_environment_paths(
+            environment_signature
+        )
+        try:
+            with open(metadata_path, encoding="utf-8") as f:
+                metadata = json.load(f)
+            if self._is_expired(metadata["timestamp"]):
+                return None
+            shutil.copyfile(cached_zip_path, zip_path)
+            return CachedEnvironment(
+                metadata["dependencies"], metadata["has_native_packages"]
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as ex:
+            _logger.debug("Failed to load a cached environment: %s", ex)
+            return None
+
+    def put_environment(
+        self,
+        environment_signature: str,
+        zip_path: str,
+        environment: CachedEnvironment,
+    ) -> None:
+        cached_zip_path, metadata_path = self._get_environment_paths(
+            environment_signature
+        )
+        try:
+            tmp_zip_path = f"{cached_zip_path}.{os.getpid()}.tmp"
+            shutil.copyfile(zip_path, tmp_zip_path)
+            os.replace(tmp_zip_path, cached_zip_path)
+            # the metadata is written last, so an environment is never read without its zip file
+            self._write_json(
+                os.path.join(_ENVIRONMENTS_DIRECTORY, os.path.basename(metadata_path)),
+                {
+                    "timestamp": time.time(),
+                    "dependencies": environment.dependencies,
+                    "has_native_packages": environment.has_native_packages,
+                },
+            )
+        except OSError as ex:
+            _logger.debug("Failed to cache an environment: %s", ex)
+
+    def clear(self) -> None:
+        with self._lock:
+            try:
+                os.remove(os.path.join(self.directory, _PACKAGE_VERSIONS_FILE))
+            except FileNotFoundError:
+                pass
+            for directory in (
+                os.path.join(self.directory, _ENVIRONMENTS_DIRECTORY),
+                self.fragments_directory,
+            ):
+                shutil.rmtree(directory, ignore_errors=True)
+                os.makedirs(directory, exist_ok=True)
+
+    def _write_json(self, relative_path: str, content: dict) -> None:
+        path = os.path.join(self.directory, relative_path)
+        # write to a temporary file first, so other processes never read a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(content, f)
+        os.replace(tmp_path, path)
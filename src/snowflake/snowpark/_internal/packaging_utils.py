@@ -2,15 +2,21 @@
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
 # The code in this file is largely a copy of https://github.com/Snowflake-Labs/snowcli/blob/main/src/snowcli/utils.py
+import copy
+import csv
 import glob
 import hashlib
 import os
 import platform
 import re
 import shutil
+import struct
 import subprocess
 import sys
+import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from pathlib import Path
 from typing import AnyStr, Dict, List, Optional, Set, Tuple
@@ -442,32 +448,165 @@ def detect_native_dependencies(
     return native_libraries
 
 
-def zip_directory_contents(target: str, output_path: str) -> None:
+def zip_directory_contents(
+    target: str,
+    output_path: str,
+    fragment_cache_directory: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> None:
     """
     Zips all files/folders inside the directory path as well as those installed one level up from the directory path.
 
+    The files of each package installed by pip (listed in the RECORD file of the package) are zipped into a separate
+    fragment, and the fragments are zipped in parallel in a thread pool, then merged into the output zip file without
+    compressing their files again. If ``fragment_cache_directory`` is set, the fragment of a package is stored in this
+    directory, keyed by the name and version of the package and the hashes of its files, and reused when the same
+    package is zipped again.
+
     Args:
         target (str): Target directory (absolute path) which contains packages installed by pip.
         output_path (str): Absolute path for output zip file.
+        fragment_cache_directory (Optional[str]): A directory where the fragments of packages are cached.
+        max_workers (Optional[int]): The maximum number of threads zipping fragments, defaults to the
+            default of :class:`~concurrent.futures.ThreadPoolExecutor`.
     """
     target = Path(target)
     output_path = Path(output_path)
-    with zipfile.ZipFile(
-        output_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True
-    ) as zipf:
-        for file in target.rglob("*"):
-            zipf.write(file, file.relative_to(target))
+    package_files, remaining_files = get_package_files(target)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fragments: List[Tuple[List[str], str]] = []
+        fragment_paths: List[str] = []
+        for key, files in package_files:
+            if fragment_cache_directory:
+                fragment_path = os.path.join(fragment_cache_directory, f"{key}.zip")
+                if not os.path.isfile(fragment_path):
+                    fragments.append((files, fragment_path))
+            else:
+                fragment_path = os.path.join(tmpdir, f"{key}.zip")
+                fragments.append((files, fragment_path))
+            fragment_paths.append(fragment_path)
+        if remaining_files:
+            fragment_path = os.path.join(tmpdir, "remaining_files.zip")
+            fragments.append((remaining_files, fragment_path))
+            fragment_paths.append(fragment_path)
+
+        _build_zip_fragments(str(target), fragments, max_workers)
+
+        with zipfile.ZipFile(
+            output_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True
+        ) as zipf:
+            # the fragments only contain files, so the directory entries are written separately
+            for directory in sorted(
+                path for path in target.rglob("*") if path.is_dir()
+            ):
+                zipf.write(directory, directory.relative_to(target))
+            for fragment_path in fragment_paths:
+                copy_zip_members(fragment_path, zipf)
 
-        parent_directory = target.parent
+            parent_directory = target.parent
 
-        for file in parent_directory.iterdir():
-            if (
-                file.is_file()
-                and not file.match(".*")
-                and file != output_path
-                and file != target
-            ):
-                zipf.write(file, file.relative_to(parent_directory))
+            for file in parent_directory.iterdir():
+                if (
+                    file.is_file()
+                    and not file.match(".*")
+                    and file != output_path
+                    and file != target
+                ):
+                    zipf.write(file, file.relative_to(parent_directory))
+
+
+def get_package_files(target: Path) -> Tuple[List[Tuple[str, List[str]]], List[str]]:
+    """
+    Finds the files of each package installed by pip in the target directory from its RECORD file.
+
+    Returns:
+        Tuple[List[Tuple[str, List[str]]], List[str]]: A key and the relative paths of the files of each package,
+        and the relative paths of the files that don't belong to any package. The key of a package depends on its name,
+        its version and the hashes and sizes of its files.
+    """
+    all_files = sorted(
+        file.relative_to(target).as_posix()
+        for file in target.rglob("*")
+        if file.is_file()
+    )
+    unclaimed_files = set(all_files)
+    package_files = []
+    for record_file_path in sorted(target.glob("*.dist-info/RECORD")):
+        with open(record_file_path, encoding="utf-8", newline="") as record_file:
+            record_content = record_file.read()
+        files = []
+        for row in csv.reader(record_content.splitlines()):
+            # RECORD file might contain relative paths to items outside target folder. (ignore these)
+            if row and row[0] in unclaimed_files:
+                files.append(row[0])
+                unclaimed_files.remove(row[0])
+        if not files:
+            continue
+        key_hash = hashlib.sha256(record_content.encode("utf-8"))
+        for file in files:
+            key_hash.update(f"{file}:{(target / file).stat().st_size}".encode())
+        package_files.append(
+            (f"{record_file_path.parent.name}-{key_hash.hexdigest()[:32]}", files)
+        )
+    remaining_files = [file for file in all_files if file in unclaimed_files]
+    return package_files, remaining_files
+
+
+def _build_zip_fragment(target: str, files: List[str], output_path: str) -> None:
+    # write to a temporary file first, so a partially written fragment is never cached
+    tmp_path = f"{output_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as zipf:
+        for file in files:
+            zipf.write(os.path.join(target, file), file)
+    os.replace(tmp_path, output_path)
+
+
+def _build_zip_fragments(
+    target: str, fragments: List[Tuple[List[str], str]], max_workers: Optional[int]
+) -> None:
+    if len(fragments) > 1 and max_workers != 1:
+        # threads are used rather than processes, so no process is forked or spawned from
+        # the user's program; zlib releases the GIL while compressing
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_build_zip_fragment, target, files, output_path)
+                for files, output_path in fragments
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for files, output_path in fragments:
+            _build_zip_fragment(target, files, output_path)
+
+
+def copy_zip_members(source_path: str, zipf: zipfile.ZipFile) -> None:
+    """
+    Appends the members of a zip file to an open zip file without decompressing and compressing them again.
+    """
+    with zipfile.ZipFile(source_path) as source, open(source_path, "rb") as f:
+        for info in source.infolist():
+            f.seek(info.header_offset)
+            header = f.read(zipfile.sizeFileHeader)
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            f.seek(
+                info.header_offset + zipfile.sizeFileHeader + name_length + extra_length
+            )
+            data = f.read(info.compress_size)
+            # zipfile has no public API to write compressed data, so the member is written
+            # the same way as ZipFile.write writes it to a seekable file. FileHeader adds a
+            # zip64 extra field when the sizes need it, and the central directory (including
+            # zip64 offsets) is written from filelist when zipf is closed.
+            new_info = copy.copy(info)
+            new_info.flag_bits &= ~0x08  # no data descriptor after the data
+            new_info.extra = b""
+            new_info.header_offset = zipf.fp.tell()
+            zipf.fp.write(new_info.FileHeader())
+            zipf.fp.write(data)
+            zipf.filelist.append(new_info)
+            zipf.NameToInfo[new_info.filename] = new_info
+            zipf.start_dir = zipf.fp.tell()
+            zipf._didModify = True
 
 
 def add_snowpark_package(
@@ -0,0 +1,273 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import hashlib
+import io
+import os
+import sys
+import threading
+from collections import OrderedDict
+from logging import getLogger
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from snowflake.connector.options import installed_pandas, pandas, pyarrow
+from snowflake.snowpark._internal.analyzer.snowflake_plan import (
+    BatchInsertQuery,
+    Query,
+)
+from snowflake.snowpark._internal.utils import parse_table_name
+
+_logger = getLogger(__name__)
+
+# Only the results of queries starting with these keywords are cached
+_READ_ONLY_QUERY_PREFIXES = ("SELECT", "WITH")
+
+DEFAULT_RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class _CacheEntry(NamedTuple):
+    sql: str
+    data: Union[List[tuple], "pandas.DataFrame"]
+    result_meta: Any
+    query_id: Optional[str]
+    size: int
+
+
+class _SpilledEntry(NamedTuple):
+    sql: str
+    path: str
+    is_pandas: bool
+    result_meta: Any
+    query_id: Optional[str]
+
+
+def is_cacheable_query(query: Query) -> bool:
+    if isinstance(query, BatchInsertQuery):
+        return False
+    return query.sql.lstrip(" \t\r\n(").upper().startswith(_READ_ONLY_QUERY_PREFIXES)
+
+
+def _estimate_size(data: Union[List[tuple], "pandas.DataFrame"]) -> int:
+    if isinstance(data, list):
+        return sys.getsizeof(data) + sum(
+            sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row) for row in data
+        )
+    return int(data.memory_usage(index=True, deep=True).sum())
+
+
+def _copy_data(
+    data: Union[List[tuple], "pandas.DataFrame"]
+) -> Union[List[tuple], "pandas.DataFrame"]:
+    # rows are tuples so a shallow copy of the list is enough, but a pandas DataFrame can be
+    # modified in place by the caller
+    return list(data) if isinstance(data, list) else data.copy()
+
+
+def _to_arrow_table(
+    data: Union[List[tuple], "pandas.DataFrame"], num_columns: int
+) -> Optional["pyarrow.Table"]:
+    """Converts a result to an Arrow table, returns None if the values can't be stored
+    in Arrow and read back without changing their types."""
+    try:
+        if not isinstance(data, list):
+            return pyarrow.Table.from_pandas(data, preserve_index=True)
+        columns = list(zip(*data)) if data else [() for _ in range(num_columns)]
+        arrays = [pyarrow.array(values) for values in columns]
+    except (ValueError, TypeError, pyarrow.ArrowException):
+        # ArrowInvalid and ArrowTypeError are subclasses of ValueError and TypeError
+        return None
+    for array in arrays:
+        # an Arrow column only has a single time zone, so timestamps with different
+        # offsets would be read back in the same time zone
+        if pyarrow.types.is_timestamp(array.type) and array.type.tz is not None:
+            return None
+    return pyarrow.Table.from_arrays(
+        arrays, names=[f"c{i}" for i in range(len(arrays))]
+    )
+
+
+def _from_arrow_table(
+    table: "pyarrow.Table", is_pandas: bool
+) -> Union[List[tuple], "pandas.DataFrame"]:
+    if is_pandas:
+        return table.to_pandas()
+    columns = [column.to_pylist() for column in table.columns]
+    return list(zip(*columns)) if columns else []
+
+
+class ResultCache:
+    """
+    An LRU cache of the results of read-only queries executed in a session, which
+    are kept in memory up to ``max_bytes`` bytes. If ``spill_directory`` is set and
+    ``pyarrow`` is installed, results evicted from memory are written to this directory
+    as Arrow IPC files instead of being discarded.
+
+    A result is keyed by the SQL text and bind parameters of the queries that produced it,
+    whether it was fetched as a pandas DataFrame, and the current role, database, schema
+    and warehouse of the session.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES,
+        spill_directory: Optional[str] = None,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be a non-negative integer")
+        self.max_bytes = max_bytes
+        self.spill_directory = (
+            spill_directory if spill_directory and installed_pandas else None
+        )
+        if spill_directory and not installed_pandas:
+            _logger.warning(
+                "Results evicted from the result cache are discarded because pyarrow is not installed"
+            )
+        if self.spill_directory:
+            os.makedirs(self.spill_directory, exist_ok=True)
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._spilled: Dict[str, _SpilledEntry] = {}
+        self._size = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def get_key(
+        queries: List[Query], to_pandas: bool, context: Tuple[Optional[str], ...]
+    ) -> str:
+        key = repr(([(q.sql, q.params) for q in queries], to_pandas, context))
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], Any]]:
+        """Returns a copy of the cached result set and its metadata, or None for a cache miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            elif key in self._spilled:
+                entry = self._load_spilled(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return (
+                {"data": _copy_data(entry.data), "sfqid": entry.query_id},
+                entry.result_meta,
+            )
+
+    def put(self, key: str, sql: str, result: Dict[str, Any], result_meta: Any) -> None:
+        data = result["data"]
+        with self._lock:
+            self._remove(key)
+            entry = _CacheEntry(
+                sql,
+                _copy_data(data),
+                result_meta,
+                result.get("sfqid"),
+                _estimate_size(data),
+            )
+            self._entries[key] = entry
+            self._size += entry.size
+            self._evict()
+
+    def invalidate(self, table_name: Union[str, Iterable[str]]) -> None:
+        """Removes the cached results of queries that may read the given table. The check is
+        conservative: any query whose SQL text contains the name of the table is removed."""
+        name_parts = (
+            parse_table_name(table_name) if isinstance(table_name, str) else table_name
+        )
+        name = list(name_parts)[-1]
+        # unquoted identifiers are case-insensitive
+        name = name[1:-1] if name.startswith('"') and name.endswith('"') else name
+        name = name.upper()
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if name in e.sql.upper()]:
+                self._remove(key)
+            for key in [k for k, e in self._spilled.items() if name in e.sql.upper()]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries) + list(self._spilled):
+                self._remove(key)
+
+    @property
+    def size(self) -> int:
+        """The estimated number of bytes of the results kept in memory."""
+        return self._size
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "spilled_entries": len(self._spilled),
+                "size_bytes": self._size,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+        spilled = self._spilled.pop(key, None)
+        if spilled is not None:
+            try:
+                os.remove(spilled.path)
+            except OSError:  # pragma: no cover
+                pass
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes and self._entries:
+            key, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+            self.evictions += 1
+            if self.spill_directory:
+                self._spill(key, entry)
+
+    def _spill(self, key: str, entry: _CacheEntry) -> None:
+        table = _to_arrow_table(entry.data, len(entry.result_meta or []))
+        if table is None:
+            return
+        path = os.path.join(self.spill_directory, f"{key}.arrow")
+        try:
+            with pyarrow.OSFile(path, "wb") as sink:
+                with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        except (OSError, pyarrow.ArrowException) as ex:
+            _logger.debug("Failed to spill a cached result to %s: %s", path, ex)
+            return
+        self._spilled[key] = _SpilledEntry(
+            entry.sql,
+            path,
+            not isinstance(entry.data, list),
+            entry.result_meta,
+            entry.query_id,
+        )
+
+    def _load_spilled(self, key: str) -> Optional[_CacheEntry]:
+        spilled = self._spilled.pop(key)
+        try:
+            with open(spilled.path, "rb") as f:
+                table = pyarrow.ipc.open_file(io.BytesIO(f.read())).read_all()
+            os.remove(spilled.path)
+        except (OSError, pyarrow.ArrowException) as ex:
+            _logger.debug(
+                "Failed to read a spilled result from %s: %s", spilled.path, ex
+            )
+            return None
+        data = _from_arrow_table(table, spilled.is_pandas)
+        entry = _CacheEntry(
+            spilled.sql,
+            data,
+            spilled.result_meta,
+            spilled.query_id,
+            _estimate_size(data),
+        )
+        self._entries[key] = entry
+        self._size += entry.size
+        self._evict()
+        return entry
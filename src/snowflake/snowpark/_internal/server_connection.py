@@ -3,12 +3,18 @@
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
 
+import copy
 import functools
 import importlib
 import inspect
+import io
 import os
+import re
 import sys
 import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from logging import getLogger
 from typing import (
     IO,
@@ -29,9 +35,10 @@ from snowflake.connector.constants import ENV_VAR_PARTNER, FIELD_ID_TO_NAME
 from snowflake.connector.cursor import ResultMetadata, SnowflakeCursor
 from snowflake.connector.errors import NotSupportedError, ProgrammingError
 from snowflake.connector.network import ReauthenticationRequest
-from snowflake.connector.options import pandas
+from snowflake.connector.options import pandas, pyarrow
 from snowflake.snowpark._internal.analyzer.analyzer_utils import (
     quote_name_without_upper_casing,
+    unquote_if_quoted,
 )
 from snowflake.snowpark._internal.analyzer.datatype_mapper import str_to_sql
 from snowflake.snowpark._internal.analyzer.expression import Attribute
@@ -42,9 +49,13 @@ from snowflake.snowpark._internal.analyzer.schema_utils import (
 )
 from snowflake.snowpark._internal.analyzer.snowflake_plan import (
     BatchInsertQuery,
+    BulkUploadQuery,
+    Query,
     SnowflakePlan,
+    get_query_dependencies,
 )
 from snowflake.snowpark._internal.error_message import SnowparkClientExceptionMessages
+from snowflake.snowpark._internal.result_cache import is_cacheable_query
 from snowflake.snowpark._internal.telemetry import TelemetryClient
 from snowflake.snowpark._internal.utils import (
     escape_quotes,
@@ -54,12 +65,21 @@ from snowflake.snowpark._internal.utils import (
     normalize_local_file,
     normalize_remote_file_or_dir,
     result_set_to_iter,
+    result_set_to_row_set,
     result_set_to_rows,
     unwrap_stage_location_single_quote,
 )
 from snowflake.snowpark.async_job import AsyncJob, _AsyncResultType
 from snowflake.snowpark.query_history import QueryHistory, QueryRecord
-from snowflake.snowpark.row import Row
+from snowflake.snowpark.row import Row, RowSet
+from snowflake.snowpark.types import (
+    BinaryType,
+    BooleanType,
+    DataType,
+    DecimalType,
+    _FractionalType,
+    _IntegralType,
+)
 
 if TYPE_CHECKING:
     try:
@@ -85,6 +105,38 @@ def _build_target_path(stage_location: str, dest_prefix: str = "") -> str:
     return f"{qualified_stage_name}{dest_prefix_name if dest_prefix_name else ''}"
 
 
+# The maximum number of schema queries whose attributes are cached in a session
+SCHEMA_CACHE_MAX_SIZE = 1000
+
+# Statements that may change the schema of tables and views, which clear the cached attributes
+# of schema queries
+_SCHEMA_CHANGING_STATEMENT_PREFIXES = ("alter", "create", "drop", "undrop", "replace")
+
+
+_SELECT_STAR_FROM_PATTERN = re.compile(
+    r"SELECT\s+\*\s+FROM\s+(.*)", flags=re.IGNORECASE | re.DOTALL
+)
+
+
+def _normalize_schema_query(query: str) -> str:
+    """Normalizes a schema query for the schema cache, so ``SELECT * FROM (t)`` (the schema query of a
+    :class:`Table`) and ``SELECT * FROM t`` (the schema query of the same table in a simplified query)
+    share the cached attributes."""
+    query = query.strip()
+    match = _SELECT_STAR_FROM_PATTERN.fullmatch(query)
+    if match:
+        source = match.group(1).strip()
+        if (
+            source.startswith("(")
+            and source.endswith(")")
+            and "(" not in source[1:-1]
+            and ")" not in source[1:-1]
+        ):
+            source = source[1:-1].strip()
+        return f"SELECT * FROM {source}"
+    return query
+
+
 def _build_put_statement(
     local_path: str,
     stage_location: str,
@@ -160,6 +212,14 @@ class ServerConnection:
         self._cursor = self._conn.cursor()
         self._telemetry_client = TelemetryClient(self._conn)
         self._query_listener: Set[QueryHistory] = set()
+        # Attributes of the schema queries described in this session, keyed by the schema
+        # query and the current context, see get_result_attributes
+        self._schema_cache: "OrderedDict[Tuple[str, Tuple[Optional[str], ...]], List[Attribute]]" = (
+            OrderedDict()
+        )
+        self._schema_cache_enabled = True
+        self.describe_query_count = 0
+        self.schema_cache_hit_count = 0
         # The session in this case refers to a Snowflake session, not a
         # Snowpark session
         self._telemetry_client.send_session_created_telemetry(not bool(conn))
@@ -224,13 +284,61 @@ class ServerConnection:
             else None
         )
 
+    def _get_current_context(self) -> Tuple[Optional[str], ...]:
+        """Returns the current role, database, schema and warehouse known by the connector,
+        without a round trip to Snowflake."""
+        return (
+            self._conn.role,
+            self._conn.database,
+            self._conn.schema,
+            self._conn.warehouse,
+        )
+
     def _get_string_datum(self, query: str) -> Optional[str]:
         rows = result_set_to_rows(self.run_query(query)["data"])
         return rows[0][0] if len(rows) > 0 else None
 
     @SnowflakePlan.Decorator.wrap_exception
     def get_result_attributes(self, query: str) -> List[Attribute]:
-        return convert_result_meta_to_attribute(run_new_describe(self._cursor, query))
+        attributes = self.get_cached_result_attributes(query)
+        if attributes is not None:
+            return attributes
+        attributes = convert_result_meta_to_attribute(
+            run_new_describe(self._cursor, query)
+        )
+        self.describe_query_count += 1
+        if not self._schema_cache_enabled:
+            return attributes
+        self._schema_cache[
+            (_normalize_schema_query(query), self._get_current_context())
+        ] = attributes
+        if len(self._schema_cache) > SCHEMA_CACHE_MAX_SIZE:
+            self._schema_cache.popitem(last=False)
+        return [Attribute(a.name, a.datatype, a.nullable) for a in attributes]
+
+    def get_cached_result_attributes(self, query: str) -> Optional[List[Attribute]]:
+        """Returns the attributes of a schema query that was already described in the current
+        context, or None. The cache is cleared when a statement that may change the schema of
+        tables or views is executed, see _clear_schema_cache_if_needed."""
+        if not self._schema_cache_enabled:
+            return None
+        key = (_normalize_schema_query(query), self._get_current_context())
+        attributes = self._schema_cache.get(key)
+        if attributes is None:
+            return None
+        self._schema_cache.move_to_end(key)
+        self.schema_cache_hit_count += 1
+        # every plan gets new attributes (with new expression IDs), the same as a describe query
+        return [Attribute(a.name, a.datatype, a.nullable) for a in attributes]
+
+    def clear_schema_cache(self) -> None:
+        self._schema_cache.clear()
+
+    def _clear_schema_cache_if_needed(self, query: str) -> None:
+        if self._schema_cache and query.lstrip(" \t\r\n(").lower().startswith(
+            _SCHEMA_CHANGING_STATEMENT_PREFIXES
+        ):
+            self._schema_cache.clear()
 
     @_Decorator.log_msg_and_perf_telemetry("Uploading file to stage")
     def upload_file(
@@ -349,6 +457,7 @@ class ServerConnection:
     def execute_and_notify_query_listener(
         self, query: str, **kwargs: Any
     ) -> SnowflakeCursor:
+        self._clear_schema_cache_if_needed(query)
         results_cursor = self._cursor.execute(query, **kwargs)
         self.notify_query_listeners(
             QueryRecord(results_cursor.sfqid, results_cursor.query)
@@ -358,6 +467,7 @@ class ServerConnection:
     def execute_async_and_notify_query_listener(
         self, query: str, **kwargs: Any
     ) -> Dict[str, Any]:
+        self._clear_schema_cache_if_needed(query)
         results_cursor = self._cursor.execute_async(query, **kwargs)
         self.notify_query_listeners(QueryRecord(results_cursor["queryId"], query))
         return results_cursor
@@ -388,6 +498,7 @@ class ServerConnection:
         case_sensitive: bool = True,
         params: Optional[Sequence[Any]] = None,
         num_statements: Optional[int] = None,
+        to_arrow: bool = False,
         **kwargs,
     ) -> Union[Dict[str, Any], AsyncJob]:
         try:
@@ -421,7 +532,10 @@ class ServerConnection:
         # calls to_pandas() to execute the query.
         if block:
             return self._to_data_or_iter(
-                results_cursor=results_cursor, to_pandas=to_pandas, to_iter=to_iter
+                results_cursor=results_cursor,
+                to_pandas=to_pandas,
+                to_iter=to_iter,
+                to_arrow=to_arrow,
             )
         else:
             return AsyncJob(
@@ -441,8 +555,28 @@ class ServerConnection:
         results_cursor: SnowflakeCursor,
         to_pandas: bool = False,
         to_iter: bool = False,
+        to_arrow: bool = False,
     ) -> Dict[str, Any]:
         qid = results_cursor.sfqid
+        if to_arrow:
+            try:
+                # fetch_arrow_batches() is called before the iterator is consumed, so it still
+                # returns the result of this query if another query is executed with this cursor
+                data_or_iter = (
+                    (
+                        batch
+                        for table in results_cursor.fetch_arrow_batches()
+                        for batch in table.to_batches()
+                    )
+                    if to_iter
+                    else results_cursor.fetch_arrow_all(force_return_table=True)
+                )
+            except NotSupportedError:
+                raise SnowparkClientExceptionMessages.SERVER_FAILED_FETCH_ARROW(
+                    "The result of the query is not in the Arrow format. If you use "
+                    "session.sql(...).to_arrow(), the input query can only be a SELECT statement."
+                )
+            return {"data": data_or_iter, "sfqid": qid}
         if (
             to_iter and not to_pandas
         ):  # Fix for SNOW-869536, to_pandas doesn't have this issue, SnowflakeCursor.fetch_pandas_batches already handles the isolation.
@@ -491,9 +625,17 @@ class ServerConnection:
         data_type: _AsyncResultType = _AsyncResultType.ROW,
         log_on_exception: bool = False,
         case_sensitive: bool = True,
+        to_arrow: bool = False,
+        columnar: bool = False,
         **kwargs,
     ) -> Union[
-        List[Row], "pandas.DataFrame", Iterator[Row], Iterator["pandas.DataFrame"]
+        List[Row],
+        RowSet,
+        "pandas.DataFrame",
+        "pyarrow.Table",
+        Iterator[Row],
+        Iterator["pandas.DataFrame"],
+        Iterator["pyarrow.RecordBatch"],
     ]:
         if (
             is_in_stored_procedure()
@@ -514,16 +656,21 @@ class ServerConnection:
             data_type=data_type,
             log_on_exception=log_on_exception,
             case_sensitive=case_sensitive,
+            to_arrow=to_arrow,
         )
         if not block:
             return result_set
-        elif to_pandas:
+        elif to_pandas or to_arrow:
             return result_set["data"]
         else:
             if to_iter:
                 return result_set_to_iter(
                     result_set["data"], result_meta, case_sensitive=case_sensitive
                 )
+            elif columnar:
+                return result_set_to_row_set(
+                    result_set["data"], result_meta, case_sensitive=case_sensitive
+                )
             else:
                 return result_set_to_rows(
                     result_set["data"], result_meta, case_sensitive=case_sensitive
@@ -539,6 +686,7 @@ class ServerConnection:
         data_type: _AsyncResultType = _AsyncResultType.ROW,
         log_on_exception: bool = False,
         case_sensitive: bool = True,
+        to_arrow: bool = False,
         **kwargs,
     ) -> Tuple[
         Dict[
@@ -546,6 +694,7 @@ class ServerConnection:
             Union[
                 List[Any],
                 "pandas.DataFrame",
+                "pyarrow.Table",
                 SnowflakeCursor,
                 Iterator["pandas.DataFrame"],
                 str,
@@ -556,6 +705,21 @@ class ServerConnection:
         action_id = plan.session._generate_new_action_id()
         # potentially optimize the query using CTEs
         plan = plan.replace_repeated_subquery_with_cte()
+        result_cache = plan.session._result_cache
+        cache_key = None
+        if (
+            result_cache is not None
+            and block
+            and not to_iter
+            and not to_arrow
+            and all(is_cacheable_query(q) for q in plan.queries)
+        ):
+            cache_key = result_cache.get_key(
+                plan.queries, to_pandas, self._get_current_context()
+            )
+            cached = result_cache.get(cache_key)
+            if cached is not None:
+                return cached
         result, result_meta = None, None
         try:
             placeholders = {}
@@ -599,19 +763,37 @@ class ServerConnection:
                 if action_id < plan.session._last_canceled_id:
                     raise SnowparkClientExceptionMessages.SERVER_QUERY_IS_CANCELLED()
             else:
-                for i, query in enumerate(plan.queries):
-                    if isinstance(query, BatchInsertQuery):
+                num_queries = len(plan.queries)
+                first_query_index = 0
+                if num_queries > 2 and self._can_run_queries_concurrently(
+                    plan.queries[:-1], plan.session._max_concurrent_queries, **kwargs
+                ):
+                    placeholders = self._run_queries_concurrently(
+                        plan.queries[:-1],
+                        plan.session._max_concurrent_queries,
+                        log_on_exception=log_on_exception,
+                        **kwargs,
+                    )
+                    if action_id < plan.session._last_canceled_id:
+                        raise SnowparkClientExceptionMessages.SERVER_QUERY_IS_CANCELLED()
+                    first_query_index = num_queries - 1
+                for i in range(first_query_index, num_queries):
+                    query = plan.queries[i]
+                    if isinstance(query, BulkUploadQuery):
+                        self.run_bulk_upload(query, **kwargs)
+                    elif isinstance(query, BatchInsertQuery):
                         self.run_batch_insert(query.sql, query.rows, **kwargs)
                     else:
-                        is_last = i == len(plan.queries) - 1 and not block
+                        is_last = i == num_queries - 1 and not block
                         final_query = query.sql
                         for holder, id_ in placeholders.items():
                             final_query = final_query.replace(holder, id_)
                         result = self.run_query(
                             final_query,
                             to_pandas,
-                            to_iter and (i == len(plan.queries) - 1),
+                            to_iter and (i == num_queries - 1),
                             is_ddl_on_temp_object=query.is_ddl_on_temp_object,
+                            to_arrow=to_arrow and (i == num_queries - 1),
                             block=not is_last,
                             data_type=data_type,
                             async_job_plan=plan,
@@ -642,8 +824,102 @@ class ServerConnection:
         if result is None:
             raise SnowparkClientExceptionMessages.SQL_LAST_QUERY_RETURN_RESULTSET()
 
+        if cache_key is not None:
+            result_cache.put(
+                cache_key,
+                "\n".join(q.sql for q in plan.queries),
+                result,
+                result_meta,
+            )
         return result, result_meta
 
+    @staticmethod
+    def _can_run_queries_concurrently(
+        queries: List[Query], max_concurrent_queries: int, **kwargs
+    ) -> bool:
+        if max_concurrent_queries <= 1:
+            return False
+        # run_batch_insert sets the query tag of the Snowflake session during the batch insertion,
+        # which would also tag the queries executed concurrently
+        statement_params = kwargs.get("_statement_params")
+        return not (
+            statement_params
+            and "QUERY_TAG" in statement_params
+            and any(
+                isinstance(q, BatchInsertQuery) and not isinstance(q, BulkUploadQuery)
+                for q in queries
+            )
+        )
+
+    def _run_queries_concurrently(
+        self, queries: List[Query], max_concurrent_queries: int, **kwargs
+    ) -> Dict[str, str]:
+        """Executes the queries of a plan with at most ``max_concurrent_queries`` queries running at
+        the same time. A query is submitted as soon as all queries it depends on finish, see
+        :func:`get_query_dependencies`. Returns the query ids of the executed queries, keyed by their
+        query id place holders."""
+        distinct_queries, dependencies = get_query_dependencies(queries)
+        placeholders = {}
+        pending = list(range(len(distinct_queries)))
+        finished = set()
+        running = {}
+        with ThreadPoolExecutor(max_workers=max_concurrent_queries) as executor:
+            while pending or running:
+                for i in [i for i in pending if dependencies[i] <= finished]:
+                    if len(running) == max_concurrent_queries:
+                        break
+                    pending.remove(i)
+                    future = executor.submit(
+                        self._run_query_with_new_cursor,
+                        distinct_queries[i],
+                        dict(placeholders),
+                        **kwargs,
+                    )
+                    running[future] = i
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    # raises the exception of a failed query, after the running queries finish
+                    query_id = future.result()
+                    if query_id is not None:
+                        placeholders[
+                            distinct_queries[i].query_id_place_holder
+                        ] = query_id
+                    finished.add(i)
+        return placeholders
+
+    @contextmanager
+    def _with_new_cursor(self) -> Iterator["ServerConnection"]:
+        """Returns a copy of this connection with its own cursor, which is closed on exit.
+        A cursor can't execute queries concurrently, but the cursors of a connection can."""
+        connection = copy.copy(self)
+        connection._cursor = self._conn.cursor()
+        try:
+            yield connection
+        finally:
+            connection._cursor.close()
+
+    def _run_query_with_new_cursor(
+        self, query: Query, placeholders: Dict[str, str], **kwargs
+    ) -> Optional[str]:
+        with self._with_new_cursor() as connection:
+            if isinstance(query, BulkUploadQuery):
+                connection.run_bulk_upload(query, **kwargs)
+                return None
+            if isinstance(query, BatchInsertQuery):
+                connection.run_batch_insert(query.sql, query.rows, **kwargs)
+                return None
+            final_query = query.sql
+            for holder, id_ in placeholders.items():
+                final_query = final_query.replace(holder, id_)
+            result = connection.run_query(
+                final_query,
+                is_ddl_on_temp_object=query.is_ddl_on_temp_object,
+                params=query.params,
+                **kwargs,
+            )
+            return result["sfqid"]
+
     def get_result_and_metadata(
         self, plan: SnowflakePlan, **kwargs
     ) -> Tuple[List[Row], List[Attribute]]:
@@ -682,6 +958,17 @@ class ServerConnection:
             self.execute_and_notify_query_listener("alter session unset query_tag")
         logger.debug("Execute batch insertion query %s", query)
 
+    def run_bulk_upload(self, query: BulkUploadQuery, **kwargs) -> None:
+        input_stream = _rows_to_parquet_stream(query.rows, query.attributes)
+        self.upload_stream(
+            input_stream,
+            query.stage_location,
+            query.file_name,
+            compress_data=False,
+            overwrite=True,
+        )
+        logger.debug("Execute bulk upload query %s", query.sql)
+
     def _get_client_side_session_parameter(self, name: str, default_value: Any) -> Any:
         """It doesn't go to Snowflake to retrieve the session parameter.
         Use this only when you know the Snowflake session parameter is sent to the client when a session/connection is created.
@@ -693,6 +980,49 @@ class ServerConnection:
         )
 
 
+def _get_arrow_type(datatype: DataType) -> "pyarrow.DataType":
+    if isinstance(datatype, _IntegralType):
+        return pyarrow.int64()
+    if isinstance(datatype, _FractionalType):
+        return pyarrow.float64()
+    if isinstance(datatype, DecimalType):
+        return pyarrow.decimal128(datatype.precision, datatype.scale)
+    if isinstance(datatype, BooleanType):
+        return pyarrow.bool_()
+    if isinstance(datatype, BinaryType):
+        return pyarrow.binary()
+    # create_dataframe already converts the values of other types to strings
+    return pyarrow.string()
+
+
+def _rows_to_parquet_stream(rows: List[Row], attributes: List[Attribute]) -> IO[bytes]:
+    """Serializes the rows of a local relation to an in-memory Parquet file, whose column names are the
+    unquoted names of ``attributes``."""
+    import pyarrow.parquet as pq
+
+    columns = list(zip(*rows)) if rows else [() for _ in attributes]
+    arrays = []
+    for attr, values in zip(attributes, columns):
+        try:
+            array = pyarrow.array(values, type=_get_arrow_type(attr.datatype))
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            # e.g., a float value in a column of integers, Snowflake casts the strings
+            # to the column type when copying the file into the table
+            array = pyarrow.array(
+                [None if v is None else str(v) for v in values],
+                type=pyarrow.string(),
+            )
+        arrays.append(array)
+    table = pyarrow.Table.from_arrays(
+        arrays,
+        names=[unquote_if_quoted(attr.name) for attr in attributes],
+    )
+    input_stream = io.BytesIO()
+    pq.write_table(table, input_stream)
+    input_stream.seek(0)
+    return input_stream
+
+
 def _fix_pandas_df_fixed_type(
     pd_df: "pandas.DataFrame", results_cursor: SnowflakeCursor
 ) -> "pandas.DataFrame":
@@ -132,23 +132,29 @@ def safe_telemetry(func):
 
 
 # Action telemetry decorator for DataFrame class
+def send_df_collect_telemetry(df, func_name: str, sfqids: List[str]) -> None:
+    plan = df._select_statement or df._plan
+    api_calls = [
+        *plan.api_calls,
+        {TelemetryField.NAME.value: f"DataFrame.{func_name}"},
+    ]
+    # The first api call will indicate whether sql simplifier is enabled.
+    api_calls[0]["sql_simplifier_enabled"] = df._session.sql_simplifier_enabled
+    df._session._conn._telemetry_client.send_function_usage_telemetry(
+        f"action_{func_name}",
+        TelemetryField.FUNC_CAT_ACTION.value,
+        api_calls=api_calls,
+        sfqids=sfqids,
+    )
+
+
 def df_collect_api_telemetry(func):
     @functools.wraps(func)
     def wrap(*args, **kwargs):
         with args[0]._session.query_history() as query_history:
             result = func(*args, **kwargs)
-        plan = args[0]._select_statement or args[0]._plan
-        api_calls = [
-            *plan.api_calls,
-            {TelemetryField.NAME.value: f"DataFrame.{func.__name__}"},
-        ]
-        # The first api call will indicate whether sql simplifier is enabled.
-        api_calls[0]["sql_simplifier_enabled"] = args[0]._session.sql_simplifier_enabled
-        args[0]._session._conn._telemetry_client.send_function_usage_telemetry(
-            f"action_{func.__name__}",
-            TelemetryField.FUNC_CAT_ACTION.value,
-            api_calls=api_calls,
-            sfqids=[q.query_id for q in query_history.queries],
+        send_df_collect_telemetry(
+            args[0], func.__name__, [q.query_id for q in query_history.queries]
         )
         return result
 
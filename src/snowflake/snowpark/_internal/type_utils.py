@@ -14,6 +14,7 @@ import re
 import sys
 import typing  # noqa: F401
 from array import array
+from functools import reduce
 from typing import (  # noqa: F401
     TYPE_CHECKING,
     Any,
@@ -23,6 +24,7 @@ from typing import (  # noqa: F401
     List,
     NewType,
     Optional,
+    Sequence,
     Tuple,
     Type,
     Union,
@@ -411,6 +413,90 @@ def infer_schema(
     return StructType(fields)
 
 
+def _infer_column_type(name: str, values: Sequence[Any]) -> Tuple[DataType, bool]:
+    """Returns the merged type of the values of a column and whether the column has None.
+    The type of a scalar only depends on its Python type (and whether a datetime has a timezone),
+    so it's only inferred and merged once per Python type."""
+    datatype = NullType()
+    nullable = False
+    seen_keys = set()
+    for value in values:
+        if value is None:
+            nullable = True
+            continue
+        value_type = type(value)
+        if value_type in PYTHON_TO_SNOW_TYPE_MAPPINGS:
+            key = (
+                (value_type, value.tzinfo is None)
+                if value_type is datetime.datetime
+                else value_type
+            )
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+        try:
+            value_datatype = infer_type(value)
+        except TypeError as e:
+            raise TypeError(f"Unable to infer the type of the field {name}.") from e
+        datatype = merge_type(datatype, value_datatype, name=f"field {name}")
+    return datatype, nullable
+
+
+def infer_schema_from_data(
+    data: Union[List, Tuple],
+    names: Optional[List] = None,
+    sample_size: Optional[int] = None,
+) -> StructType:
+    """Infers the schema of local data, which is the same as merging the result of
+    :func:`infer_schema` for every row, but inferred column by column when every row is a
+    list or tuple with the same number of values, or every row is a single value.
+
+    If ``sample_size`` is set and there are more rows, the schema is only inferred from
+    ``sample_size`` rows evenly spaced in ``data``, and every column is nullable.
+    """
+    if sample_size is not None and len(data) > sample_size:
+        step = -(-len(data) // max(sample_size, 1))
+        data = data[::step]
+        schema = infer_schema_from_data(data, names)
+        return StructType(
+            [StructField(f.name, f.datatype, True) for f in schema.fields]
+        )
+
+    def is_plain_row(row: Any) -> bool:
+        return (
+            isinstance(row, (list, tuple))
+            and len(row) > 0
+            and getattr(row, "_fields", None) is None
+        )
+
+    if data and all(is_plain_row(row) for row in data):
+        num_columns = len(data[0])
+        if all(len(row) == num_columns for row in data):
+            if names is None:
+                names = [f"_{i}" for i in range(1, num_columns + 1)]
+            elif len(names) < num_columns:
+                # same as infer_schema, which also extends the given names
+                names.extend(f"_{i}" for i in range(len(names) + 1, num_columns + 1))
+            fields = []
+            for name, values in zip(names, zip(*data)):
+                datatype, nullable = _infer_column_type(name, values)
+                fields.append(StructField(name, datatype, nullable))
+            return StructType(fields)
+    elif data and all(
+        row is None
+        or (
+            not isinstance(row, (list, tuple, dict))
+            and isinstance(row, VALID_PYTHON_TYPES_FOR_LITERAL_VALUE)
+        )
+        for row in data
+    ):
+        name = names[0] if names else "_1"
+        datatype, nullable = _infer_column_type(name, data)
+        return StructType([StructField(name, datatype, nullable)])
+
+    return reduce(merge_type, (infer_schema(row, names) for row in data))
+
+
 def merge_type(a: DataType, b: DataType, name: Optional[str] = None) -> DataType:
     # null type
     if isinstance(a, NullType):
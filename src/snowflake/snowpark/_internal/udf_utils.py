@@ -2,12 +2,16 @@
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
 import collections.abc
+import hashlib
 import io
 import os
 import pickle
 import sys
+import threading
 import typing
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from types import ModuleType
 from typing import (
@@ -75,6 +79,9 @@ _DEFAULT_HANDLER_NAME = "compute"
 # because zip compression ratio is quite high.
 _MAX_INLINE_CLOSURE_SIZE_BYTES = 8192
 
+# The maximum total size of the handler code cached by generate_python_code.
+GENERATED_CODE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 # Every table function handler class must define the process method.
 TABLE_FUNCTION_PROCESS_METHOD = "process"
 TABLE_FUNCTION_END_PARTITION_METHOD = "end_partition"
@@ -575,6 +582,7 @@ def cleanup_failed_permanent_registration(
                 "Removing Snowpark uploaded file: %s",
                 upload_file_stage_location,
             )
+            session._import_cache.remove_uploaded_code(upload_file_stage_location)
             session._run_query(f"REMOVE {upload_file_stage_location}")
             logger.info(
                 "Finished removing Snowpark uploaded file: %s",
@@ -603,6 +611,48 @@ def pickle_function(func: Callable) -> bytes:
         raise pickle.PicklingError(f"{str(ex)}: {failure_hint}")
 
 
+class GeneratedCodeCache:
+    """
+    An LRU cache of the handler code generated by :func:`generate_python_code`, keyed by
+    the checksum of the pickled function and the registration options, so registering the same
+    function again (e.g., with another name or in another session) doesn't generate its handler
+    code again. At most ``max_bytes`` characters of code are kept.
+    """
+
+    def __init__(self, max_bytes: int = GENERATED_CODE_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            code = self._entries.get(key)
+            if code is not None:
+                self._entries.move_to_end(key)
+            return code
+
+    def put(self, key: str, code: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._size -= len(self._entries.pop(key))
+            if len(code) > self.max_bytes:
+                return
+            self._entries[key] = code
+            self._size += len(code)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_generated_code_cache = GeneratedCodeCache()
+
+
 def generate_python_code(
     func: Callable,
     arg_names: List[str],
@@ -658,6 +708,45 @@ def generate_python_code(
                     annotated_func.__annotations__ = annotation
     else:
         pickled_func = pickle_function(func)
+
+    # the generated code only depends on the pickled function and the registration options
+    cache_key = repr(
+        (
+            hashlib.sha256(pickled_func).hexdigest(),
+            arg_names,
+            object_type.value,
+            is_pandas_udf,
+            is_dataframe_input,
+            max_batch_size,
+            source_code_display,
+        )
+    )
+    code = _generated_code_cache.get(cache_key)
+    if code is None:
+        code = _generate_python_code_from_pickle(
+            func,
+            pickled_func,
+            arg_names,
+            object_type,
+            is_pandas_udf,
+            is_dataframe_input,
+            max_batch_size,
+            source_code_display,
+        )
+        _generated_code_cache.put(cache_key, code)
+    return code
+
+
+def _generate_python_code_from_pickle(
+    func: Callable,
+    pickled_func: bytes,
+    arg_names: List[str],
+    object_type: TempObjectType,
+    is_pandas_udf: bool,
+    is_dataframe_input: bool,
+    max_batch_size: Optional[int],
+    source_code_display: bool,
+) -> str:
     args = ",".join(arg_names)
 
     try:
@@ -901,7 +990,31 @@ def resolve_imports_and_packages(
             source_code_display=source_code_display,
         )
         if not force_inline_code and len(code) > _MAX_INLINE_CLOSURE_SIZE_BYTES:
-            dest_prefix = get_udf_upload_prefix(udf_name)
+            code_checksum = hashlib.sha256(code.encode("utf-8")).hexdigest()
+            context = session._get_import_cache_context()
+            # A permanent object only reuses handler code uploaded under its own
+            # prefix, so it never depends on a file owned by another object.
+            # Temporary objects share the session stage, whose files are kept
+            # for the lifetime of the session, so they can reuse any upload there.
+            uploaded_code_location = (
+                f"{upload_and_import_stage}/{dest_prefix}"
+                if is_permanent
+                else upload_and_import_stage
+            )
+            uploaded_code = session._import_cache.get_uploaded_code(
+                code_checksum, uploaded_code_location, context
+            )
+        else:
+            uploaded_code = None
+        if uploaded_code is not None:
+            # the same handler code was uploaded to this stage by a previous registration
+            uploaded_file_stage_location, udf_file_name_base = uploaded_code
+            all_urls.append(uploaded_file_stage_location)
+            # nothing is uploaded, so nothing is removed if the registration fails
+            upload_file_stage_location = None
+            inline_code = None
+            handler = f"{udf_file_name_base}.{_DEFAULT_HANDLER_NAME}"
+        elif not force_inline_code and len(code) > _MAX_INLINE_CLOSURE_SIZE_BYTES:
             upload_file_stage_location = normalize_remote_file_or_dir(
                 f"{upload_and_import_stage}/{dest_prefix}/{udf_file_name}"
             )
@@ -923,6 +1036,13 @@ def resolve_imports_and_packages(
                     is_in_udf=True,
                     skip_upload_on_content_match=skip_upload_on_content_match,
                 )
+            session._import_cache.add_uploaded_code(
+                code_checksum,
+                uploaded_code_location,
+                upload_file_stage_location,
+                udf_file_name_base,
+                context,
+            )
             all_urls.append(upload_file_stage_location)
             inline_code = None
             handler = f"{udf_file_name_base}.{_DEFAULT_HANDLER_NAME}"
@@ -1069,6 +1189,69 @@ HANDLER='{handler}'{execute_as_sql}
     )
 
 
+def register_many(
+    session: "snowflake.snowpark.Session",
+    registration_cls: type,
+    registrations: Iterable[Union[Any, Dict[str, Any]]],
+    max_workers: int,
+    default_kwargs: Dict[str, Any],
+) -> List[Any]:
+    """Registers UDFs, UDTFs, UDAFs or stored procedures with the ``register`` method of
+    ``registration_cls``. A registration is either the function or handler to register, or a
+    dict of the keyword arguments of ``register``, which override ``default_kwargs``.
+
+    The first registration runs alone, so the session stage is created and the session-level
+    imports are uploaded once, and the versions of all UDF-level packages are queried once.
+    The other registrations run in ``max_workers`` threads, each with its own cursor.
+    """
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError(
+            f"max_workers must be a positive integer, but got {max_workers}"
+        )
+    calls = [
+        ((), {**default_kwargs, **registration})
+        if isinstance(registration, dict)
+        else ((registration,), default_kwargs)
+        for registration in registrations
+    ]
+    if not calls:
+        return []
+
+    package_names = set()
+    for _, kwargs in calls:
+        if kwargs.get("packages"):
+            package_names.update(
+                package_name
+                for package_name, _, _ in session._parse_packages(
+                    kwargs["packages"]
+                ).values()
+            )
+    if package_names:
+        session._get_available_versions_for_packages(
+            sorted(package_names), session._get_package_table()
+        )
+
+    def register(args: Tuple, kwargs: Dict[str, Any]) -> Any:
+        with session._with_new_cursor() as worker_session:
+            return registration_cls(worker_session).register(*args, **kwargs)
+
+    first_args, first_kwargs = calls[0]
+    results = [registration_cls(session).register(*first_args, **first_kwargs)]
+    if max_workers == 1:
+        results.extend(
+            registration_cls(session).register(*args, **kwargs)
+            for args, kwargs in calls[1:]
+        )
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(register, args, kwargs) for args, kwargs in calls[1:]
+            ]
+        # raises the exception of the first failed registration, after all registrations finish
+        results.extend(future.result() for future in futures)
+    return results
+
+
 def generate_anonymous_python_sp_sql(
     return_type: DataType,
     input_args: List[UDFColumn],
@@ -13,13 +13,16 @@ import io
 import logging
 import os
 import platform
+import queue
 import random
 import re
 import string
+import threading
 import traceback
 import zipfile
 from enum import Enum
 from json import JSONEncoder
+from operator import itemgetter
 from random import choice
 from typing import (
     IO,
@@ -33,16 +36,17 @@ from typing import (
     Optional,
     Tuple,
     Type,
+    TypeVar,
     Union,
 )
 
 import snowflake.snowpark
 from snowflake.connector.cursor import ResultMetadata, SnowflakeCursor
 from snowflake.connector.description import OPERATING_SYSTEM, PLATFORM
-from snowflake.connector.options import pandas
+from snowflake.connector.options import pandas, pyarrow
 from snowflake.connector.version import VERSION as connector_version
 from snowflake.snowpark._internal.error_message import SnowparkClientExceptionMessages
-from snowflake.snowpark.row import Row
+from snowflake.snowpark.row import Row, RowSet
 from snowflake.snowpark.version import VERSION as snowpark_version
 
 if TYPE_CHECKING:
@@ -51,6 +55,8 @@ if TYPE_CHECKING:
     except ImportError:
         ResultMetadataV2 = ResultMetadata
 
+T = TypeVar("T")
+
 STAGE_PREFIX = "@"
 
 # Scala uses 3 but this can be larger. Consider allowing users to configure it.
@@ -556,24 +562,26 @@ def column_to_bool(col_):
     return bool(col_)
 
 
+def _get_row_fields(
+    result_meta: Optional[Union[List[ResultMetadata], List["ResultMetadataV2"]]],
+    case_sensitive: bool,
+) -> Optional[List[str]]:
+    # the field names of the rows of a result, which are shared by all rows
+    if not result_meta:
+        return None
+    return list(
+        Row._builder.build(*[col.name for col in result_meta])
+        .set_case_sensitive(case_sensitive)
+        .to_row()
+    )
+
+
 def result_set_to_rows(
     result_set: List[Any],
     result_meta: Optional[Union[List[ResultMetadata], List["ResultMetadataV2"]]] = None,
     case_sensitive: bool = True,
 ) -> List[Row]:
-    col_names = [col.name for col in result_meta] if result_meta else None
-    rows = []
-    row_struct = Row
-    if col_names:
-        row_struct = (
-            Row._builder.build(*col_names).set_case_sensitive(case_sensitive).to_row()
-        )
-    for data in result_set:
-        if data is None:
-            raise ValueError("Result returned from Python connector is None")
-        row = row_struct(*data)
-        rows.append(row)
-    return rows
+    return list(result_set_to_iter(result_set, result_meta, case_sensitive))
 
 
 def result_set_to_iter(
@@ -581,17 +589,35 @@ def result_set_to_iter(
     result_meta: Optional[List[ResultMetadata]] = None,
     case_sensitive: bool = True,
 ) -> Iterator[Row]:
-    col_names = [col.name for col in result_meta] if result_meta else None
-    row_struct = Row
-    if col_names:
-        row_struct = (
-            Row._builder.build(*col_names).set_case_sensitive(case_sensitive).to_row()
-        )
+    fields = _get_row_fields(result_meta, case_sensitive)
+    has_duplicates = fields is not None and len(set(fields)) != len(fields)
     for data in result_set:
         if data is None:
             raise ValueError("Result returned from Python connector is None")
-        row = row_struct(*data)
-        yield row
+        if fields is None:
+            yield Row(*data)
+        else:
+            yield Row._from_values_and_fields(
+                data, fields, has_duplicates, case_sensitive
+            )
+
+
+def result_set_to_row_set(
+    result_set: List[Any],
+    result_meta: Optional[Union[List[ResultMetadata], List["ResultMetadataV2"]]] = None,
+    case_sensitive: bool = True,
+) -> RowSet:
+    if None in result_set:
+        raise ValueError("Result returned from Python connector is None")
+    fields = _get_row_fields(result_meta, case_sensitive)
+    if fields is not None:
+        num_columns = len(fields)
+    else:
+        num_columns = len(result_set[0]) if result_set else 0
+    # itemgetter doesn't allocate any objects, unlike zip(*result_set), which would trigger
+    # garbage collections scanning the whole result set
+    columns = [list(map(itemgetter(i), result_set)) for i in range(num_columns)]
+    return RowSet(columns, fields, case_sensitive)
 
 
 class PythonObjJSONEncoder(JSONEncoder):
@@ -739,6 +765,59 @@ def check_is_pandas_dataframe_in_to_pandas(result: Any) -> None:
         )
 
 
+def prefetch_iterator(iterator: Iterator[T], max_prefetched: int) -> Iterator[T]:
+    """Returns an iterator over the items of ``iterator``, which are fetched by a background
+    thread while the caller processes the previous items. At most ``max_prefetched`` items are
+    fetched ahead of the caller, so the memory used doesn't depend on the number of items."""
+    if max_prefetched <= 0:
+        yield from iterator
+        return
+
+    items = queue.Queue(maxsize=max_prefetched)
+    stopped = threading.Event()
+    end = object()
+
+    def put(item: Any) -> bool:
+        # returns False if the caller stopped iterating
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def fetch() -> None:
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+            put((end, None))
+        except BaseException as ex:
+            put((end, ex))
+
+    threading.Thread(target=fetch, daemon=True).start()
+    try:
+        while True:
+            item, ex = items.get()
+            if item is end:
+                if ex is not None:
+                    raise ex
+                return
+            yield item
+    finally:
+        stopped.set()
+
+
+def check_is_arrow_table_in_to_arrow(result: Any) -> None:
+    if not isinstance(result, pyarrow.Table):
+        raise SnowparkClientExceptionMessages.SERVER_FAILED_FETCH_ARROW(
+            "to_arrow() did not return a pyarrow Table. "
+            "If you use session.sql(...).to_arrow(), the input query can only be a "
+            "SELECT statement."
+        )
+
+
 def get_copy_into_table_options(
     options: Dict[str, Any]
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
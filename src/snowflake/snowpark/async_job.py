@@ -2,17 +2,39 @@
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
 
+import asyncio
+import functools
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from enum import Enum
 from logging import getLogger
-from typing import TYPE_CHECKING, Iterator, List, Literal, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import snowflake.snowpark
 from snowflake.connector.errors import DatabaseError
 from snowflake.connector.options import pandas
 from snowflake.snowpark._internal.analyzer.analyzer_utils import result_scan_statement
-from snowflake.snowpark._internal.analyzer.snowflake_plan import Query
+from snowflake.snowpark._internal.analyzer.snowflake_plan import Query, SnowflakePlan
+from snowflake.snowpark._internal.error_message import SnowparkClientExceptionMessages
 from snowflake.snowpark._internal.utils import (
+    SKIP_LEVELS_TWO,
     check_is_pandas_dataframe_in_to_pandas,
+    create_or_update_statement_params_with_query_tag,
     is_in_stored_procedure,
     result_set_to_iter,
     result_set_to_rows,
@@ -22,11 +44,26 @@ from snowflake.snowpark.functions import col
 from snowflake.snowpark.row import Row
 
 if TYPE_CHECKING:
+    import snowflake.snowpark._internal.server_connection
     import snowflake.snowpark.dataframe
     import snowflake.snowpark.session
 
+# Python 3.8 needs to use typing.Iterable because collections.abc.Iterable is not subscriptable
+# Python 3.9 can use both
+# Python 3.10 needs to use collections.abc.Iterable because typing.Iterable is removed
+if sys.version_info <= (3, 9):
+    from typing import Iterable
+else:
+    from collections.abc import Iterable
+
 _logger = getLogger(__name__)
 
+# the interval between two rounds of status checks of asynchronous queries grows exponentially
+# from the initial interval to the max interval
+_POLL_INITIAL_INTERVAL_SECONDS = 0.1
+_POLL_MAX_INTERVAL_SECONDS = 5.0
+_MAX_STATUS_CHECK_WORKERS = 16
+
 
 class _AsyncResultType(Enum):
     ROW = "row"
@@ -193,6 +230,85 @@ class AsyncJob:
         self._inserted = False
         self._updated = False
         self._deleted = False
+        self._is_done = False
+        # called after the result is fetched, e.g., to invalidate the cached results of a written table
+        self._result_callbacks: List[Callable[[], None]] = []
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        """Waits for the query without blocking the event loop and returns the same result as
+        :meth:`result`, so the query can be awaited in a coroutine, e.g., with ``asyncio.gather``."""
+        return self._wait_and_get_result().__await__()
+
+    async def _wait_and_get_result(self) -> Any:
+        loop = asyncio.get_running_loop()
+        interval = _POLL_INITIAL_INTERVAL_SECONDS
+        # the status checks and the result fetching send requests, so they run in the default executor
+        while not await loop.run_in_executor(None, self.is_done):
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, _POLL_MAX_INTERVAL_SECONDS)
+        return await loop.run_in_executor(None, self.result)
+
+    @staticmethod
+    def wait_all(jobs: Iterable["AsyncJob"], timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the queries of all given jobs finish, or until ``timeout`` seconds passed, and returns
+        whether all queries have finished. See :meth:`as_completed` for how the status of the queries is checked.
+
+        Example::
+
+            >>> jobs = [session.sql(f"select {i}").collect_nowait() for i in range(3)]
+            >>> AsyncJob.wait_all(jobs, timeout=60)
+            True
+            >>> [job.result()[0][0] for job in jobs]
+            [0, 1, 2]
+        """
+        try:
+            for _ in AsyncJob.as_completed(jobs, timeout):
+                pass
+        except TimeoutError:
+            return False
+        return True
+
+    @staticmethod
+    def as_completed(
+        jobs: Iterable["AsyncJob"], timeout: Optional[float] = None
+    ) -> Iterator["AsyncJob"]:
+        """
+        Returns an iterator that yields the given jobs as their queries finish. Raises a ``TimeoutError``
+        if some queries haven't finished after ``timeout`` seconds.
+
+        The status of the queries of all unfinished jobs is checked concurrently in each round, and the
+        interval between two rounds grows exponentially while no query finishes. The queries that are
+        already known to be finished (e.g., by :meth:`is_done`) are not checked again.
+
+        Example::
+
+            >>> jobs = [session.sql(f"select {i}").collect_nowait() for i in range(3)]
+            >>> sorted(job.result()[0][0] for job in AsyncJob.as_completed(jobs))
+            [0, 1, 2]
+        """
+        pending = list({id(job): job for job in jobs}.values())
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = _POLL_INITIAL_INTERVAL_SECONDS
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(_MAX_STATUS_CHECK_WORKERS, len(pending)))
+        ) as executor:
+            while pending:
+                done = list(executor.map(lambda job: job.is_done(), pending))
+                finished = [job for job, is_done in zip(pending, done) if is_done]
+                pending = [job for job, is_done in zip(pending, done) if not is_done]
+                yield from finished
+                if not pending:
+                    break
+                if finished:
+                    interval = _POLL_INITIAL_INTERVAL_SECONDS
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(
+                        f"{len(pending)} queries haven't finished after {timeout} seconds"
+                    )
+                time.sleep(interval if remaining is None else min(interval, remaining))
+                interval = min(interval * 2, _POLL_MAX_INTERVAL_SECONDS)
 
     @property
     def query(self) -> Optional[str]:
@@ -237,9 +353,15 @@ class AsyncJob:
         Checks the status of the query associated with this instance and returns a bool value
         indicating whether the query has finished.
         """
-        status = self._session._conn._conn.get_query_status(self.query_id)
-        is_running = self._session._conn._conn.is_still_running(status)
-        return not is_running
+        if not self._is_done:
+            connection = self._session._conn._conn
+            # the connector keeps the IDs of the finished queries it executed asynchronously
+            if self.query_id in getattr(connection, "_done_async_sfqids", {}):
+                self._is_done = True
+            else:
+                status = connection.get_query_status(self.query_id)
+                self._is_done = not connection.is_still_running(status)
+        return self._is_done
 
     def cancel(self) -> None:
         """Cancels the query associated with this instance."""
@@ -398,4 +520,286 @@ class AsyncJob:
                 log_on_exception=self._log_on_exception,
                 **self._parameters,
             )
+        for callback in self._result_callbacks:
+            callback()
         return result
+
+
+class AsyncJobGroup:
+    """
+    Writes the data of several DataFrames to tables or stage locations concurrently, with at most
+    ``max_in_flight`` writes running at the same time. Each write is submitted as an :class:`AsyncJob`
+    with its own cursor as soon as one of the running writes finishes, so the writes don't wait for
+    each other to be submitted. The plans of the writes are resolved when they are added to the group.
+
+    :class:`AsyncJobGroup` can be created by :meth:`Session.create_async_job_group`. Its
+    :meth:`save_as_table` and :meth:`copy_into_location` methods are the same as
+    :meth:`DataFrameWriter.save_as_table` and :meth:`DataFrameWriter.copy_into_location` and return a
+    ``concurrent.futures.Future`` of the result of the write. :meth:`result` waits for all writes and
+    raises a :class:`~snowflake.snowpark.exceptions.SnowparkAsyncJobGroupException` with the errors of
+    all failed writes, if any.
+
+    Example::
+
+        >>> df1 = session.create_dataframe([[1, 2], [3, 4]], schema=["a", "b"])
+        >>> df2 = session.create_dataframe([[5, 6]], schema=["a", "b"])
+        >>> with session.create_async_job_group(max_in_flight=2) as group:
+        ...     _ = group.save_as_table(df1, "my_table1", mode="overwrite", table_type="temporary")
+        ...     _ = group.save_as_table(df2, "my_table2", mode="overwrite", table_type="temporary")
+        >>> group.result()
+        [None, None]
+        >>> group.progress
+        {'total': 2, 'pending': 0, 'running': 0, 'succeeded': 2, 'failed': 0, 'cancelled': 0}
+        >>> session.table("my_table2").collect()
+        [Row(A=5, B=6)]
+
+    Note:
+        Leaving the ``with`` block waits for all writes to finish, but doesn't raise their errors.
+        If an exception is raised in the ``with`` block, the writes are cancelled.
+    """
+
+    def __init__(
+        self, session: "snowflake.snowpark.session.Session", max_in_flight: int = 8
+    ) -> None:
+        if not isinstance(max_in_flight, int) or max_in_flight < 1:
+            raise ValueError(
+                f"max_in_flight must be a positive integer, but got {max_in_flight}"
+            )
+        self._session = session
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        self._futures: List[Future] = []
+        # the jobs of the running writes, keyed by their indices
+        self._running_jobs: Dict[int, AsyncJob] = {}
+        self._cancelled = False
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "AsyncJobGroup":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is not None:
+            self.cancel()
+        self._executor.shutdown(wait=True)
+
+    @property
+    def futures(self) -> List[Future]:
+        """The futures of the results of the writes, in the order they were added to the group."""
+        with self._lock:
+            return list(self._futures)
+
+    @property
+    def progress(self) -> Dict[str, int]:
+        """Returns the number of writes in the group, and the number of writes that are pending,
+        running, succeeded, failed and cancelled."""
+        counts = dict.fromkeys(
+            ("total", "pending", "running", "succeeded", "failed", "cancelled"), 0
+        )
+        for future in self.futures:
+            counts["total"] += 1
+            if future.cancelled():
+                counts["cancelled"] += 1
+            elif not future.done():
+                counts["running" if future.running() else "pending"] += 1
+            elif future.exception() is not None:
+                counts["failed"] += 1
+            else:
+                counts["succeeded"] += 1
+        return counts
+
+    def save_as_table(
+        self,
+        dataframe: "snowflake.snowpark.dataframe.DataFrame",
+        table_name: Union[str, Iterable[str]],
+        *,
+        mode: Optional[str] = None,
+        column_order: str = "index",
+        table_type: Literal["", "temp", "temporary", "transient"] = "",
+        clustering_keys: Optional[Iterable["snowflake.snowpark.Column"]] = None,
+        statement_params: Optional[Dict[str, str]] = None,
+    ) -> Future:
+        """Adds a write of ``dataframe`` to a table to the group. See :meth:`DataFrameWriter.save_as_table`
+        for the arguments.
+
+        Returns:
+            A ``concurrent.futures.Future`` of ``None``.
+        """
+        plan = dataframe.write._get_save_as_table_plan(
+            table_name,
+            mode=mode,
+            column_order=column_order,
+            table_type=table_type,
+            clustering_keys=clustering_keys,
+        )
+        future = self._submit(
+            plan,
+            statement_params or dataframe._statement_params,
+            _AsyncResultType.NO_RESULT,
+        )
+        # a query run while the table is written may have cached the previous results
+        future.add_done_callback(
+            lambda _: dataframe._session._invalidate_result_cache(table_name)
+        )
+        return future
+
+    def copy_into_location(
+        self,
+        dataframe: "snowflake.snowpark.dataframe.DataFrame",
+        location: str,
+        *,
+        partition_by: Optional[Union["snowflake.snowpark.Column", str]] = None,
+        file_format_name: Optional[str] = None,
+        file_format_type: Optional[str] = None,
+        format_type_options: Optional[Dict[str, str]] = None,
+        header: bool = False,
+        statement_params: Optional[Dict[str, str]] = None,
+        **copy_options: Optional[str],
+    ) -> Future:
+        """Adds an unloading of ``dataframe`` into files in a stage location to the group. See
+        :meth:`DataFrameWriter.copy_into_location` for the arguments.
+
+        Returns:
+            A ``concurrent.futures.Future`` of a list of :class:`Row` objects containing unloading results.
+        """
+        df = dataframe.write._get_copy_into_location_dataframe(
+            location,
+            partition_by=partition_by,
+            file_format_name=file_format_name,
+            file_format_type=file_format_type,
+            format_type_options=format_type_options,
+            header=header,
+            **copy_options,
+        )
+        future = self._submit(
+            df._plan,
+            create_or_update_statement_params_with_query_tag(
+                statement_params or dataframe._statement_params,
+                df._session.query_tag,
+                SKIP_LEVELS_TWO,
+            ),
+            _AsyncResultType.ROW,
+        )
+        # a file read while the data is unloaded may have cached the previous schema
+        future.add_done_callback(lambda _: df._session._invalidate_infer_schema_cache())
+        return future
+
+    def is_done(self) -> bool:
+        """Checks whether all writes in the group have finished."""
+        return all(future.done() for future in self.futures)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits until all writes in the group finish, or until ``timeout`` seconds passed.
+        Returns whether all writes have finished."""
+        _, not_done = wait(self.futures, timeout=timeout)
+        return not not_done
+
+    def result(self) -> List[Any]:
+        """Waits until all writes in the group finish, and returns their results in the order they
+        were added to the group. If any write failed or was cancelled, raises a
+        :class:`~snowflake.snowpark.exceptions.SnowparkAsyncJobGroupException` whose ``errors``
+        contain the exceptions of all failed writes, keyed by their indices.
+        """
+        futures = self.futures
+        wait(futures)
+        errors = {}
+        for i, future in enumerate(futures):
+            if future.cancelled():
+                errors[i] = CancelledError()
+            elif future.exception() is not None:
+                errors[i] = future.exception()
+        if errors:
+            raise SnowparkClientExceptionMessages.SERVER_ASYNC_JOB_GROUP_FAILED(
+                errors, len(futures)
+            )
+        return [future.result() for future in futures]
+
+    def cancel(self) -> None:
+        """Cancels the writes that haven't been submitted and the queries of the running writes."""
+        with self._lock:
+            self._cancelled = True
+            for future in self._futures:
+                future.cancel()
+            query_ids = [job.query_id for job in self._running_jobs.values()]
+        for query_id in query_ids:
+            # the cursor of the running job is used to wait for its result in another thread
+            AsyncJob(query_id, None, self._session).cancel()
+
+    def _submit(
+        self,
+        plan: SnowflakePlan,
+        statement_params: Optional[Dict[str, str]],
+        data_type: _AsyncResultType,
+    ) -> Future:
+        with self._lock:
+            if self._cancelled:
+                raise RuntimeError("Can't add a write to a cancelled AsyncJobGroup")
+            future = self._executor.submit(
+                self._execute, len(self._futures), plan, statement_params, data_type
+            )
+            self._futures.append(future)
+        return future
+
+    def _execute(
+        self,
+        index: int,
+        plan: SnowflakePlan,
+        statement_params: Optional[Dict[str, str]],
+        data_type: _AsyncResultType,
+    ) -> Any:
+        with _with_new_cursor(plan) as (connection, plan):
+            job = connection.execute(
+                plan,
+                block=False,
+                data_type=data_type,
+                _statement_params=statement_params,
+            )
+            with self._lock:
+                self._running_jobs[index] = job
+                cancelled = self._cancelled
+            try:
+                if cancelled:
+                    job.cancel()
+                return job.result()
+            finally:
+                with self._lock:
+                    self._running_jobs.pop(index)
+
+
+def _call_when_done(result: Any, callback: Callable[[], None]) -> None:
+    """Calls ``callback`` now if ``result`` is the result of a blocking action, or after the result
+    of the job is fetched if ``result`` is an :class:`AsyncJob`."""
+    if isinstance(result, AsyncJob):
+        result._result_callbacks.append(callback)
+    else:
+        callback()
+
+
+@contextmanager
+def _with_new_cursor(
+    plan: SnowflakePlan,
+) -> Iterator[
+    Tuple[
+        "snowflake.snowpark._internal.server_connection.ServerConnection", SnowflakePlan
+    ]
+]:
+    """Returns a copy of the connection of the session of ``plan`` with its own cursor, and a copy
+    of ``plan`` bound to a session using this connection, because the async job runs its post
+    actions with the cursor of the session of the plan."""
+    with plan.session._with_new_cursor() as worker_session:
+        yield worker_session._conn, plan.with_session(worker_session)
+
+
+async def _execute_and_wait(plan: SnowflakePlan, **kwargs) -> Tuple[AsyncJob, Any]:
+    """Executes ``plan`` as an :class:`AsyncJob` with its own cursor and waits for its result in
+    a coroutine, and returns the job and its result. Only the submission of the queries, the status
+    checks and the result fetching run in the default executor of the event loop, so no thread is
+    blocked while the query is running. The query is cancelled if the coroutine is cancelled."""
+    loop = asyncio.get_running_loop()
+    with _with_new_cursor(plan) as (connection, plan):
+        job = await loop.run_in_executor(
+            None, functools.partial(connection.execute, plan, block=False, **kwargs)
+        )
+        try:
+            return job, await job
+        except asyncio.CancelledError:
+            job.cancel()
+            raise
@@ -91,6 +91,7 @@ from snowflake.snowpark._internal.telemetry import (
     df_api_usage,
     df_collect_api_telemetry,
     df_to_relational_group_df_api_usage,
+    send_df_collect_telemetry,
 )
 from snowflake.snowpark._internal.type_utils import (
     ColumnOrName,
@@ -102,6 +103,7 @@ from snowflake.snowpark._internal.utils import (
     SKIP_LEVELS_THREE,
     SKIP_LEVELS_TWO,
     TempObjectType,
+    check_is_arrow_table_in_to_arrow,
     check_is_pandas_dataframe_in_to_pandas,
     column_to_bool,
     create_or_update_statement_params_with_query_tag,
@@ -115,12 +117,13 @@ from snowflake.snowpark._internal.utils import (
     is_sql_select_statement,
     parse_positional_args_to_list,
     parse_table_name,
+    prefetch_iterator,
     private_preview,
     quote_name,
     random_name_for_temp_object,
     validate_object_name,
 )
-from snowflake.snowpark.async_job import AsyncJob, _AsyncResultType
+from snowflake.snowpark.async_job import AsyncJob, _AsyncResultType, _execute_and_wait
 from snowflake.snowpark.column import Column, _to_col_if_sql_expr, _to_col_if_str
 from snowflake.snowpark.dataframe_analytics_functions import DataFrameAnalyticsFunctions
 from snowflake.snowpark.dataframe_na_functions import DataFrameNaFunctions
@@ -142,7 +145,7 @@ from snowflake.snowpark.functions import (
     to_char,
 )
 from snowflake.snowpark.mock._select_statement import MockSelectStatement
-from snowflake.snowpark.row import Row
+from snowflake.snowpark.row import Row, RowSet
 from snowflake.snowpark.table_function import (
     TableFunctionCall,
     _create_table_function_expression,
@@ -161,6 +164,7 @@ else:
     from collections.abc import Iterable
 
 if TYPE_CHECKING:
+    import pyarrow  # pragma: no cover
     from table import Table  # pragma: no cover
 
 _logger = getLogger(__name__)
@@ -554,7 +558,8 @@ class DataFrame:
         block: bool = True,
         log_on_exception: bool = False,
         case_sensitive: bool = True,
-    ) -> List[Row]:
+        columnar: bool = False,
+    ) -> Union[List[Row], RowSet]:
         ...  # pragma: no cover
 
     @overload
@@ -565,6 +570,7 @@ class DataFrame:
         block: bool = False,
         log_on_exception: bool = False,
         case_sensitive: bool = True,
+        columnar: bool = False,
     ) -> AsyncJob:
         ...  # pragma: no cover
 
@@ -576,7 +582,8 @@ class DataFrame:
         block: bool = True,
         log_on_exception: bool = False,
         case_sensitive: bool = True,
-    ) -> Union[List[Row], AsyncJob]:
+        columnar: bool = False,
+    ) -> Union[List[Row], RowSet, AsyncJob]:
         """Executes the query representing this DataFrame and returns the result as a
         list of :class:`Row` objects.
 
@@ -587,6 +594,10 @@ class DataFrame:
                 asynchronously and returns an :class:`AsyncJob`.
             case_sensitive: A bool value which controls the case sensitivity of the fields in the
                 :class:`Row` objects returned by the ``collect``. Defaults to ``True``.
+            columnar: Whether to return the result as a :class:`RowSet`, which stores the values
+                column by column and only creates a :class:`Row` object when a row is accessed.
+                It uses much less memory than a list of rows for large results. Defaults to ``False``.
+                It is ignored when ``block`` is ``False``.
 
         See also:
             :meth:`collect_nowait()`
@@ -596,6 +607,7 @@ class DataFrame:
             block=block,
             log_on_exception=log_on_exception,
             case_sensitive=case_sensitive,
+            columnar=columnar,
         )
 
     @df_collect_api_telemetry
@@ -626,6 +638,80 @@ class DataFrame:
             case_sensitive=case_sensitive,
         )
 
+    async def collect_async(
+        self,
+        *,
+        statement_params: Optional[Dict[str, str]] = None,
+        log_on_exception: bool = False,
+        case_sensitive: bool = True,
+    ) -> List[Row]:
+        """Executes the query representing this DataFrame in a coroutine and returns the result as a
+        list of :class:`Row` objects. It doesn't block the event loop while the query is running.
+
+        The query is executed asynchronously with its own cursor, like :meth:`collect_nowait`, and only
+        the submission of the query, the checks of its status and the fetching of its result run in the
+        default executor of the event loop, so many queries can run concurrently with a few threads. The
+        query is cancelled if the coroutine is cancelled.
+
+        Example::
+
+            >>> import asyncio
+            >>> async def main():
+            ...     dfs = [session.create_dataframe([[i]], schema=["a"]) for i in range(3)]
+            ...     return await asyncio.gather(*[df.collect_async() for df in dfs])
+            >>> asyncio.run(main())
+            [[Row(A=0)], [Row(A=1)], [Row(A=2)]]
+
+        Args:
+            statement_params: Dictionary of statement level parameters to be set while executing this action.
+            case_sensitive: A bool value which controls the case sensitivity of the fields in the
+                :class:`Row` objects returned by the ``collect_async``. Defaults to ``True``.
+
+        See also:
+            :meth:`collect()`
+        """
+        result, sfqids = await self._internal_collect_async(
+            statement_params=statement_params,
+            data_type=_AsyncResultType.ROW,
+            log_on_exception=log_on_exception,
+            case_sensitive=case_sensitive,
+        )
+        send_df_collect_telemetry(self, "collect_async", sfqids)
+        return result
+
+    async def _internal_collect_async(
+        self,
+        *,
+        statement_params: Optional[Dict[str, str]] = None,
+        data_type: _AsyncResultType = _AsyncResultType.ROW,
+        **kwargs: Any,
+    ) -> Tuple[Any, List[str]]:
+        # returns the query ids with the result for telemetry, because a query history
+        # listener of the session would also record the queries of other coroutines
+        from snowflake.snowpark.mock._connection import MockServerConnection
+
+        statement_params = create_or_update_statement_params_with_query_tag(
+            statement_params or self._statement_params,
+            self._session.query_tag,
+            SKIP_LEVELS_THREE,
+        )
+        if isinstance(self._session._conn, MockServerConnection):
+            # local testing doesn't support async jobs, so the plan is executed in the event loop
+            result = self._session._conn.execute(
+                self._plan,
+                to_pandas=data_type == _AsyncResultType.PANDAS,
+                _statement_params=statement_params,
+                **kwargs,
+            )
+            return result, []
+        job, result = await _execute_and_wait(
+            self._plan,
+            data_type=data_type,
+            _statement_params=statement_params,
+            **kwargs,
+        )
+        return result, [job.query_id]
+
     def _internal_collect_with_tag_no_telemetry(
         self,
         *,
@@ -634,7 +720,8 @@ class DataFrame:
         data_type: _AsyncResultType = _AsyncResultType.ROW,
         log_on_exception: bool = False,
         case_sensitive: bool = True,
-    ) -> Union[List[Row], AsyncJob]:
+        columnar: bool = False,
+    ) -> Union[List[Row], RowSet, AsyncJob]:
         # When executing a DataFrame in any method of snowpark (either public or private),
         # we should always call this method instead of collect(), to make sure the
         # query tag is set properly.
@@ -649,6 +736,7 @@ class DataFrame:
             ),
             log_on_exception=log_on_exception,
             case_sensitive=case_sensitive,
+            columnar=columnar,
         )
 
     _internal_collect_with_tag = df_collect_api_telemetry(
@@ -813,6 +901,35 @@ class DataFrame:
 
         return result
 
+    async def to_pandas_async(
+        self,
+        *,
+        statement_params: Optional[Dict[str, str]] = None,
+        **kwargs: Dict[str, Any],
+    ) -> "pandas.DataFrame":
+        """
+        Executes the query representing this DataFrame in a coroutine and returns the result as a
+        `pandas DataFrame <https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.html>`_.
+        It doesn't block the event loop while the query is running, see :meth:`collect_async`.
+
+        Args:
+            statement_params: Dictionary of statement level parameters to be set while executing this action.
+
+        Note:
+            1. This method is only available if pandas is installed and available.
+
+            2. If you use :func:`Session.sql` with this method, the input query of
+            :func:`Session.sql` can only be a SELECT statement.
+        """
+        result, sfqids = await self._internal_collect_async(
+            statement_params=statement_params,
+            data_type=_AsyncResultType.PANDAS,
+            **kwargs,
+        )
+        check_is_pandas_dataframe_in_to_pandas(result)
+        send_df_collect_telemetry(self, "to_pandas_async", sfqids)
+        return result
+
     if installed_pandas:
         import pandas
 
@@ -887,6 +1004,97 @@ class DataFrame:
             **kwargs,
         )
 
+    @df_collect_api_telemetry
+    def to_arrow(
+        self,
+        *,
+        statement_params: Optional[Dict[str, str]] = None,
+        **kwargs: Dict[str, Any],
+    ) -> "pyarrow.Table":
+        """
+        Executes the query representing this DataFrame and returns the result as a
+        `pyarrow Table <https://arrow.apache.org/docs/python/generated/pyarrow.Table.html>`_,
+        which is built from the Arrow result batches of the query without converting the data
+        to Python objects or pandas.
+
+        When the data is too large to fit into memory, you can use :meth:`to_arrow_batches`.
+
+        Example::
+
+            >>> df = session.create_dataframe([[1, "a"], [2, "b"]], schema=["a", "b"])
+            >>> df.to_arrow().to_pydict()
+            {'A': [1, 2], 'B': ['a', 'b']}
+
+        Args:
+            statement_params: Dictionary of statement level parameters to be set while executing this action.
+
+        Note:
+            1. This method requires ``pyarrow``, which is installed with the ``pandas`` extra.
+
+            2. If you use :func:`Session.sql` with this method, the input query of
+            :func:`Session.sql` can only be a SELECT statement.
+        """
+        result = self._session._conn.execute(
+            self._plan,
+            to_arrow=True,
+            _statement_params=create_or_update_statement_params_with_query_tag(
+                statement_params or self._statement_params,
+                self._session.query_tag,
+                SKIP_LEVELS_TWO,
+            ),
+            **kwargs,
+        )
+        check_is_arrow_table_in_to_arrow(result)
+        return result
+
+    @df_collect_api_telemetry
+    def to_arrow_batches(
+        self,
+        *,
+        statement_params: Optional[Dict[str, str]] = None,
+        prefetch_batches: int = 2,
+        **kwargs: Dict[str, Any],
+    ) -> Iterator["pyarrow.RecordBatch"]:
+        """
+        Executes the query representing this DataFrame and returns an iterator of
+        `pyarrow RecordBatches <https://arrow.apache.org/docs/python/generated/pyarrow.RecordBatch.html>`_
+        (containing a subset of rows) that you can use to retrieve the results.
+
+        Unlike :meth:`to_arrow`, this method does not load all data into memory at once:
+        the batches are downloaded by a background thread while the previous batch is processed,
+        and at most ``prefetch_batches`` batches are downloaded ahead.
+
+        Example::
+
+            >>> df = session.create_dataframe([[1, 2], [3, 4]], schema=["a", "b"])
+            >>> for batch in df.to_arrow_batches():
+            ...     print(batch.to_pydict())
+            {'A': [1, 3], 'B': [2, 4]}
+
+        Args:
+            statement_params: Dictionary of statement level parameters to be set while executing this action.
+            prefetch_batches: The maximum number of batches downloaded ahead of the batch being processed.
+                Set it to 0 to download each batch when it is requested.
+
+        Note:
+            1. This method requires ``pyarrow``, which is installed with the ``pandas`` extra.
+
+            2. If you use :func:`Session.sql` with this method, the input query of
+            :func:`Session.sql` can only be a SELECT statement.
+        """
+        batches = self._session._conn.execute(
+            self._plan,
+            to_arrow=True,
+            to_iter=True,
+            _statement_params=create_or_update_statement_params_with_query_tag(
+                statement_params or self._statement_params,
+                self._session.query_tag,
+                SKIP_LEVELS_TWO,
+            ),
+            **kwargs,
+        )
+        return prefetch_iterator(batches, prefetch_batches)
+
     @df_api_usage
     def to_df(self, *names: Union[str, Iterable[str]]) -> "DataFrame":
         """
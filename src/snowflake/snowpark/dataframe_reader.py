@@ -2,14 +2,15 @@
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
 
+import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import snowflake.snowpark
 from snowflake.snowpark._internal.analyzer.analyzer_utils import (
     create_file_format_statement,
-    drop_file_format_if_exists_statement,
     infer_schema_statement,
     quote_name_without_upper_casing,
 )
@@ -357,6 +358,11 @@ class DataFrameReader:
     def schema(self, schema: StructType) -> "DataFrameReader":
         """Define the schema for CSV files that you want to read.
 
+        If no schema is defined and the ``INFER_SCHEMA`` option is enabled, the schema is inferred from
+        the files and cached in the session, see :meth:`clear_infer_schema_cache`. The cache doesn't see
+        files changed by ``PUT``, ``REMOVE`` or ``COPY`` commands run with :meth:`Session.sql` or by other
+        sessions, so define the schema, or clear the cache after such changes.
+
         Args:
             schema: Schema configuration for the CSV file to be read.
 
@@ -386,6 +392,10 @@ class DataFrameReader:
     def csv(self, path: str) -> DataFrame:
         """Specify the path of the CSV file(s) to load.
 
+        When the schema is inferred, it is cached in the session and reused when the same files are read
+        with the same options. Call :meth:`clear_infer_schema_cache` after the files are changed by ``PUT``,
+        ``REMOVE`` or ``COPY`` commands run with :meth:`Session.sql` or by other sessions.
+
         Args:
             path: The stage location of a CSV file, or a stage location that has CSV files.
 
@@ -569,36 +579,104 @@ class DataFrameReader:
             self.option(k, v)
         return self
 
+    def infer_schemas(
+        self, paths: Iterable[str], format: str, *, max_workers: int = 4
+    ) -> Dict[str, StructType]:
+        """Infers the schemas of the files in several stage locations concurrently, using the
+        options set in this DataFrameReader.
+
+        The inferred schemas are cached in the session, keyed by the path, the format and the format
+        type options, so the DataFrames that read these paths with the same options afterwards don't
+        infer their schemas again. Inferring the schemas of files with the same format type options
+        also reuses a single temporary file format in the session.
+
+        Args:
+            paths: The stage locations of the files.
+            format: The format of the files, one of ``CSV``, ``JSON``, ``PARQUET``, ``AVRO`` and ``ORC``.
+            max_workers: The maximum number of schemas inferred at the same time, each with its own cursor.
+
+        Returns:
+            A dict mapping each path to its inferred schema. If the schema of a path can't be inferred,
+            the exception of the first such path is raised after the schemas of all paths are inferred.
+
+        Example::
+
+            >>> _ = session.sql("create or replace temp stage mystage").collect()
+            >>> _ = session.file.put("tests/resources/testCSVheader.csv", "@mystage/dir1", auto_compress=False)
+            >>> _ = session.file.put("tests/resources/testCSVheader.csv", "@mystage/dir2", auto_compress=False)
+            >>> schemas = session.read.options({"infer_schema": True, "parse_header": True}).infer_schemas(
+            ...     ["@mystage/dir1", "@mystage/dir2"], "csv"
+            ... )
+            >>> schemas["@mystage/dir2"].names
+            ['"id"', '"name"', '"rating"']
+        """
+        from snowflake.snowpark.mock._connection import MockServerConnection
+
+        if isinstance(self._session._conn, MockServerConnection):
+            raise NotImplementedError(
+                "[Local Testing] Inferring the schema of files is not implemented."
+            )
+        format = format.upper()
+        if format not in INFER_SCHEMA_FORMAT_TYPES:
+            raise ValueError(
+                f"format must be one of {', '.join(INFER_SCHEMA_FORMAT_TYPES)}, but got {format}"
+            )
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError(
+                f"max_workers must be a positive integer, but got {max_workers}"
+            )
+        paths = list(dict.fromkeys(paths))
+
+        def infer(
+            path: str, session: "snowflake.snowpark.session.Session"
+        ) -> StructType:
+            reader = DataFrameReader(session)
+            reader._cur_options = dict(self._cur_options)
+            schema, _, _, exception = reader._infer_schema_for_file_format(path, format)
+            if exception is not None:
+                raise exception
+            return StructType._from_attributes(schema)
+
+        def infer_with_new_cursor(path: str) -> StructType:
+            with self._session._with_new_cursor() as worker_session:
+                return infer(path, worker_session)
+
+        if max_workers == 1:
+            return {path: infer(path, self._session) for path in paths}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(infer_with_new_cursor, path) for path in paths]
+        # raises the exception of the first failed path, after all schemas are inferred
+        return {path: future.result() for path, future in zip(paths, futures)}
+
+    def clear_infer_schema_cache(
+        self, paths: Optional[Union[str, Iterable[str]]] = None
+    ) -> None:
+        """Discards the schemas of files inferred in this session, which are cached so reading
+        the same files with the same options doesn't infer their schemas again.
+
+        Call this method after the files in a stage location are changed outside of Snowpark, e.g., by
+        a ``PUT``, ``REMOVE`` or ``COPY`` command run with :meth:`Session.sql` or by other sessions. The
+        cache is cleared automatically when files are uploaded with :meth:`FileOperation.put` or
+        :meth:`FileOperation.put_stream`, and when an unload with
+        :meth:`DataFrameWriter.copy_into_location` finishes (for an :class:`AsyncJob`, when its result
+        is fetched).
+
+        Args:
+            paths: The stage locations whose cached schemas are discarded. The schemas of all paths
+                starting with one of these locations are discarded. If it is ``None``, all cached
+                schemas are discarded.
+        """
+        self._session._invalidate_infer_schema_cache(
+            [paths] if isinstance(paths, str) else paths
+        )
+
     def _infer_schema_for_file_format(
         self, path: str, format: str
     ) -> Tuple[List, List, List, Exception]:
         format_type_options, _ = get_copy_into_table_options(self._cur_options)
 
-        temp_file_format_name = self._session.get_fully_qualified_name_if_possible(
-            random_name_for_temp_object(TempObjectType.FILE_FORMAT)
-        )
-        drop_tmp_file_format_if_exists_query: Optional[str] = None
-        use_temp_file_format = "FORMAT_NAME" not in self._cur_options
-        file_format_name = self._cur_options.get("FORMAT_NAME", temp_file_format_name)
-        infer_schema_query = infer_schema_statement(path, file_format_name)
         try:
-            if use_temp_file_format:
-                self._session._conn.run_query(
-                    create_file_format_statement(
-                        file_format_name,
-                        format,
-                        format_type_options,
-                        temp=True,
-                        if_not_exist=True,
-                        use_scoped_temp_objects=self._session._use_scoped_temp_objects,
-                        is_generated=True,
-                    ),
-                    is_ddl_on_temp_object=True,
-                )
-                drop_tmp_file_format_if_exists_query = (
-                    drop_file_format_if_exists_statement(file_format_name)
-                )
-            results = self._session._conn.run_query(infer_schema_query)["data"]
+            results = self._run_infer_schema_query(path, format, format_type_options)
             new_schema = []
             schema_to_cast = []
             transformations: List["snowflake.snowpark.column.Column"] = []
@@ -635,15 +713,84 @@ class DataFrameReader:
             read_file_transformations = [t._expression.sql for t in transformations]
         except Exception as e:
             return None, None, None, e
-        finally:
-            # Clean up the file format we created
-            if drop_tmp_file_format_if_exists_query is not None:
-                self._session._conn.run_query(
-                    drop_tmp_file_format_if_exists_query, is_ddl_on_temp_object=True
-                )
 
         return new_schema, schema_to_cast, read_file_transformations, None
 
+    def _run_infer_schema_query(
+        self, path: str, format: str, format_type_options: Dict[str, Any]
+    ) -> List[Any]:
+        """Returns the result of INFER_SCHEMA for the files in ``path``, which is cached in the
+        session, keyed by the path, the format and the format type options."""
+        session = self._session
+        user_file_format_name = self._cur_options.get("FORMAT_NAME")
+        options_key = json.dumps(sorted(format_type_options.items()), default=str)
+        context = session._get_import_cache_context()
+        cache_key = (path, format, options_key, user_file_format_name, *context)
+        with session._infer_schema_lock:
+            results = session._infer_schema_cache.get(cache_key)
+        if results is not None:
+            return results
+
+        if user_file_format_name is not None:
+            results = session._conn.run_query(
+                infer_schema_statement(path, user_file_format_name)
+            )["data"]
+        else:
+            file_format_key = (format, options_key, *context)
+            file_format_name = self._get_temp_file_format(
+                file_format_key, format, format_type_options
+            )
+            try:
+                results = session._conn.run_query(
+                    infer_schema_statement(path, file_format_name)
+                )["data"]
+            except Exception:
+                # the temp file format may have been dropped, so a new one is created next time.
+                # It is not dropped here, since other threads may be using it.
+                with session._infer_schema_lock:
+                    if (
+                        session._temp_file_formats.get(file_format_key)
+                        == file_format_name
+                    ):
+                        session._temp_file_formats.pop(file_format_key)
+                raise
+
+        # no result is cached if no file was found, since the files may be uploaded later
+        if results:
+            with session._infer_schema_lock:
+                session._infer_schema_cache[cache_key] = results
+        return results
+
+    def _get_temp_file_format(
+        self,
+        file_format_key: Tuple[Optional[str], ...],
+        format: str,
+        format_type_options: Dict[str, Any],
+    ) -> str:
+        """Returns the temp file format with the given options, which is created once and
+        reused by all DataFrameReaders of the session."""
+        session = self._session
+        with session._infer_schema_lock:
+            file_format_name = session._temp_file_formats.get(file_format_key)
+            if file_format_name is None:
+                file_format_name = session.get_fully_qualified_name_if_possible(
+                    random_name_for_temp_object(TempObjectType.FILE_FORMAT)
+                )
+                session._conn.run_query(
+                    create_file_format_statement(
+                        file_format_name,
+                        format,
+                        format_type_options,
+                        temp=True,
+                        if_not_exist=True,
+                        use_scoped_temp_objects=session._use_scoped_temp_objects,
+                        is_generated=True,
+                    ),
+                    is_ddl_on_temp_object=True,
+                )
+                session._temp_file_formats[file_format_key] = file_format_name
+        return file_format_name
+
     def _read_semi_structured_file(self, path: str, format: str) -> DataFrame:
         from snowflake.snowpark.mock._connection import MockServerConnection
 
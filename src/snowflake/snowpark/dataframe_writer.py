@@ -6,6 +6,7 @@ import sys
 from typing import Dict, List, Literal, Optional, Union, overload
 
 import snowflake.snowpark  # for forward references of type hints
+from snowflake.snowpark._internal.analyzer.snowflake_plan import SnowflakePlan
 from snowflake.snowpark._internal.analyzer.snowflake_plan_node import (
     CopyIntoLocationNode,
     SaveMode,
@@ -24,7 +25,7 @@ from snowflake.snowpark._internal.utils import (
     validate_object_name,
     warning,
 )
-from snowflake.snowpark.async_job import AsyncJob, _AsyncResultType
+from snowflake.snowpark.async_job import AsyncJob, _AsyncResultType, _call_when_done
 from snowflake.snowpark.column import Column, _to_col_if_str
 from snowflake.snowpark.functions import sql_expr
 from snowflake.snowpark.row import Row
@@ -167,59 +168,23 @@ class DataFrameWriter:
             >>> session.table("my_transient_table").collect()
             [Row(A=1, B=2), Row(A=3, B=4)]
         """
-        save_mode = (
-            str_to_enum(mode.lower(), SaveMode, "'mode'") if mode else self._save_mode
-        )
-        full_table_name = (
-            table_name if isinstance(table_name, str) else ".".join(table_name)
-        )
-        validate_object_name(full_table_name)
-        table_name = (
-            parse_table_name(table_name) if isinstance(table_name, str) else table_name
-        )
-        if column_order is None or column_order.lower() not in ("name", "index"):
-            raise ValueError("'column_order' must be either 'name' or 'index'")
-        column_names = (
-            self._dataframe.columns if column_order.lower() == "name" else None
-        )
-        clustering_exprs = (
-            [
-                _to_col_if_str(col, "DataFrameWriter.save_as_table")._expression
-                for col in clustering_keys
-            ]
-            if clustering_keys
-            else []
-        )
-
-        if create_temp_table:
-            warning(
-                "save_as_table.create_temp_table",
-                "create_temp_table is deprecated. We still respect this parameter when it is True but "
-                'please consider using `table_type="temporary"` instead.',
-            )
-            table_type = "temporary"
-
-        if table_type and table_type.lower() not in SUPPORTED_TABLE_TYPES:
-            raise ValueError(
-                f"Unsupported table type. Expected table types: {SUPPORTED_TABLE_TYPES}"
-            )
-
-        create_table_logic_plan = SnowflakeCreateTable(
+        session = self._dataframe._session
+        snowflake_plan = self._get_save_as_table_plan(
             table_name,
-            column_names,
-            save_mode,
-            self._dataframe._plan,
-            table_type,
-            clustering_exprs,
+            mode=mode,
+            column_order=column_order,
+            create_temp_table=create_temp_table,
+            table_type=table_type,
+            clustering_keys=clustering_keys,
         )
-        session = self._dataframe._session
-        snowflake_plan = session._analyzer.resolve(create_table_logic_plan)
         result = session._conn.execute(
             snowflake_plan,
             _statement_params=statement_params or self._dataframe._statement_params,
             block=block,
             data_type=_AsyncResultType.NO_RESULT,
         )
+        # a query run while the table is written may have cached the previous results
+        _call_when_done(result, lambda: session._invalidate_result_cache(table_name))
         return result if not block else None
 
     @overload
@@ -308,6 +273,94 @@ class DataFrameWriter:
             FIRST_NAME: [["John","Rick","Anthony"]]
             LAST_NAME: [["Berry","Berry","Davis"]]
         """
+        df = self._get_copy_into_location_dataframe(
+            location,
+            partition_by=partition_by,
+            file_format_name=file_format_name,
+            file_format_type=file_format_type,
+            format_type_options=format_type_options,
+            header=header,
+            **copy_options,
+        )
+        result = df._internal_collect_with_tag(
+            statement_params=statement_params or self._dataframe._statement_params,
+            block=block,
+        )
+        # a file read while the data is unloaded may have cached the previous schema
+        _call_when_done(result, self._dataframe._session._invalidate_infer_schema_cache)
+        return result
+
+    def _get_save_as_table_plan(
+        self,
+        table_name: Union[str, Iterable[str]],
+        *,
+        mode: Optional[str] = None,
+        column_order: str = "index",
+        create_temp_table: bool = False,
+        table_type: Literal["", "temp", "temporary", "transient"] = "",
+        clustering_keys: Optional[Iterable[ColumnOrName]] = None,
+    ) -> SnowflakePlan:
+        save_mode = (
+            str_to_enum(mode.lower(), SaveMode, "'mode'") if mode else self._save_mode
+        )
+        full_table_name = (
+            table_name if isinstance(table_name, str) else ".".join(table_name)
+        )
+        validate_object_name(full_table_name)
+        table_name = (
+            parse_table_name(table_name) if isinstance(table_name, str) else table_name
+        )
+        if column_order is None or column_order.lower() not in ("name", "index"):
+            raise ValueError("'column_order' must be either 'name' or 'index'")
+        column_names = (
+            self._dataframe.columns if column_order.lower() == "name" else None
+        )
+        clustering_exprs = (
+            [
+                _to_col_if_str(col, "DataFrameWriter.save_as_table")._expression
+                for col in clustering_keys
+            ]
+            if clustering_keys
+            else []
+        )
+
+        if create_temp_table:
+            warning(
+                "save_as_table.create_temp_table",
+                "create_temp_table is deprecated. We still respect this parameter when it is True but "
+                'please consider using `table_type="temporary"` instead.',
+            )
+            table_type = "temporary"
+
+        if table_type and table_type.lower() not in SUPPORTED_TABLE_TYPES:
+            raise ValueError(
+                f"Unsupported table type. Expected table types: {SUPPORTED_TABLE_TYPES}"
+            )
+
+        create_table_logic_plan = SnowflakeCreateTable(
+            table_name,
+            column_names,
+            save_mode,
+            self._dataframe._plan,
+            table_type,
+            clustering_exprs,
+        )
+        session = self._dataframe._session
+        snowflake_plan = session._analyzer.resolve(create_table_logic_plan)
+        session._invalidate_result_cache(table_name)
+        return snowflake_plan
+
+    def _get_copy_into_location_dataframe(
+        self,
+        location: str,
+        *,
+        partition_by: Optional[ColumnOrSqlExpr] = None,
+        file_format_name: Optional[str] = None,
+        file_format_type: Optional[str] = None,
+        format_type_options: Optional[Dict[str, str]] = None,
+        header: bool = False,
+        **copy_options: Optional[str],
+    ) -> "snowflake.snowpark.DataFrame":
         stage_location = normalize_remote_file_or_dir(location)
         if isinstance(partition_by, str):
             partition_by = sql_expr(partition_by)._expression
@@ -330,9 +383,7 @@ class DataFrameWriter:
             )
         )
         add_api_call(df, "DataFrameWriter.copy_into_location")
-        return df._internal_collect_with_tag(
-            statement_params=statement_params or self._dataframe._statement_params,
-            block=block,
-        )
+        self._dataframe._session._invalidate_infer_schema_cache()
+        return df
 
     saveAsTable = save_as_table
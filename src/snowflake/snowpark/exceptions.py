@@ -5,7 +5,7 @@
 
 """This package contains all Snowpark client-side exceptions."""
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from snowflake.connector.errors import Error as ConnectorError
 
@@ -242,6 +242,24 @@ class SnowparkQueryCancelledException(SnowparkServerException):
     pass
 
 
+class SnowparkAsyncJobGroupException(SnowparkServerException):
+    """Exception for when some jobs of an :class:`~snowflake.snowpark.async_job.AsyncJobGroup` failed.
+
+    Includes error codes: 1413.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        error_code: Optional[str] = None,
+        errors: Optional[Dict[int, Exception]] = None,
+    ) -> None:
+        super().__init__(message, error_code=error_code)
+        #: The exceptions of the failed jobs, keyed by the indices of the jobs in the group.
+        self.errors: Dict[int, Exception] = errors or {}
+
+
 class SnowparkFetchDataException(SnowparkServerException):
     """Exception for when we are trying to fetch data from Snowflake.
 
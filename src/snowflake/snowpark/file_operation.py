@@ -137,6 +137,8 @@ class FileOperation:
             put_result = snowflake.snowpark.dataframe.DataFrame(
                 self._session, plan
             )._internal_collect_with_tag(statement_params=statement_params)
+        # the uploaded files may change the schemas inferred from the stage
+        self._session._invalidate_infer_schema_cache()
         return [PutResult(**file_result.asDict()) for file_result in put_result]
 
     def get(
@@ -285,6 +287,7 @@ class FileOperation:
             )
             result_data = put_result["data"]
 
+        self._session._invalidate_infer_schema_cache()
         result_meta = cursor.description
         put_result = result_set_to_rows(result_data, result_meta)[0]
         return PutResult(**put_result.asDict())
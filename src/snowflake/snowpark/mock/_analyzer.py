@@ -158,6 +158,8 @@ class MockAnalyzer:
         self.generated_alias_maps = {}
         self.subquery_plans = []
         self.alias_maps_to_use = None
+        self.resolved_plan_count = 0
+        self.reused_plan_count = 0
 
     def analyze(
         self,
@@ -599,6 +601,7 @@ class MockAnalyzer:
         if self.subquery_plans:
             result = result.with_subqueries(self.subquery_plans)
 
+        self.resolved_plan_count += 1
         return result
 
     def do_resolve(
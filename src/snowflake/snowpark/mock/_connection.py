@@ -9,7 +9,6 @@ import os
 import re
 import sys
 import time
-from copy import copy
 from decimal import Decimal
 from logging import getLogger
 from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
@@ -19,7 +18,7 @@ import snowflake.snowpark.mock._constants
 from snowflake.connector.cursor import ResultMetadata, SnowflakeCursor
 from snowflake.connector.errors import NotSupportedError, ProgrammingError
 from snowflake.connector.network import ReauthenticationRequest
-from snowflake.connector.options import pandas
+from snowflake.connector.options import pandas, pyarrow
 from snowflake.snowpark._internal.analyzer.analyzer_utils import (
     escape_quotes,
     quote_name,
@@ -44,7 +43,7 @@ from snowflake.snowpark.async_job import AsyncJob, _AsyncResultType
 from snowflake.snowpark.exceptions import SnowparkSQLException
 from snowflake.snowpark.mock._plan import MockExecutionPlan, execute_mock_plan
 from snowflake.snowpark.mock._snowflake_data_type import TableEmulator
-from snowflake.snowpark.row import Row
+from snowflake.snowpark.row import Row, RowSet
 from snowflake.snowpark.types import (
     ArrayType,
     DecimalType,
@@ -75,6 +74,39 @@ def _build_target_path(stage_location: str, dest_prefix: str = "") -> str:
     return f"{qualified_stage_name}{dest_prefix_name if dest_prefix_name else ''}"
 
 
+class _TableStorage:
+    """
+    The data of a table in the entity registry. The tables appended to it are kept as a list of
+    chunks, so an append doesn't copy the rows already in the table. The chunks are concatenated
+    into a snapshot when the table is read, which is shared by all reads until the next write.
+
+    The snapshot is never modified: a read returns a shallow copy of it, which shares its data, so
+    the executor must copy a table it read before modifying its values in place.
+    """
+
+    def __init__(self, table: TableEmulator) -> None:
+        self._chunks: List[TableEmulator] = [table]
+        self._snapshot: Optional[TableEmulator] = table
+        self.columns = table.columns
+        self.sf_types = table.sf_types
+
+    def append(self, table: TableEmulator) -> None:
+        # Fix append by index
+        table.columns = self.columns
+        self._chunks.append(table)
+        self._snapshot = None
+
+    def read(self) -> TableEmulator:
+        if self._snapshot is None:
+            snapshot = pandas.concat(self._chunks, ignore_index=True)
+            snapshot.sf_types = self.sf_types
+            self._chunks = [snapshot]
+            self._snapshot = snapshot
+        table = self._snapshot.copy(deep=False)
+        table.sf_types = dict(self.sf_types)
+        return table
+
+
 class MockServerConnection:
     class TabularEntityRegistry:
         # Registry to store tables and views.
@@ -105,7 +137,7 @@ class MockServerConnection:
         def read_table(self, name: Union[str, Iterable[str]]) -> TableEmulator:
             qualified_name = self.get_fully_qualified_name(name)
             if qualified_name in self.table_registry:
-                return copy(self.table_registry[qualified_name])
+                return self.table_registry[qualified_name].read()
             else:
                 raise SnowparkSQLException(
                     f"Object '{name}' does not exist or not authorized."
@@ -115,28 +147,24 @@ class MockServerConnection:
             self, name: Union[str, Iterable[str]], table: TableEmulator, mode: SaveMode
         ) -> Row:
             name = self.get_fully_qualified_name(name)
-            table = copy(table)
+            # the data of the table is shared with the written table, which is never modified in place
+            table = table.copy(deep=False)
+            table.sf_types = dict(table.sf_types)
             if mode == SaveMode.APPEND:
-                # Fix append by index
                 if name in self.table_registry:
-                    target_table = self.table_registry[name]
-                    table.columns = target_table.columns
-                    self.table_registry[name] = pandas.concat(
-                        [target_table, table], ignore_index=True
-                    )
-                    self.table_registry[name].sf_types = target_table.sf_types
+                    self.table_registry[name].append(table)
                 else:
-                    self.table_registry[name] = table
+                    self.table_registry[name] = _TableStorage(table)
             elif mode == SaveMode.IGNORE:
                 if name not in self.table_registry:
-                    self.table_registry[name] = table
+                    self.table_registry[name] = _TableStorage(table)
             elif mode == SaveMode.OVERWRITE:
-                self.table_registry[name] = table
+                self.table_registry[name] = _TableStorage(table)
             elif mode == SaveMode.ERROR_IF_EXISTS:
                 if name in self.table_registry:
                     raise SnowparkSQLException(f"Table {name} already exists")
                 else:
-                    self.table_registry[name] = table
+                    self.table_registry[name] = _TableStorage(table)
             else:
                 raise ProgrammingError(f"Unrecognized mode: {mode}")
             return [
@@ -402,9 +430,17 @@ class MockServerConnection:
         block: bool = True,
         data_type: _AsyncResultType = _AsyncResultType.ROW,
         case_sensitive: bool = True,
+        to_arrow: bool = False,
+        columnar: bool = False,
         **kwargs,
     ) -> Union[
-        List[Row], "pandas.DataFrame", Iterator[Row], Iterator["pandas.DataFrame"]
+        List[Row],
+        RowSet,
+        "pandas.DataFrame",
+        "pyarrow.Table",
+        Iterator[Row],
+        Iterator["pandas.DataFrame"],
+        Iterator["pyarrow.RecordBatch"],
     ]:
         if not block:
             raise NotImplementedError(
@@ -414,22 +450,35 @@ class MockServerConnection:
         res = execute_mock_plan(plan)
         if isinstance(res, TableEmulator):
             # stringfy the variant type in the result df
-            for col in res.columns:
+            variant_columns = [
+                col
+                for col in res.columns
                 if isinstance(
                     res.sf_types[col].datatype, (ArrayType, MapType, VariantType)
-                ):
-                    from snowflake.snowpark.mock import CUSTOM_JSON_ENCODER
-
-                    for row in range(len(res[col])):
-                        if res[col][row] is not None:
-                            res.loc[row, col] = json.dumps(
-                                res[col][row], cls=CUSTOM_JSON_ENCODER, indent=2
-                            )
-                        else:
-                            # snowflake returns Python None instead of the str 'null' for DataType data
-                            res.loc[row, col] = (
-                                "null" if row in res._null_rows_idxs_map[col] else None
-                            )
+                )
+            ]
+            if variant_columns:
+                # the result may share its data with a table in the entity registry
+                res = res.copy()
+            for col in variant_columns:
+                from snowflake.snowpark.mock import CUSTOM_JSON_ENCODER
+
+                for row in range(len(res[col])):
+                    if res[col][row] is not None:
+                        res.loc[row, col] = json.dumps(
+                            res[col][row], cls=CUSTOM_JSON_ENCODER, indent=2
+                        )
+                    else:
+                        # snowflake returns Python None instead of the str 'null' for DataType data
+                        res.loc[row, col] = (
+                            "null" if row in res._null_rows_idxs_map[col] else None
+                        )
+
+            if to_arrow:
+                table = pyarrow.Table.from_pandas(
+                    _fix_pandas_df_fixed_type(res), preserve_index=False
+                )
+                return iter(table.to_batches()) if to_iter else table
 
             # when setting output rows, snowpark python running against snowflake don't escape double quotes
             # in column names. while in the local testing calculation, double quotes are preserved.
@@ -443,6 +492,24 @@ class MockServerConnection:
                 sf_types = [res.sf_types_by_col_index[key] for key in keys]
             else:
                 sf_types = list(res.sf_types.values())
+            if columnar:
+                return RowSet(
+                    [
+                        [
+                            Decimal(str(v)) if v is not None else v
+                            for v in res.iloc[:, i]
+                        ]
+                        if isinstance(sf_types[i].datatype, DecimalType)
+                        else list(res.iloc[:, i])
+                        for i in range(len(columns))
+                    ],
+                    list(
+                        Row._builder.build(*columns)
+                        .set_case_sensitive(case_sensitive)
+                        .to_row()
+                    ),
+                    case_sensitive,
+                )
             for pdr in res.itertuples(index=False, name=None):
                 row_struct = (
                     Row._builder.build(*columns)
@@ -462,6 +529,17 @@ class MockServerConnection:
                 rows.append(row)
         elif isinstance(res, list):
             rows = [r for r in res]
+            if columnar:
+                return RowSet(
+                    [list(column) for column in zip(*rows)],
+                    list(rows[0]._fields) if rows and rows[0]._fields else None,
+                    case_sensitive,
+                )
+            if to_arrow:
+                raise SnowparkClientExceptionMessages.SERVER_FAILED_FETCH_ARROW(
+                    "to_arrow() did not return a pyarrow Table. If you use session.sql(...).to_arrow(), "
+                    "the input query can only be a SELECT statement."
+                )
 
         if to_pandas:
             pandas_df = pandas.DataFrame()
@@ -7,14 +7,17 @@ import datetime
 import json
 import math
 import numbers
+import re
 import string
 from decimal import Decimal
 from functools import partial, reduce
 from numbers import Real
-from typing import Any, Callable, Optional, Tuple, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, TypeVar, Union
 
 import pytz
 
+from snowflake.connector.options import pandas as pd
+
 from snowflake.snowpark.exceptions import SnowparkSQLException
 from snowflake.snowpark.mock._snowflake_data_type import (
     ColumnEmulator,
@@ -49,6 +52,9 @@ from ._util import (
     unalias_datetime_part,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 RETURN_TYPE = Union[ColumnEmulator, TableEmulator]
 
 _MOCK_FUNCTION_IMPLEMENTATION_MAP = {}
@@ -220,7 +226,8 @@ def mock_count_distinct(*cols: ColumnEmulator) -> ColumnEmulator:
     """
     dict_data = {}
     for i in range(len(cols)):
-        dict_data[f"temp_col_{i}"] = cols[i]
+        # the values are taken by position, the index of a group doesn't start from 0
+        dict_data[f"temp_col_{i}"] = cols[i].to_numpy()
     rows = len(cols[0])
     temp_table = TableEmulator(dict_data, index=[i for i in range(len(cols[0]))])
     temp_table = temp_table.reset_index()
@@ -229,7 +236,6 @@ def mock_count_distinct(*cols: ColumnEmulator) -> ColumnEmulator:
         for i in range(rows):
             if col[col.index[i]] is None:
                 to_drop_index.add(i)
-                break
     temp_table = temp_table.drop(index=list(to_drop_index))
     temp_table = temp_table.drop_duplicates(subset=list(dict_data.keys()))
     count_column = temp_table.count()
@@ -283,6 +289,79 @@ def mock_listagg(column: ColumnEmulator, delimiter: str, is_distinct: bool):
     )
 
 
+# the widths of the fields parsed in bulk by _bulk_strptime, and their values when they are not in the format
+_BULK_STRPTIME_FIELDS = {
+    "Y": (4, 1900),
+    "m": (2, 1),
+    "d": (2, 1),
+    "H": (2, 0),
+    "M": (2, 0),
+    "S": (2, 0),
+    "f": (6, 0),
+}
+
+
+def _bulk_strptime(values: "np.ndarray", fmt: str) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Parses the strings of ``values`` in bulk with the ``datetime.strptime`` format ``fmt``, and returns the positions
+    of the parsed strings and their datetime64 values. Only the strings with zero-padded fields, as formatted by
+    ``datetime.strftime``, are parsed; the other strings must be parsed one by one.
+    """
+    import numpy as np
+
+    not_parsed = np.empty(0, dtype=int), np.empty(0, dtype="datetime64[us]")
+    # the position of the literal characters and the position and width of each field in the strings
+    literals, fields, length = [], {}, 0
+    for i, token in enumerate(re.split("(%.)", fmt)):
+        if i % 2 == 0:
+            if "%" in token:
+                return not_parsed
+            literals.extend((length + j, ord(c)) for j, c in enumerate(token))
+            length += len(token)
+        else:
+            if token[1] not in _BULK_STRPTIME_FIELDS or token[1] in fields:
+                return not_parsed
+            fields[token[1]] = (length, _BULK_STRPTIME_FIELDS[token[1]][0])
+            length += _BULK_STRPTIME_FIELDS[token[1]][0]
+    if not fields:
+        return not_parsed
+
+    rows = np.flatnonzero([type(v) is str and len(v) == length for v in values])
+    codes = (
+        np.array(values[rows].tolist(), dtype=f"<U{length}")
+        .view(np.uint32)
+        .reshape(len(rows), length)
+        .astype(np.int64)
+    )
+    valid = np.ones(len(rows), dtype=bool)
+    for position, code in literals:
+        valid &= codes[:, position] == code
+    parts = {}
+    for name, (_, default) in _BULK_STRPTIME_FIELDS.items():
+        if name not in fields:
+            parts[name] = np.full(len(rows), default)
+            continue
+        start, width = fields[name]
+        digits = codes[:, start : start + width] - ord("0")
+        valid &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+        parts[name] = digits @ 10 ** np.arange(width - 1, -1, -1)
+    valid &= (parts["Y"] >= 1) & (parts["m"] >= 1) & (parts["m"] <= 12)
+    valid &= (parts["H"] < 24) & (parts["M"] < 60) & (parts["S"] < 60)
+    rows, parts = rows[valid], {name: part[valid] for name, part in parts.items()}
+
+    months = ((parts["Y"] - 1970) * 12 + parts["m"] - 1).astype("datetime64[M]")
+    month_starts = months.astype("datetime64[D]")
+    days_in_month = (months + 1).astype("datetime64[D]") - month_starts
+    valid = (parts["d"] >= 1) & (parts["d"] <= days_in_month.astype(np.int64))
+    seconds = (
+        (parts["d"] - 1) * 86400 + parts["H"] * 3600 + parts["M"] * 60 + parts["S"]
+    )
+    parsed = month_starts.astype("datetime64[us]") + (
+        seconds * 1000000 + parts["f"]
+    ).astype("timedelta64[us]")
+    return rows[valid], parsed[valid]
+
+
 @patch("to_date")
 def mock_to_date(
     column: ColumnEmulator,
@@ -308,31 +387,28 @@ def mock_to_date(
 
         [ ] For all other values, a conversion error is generated.
     """
-    res = []
+    import numpy as np
+
     auto_detect = bool(not fmt)
 
     date_format, _, _ = convert_snowflake_datetime_format(
         fmt, default_format="%Y-%m-%d"
     )
 
-    for data in column:
-        if data is None:
-            res.append(None)
-            continue
-        try:
-            if auto_detect and data.isnumeric():
-                res.append(
-                    datetime.datetime.utcfromtimestamp(
-                        process_numeric_time(data)
-                    ).date()
-                )
-            else:
-                res.append(datetime.datetime.strptime(data, date_format).date())
-        except BaseException:
-            if try_cast:
-                res.append(None)
-            else:
-                raise
+    def convert(data):
+        if auto_detect and data.isnumeric():
+            return datetime.datetime.utcfromtimestamp(process_numeric_time(data)).date()
+        return datetime.datetime.strptime(data, date_format).date()
+
+    # the strings are parsed in bulk, and the strings the bulk parsing rejects are converted one by one
+    values = column.to_numpy(dtype=object)
+    res = np.full(len(values), None, dtype=object)
+    rows, parsed = _bulk_strptime(values, date_format)
+    res[rows] = parsed.astype("datetime64[D]").astype(object)
+    unparsed = np.ones(len(values), dtype=bool)
+    unparsed[rows] = False
+    for i in np.flatnonzero(unparsed):
+        res[i] = try_convert(convert, try_cast, values[i])
     return ColumnEmulator(
         data=res, sf_type=ColumnType(DateType(), column.sf_type.nullable)
     )
@@ -423,34 +499,45 @@ def mock_to_decimal(
 
         [ ] If the variant contains JSON null value, the output is NULL.
     """
-    res = []
-
-    for data in e:
-        if data is None:
-            res.append(data)
-            continue
-        try:
-            try:
-                float(data)
-            except ValueError:
-                raise SnowparkSQLException(f"Numeric value '{data}' is not recognized.")
-
-            integer_part = round(float(data))
-            integer_part_str = str(integer_part)
-            len_integer_part = (
-                len(integer_part_str) - 1
-                if integer_part_str[0] == "-"
-                else len(integer_part_str)
+    import numpy as np
+
+    values = e.to_numpy(dtype=object)
+    res = np.full(len(values), None, dtype=object)
+    # the integer parts of the numbers are rounded and checked in bulk, while the other values and the numbers
+    # whose integer part can't be represented exactly as a float are converted one by one
+    rows = np.flatnonzero([type(v) is int or type(v) is float for v in values])
+    numbers = np.asarray(values[rows].tolist(), dtype=float)
+    integer_parts = np.rint(np.where(np.isfinite(numbers), numbers, 0))
+    len_integer_parts = (
+        np.searchsorted(10.0 ** np.arange(1, 16), np.abs(integer_parts), side="right")
+        + 1
+    )
+    valid = (
+        np.isfinite(numbers)
+        & (np.abs(integer_parts) < 1e15)
+        & (len_integer_parts <= precision)
+    )
+    remaining_decimal_lens = np.minimum(
+        precision - len_integer_parts - (integer_parts < 0), scale
+    )
+    res[rows[valid]] = np.fromiter(
+        (
+            Decimal(str(round(number, remaining_decimal_len)))
+            for number, remaining_decimal_len in zip(
+                numbers[valid].tolist(), remaining_decimal_lens[valid].tolist()
             )
-            if len_integer_part > precision:
-                raise SnowparkSQLException(f"Numeric value '{data}' is out of range")
-            remaining_decimal_len = min(precision - len(str(integer_part)), scale)
-            res.append(Decimal(str(round(float(data), remaining_decimal_len))))
-        except BaseException:
-            if try_cast:
-                res.append(None)
-            else:
-                raise
+        ),
+        dtype=object,
+        count=np.count_nonzero(valid),
+    )
+    unconverted = np.ones(len(values), dtype=bool)
+    unconverted[rows[valid]] = False
+    for i in np.flatnonzero(unconverted):
+        res[i] = try_convert(
+            partial(_to_decimal_value, precision=precision, scale=scale),
+            try_cast,
+            values[i],
+        )
 
     return ColumnEmulator(
         data=res,
@@ -458,6 +545,25 @@ def mock_to_decimal(
     )
 
 
+def _to_decimal_value(data: Any, precision: int, scale: int) -> Decimal:
+    try:
+        float(data)
+    except ValueError:
+        raise SnowparkSQLException(f"Numeric value '{data}' is not recognized.")
+
+    integer_part = round(float(data))
+    integer_part_str = str(integer_part)
+    len_integer_part = (
+        len(integer_part_str) - 1
+        if integer_part_str[0] == "-"
+        else len(integer_part_str)
+    )
+    if len_integer_part > precision:
+        raise SnowparkSQLException(f"Numeric value '{data}' is out of range")
+    remaining_decimal_len = min(precision - len(str(integer_part)), scale)
+    return Decimal(str(round(float(data), remaining_decimal_len)))
+
+
 @patch("to_time")
 def mock_to_time(
     column: ColumnEmulator,
@@ -573,82 +679,112 @@ def _to_timestamp(
 
         [ ] If the value is greater than or equal to 31536000000000000, then the value is treated as nanoseconds.
     """
-    res = []
+    import numpy as np
+
+    values = column.to_numpy(dtype=object)
+    res = np.full(len(values), None, dtype=object)
     fmt_column = fmt if fmt is not None else [None] * len(column)
+    default_format = "%Y-%m-%d %H:%M:%S.%f"
 
-    for data, format in zip(column, fmt_column):
+    # the rows are grouped by format, so that each format is converted once and its strings are parsed in bulk
+    rows_by_format = {}
+    for i, format in enumerate(fmt_column):
+        rows_by_format.setdefault(format, []).append(i)
+
+    for format, rows in rows_by_format.items():
         auto_detect = bool(not format)
-        default_format = "%Y-%m-%d %H:%M:%S.%f"
         (
             timestamp_format,
             hour_delta,
             fractional_seconds,
         ) = convert_snowflake_datetime_format(format, default_format=default_format)
+        rows = np.asarray(rows)
+        unparsed = np.ones(len(rows), dtype=bool)
+        # the strings are parsed in bulk unless their fractional seconds would be truncated
+        if (
+            not auto_detect
+            and fractional_seconds >= 6
+            and not re.search(r"\.%.%", timestamp_format)
+        ):
+            parsed_rows, parsed = _bulk_strptime(values[rows], timestamp_format)
+            parsed = parsed + np.timedelta64(hour_delta, "h")
+            parsed = parsed.astype(object)
+            if add_timezone:
+                parsed = [LocalTimezone.replace_tz(d) for d in parsed]
+            res[rows[parsed_rows]] = parsed
+            unparsed[parsed_rows] = False
+
+        convert = partial(
+            _to_timestamp_value,
+            auto_detect=auto_detect,
+            timestamp_format=timestamp_format,
+            default_format=default_format,
+            hour_delta=hour_delta,
+            fractional_seconds=fractional_seconds,
+            add_timezone=add_timezone,
+        )
+        for i in rows[unparsed]:
+            res[i] = try_convert(convert, try_cast, values[i])
+    return res
 
-        try:
-            if data is None:
-                res.append(None)
-                continue
-
-            if auto_detect:
-                if isinstance(data, numbers.Number) or (
-                    isinstance(data, str) and data.isnumeric()
-                ):
-                    parsed = datetime.datetime.utcfromtimestamp(
-                        process_numeric_time(data)
-                    )
-                    # utc timestamps should be in utc timezone
-                    if add_timezone:
-                        parsed = parsed.replace(tzinfo=pytz.utc)
-                elif isinstance(data, datetime.datetime):
-                    parsed = data
-                elif isinstance(data, datetime.date):
-                    parsed = datetime.datetime.combine(data, datetime.time(0, 0, 0))
-                elif isinstance(data, str):
-                    # dateutil is a pandas dependency
-                    import dateutil.parser
-
-                    try:
-                        parsed = dateutil.parser.parse(data)
-                    except ValueError:
-                        parsed = None
-                else:
-                    parsed = None
-            else:
-                # handle seconds fraction
-                try:
-                    datetime_data = datetime.datetime.strptime(
-                        process_string_time_with_fractional_seconds(
-                            data, fractional_seconds
-                        ),
-                        timestamp_format,
-                    )
-                except ValueError:
-                    # when creating df from pandas df, datetime doesn't come with microseconds
-                    # leading to ValueError when using the default format
-                    # but it's still a valid format to snowflake, so we use format code without microsecond to parse
-                    if timestamp_format == default_format:
-                        datetime_data = datetime.datetime.strptime(
-                            process_string_time_with_fractional_seconds(
-                                data, fractional_seconds
-                            ),
-                            "%Y-%m-%d %H:%M:%S",
-                        )
-                    else:
-                        raise
-                parsed = datetime_data + datetime.timedelta(hours=hour_delta)
 
-            # Add the local timezone if tzinfo is missing and a tz is desired
-            if parsed and add_timezone and parsed.tzinfo is None:
-                parsed = LocalTimezone.replace_tz(parsed)
+def _to_timestamp_value(
+    data: Any,
+    auto_detect: bool,
+    timestamp_format: str,
+    default_format: str,
+    hour_delta: int,
+    fractional_seconds: int,
+    add_timezone: bool,
+) -> Optional[datetime.datetime]:
+    if auto_detect:
+        if isinstance(data, numbers.Number) or (
+            isinstance(data, str) and data.isnumeric()
+        ):
+            parsed = datetime.datetime.utcfromtimestamp(process_numeric_time(data))
+            # utc timestamps should be in utc timezone
+            if add_timezone:
+                parsed = parsed.replace(tzinfo=pytz.utc)
+        elif isinstance(data, datetime.datetime):
+            parsed = data
+        elif isinstance(data, datetime.date):
+            parsed = datetime.datetime.combine(data, datetime.time(0, 0, 0))
+        elif isinstance(data, str):
+            # dateutil is a pandas dependency
+            import dateutil.parser
 
-            res.append(parsed)
-        except BaseException:
-            if try_cast:
-                res.append(None)
+            try:
+                parsed = dateutil.parser.parse(data)
+            except ValueError:
+                parsed = None
+        else:
+            parsed = None
+    else:
+        # handle seconds fraction
+        try:
+            datetime_data = datetime.datetime.strptime(
+                process_string_time_with_fractional_seconds(data, fractional_seconds),
+                timestamp_format,
+            )
+        except ValueError:
+            # when creating df from pandas df, datetime doesn't come with microseconds
+            # leading to ValueError when using the default format
+            # but it's still a valid format to snowflake, so we use format code without microsecond to parse
+            if timestamp_format == default_format:
+                datetime_data = datetime.datetime.strptime(
+                    process_string_time_with_fractional_seconds(
+                        data, fractional_seconds
+                    ),
+                    "%Y-%m-%d %H:%M:%S",
+                )
             else:
                 raise
-    return res
+        parsed = datetime_data + datetime.timedelta(hours=hour_delta)
+
+    # Add the local timezone if tzinfo is missing and a tz is desired
+    if parsed and add_timezone and parsed.tzinfo is None:
+        parsed = LocalTimezone.replace_tz(parsed)
+    return parsed
 
 
 @patch("to_timestamp")
@@ -735,7 +871,11 @@ def mock_to_char(
     fmt: Optional[str] = None,
     try_cast: bool = False,
 ) -> ColumnEmulator:  # TODO: support more input types
+    import numpy as np
+
     source_datatype = column.sf_type.datatype
+    values = column.to_numpy(dtype=object)
+    res = np.full(len(values), None, dtype=object)
 
     if isinstance(source_datatype, DateType):
         date_format, _, _ = convert_snowflake_datetime_format(
@@ -744,6 +884,12 @@ def mock_to_char(
         func = partial(
             try_convert, lambda x: datetime.datetime.strftime(x, date_format), try_cast
         )
+        # each distinct date is only formatted once
+        rows = np.flatnonzero([type(v) is datetime.date for v in values])
+        codes, dates = pd.factorize(values[rows])
+        res[rows] = np.array([func(d) for d in dates], dtype=object)[codes]
+        converted = np.zeros(len(values), dtype=bool)
+        converted[rows] = True
     elif isinstance(source_datatype, TimeType):
         raise NotImplementedError(
             "[Local Testing] Use TO_CHAR on Time data is not supported yet"
@@ -752,17 +898,27 @@ def mock_to_char(
         raise NotImplementedError(
             "[Local Testing] Use TO_CHAR on Timestamp data is not supported yet"
         )
-    elif isinstance(source_datatype, _NumericType):
-        if fmt:
+    elif isinstance(source_datatype, (_NumericType, StringType)):
+        if fmt and isinstance(source_datatype, _NumericType):
             raise NotImplementedError(
                 "[Local Testing] Use format strings with Numeric types in TO_CHAR is not supported yet."
             )
         func = partial(try_convert, lambda x: str(x), try_cast)
+        converted = ~np.equal(values, None)
+        res[converted] = np.fromiter(
+            map(str, values[converted]), dtype=object, count=np.count_nonzero(converted)
+        )
     else:
         func = partial(try_convert, lambda x: str(x), try_cast)
-    new_col = column.apply(func)
-    new_col.sf_type = ColumnType(StringType(), column.sf_type.nullable)
-    return new_col
+        converted = np.zeros(len(values), dtype=bool)
+    for i in np.flatnonzero(~converted):
+        res[i] = func(values[i])
+    return ColumnEmulator(
+        data=res,
+        index=column.index,
+        name=column.name,
+        sf_type=ColumnType(StringType(), column.sf_type.nullable),
+    )
 
 
 @patch("to_double")
@@ -804,6 +960,13 @@ def mock_to_double(
         )
 
 
+# the strings converted by to_boolean, which are case-insensitive
+_BOOLEAN_STRINGS = {
+    **{s: True for s in ("true", "t", "yes", "y", "on", "1")},
+    **{s: False for s in ("false", "f", "no", "n", "off", "0")},
+}
+
+
 @patch("to_boolean")
 def mock_to_boolean(column: ColumnEmulator, try_cast: bool = False) -> ColumnEmulator:
     """
@@ -827,7 +990,11 @@ def mock_to_boolean(column: ColumnEmulator, try_cast: bool = False) -> ColumnEmu
 
 
     """
-    if isinstance(column.sf_type, StringType):
+    import numpy as np
+
+    values = column.to_numpy(dtype=object)
+    res = np.full(len(values), None, dtype=object)
+    if isinstance(column.sf_type.datatype, StringType):
 
         def convert_str_to_bool(x: Optional[str]):
             if x is None:
@@ -838,10 +1005,12 @@ def mock_to_boolean(column: ColumnEmulator, try_cast: bool = False) -> ColumnEmu
                 return False
             raise SnowparkSQLException(f"Boolean value {x} is not recognized")
 
-        new_col = column.apply(lambda x: try_convert(convert_str_to_bool, try_cast, x))
-        new_col.sf_type = ColumnType(BooleanType(), column.sf_type.nullable)
-        return new_col
-    elif isinstance(column.sf_type, _NumericType):
+        convert = convert_str_to_bool
+        # the recognized strings are converted in bulk
+        converted = pd.Series(values, dtype=object).str.lower().map(_BOOLEAN_STRINGS)
+        rows = np.flatnonzero(converted.notna().to_numpy())
+        res[rows] = converted.to_numpy(dtype=object)[rows]
+    elif isinstance(column.sf_type.datatype, _NumericType):
 
         def convert_num_to_bool(x: Optional[Real]):
             if x is None:
@@ -853,13 +1022,26 @@ def mock_to_boolean(column: ColumnEmulator, try_cast: bool = False) -> ColumnEmu
             else:
                 return x != 0
 
-        new_col = column.apply(lambda x: try_convert(convert_num_to_bool, try_cast, x))
-        new_col.sf_type = ColumnType(BooleanType(), column.sf_type.nullable)
-        return new_col
+        convert = convert_num_to_bool
+        # the finite ints and floats are converted in bulk
+        rows = np.flatnonzero([type(v) is int or type(v) is float for v in values])
+        numbers = np.asarray(values[rows].tolist(), dtype=float)
+        rows = rows[np.isfinite(numbers)]
+        res[rows] = (numbers[np.isfinite(numbers)] != 0).astype(object)
     else:
         raise SnowparkSQLException(
             f"Invalid type {column.sf_type.datatype} for parameter 'TO_BOOLEAN'"
         )
+    unconverted = np.ones(len(values), dtype=bool)
+    unconverted[rows] = False
+    for i in np.flatnonzero(unconverted):
+        res[i] = try_convert(convert, try_cast, values[i])
+    return ColumnEmulator(
+        data=res,
+        index=column.index,
+        name=column.name,
+        sf_type=ColumnType(BooleanType(), column.sf_type.nullable),
+    )
 
 
 @patch("to_binary")
@@ -1133,12 +1315,106 @@ def mock_dateadd(
     else:
         raise ValueError(f"{part} is not a recognized date or time part.")
 
-    res = datetime_expr.combine(
-        value_expr, lambda date, duration: func(cast(date), duration)
-    )
+    res = _dateadd_in_bulk(part, value_expr, datetime_expr)
+    if res is None:
+        res = datetime_expr.combine(
+            value_expr, lambda date, duration: func(cast(date), duration)
+        )
+    elif res.dtype == "datetime64[D]":
+        res = ColumnEmulator(res.astype(object), index=datetime_expr.index)
+    else:
+        res = ColumnEmulator(res.astype("datetime64[ns]"), index=datetime_expr.index)
     return ColumnEmulator(res, sf_type=sf_type)
 
 
+# the microseconds of the parts that are added by _dateadd_in_bulk as a fixed duration
+_DATEADD_PART_MICROSECONDS = {
+    "week": 7 * 24 * 3600 * 10**6,
+    "day": 24 * 3600 * 10**6,
+    "hour": 3600 * 10**6,
+    "minute": 60 * 10**6,
+    "second": 10**6,
+    "millisecond": 1000,
+    "microsecond": 1,
+}
+_DATEADD_PART_MONTHS = {"year": 12, "quarter": 3, "month": 1}
+_MICROSECONDS_PER_DAY = 24 * 3600 * 10**6
+
+
+def _dateadd_in_bulk(
+    part: str, value_expr: ColumnEmulator, datetime_expr: ColumnEmulator
+) -> Optional["np.ndarray"]:
+    """
+    Adds the integer durations of ``value_expr`` to the dates or naive datetimes of ``datetime_expr`` with numpy,
+    and returns the datetime64[D] result for dates or the datetime64[us] result for datetimes. Returns None when
+    a value can't be added in bulk, or when the result is out of range, in which case the values are added one by one.
+    """
+    import numpy as np
+
+    durations = value_expr.to_numpy(dtype=object)
+    datetimes = datetime_expr.to_numpy(dtype=object)
+    if (
+        part not in _DATEADD_PART_MICROSECONDS and part not in _DATEADD_PART_MONTHS
+    ) or not all(type(d) is int and abs(d) < 10**9 for d in durations):
+        return None
+    durations = np.asarray(durations.tolist(), dtype=np.int64)
+    types = set(map(type, datetimes))
+    if types == {datetime.date}:
+        is_date = part in _DATEADD_PART_MONTHS or part in ("week", "day")
+        days = (
+            np.fromiter(
+                (d.toordinal() for d in datetimes), dtype=np.int64, count=len(datetimes)
+            )
+            - datetime.date(1970, 1, 1).toordinal()
+        )
+        microseconds = days * _MICROSECONDS_PER_DAY
+    elif (
+        types
+        and types <= {datetime.datetime, pd.Timestamp}
+        and all(d.tzinfo is None for d in datetimes)
+    ):
+        is_date = False
+        try:
+            nanoseconds = pd.DatetimeIndex(datetimes).as_unit("ns").asi8
+        except (ValueError, OverflowError):
+            return None
+        if (nanoseconds % 1000).any():
+            return None
+        microseconds = nanoseconds // 1000
+    else:
+        return None
+
+    if part in _DATEADD_PART_MONTHS:
+        days = microseconds // _MICROSECONDS_PER_DAY
+        months = days.astype("datetime64[D]").astype("datetime64[M]")
+        day_of_month = days - months.astype("datetime64[D]").astype(np.int64)
+        months = months.astype(np.int64) + durations * _DATEADD_PART_MONTHS[part]
+        month_starts = months.astype("datetime64[M]").astype("datetime64[D]")
+        days_in_month = (
+            (months + 1).astype("datetime64[M]").astype("datetime64[D]") - month_starts
+        ).astype(np.int64)
+        # the day of month is clamped to the end of the month like pandas.DateOffset,
+        # while datetime.replace raises an error for the years that don't have Feb 29
+        if part == "year" and (day_of_month >= days_in_month).any():
+            return None
+        res = (
+            month_starts.astype(np.int64) + np.minimum(day_of_month, days_in_month - 1)
+        ) * _MICROSECONDS_PER_DAY + (microseconds - days * _MICROSECONDS_PER_DAY)
+    else:
+        res = microseconds + durations * _DATEADD_PART_MICROSECONDS[part]
+
+    # the results must be valid python dates, and valid pandas timestamps for the datetimes
+    if is_date:
+        min_value, max_value = datetime.date.min, datetime.date.max
+    else:
+        min_value, max_value = pd.Timestamp.min.ceil("us"), pd.Timestamp.max
+    min_value, max_value = np.array([min_value, max_value], dtype="datetime64[us]")
+    res = res.astype("datetime64[us]")
+    if ((res < min_value) | (res > max_value)).any():
+        return None
+    return res.astype("datetime64[D]") if is_date else res
+
+
 CompareType = TypeVar("CompareType")
 
 
@@ -1175,16 +1451,67 @@ def _greatest(x: CompareType, y: Any) -> Union[CompareType, float]:
     return _compare(x, y)[0]
 
 
+def _compare_in_bulk(
+    exprs: Tuple[ColumnEmulator, ...], greatest: bool
+) -> Optional["np.ndarray"]:
+    """
+    Computes greatest or least with numpy when all the values are ints or all the values are floats other than NaN,
+    and returns None otherwise. Like when the values are compared one by one, the result of a row is NaN if any of
+    its values is NULL.
+    """
+    import numpy as np
+
+    columns = [expr.to_numpy(dtype=object) for expr in exprs]
+    is_null = np.zeros(len(columns[0]), dtype=bool)
+    for values in columns:
+        is_null |= np.equal(values, None)
+    types = set()
+    for values in columns:
+        types.update(map(type, values[~is_null]))
+    if types != {int} and types != {float}:
+        return None
+    dtype = np.int64 if types == {int} else np.float64
+    try:
+        arrays = [
+            np.asarray(np.where(is_null, 0, values).tolist(), dtype=dtype)
+            for values in columns
+        ]
+    except OverflowError:
+        return None
+    if dtype == np.float64 and any(np.isnan(array).any() for array in arrays):
+        return None
+
+    res = arrays[0]
+    for array in arrays[1:]:
+        res = (
+            np.where(res > array, res, array)
+            if greatest
+            else np.where(res > array, array, res)
+        )
+    if is_null.any():
+        res = res.astype(float)
+        res[is_null] = np.nan
+    return res
+
+
 @patch("greatest")
 def mock_greatest(*exprs: ColumnEmulator):
-    result = reduce(lambda x, y: x.combine(y, _greatest), exprs)
+    res = _compare_in_bulk(exprs, greatest=True)
+    if res is None:
+        result = reduce(lambda x, y: x.combine(y, _greatest), exprs)
+    else:
+        result = ColumnEmulator(res, index=exprs[0].index)
     result.sf_type = exprs[0].sf_type
     return result
 
 
 @patch("least")
 def mock_least(*exprs: ColumnEmulator):
-    result = reduce(lambda x, y: x.combine(y, _least), exprs)
+    res = _compare_in_bulk(exprs, greatest=False)
+    if res is None:
+        result = reduce(lambda x, y: x.combine(y, _least), exprs)
+    else:
+        result = ColumnEmulator(res, index=exprs[0].index)
     result.sf_type = exprs[0].sf_type
     return result
 
@@ -1227,8 +1554,47 @@ def _initcap(value: Optional[str], delimiters: Optional[str]) -> str:
     return result
 
 
+def _initcap_in_bulk(values: "np.ndarray", delimiters: Optional[str]) -> "np.ndarray":
+    """
+    Applies _initcap to ASCII strings without NUL characters at once, by joining them with NUL characters
+    and capitalizing the characters that follow a delimiter or a NUL character.
+    """
+    import numpy as np
+
+    delims = DEFAULT_INITCAP_DELIMITERS if delimiters is None else set(delimiters)
+    codes = np.frombuffer("\0".join(values).encode("ascii"), dtype=np.uint8)
+    if len(codes) == 0:
+        return np.array(values, dtype=object)
+    is_delim = np.zeros(128, dtype=bool)
+    is_delim[[ord(c) for c in delims if c.isascii()]] = True
+    is_delim[0] = True
+    cap = np.empty(len(codes), dtype=bool)
+    cap[0] = True
+    cap[1:] = is_delim[codes[:-1]]
+    ascii_chars = "".join(map(chr, range(128)))
+    upper = np.frombuffer(ascii_chars.upper().encode("ascii"), dtype=np.uint8)
+    lower = np.frombuffer(ascii_chars.lower().encode("ascii"), dtype=np.uint8)
+    res = np.where(cap, upper[codes], lower[codes]).tobytes().decode("ascii")
+    return np.array(res.split("\0"), dtype=object)
+
+
 @patch("initcap")
 def mock_initcap(values: ColumnEmulator, delimiters: ColumnEmulator):
-    result = values.combine(delimiters, _initcap)
+    import numpy as np
+
+    strings = values.to_numpy(dtype=object)
+    res = np.full(len(strings), None, dtype=object)
+    if not isinstance(delimiters, ColumnEmulator):
+        delimiters = [delimiters] * len(strings)
+    # the ASCII strings are capitalized in bulk for each distinct delimiters, and the other strings one by one
+    rows_by_delimiters = {}
+    for i, (value, delimiter) in enumerate(zip(strings, delimiters)):
+        if type(value) is str and value.isascii() and "\0" not in value:
+            rows_by_delimiters.setdefault(delimiter, []).append(i)
+        else:
+            res[i] = _initcap(value, delimiter)
+    for delimiter, rows in rows_by_delimiters.items():
+        res[rows] = _initcap_in_bulk(strings[rows], delimiter)
+    result = ColumnEmulator(res, index=values.index)
     result.sf_type = values.sf_type
     return result
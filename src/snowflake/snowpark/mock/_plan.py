@@ -9,8 +9,19 @@ import re
 import typing
 import uuid
 from enum import Enum
-from functools import cached_property, partial
-from typing import TYPE_CHECKING, Dict, List, NoReturn, Optional, Union
+from functools import cached_property, partial, reduce
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    Iterable,
+    List,
+    NoReturn,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from unittest.mock import MagicMock
 
 from snowflake.snowpark._internal.analyzer.table_merge_expression import (
@@ -22,6 +33,7 @@ from snowflake.snowpark._internal.analyzer.table_merge_expression import (
     UpdateMergeExpression,
 )
 from snowflake.snowpark._internal.analyzer.window_expression import (
+    CurrentRow,
     FirstValue,
     Lag,
     LastValue,
@@ -36,10 +48,19 @@ from snowflake.snowpark._internal.analyzer.window_expression import (
 from snowflake.snowpark.mock._window_utils import (
     EntireWindowIndexer,
     RowFrameIndexer,
+    exact_numeric_values,
+    get_partition_bounds,
+    get_peer_ids,
+    get_row_frame_bounds,
     is_rank_related_window_function,
+    windowed_count,
+    windowed_extreme,
+    windowed_sum,
 )
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from snowflake.snowpark.mock._analyzer import MockAnalyzer
 
 import snowflake.snowpark.mock._file_operation as mock_file_operation
@@ -74,6 +95,8 @@ from snowflake.snowpark._internal.analyzer.binary_expression import (
 )
 from snowflake.snowpark._internal.analyzer.binary_plan_node import Join
 from snowflake.snowpark._internal.analyzer.expression import (
+    COLUMN_DEPENDENCY_ALL,
+    COLUMN_DEPENDENCY_DOLLAR,
     Attribute,
     CaseWhen,
     Expression,
@@ -89,6 +112,7 @@ from snowflake.snowpark._internal.analyzer.expression import (
     SubfieldInt,
     SubfieldString,
     UnresolvedAttribute,
+    derive_dependent_columns,
 )
 from snowflake.snowpark._internal.analyzer.snowflake_plan import SnowflakePlan
 from snowflake.snowpark._internal.analyzer.snowflake_plan_node import (
@@ -143,6 +167,7 @@ from snowflake.snowpark.mock._util import (
     convert_wildcard_to_regex,
     custom_comparator,
     fix_drift_between_column_sf_type_and_dtype,
+    restore_nulls_from_nullable_dtype,
 )
 from snowflake.snowpark.row import Row
 from snowflake.snowpark.types import (
@@ -163,6 +188,7 @@ from snowflake.snowpark.types import (
     TimestampType,
     TimeType,
     VariantType,
+    _IntegralType,
     _NumericType,
 )
 
@@ -234,8 +260,11 @@ def handle_order_by_clause(
     result_df: TableEmulator,
     analyzer: "MockAnalyzer",
     expr_to_alias: Optional[Dict[str, str]],
+    limit: Optional[int] = None,
 ) -> TableEmulator:
-    """Given an input dataframe `result_df` and a list of SortOrder expressions `order_by`, return the sorted dataframe."""
+    """Given an input dataframe `result_df` and a list of SortOrder expressions `order_by`, return the sorted dataframe.
+    If `limit` is given, only the first `limit` rows of the sorted dataframe are needed, and the other rows may be
+    omitted."""
     sort_columns_array = []
     sort_orders_array = []
     null_first_last_array = []
@@ -252,6 +281,16 @@ def handle_order_by_clause(
         null_first_last_array.append(
             isinstance(exp.null_ordering, NullsFirst) or exp.null_ordering == NullsFirst
         )
+    if limit is not None and limit < len(result_df):
+        # the rows that can't be among the first rows by the first sort key are dropped before sorting
+        is_candidate = _top_k_candidates(
+            result_df[sort_columns_array[0]],
+            limit,
+            sort_orders_array[0],
+            null_first_last_array[0],
+        )
+        if is_candidate is not None:
+            result_df = result_df[is_candidate]
     for column, ascending, null_first in reversed(
         list(zip(sort_columns_array, sort_orders_array, null_first_last_array))
     ):
@@ -306,6 +345,88 @@ def handle_range_frame_indexing(
     return windows
 
 
+VECTORIZED_AGGREGATE_WINDOW_FUNCTIONS = ("sum", "count", "min", "max", "avg")
+VECTORIZED_RANK_WINDOW_FUNCTIONS = (
+    "row_number",
+    "rank",
+    "dense_rank",
+    "percent_rank",
+    "cume_dist",
+)
+# The binary expressions computed with pandas nullable dtypes when their operands contain None
+NULLABLE_DTYPE_BINARY_EXPRESSIONS = (
+    Add,
+    Subtract,
+    Multiply,
+    Divide,
+    Remainder,
+    Pow,
+    GreaterThan,
+    GreaterThanOrEqual,
+    LessThan,
+    LessThanOrEqual,
+)
+VECTORIZED_AGGREGATE_FUNCTIONS = (
+    "sum",
+    "count",
+    "min",
+    "max",
+    "avg",
+    "count_distinct",
+    "median",
+    "listagg",
+)
+# The functions whose built-in local testing implementations compute the value of each row from this row only
+ROW_WISE_FUNCTIONS = (
+    "abs",
+    "coalesce",
+    "contains",
+    "dateadd",
+    "endswith",
+    "iff",
+    "initcap",
+    "length",
+    "lower",
+    "startswith",
+    "substring",
+    "to_boolean",
+    "to_char",
+    "to_date",
+    "to_decimal",
+    "to_double",
+    "to_time",
+    "to_timestamp",
+    "upper",
+)
+# The binary expressions whose value for a row only depends on the values of their operands for this row
+ROW_WISE_BINARY_EXPRESSIONS = (
+    Add,
+    Subtract,
+    Multiply,
+    Divide,
+    Remainder,
+    EqualTo,
+    NotEqualTo,
+    EqualNullSafe,
+    GreaterThan,
+    GreaterThanOrEqual,
+    LessThan,
+    LessThanOrEqual,
+    And,
+    Or,
+)
+# The built-in local testing implementations of the functions computed by handle_vectorized_window_expression
+# and handle_vectorized_aggregate_expression, and of the row-wise functions. A function patched by users is
+# computed window by window or group by group instead, and isn't assumed to be row-wise.
+VECTORIZED_FUNCTION_DEFAULT_IMPLEMENTATIONS = {
+    func_name: _MOCK_FUNCTION_IMPLEMENTATION_MAP.get(func_name)
+    for func_name in VECTORIZED_AGGREGATE_WINDOW_FUNCTIONS
+    + VECTORIZED_RANK_WINDOW_FUNCTIONS
+    + VECTORIZED_AGGREGATE_FUNCTIONS
+    + ROW_WISE_FUNCTIONS
+}
+
+
 def handle_function_expression(
     exp: FunctionExpression,
     input_data: Union[TableEmulator, ColumnEmulator],
@@ -382,10 +503,756 @@ def handle_function_expression(
     return _MOCK_FUNCTION_IMPLEMENTATION_MAP[func_name](*to_pass_args)
 
 
+def _is_row_wise_expression(exp: Expression) -> bool:
+    """Whether the value of the expression for a row only depends on the columns of this row."""
+    if isinstance(exp, (Attribute, Literal)):
+        return True
+    if isinstance(exp, UnresolvedAttribute):
+        return not exp.is_sql_text
+    if isinstance(exp, (Alias, UnresolvedAlias, UnaryMinus, Not, IsNull, IsNotNull)):
+        return _is_row_wise_expression(exp.child)
+    if isinstance(exp, ROW_WISE_BINARY_EXPRESSIONS):
+        return _is_row_wise_expression(exp.left) and _is_row_wise_expression(exp.right)
+    if isinstance(exp, Like):
+        return _is_row_wise_expression(exp.expr) and isinstance(exp.pattern, Literal)
+    if isinstance(exp, InExpression):
+        return _is_row_wise_expression(exp.columns) and all(
+            isinstance(value, Literal) for value in exp.values
+        )
+    if isinstance(exp, FunctionExpression):
+        func_name = exp.name.lower()
+        return (
+            func_name in ROW_WISE_FUNCTIONS
+            and _is_default_mock_function(func_name)
+            and not exp.is_distinct
+            and all(_is_row_wise_expression(child) for child in exp.children)
+        )
+    return False
+
+
+def _is_default_mock_function(func_name: str) -> bool:
+    """Whether the local testing implementation of the function is the built-in one, not one patched by users."""
+    default_implementation = VECTORIZED_FUNCTION_DEFAULT_IMPLEMENTATIONS.get(func_name)
+    return _MOCK_FUNCTION_IMPLEMENTATION_MAP.get(func_name) is default_implementation
+
+
+def handle_vectorized_window_expression(
+    exp: WindowExpression,
+    input_data: TableEmulator,
+    analyzer: "MockAnalyzer",
+    expr_to_alias: Dict[str, str],
+) -> Optional[ColumnEmulator]:
+    """
+    Computes a window expression over the whole input at once, using prefix sums, cumulative
+    min/max and shifts within each partition, instead of materializing one window per row.
+    Returns None if the window function, its arguments or its window frame is not supported,
+    in which case the window expression needs to be computed window by window.
+    """
+    import numpy as np
+
+    window_function = exp.window_function
+    window_spec = exp.window_spec
+    frame_spec = (
+        window_spec.frame_spec
+        if isinstance(window_spec.frame_spec, SpecifiedWindowFrame)
+        else None
+    )
+
+    func_name = None
+    if isinstance(window_function, FunctionExpression):
+        func_name = window_function.name.lower()
+        if window_function.is_distinct:
+            return None
+        if func_name in VECTORIZED_AGGREGATE_WINDOW_FUNCTIONS:
+            if not (
+                _is_default_mock_function(func_name)
+                and len(window_function.children) == 1
+                and (
+                    _is_row_wise_expression(window_function.children[0])
+                    or (
+                        func_name == "count"
+                        and isinstance(window_function.children[0], Star)
+                    )
+                )
+            ):
+                return None
+        elif func_name in VECTORIZED_RANK_WINDOW_FUNCTIONS:
+            if (
+                frame_spec is not None
+                or window_function.children
+                or not (
+                    _is_default_mock_function(func_name)
+                    or func_name not in _MOCK_FUNCTION_IMPLEMENTATION_MAP
+                )
+            ):
+                return None
+        else:
+            return None
+    elif isinstance(window_function, (Lead, Lag, FirstValue, LastValue)):
+        if not _is_row_wise_expression(window_function.expr) or (
+            window_function.ignore_nulls
+        ):
+            return None
+        if isinstance(window_function, (Lead, Lag)) and (
+            frame_spec is not None or not isinstance(window_function.default, Literal)
+        ):
+            return None
+    else:
+        return None
+
+    if is_rank_related_window_function(window_function) and not window_spec.order_spec:
+        # let the window by window evaluation report the error
+        return None
+    if frame_spec is not None and isinstance(frame_spec.frame_type, RangeFrame):
+        if isinstance(frame_spec.lower, Literal) or isinstance(
+            frame_spec.upper, Literal
+        ):
+            return None
+
+    # Sort the rows by the ORDER BY clause, then gather the rows of each partition, keeping
+    # the partitions in the order of their first row, just like the window by window evaluation
+    if window_spec.order_spec:
+        res = handle_order_by_clause(
+            window_spec.order_spec, input_data, analyzer, expr_to_alias
+        )
+    else:
+        res = input_data
+    if window_spec.partition_spec:
+        partition_columns = [e.name for e in window_spec.partition_spec]
+        if any(c not in res.columns for c in partition_columns) or (
+            res[partition_columns].isna().any(axis=None)
+        ):
+            return None
+        partition_ids = res.groupby(partition_columns, sort=False).ngroup().to_numpy()
+        order = np.argsort(partition_ids, kind="stable")
+        res = res.iloc[order]
+        partition_ids = partition_ids[order]
+    else:
+        partition_ids = np.zeros(len(res), dtype=np.int64)
+    num_rows = len(res)
+    positions = np.arange(num_rows)
+    partition_start, partition_end = get_partition_bounds(partition_ids)
+
+    def get_peer_bounds():
+        order_keys = [
+            np.asarray(
+                calculate_expression(e.child, res, analyzer, expr_to_alias),
+                dtype=object,
+            )
+            for e in window_spec.order_spec
+        ]
+        return get_partition_bounds(get_peer_ids(partition_start, order_keys))
+
+    # The window frame [start, end) of each row
+    max_frame_width = -1
+    if is_rank_related_window_function(window_function) and frame_spec is None:
+        start, end = partition_start, partition_end
+    elif frame_spec is not None and isinstance(frame_spec.frame_type, RowFrame):
+        start, end = get_row_frame_bounds(frame_spec, partition_start, partition_end)
+        bounds = [
+            0 if isinstance(b, CurrentRow) else b.value
+            for b in (frame_spec.lower, frame_spec.upper)
+            if isinstance(b, (CurrentRow, Literal))
+        ]
+        if len(bounds) == 2:
+            max_frame_width = max(0, bounds[1] - bounds[0] + 1)
+    elif not window_spec.order_spec:
+        start, end = partition_start, partition_end
+    else:
+        peer_start, peer_end = get_peer_bounds()
+        if frame_spec is None:
+            start, end = partition_start, peer_end
+        else:
+            start = (
+                partition_start
+                if isinstance(frame_spec.lower, UnboundedPreceding)
+                else peer_start
+            )
+            end = (
+                partition_end
+                if isinstance(frame_spec.upper, UnboundedFollowing)
+                else peer_end
+            )
+
+    data, dtype = None, object
+    if func_name in VECTORIZED_AGGREGATE_WINDOW_FUNCTIONS:
+        if isinstance(window_function.children[0], Star):
+            # count(*) counts every row of the frame
+            is_valid = np.ones(num_rows, dtype=bool)
+        else:
+            argument = calculate_expression(
+                window_function.children[0], res, analyzer, expr_to_alias
+            )
+            arg_type = argument.sf_type
+            is_valid = ~argument.isna().to_numpy()
+            if func_name != "count":
+                # Decimals and integers beyond the range of int64 are computed window by window
+                if not isinstance(arg_type.datatype, _NumericType) or isinstance(
+                    arg_type.datatype, DecimalType
+                ):
+                    return None
+                values = exact_numeric_values(argument.tolist(), is_valid)
+                if values is None:
+                    return None
+        window_count = windowed_count(
+            is_valid, partition_ids, partition_start, start, end
+        )
+        if func_name in ("sum", "avg"):
+            # the window by window evaluation adds the values as floats, which is only exact for the
+            # integers in the range of float64
+            if values.dtype.kind == "i" and np.abs(values).max(initial=0) > 2**53:
+                return None
+            window_sum = windowed_sum(
+                values.astype(float),
+                partition_start,
+                partition_end,
+                start,
+                end,
+                max_frame_width,
+            )
+            if window_sum is None:
+                return None
+        if func_name == "count":
+            data, dtype = window_count, np.int64
+            sf_type = ColumnType(LongType(), False)
+        elif func_name == "sum":
+            data = np.where(window_count > 0, window_sum, None)
+            sf_type = ColumnType(arg_type.datatype, arg_type.nullable)
+        elif func_name == "avg":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                data = np.where(window_count > 0, window_sum / window_count, None)
+            # the result type is derived from the window of the first row, like the window by window evaluation
+            if num_rows == 0 or window_count[0] == 0:
+                sf_type = ColumnType(NullType(), True)
+            elif isinstance(arg_type.datatype, _IntegralType):
+                sf_type = ColumnType(DecimalType(38, 6), False)
+            else:
+                sf_type = ColumnType(FloatType(), False)
+        else:  # min and max
+            extreme = windowed_extreme(
+                values,
+                is_valid,
+                partition_ids,
+                partition_start,
+                partition_end,
+                start,
+                end,
+                max_frame_width,
+                func_name == "max",
+            )
+            if extreme is None:
+                return None
+            # integers are returned as they are, and floats are rounded like mock_min and mock_max
+            if isinstance(arg_type.datatype, _IntegralType):
+                data = [
+                    int(v) if c > 0 else None
+                    for v, c in zip(extreme.tolist(), window_count)
+                ]
+            else:
+                data = [
+                    round(v, 5) if c > 0 else None
+                    for v, c in zip(extreme.tolist(), window_count)
+                ]
+            sf_type = arg_type
+    elif func_name in VECTORIZED_RANK_WINDOW_FUNCTIONS:
+        position_in_partition = positions - partition_start
+        partition_size = partition_end - partition_start
+        if func_name == "row_number":
+            data, dtype = position_in_partition + 1, np.int64
+            sf_type = ColumnType(LongType(), False)
+        else:
+            peer_start, peer_end = get_peer_bounds()
+            rank = peer_start - partition_start + 1
+            if func_name == "rank":
+                data, dtype = rank, np.int64
+                sf_type = ColumnType(LongType(), False)
+            elif func_name == "dense_rank":
+                is_peer_start = (peer_start == positions).astype(np.int64)
+                peer_count = np.cumsum(is_peer_start)
+                data, dtype = peer_count - peer_count[partition_start] + 1, np.int64
+                sf_type = ColumnType(LongType(), False)
+            elif func_name == "percent_rank":
+                data = np.where(
+                    partition_size > 1,
+                    (rank - 1) / np.maximum(partition_size - 1, 1),
+                    0.0,
+                )
+                dtype = float
+                sf_type = ColumnType(DoubleType(), False)
+            else:  # cume_dist
+                data, dtype = (peer_end - partition_start) / partition_size, float
+                sf_type = ColumnType(DoubleType(), False)
+    elif isinstance(window_function, (FirstValue, LastValue)):
+        if (start >= end).any():
+            return None
+        values = calculate_expression(
+            window_function.expr, res, analyzer, expr_to_alias
+        )
+        sf_type = values.sf_type
+        values = np.asarray(values.where(values.notna(), None), dtype=object)
+        data = values[start if isinstance(window_function, FirstValue) else end - 1]
+    else:  # lead and lag
+        offset = window_function.offset * (
+            1 if isinstance(window_function, Lead) else -1
+        )
+        target = positions + offset
+        is_in_partition = (target >= partition_start) & (target < partition_end)
+        default = calculate_expression(
+            window_function.default, res, analyzer, expr_to_alias
+        )
+        default_type = default.sf_type
+        data = np.asarray(default, dtype=object)
+        sf_type = default_type
+        if is_in_partition.any():
+            values = calculate_expression(
+                window_function.expr, res, analyzer, expr_to_alias
+            )
+            expr_type = values.sf_type
+            values = np.asarray(values.where(values.notna(), None), dtype=object)
+            data = np.where(
+                is_in_partition, values[np.where(is_in_partition, target, 0)], data
+            )
+            if is_in_partition.all() or isinstance(default_type.datatype, NullType):
+                sf_type = expr_type
+            elif isinstance(expr_type.datatype, NullType):
+                sf_type = default_type
+            elif type(expr_type.datatype) is not type(default_type.datatype) and not (
+                isinstance(expr_type.datatype, StringType)
+                and isinstance(default_type.datatype, StringType)
+            ):
+                raise SnowparkSQLException(
+                    f"[Local Testing] Detected type {type(expr_type.datatype)} and type {type(default_type.datatype)}"
+                    f" in column, coercion is not currently supported"
+                )
+            else:
+                sf_type = expr_type
+
+    res_col = ColumnEmulator(data=data, dtype=dtype, index=res.index)
+    res_col.sf_type = sf_type
+    return res_col.sort_index()
+
+
+def handle_vectorized_aggregate_expression(
+    exp: Expression,
+    input_data: TableEmulator,
+    group_ids: "np.ndarray",
+    num_groups: int,
+    analyzer: "MockAnalyzer",
+    expr_to_alias: Dict[str, str],
+) -> Optional[Tuple[list, ColumnType]]:
+    """
+    Computes an aggregate expression for all groups of the input at once, from the group id of each
+    row, instead of evaluating the aggregate function on every group. Returns the value of each group
+    and the type of the result, or None if the aggregate function or its arguments are not supported,
+    in which case the aggregate expression needs to be computed group by group.
+    """
+    import numpy as np
+
+    if isinstance(exp, (Alias, UnresolvedAlias)):
+        exp = exp.child
+    if isinstance(exp, ListAgg):
+        func_name, arguments = "listagg", [exp.col]
+    elif isinstance(exp, FunctionExpression):
+        func_name = exp.name.lower()
+        if func_name == "count" and exp.is_distinct:
+            func_name = "count_distinct"
+        elif exp.is_distinct:
+            return None
+        arguments = exp.children
+    else:
+        return None
+    if (
+        func_name not in VECTORIZED_AGGREGATE_FUNCTIONS
+        or not _is_default_mock_function(func_name)
+        or not arguments
+        or (len(arguments) > 1 and func_name != "count_distinct")
+        or not all(_is_row_wise_expression(argument) for argument in arguments)
+    ):
+        return None
+
+    columns = [
+        calculate_expression(argument, input_data, analyzer, expr_to_alias)
+        for argument in arguments
+    ]
+    column = columns[0]
+    arg_type = column.sf_type
+    is_null = column.isna().to_numpy()
+
+    if func_name == "count":
+        counts = np.bincount(group_ids[~is_null], minlength=num_groups)
+        return counts.tolist(), ColumnType(LongType(), False)
+    if func_name == "count_distinct":
+        # the distinct rows that don't contain a None are counted, like mock_count_distinct
+        has_none = np.zeros(len(column), dtype=bool)
+        for c in columns:
+            has_none |= np.fromiter((v is None for v in c), dtype=bool, count=len(c))
+        rows = pd.DataFrame(
+            {
+                "group_id": group_ids,
+                **{str(i): c.to_numpy(dtype=object) for i, c in enumerate(columns)},
+            }
+        )[~has_none].drop_duplicates()
+        counts = np.bincount(rows["group_id"].to_numpy(), minlength=num_groups)
+        return counts.tolist(), ColumnType(LongType(), False)
+    if func_name == "listagg":
+        # the non-null values of each group in the order of the rows
+        order = np.argsort(group_ids, kind="stable")
+        values = column.to_numpy(dtype=object)[order]
+        not_null = ~is_null[order]
+        group_end = np.cumsum(np.bincount(group_ids, minlength=num_groups))
+        result = []
+        for start, end in zip(np.concatenate(([0], group_end[:-1])), group_end):
+            group_values = values[start:end][not_null[start:end]]
+            if exp.is_distinct:
+                group_values = dict.fromkeys(group_values)
+            result.append(exp.delimiter.join(str(v) for v in group_values))
+        return result, ColumnType(StringType(16777216), exp.col.nullable)
+
+    if not isinstance(arg_type.datatype, _NumericType):
+        if func_name in ("min", "max"):
+            values = column[~is_null].groupby(group_ids[~is_null], sort=False)
+            extremes = values.min() if func_name == "min" else values.max()
+            return [extremes.get(g) for g in range(num_groups)], arg_type
+        return None
+    if func_name in ("min", "max", "median"):
+        if func_name == "median":
+            try:
+                values = pd.Series(np.asarray(column, dtype=float))
+            except (TypeError, ValueError):
+                return None
+            values = values[~is_null].groupby(group_ids[~is_null], sort=False)
+            aggregated = values.median()
+            datatype = arg_type.datatype
+            if isinstance(datatype, DecimalType):
+                datatype = DecimalType(datatype.precision + 3, datatype.scale + 3)
+            sf_type = ColumnType(datatype, arg_type.nullable)
+        else:
+            values = column[~is_null].groupby(group_ids[~is_null], sort=False)
+            aggregated = values.min() if func_name == "min" else values.max()
+            sf_type = arg_type
+        return [
+            round(aggregated.get(g, math.nan), 5) for g in range(num_groups)
+        ], sf_type
+
+    if func_name == "avg" and isinstance(arg_type.datatype, DecimalType):
+        # mock_avg averages Decimals exactly, which float64 sums can't
+        return None
+    try:
+        values = np.asarray(column, dtype=float)
+    except (TypeError, ValueError):
+        return None
+    is_nan = np.isnan(values)
+    if (
+        func_name == "avg"
+        and isinstance(arg_type.datatype, _IntegralType)
+        and np.abs(np.where(is_nan, 0.0, values)).sum() >= 2**53
+    ):
+        # the float64 sums of integers this large may not be exact
+        return None
+    # np.bincount adds the values of each group in the order of the rows, like the built-in implementations
+    sums = np.bincount(
+        group_ids, weights=np.where(is_nan, 0.0, values), minlength=num_groups
+    )
+    counts = np.bincount(group_ids[~is_nan], minlength=num_groups)
+    if func_name == "sum":
+        datatype = arg_type.datatype
+        if isinstance(datatype, DecimalType):
+            datatype = DecimalType(min(38, datatype.precision + 12), datatype.scale)
+        return [
+            s if c > 0 else None for s, c in zip(sums.tolist(), counts.tolist())
+        ], ColumnType(datatype, arg_type.nullable)
+    # avg, whose result type is derived from the last group, like the group by group evaluation
+    if counts[-1] == 0:
+        sf_type = ColumnType(NullType(), True)
+    elif isinstance(arg_type.datatype, _IntegralType):
+        sf_type = ColumnType(DecimalType(38, 6), False)
+    elif isinstance(arg_type.datatype, DecimalType):
+        scale = arg_type.datatype.scale
+        scale = scale + 6 if scale <= 6 else max(scale, 12)
+        sf_type = ColumnType(
+            DecimalType(max(38, arg_type.datatype.precision + 12), scale), False
+        )
+    else:
+        sf_type = ColumnType(FloatType(), False)
+    return [
+        s / c if c > 0 else None for s, c in zip(sums.tolist(), counts.tolist())
+    ], sf_type
+
+
+def split_conjuncts(exp: Expression) -> List[Expression]:
+    """Flattens a tree of AND expressions into the list of its conjuncts."""
+    if isinstance(exp, And):
+        return split_conjuncts(exp.left) + split_conjuncts(exp.right)
+    return [exp]
+
+
+def referenced_column_names(
+    expressions: Iterable[Expression], expr_to_alias: Dict[str, str]
+) -> Optional[Set[str]]:
+    """
+    Returns the names of the input columns that the expressions may read, or None if they can't be known, e.g.,
+    if an expression contains a star or a SQL text. An attribute may be read by its alias or by its name, so
+    both are returned.
+    """
+    expressions = [exp for exp in expressions if exp is not None]
+    dependent_columns = derive_dependent_columns(*expressions)
+    if (
+        dependent_columns is COLUMN_DEPENDENCY_ALL
+        or dependent_columns == COLUMN_DEPENDENCY_DOLLAR
+    ):
+        return None
+    names = set(dependent_columns)
+    # the children of expressions are stored in attributes with different names, e.g., `child`, `children`,
+    # `branches` or `partition_spec`, so all the expressions nested in the attributes are visited
+    to_visit, visited = list(expressions), set()
+    while to_visit:
+        value = to_visit.pop()
+        if isinstance(value, (list, tuple)):
+            to_visit.extend(value)
+        if not isinstance(value, Expression) or id(value) in visited:
+            continue
+        visited.add(id(value))
+        if isinstance(value, Star) or (
+            isinstance(value, UnresolvedAttribute) and value.is_sql_text
+        ):
+            return None
+        if isinstance(value, Attribute):
+            names.add(expr_to_alias.get(value.expr_id, value.name))
+        if isinstance(value, (Attribute, UnresolvedAttribute)):
+            names.add(value.name)
+        to_visit.extend(vars(value).values())
+    return names
+
+
+def filter_rows(
+    table: TableEmulator,
+    condition: Optional[Expression],
+    analyzer: "MockAnalyzer",
+    expr_to_alias: Dict[str, str],
+) -> TableEmulator:
+    """Returns the rows of the table satisfying the condition, or the table if there is no condition."""
+    if condition is None:
+        return table
+    is_satisfied = calculate_expression(condition, table, analyzer, expr_to_alias)
+    return table[is_satisfied].reset_index(drop=True)
+
+
+def _projection_column_name(
+    exp: Expression, analyzer: "MockAnalyzer", expr_to_alias: Dict[str, str]
+) -> str:
+    """Returns the name of the column computed by an expression of a projection other than a star."""
+    if isinstance(exp, Alias):
+        return expr_to_alias.get(exp.expr_id, exp.name)
+    return analyzer.analyze(exp, expr_to_alias, parse_local_name=True)
+
+
+def can_filter_before_projection(
+    where: Expression,
+    projection: List[Expression],
+    analyzer: "MockAnalyzer",
+    expr_to_alias: Dict[str, str],
+) -> bool:
+    """
+    Whether the condition of a WHERE clause, which is evaluated on the columns computed by the projection, has the
+    same value when it's evaluated on the input of the projection. It's the case if the projection computes the
+    value of each row from this row only, and the condition only reads the columns of the input that the
+    projection selects without changing them.
+    """
+    where_columns = referenced_column_names([where], expr_to_alias)
+    if where_columns is None:
+        return False
+    for exp in projection:
+        if isinstance(exp, Star) and not exp.expressions:
+            continue
+        if not _is_row_wise_expression(exp):
+            return False
+        if not isinstance(exp, (Attribute, UnresolvedAttribute)) and (
+            _projection_column_name(exp, analyzer, expr_to_alias) in where_columns
+        ):
+            return False
+    return True
+
+
+def _top_k_candidates(
+    column: ColumnEmulator, k: int, ascending: bool, null_first: bool
+) -> Optional["np.ndarray"]:
+    """
+    Returns whether each row may be among the first k rows when the rows are sorted by the values of the column
+    like custom_comparator does, which are the first k rows and the rows tied with the k-th row, or None if the
+    values of the column aren't all numbers or all strings.
+    """
+    import numpy as np
+
+    values = column.to_numpy(dtype=object)
+    if values.ndim != 1:  # columns with duplicate names
+        return None
+    is_null = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    non_null_values = values[~is_null]
+    if all(
+        isinstance(v, (int, float, np.integer, np.floating)) for v in non_null_values
+    ):
+        try:
+            numbers = non_null_values.astype(float)
+        except OverflowError:
+            return None
+        is_nan = np.zeros(len(values), dtype=bool)
+        is_nan[~is_null] = np.isnan(numbers)
+        keys = np.zeros(len(values))
+        keys[~is_null] = np.where(np.isnan(numbers), 0.0, numbers)
+    elif all(isinstance(v, str) and "\0" not in v for v in non_null_values):
+        # NumPy strings are compared by code points like Python strings, but drop trailing null characters
+        is_nan = np.zeros(len(values), dtype=bool)
+        keys = np.full(len(values), "", dtype=non_null_values.astype(str).dtype)
+        keys[~is_null] = non_null_values
+    else:
+        return None
+
+    is_value = ~is_null & ~is_nan
+    # NaN follows the numbers in ascending order and precedes them in descending order, nulls are first or
+    # last in both orders
+    value_groups = [is_value, is_nan] if ascending else [is_nan, is_value]
+    groups = [is_null] + value_groups if null_first else value_groups + [is_null]
+    is_candidate = np.zeros(len(values), dtype=bool)
+    remaining = k
+    for group in groups:
+        count = int(group.sum())
+        if remaining <= 0:
+            break
+        if count <= remaining or group is not is_value:
+            is_candidate |= group
+        else:
+            group_keys = keys[group]
+            if ascending:
+                threshold = np.partition(group_keys, remaining - 1)[remaining - 1]
+                is_candidate |= group & (keys <= threshold)
+            else:
+                threshold = np.partition(group_keys, count - remaining)[
+                    count - remaining
+                ]
+                is_candidate |= group & (keys >= threshold)
+        remaining -= count
+    return is_candidate
+
+
+def _calculate_join_key(
+    exp: Expression,
+    input_data: TableEmulator,
+    analyzer: "MockAnalyzer",
+    expr_to_alias: Dict[str, str],
+) -> Optional[ColumnEmulator]:
+    """Evaluates one side of an equality in a join condition against one input of the join,
+    returns None if the expression can't be evaluated using the columns of this input only."""
+    try:
+        return calculate_expression(exp, input_data, analyzer, expr_to_alias)
+    except SnowparkSQLException as ex:
+        if "invalid identifier" in ex.message:
+            # the expression references columns of the other input (or both inputs)
+            return None
+        raise
+
+
+def get_join_candidate_pairs(
+    left: TableEmulator,
+    right: TableEmulator,
+    join_condition: Expression,
+    analyzer: "MockAnalyzer",
+    expr_to_alias: Dict[str, str],
+):
+    """
+    Returns the row positions (left_idx, right_idx) of the pairs of rows that may satisfy the join condition,
+    in the order of a Cartesian product of the two inputs.
+
+    Conjuncts of the form ``<expr on left> = <expr on right>`` are used as keys of a hash join, so only the
+    pairs with equal keys are returned. If the join condition has no such conjunct, every pair of rows is
+    returned. In both cases the full join condition still needs to be evaluated on the returned pairs.
+    """
+    import numpy as np
+
+    left_keys, right_keys = [], []
+    for conjunct in split_conjuncts(join_condition):
+        if not isinstance(conjunct, EqualTo):
+            continue
+        left_on_left, left_on_right, right_on_left, right_on_right = (
+            _calculate_join_key(operand, side, analyzer, expr_to_alias)
+            for operand in (conjunct.left, conjunct.right)
+            for side in (left, right)
+        )
+        if (
+            left_on_left is not None
+            and left_on_right is None
+            and right_on_left is None
+            and right_on_right is not None
+        ):
+            left_keys.append(left_on_left)
+            right_keys.append(right_on_right)
+        elif (
+            left_on_left is None
+            and left_on_right is not None
+            and right_on_left is not None
+            and right_on_right is None
+        ):
+            left_keys.append(right_on_left)
+            right_keys.append(left_on_right)
+
+    if left_keys:
+        key_names = [f"KEY_{i}" for i in range(len(left_keys))]
+        left_key_df = pd.DataFrame(
+            {
+                name: np.asarray(key, dtype=object)
+                for name, key in zip(key_names, left_keys)
+            }
+        )
+        left_key_df["LEFT_IDX"] = np.arange(len(left))
+        right_key_df = pd.DataFrame(
+            {
+                name: np.asarray(key, dtype=object)
+                for name, key in zip(key_names, right_keys)
+            }
+        )
+        right_key_df["RIGHT_IDX"] = np.arange(len(right))
+        try:
+            pairs = left_key_df.merge(right_key_df, on=key_names, how="inner")
+        except TypeError:
+            # unhashable keys, e.g., values of ARRAY or OBJECT columns
+            pass
+        else:
+            pairs = pairs.sort_values(["LEFT_IDX", "RIGHT_IDX"], kind="stable")
+            return pairs["LEFT_IDX"].to_numpy(), pairs["RIGHT_IDX"].to_numpy()
+
+    return (
+        np.repeat(np.arange(len(left)), len(right)),
+        np.tile(np.arange(len(right)), len(left)),
+    )
+
+
+def take_join_pairs(
+    left: TableEmulator, right: TableEmulator, left_idx, right_idx
+) -> TableEmulator:
+    """Builds the table that pairs row left_idx[i] of the left input with row right_idx[i] of the right input."""
+    result_df = pd.concat(
+        [
+            left.iloc[left_idx].reset_index(drop=True),
+            right.iloc[right_idx].reset_index(drop=True),
+        ],
+        axis=1,
+    )
+    result_df.sf_types = {**left.sf_types, **right.sf_types}
+    return result_df
+
+
 def execute_mock_plan(
     plan: MockExecutionPlan,
     expr_to_alias: Optional[Dict[str, str]] = None,
+    *,
+    condition: Optional[Expression] = None,
+    required_columns: Optional[AbstractSet[str]] = None,
 ) -> Union[TableEmulator, List[Row]]:
+    """
+    Executes the plan. If `condition` is given, only the rows of the result satisfying it are returned, and the
+    condition is evaluated below the projections and joins of the plan where it gives the same rows. If
+    `required_columns` is given, only these columns of the result are needed, and the other columns may be
+    omitted.
+    """
     import numpy as np
 
     if expr_to_alias is None:
@@ -399,6 +1266,17 @@ def execute_mock_plan(
 
     entity_registry = analyzer.session._conn.entity_registry
 
+    if condition is not None and not (
+        isinstance(source_plan, (MockSelectExecutionPlan, Join))
+        or (isinstance(source_plan, MockSelectStatement) and source_plan.limit_ is None)
+    ):
+        return filter_rows(
+            execute_mock_plan(plan, expr_to_alias, required_columns=required_columns),
+            condition,
+            analyzer,
+            expr_to_alias,
+        )
+
     if isinstance(source_plan, SnowflakeValues):
         table = TableEmulator(
             source_plan.data,
@@ -415,7 +1293,12 @@ def execute_mock_plan(
                 table[column_name].replace(np.nan, None, inplace=True)
         return table
     if isinstance(source_plan, MockSelectExecutionPlan):
-        return execute_mock_plan(source_plan.execution_plan, expr_to_alias)
+        return execute_mock_plan(
+            source_plan.execution_plan,
+            expr_to_alias,
+            condition=condition,
+            required_columns=required_columns,
+        )
     if isinstance(source_plan, MockSelectStatement):
         projection: Optional[List[Expression]] = source_plan.projection or []
         from_: Optional[MockSelectable] = source_plan.from_
@@ -424,7 +1307,58 @@ def execute_mock_plan(
         limit_: Optional[int] = source_plan.limit_
         offset: Optional[int] = source_plan.offset
 
-        from_df = execute_mock_plan(from_, expr_to_alias)
+        if condition is not None:
+            # there is no limit, so the condition can be evaluated with the WHERE clause
+            where = condition if where is None else And(where, condition)
+
+        clause_columns = referenced_column_names(
+            [where, *(order_by or [])], expr_to_alias
+        )
+        if required_columns is not None and clause_columns is not None:
+            # the named columns computed by the projection that are neither required nor used by the clauses
+            # are pruned, the renamed columns are kept because they change the aliases of the attributes
+            pruned_projection = [
+                exp
+                for exp in projection
+                if not isinstance(exp, Alias)
+                or isinstance(exp.child, Attribute)
+                or _projection_column_name(exp, analyzer, expr_to_alias)
+                in required_columns | clause_columns
+            ]
+            # a projection without columns would have no rows
+            projection = pruned_projection or projection[:1]
+        if (
+            len(projection) == 1
+            and isinstance(projection[0], Star)
+            and not projection[0].expressions
+        ):
+            from_required_columns = (
+                None
+                if required_columns is None or clause_columns is None
+                else required_columns | clause_columns
+            )
+        elif any(isinstance(exp, Star) for exp in projection):
+            from_required_columns = None
+        else:
+            from_required_columns = referenced_column_names(
+                [*projection, where, *(order_by or [])], expr_to_alias
+            )
+
+        if where is not None and can_filter_before_projection(
+            where, projection, analyzer, expr_to_alias
+        ):
+            # the rows are filtered before the projection is computed, as deep in the plan as possible
+            from_df = execute_mock_plan(
+                from_,
+                expr_to_alias,
+                condition=where,
+                required_columns=from_required_columns,
+            )
+            where = None
+        else:
+            from_df = execute_mock_plan(
+                from_, expr_to_alias, required_columns=from_required_columns
+            )
 
         result_df = TableEmulator()
 
@@ -467,13 +1401,16 @@ def execute_mock_plan(
                                 expr_to_alias[k] = quoted_name
 
         if where:
-            condition = calculate_expression(where, result_df, analyzer, expr_to_alias)
-            result_df = result_df[condition]
+            result_df = filter_rows(result_df, where, analyzer, expr_to_alias)
 
         if order_by:
             result_df = handle_order_by_clause(
-                order_by, result_df, analyzer, expr_to_alias
-            )
+                order_by,
+                result_df,
+                analyzer,
+                expr_to_alias,
+                limit=None if limit_ is None else limit_ + (offset or 0),
+            ).reset_index(drop=True)
 
         if limit_ is not None:
             if offset is not None:
@@ -546,7 +1483,13 @@ def execute_mock_plan(
     if isinstance(source_plan, MockSelectableEntity):
         entity_name = source_plan.entity_name
         if entity_registry.is_existing_table(entity_name):
-            return entity_registry.read_table(entity_name)
+            table = entity_registry.read_table(entity_name)
+            if required_columns is not None and not table.sf_types_by_col_index:
+                # only the required columns are scanned
+                table = table[
+                    [column for column in table.columns if column in required_columns]
+                ]
+            return table
         elif entity_registry.is_existing_view(entity_name):
             execution_plan = entity_registry.get_review(entity_name)
             res_df = execute_mock_plan(execution_plan)
@@ -721,12 +1664,47 @@ def execute_mock_plan(
         if not children_dfs.indices:
             aggregate_by_groups(child_rf)
         else:
-            for _, indices in children_dfs.indices.items():
-                # we construct row by row
-                cur_group = child_rf.iloc[indices]
-                # each row starts with group keys/column expressions, if there is no group keys/column expressions
-                # it means aggregation without group (Datagrame.agg)
-                aggregate_by_groups(cur_group)
+            group_indices = list(children_dfs.indices.values())
+            group_ids = np.empty(len(child_rf), dtype=np.intp)
+            for group_id, indices in enumerate(group_indices):
+                group_ids[indices] = group_id
+            vectorized_results = [
+                handle_vectorized_aggregate_expression(
+                    exp,
+                    child_rf,
+                    group_ids,
+                    len(group_indices),
+                    plan.session._analyzer,
+                    expr_to_alias,
+                )
+                for exp in source_plan.aggregate_expressions[len(column_exps) :]
+            ]
+            if all(result is not None for result in vectorized_results):
+                # the values of the group keys are taken from the first row of each group
+                first_rows = [indices[0] for indices in group_indices]
+                key_columns = [
+                    [source_plan.grouping_expressions[idx].value] * len(first_rows)
+                    if is_literal
+                    else child_rf[expr].iloc[first_rows].tolist()
+                    for idx, (expr, is_literal, _) in enumerate(column_exps)
+                ]
+                for idx, (values, sf_type) in enumerate(vectorized_results):
+                    result_df_sf_Types[
+                        columns[idx + len(column_exps)]
+                    ] = result_df_sf_Types_by_col_idx[idx + len(column_exps)] = sf_type
+                data = [
+                    list(row)
+                    for row in zip(
+                        *key_columns, *(values for values, _ in vectorized_results)
+                    )
+                ]
+            else:
+                for indices in group_indices:
+                    # we construct row by row
+                    cur_group = child_rf.iloc[indices]
+                    # each row starts with group keys/column expressions, if there is no group keys/column expressions
+                    # it means aggregation without group (Datagrame.agg)
+                    aggregate_by_groups(cur_group)
 
         if len(data):
             for col in range(len(data[0])):
@@ -766,6 +1744,133 @@ def execute_mock_plan(
         right = execute_mock_plan(source_plan.right, R_expr_to_alias).reset_index(
             drop=True
         )
+        common_columns = set(L_expr_to_alias.keys()).intersection(
+            R_expr_to_alias.keys()
+        )
+        new_expr_to_alias = {
+            k: v
+            for k, v in {
+                **L_expr_to_alias,
+                **R_expr_to_alias,
+            }.items()
+            if k not in common_columns
+        }
+        expr_to_alias.update(new_expr_to_alias)
+
+        join_type_sql = source_plan.join_type.sql
+        remaining_condition = condition
+        # pandas orders the rows of a join on key columns by key, so the inputs of joins USING columns and
+        # NATURAL joins aren't filtered to keep the order of the rows
+        if condition is not None and not join_type_sql.startswith(
+            ("USING ", "NATURAL ")
+        ):
+            # the conjuncts of the condition that only read the columns of one input are evaluated on this input
+            # before joining, unless the join adds rows with nulls in the columns of this input
+            left_conjuncts, right_conjuncts, remaining_conjuncts = [], [], []
+            for conjunct in split_conjuncts(condition):
+                conjunct_columns = (
+                    referenced_column_names([conjunct], expr_to_alias)
+                    if _is_row_wise_expression(conjunct)
+                    else None
+                )
+                if not conjunct_columns:
+                    remaining_conjuncts.append(conjunct)
+                elif (
+                    "RIGHT" not in join_type_sql
+                    and "FULL" not in join_type_sql
+                    and conjunct_columns.issubset(left.columns)
+                    and conjunct_columns.isdisjoint(right.columns)
+                ):
+                    left_conjuncts.append(conjunct)
+                elif (
+                    "LEFT" not in join_type_sql
+                    and "FULL" not in join_type_sql
+                    and conjunct_columns.issubset(right.columns)
+                    and conjunct_columns.isdisjoint(left.columns)
+                ):
+                    right_conjuncts.append(conjunct)
+                else:
+                    remaining_conjuncts.append(conjunct)
+            if left_conjuncts:
+                left = filter_rows(
+                    left, reduce(And, left_conjuncts), analyzer, expr_to_alias
+                )
+            if right_conjuncts:
+                right = filter_rows(
+                    right, reduce(And, right_conjuncts), analyzer, expr_to_alias
+                )
+            remaining_condition = (
+                reduce(And, remaining_conjuncts) if remaining_conjuncts else None
+            )
+
+        if source_plan.join_condition:
+            # ON a condition, evaluate the condition on the candidate pairs of rows found by a hash join
+            # on the equality conjuncts of the condition (or on a Cartesian product if there is none)
+            left_idx, right_idx = get_join_candidate_pairs(
+                left, right, source_plan.join_condition, analyzer, expr_to_alias
+            )
+            candidate_df = take_join_pairs(left, right, left_idx, right_idx)
+            condition = calculate_expression(
+                source_plan.join_condition, candidate_df, analyzer, expr_to_alias
+            )
+            matched = condition.fillna(False).to_numpy(dtype=bool)
+            result_df = candidate_df[matched].reset_index(drop=True)
+            sf_types = dict(candidate_df.sf_types)
+
+            is_left_matched = np.zeros(len(left), dtype=bool)
+            is_left_matched[left_idx[matched]] = True
+            is_right_matched = np.zeros(len(right), dtype=bool)
+            is_right_matched[right_idx[matched]] = True
+
+            def unmatched_rows(base_df, is_matched, other_df):
+                unmatched_df = base_df[~is_matched].reset_index(drop=True)
+                for column in other_df.columns:
+                    unmatched_df[column] = None
+                return unmatched_df
+
+            if "SEMI" in join_type_sql:  # left semi
+                result_df = left[is_left_matched]
+                sf_types = dict(left.sf_types)
+            elif "ANTI" in join_type_sql:  # left anti
+                result_df = left[~is_left_matched]
+                sf_types = dict(left.sf_types)
+            elif "LEFT" in join_type_sql:  # left outer join
+                # rows from LEFT that did not get matched
+                result_df = pd.concat(
+                    [result_df, unmatched_rows(left, is_left_matched, right)],
+                    ignore_index=True,
+                )
+                for right_column in right.columns.values:
+                    ct = sf_types[right_column]
+                    sf_types[right_column] = ColumnType(ct.datatype, True)
+            elif "RIGHT" in join_type_sql:  # right outer join
+                # rows from RIGHT that did not get matched
+                result_df = pd.concat(
+                    [result_df, unmatched_rows(right, is_right_matched, left)],
+                    ignore_index=True,
+                )
+                for left_column in left.columns.values:
+                    ct = sf_types[left_column]
+                    sf_types[left_column] = ColumnType(ct.datatype, True)
+            elif "OUTER" in join_type_sql:  # full outer join
+                result_df = pd.concat(
+                    [
+                        result_df,
+                        unmatched_rows(left, is_left_matched, right),
+                        unmatched_rows(right, is_right_matched, left),
+                    ],
+                    ignore_index=True,
+                )
+                for col_name, col_type in sf_types.items():
+                    sf_types[col_name] = ColumnType(col_type.datatype, True)
+            result_df.sf_types = sf_types
+            return filter_rows(
+                result_df.where(result_df.notna(), None),  # Swap np.nan with None
+                remaining_condition,
+                analyzer,
+                expr_to_alias,
+            )
+
         # Processing ON clause
         using_columns = getattr(source_plan.join_type, "using_columns", None)
         on = using_columns
@@ -776,10 +1881,6 @@ def execute_mock_plan(
                 on = None
         elif isinstance(on, Column):  # ON a single column
             on = on.name
-        elif isinstance(
-            on, BinaryExpression
-        ):  # ON a condition, apply where to a Cartesian product
-            on = None
         else:  # ON clause not specified, SF returns a Cartesian product
             on = None
 
@@ -827,74 +1928,12 @@ def execute_mock_plan(
                 ]
                 result_df = result_df[reordered_cols]
 
-        common_columns = set(L_expr_to_alias.keys()).intersection(
-            R_expr_to_alias.keys()
+        return filter_rows(
+            result_df.where(result_df.notna(), None),  # Swap np.nan with None
+            remaining_condition,
+            analyzer,
+            expr_to_alias,
         )
-        new_expr_to_alias = {
-            k: v
-            for k, v in {
-                **L_expr_to_alias,
-                **R_expr_to_alias,
-            }.items()
-            if k not in common_columns
-        }
-        expr_to_alias.update(new_expr_to_alias)
-
-        if source_plan.join_condition:
-
-            def outer_join(base_df):
-                ret = base_df.apply(tuple, 1).isin(
-                    result_df[condition][base_df.columns].apply(tuple, 1)
-                )
-                ret.sf_type = ColumnType(BooleanType(), True)
-                return ret
-
-            condition = calculate_expression(
-                source_plan.join_condition, result_df, analyzer, expr_to_alias
-            )
-            sf_types = result_df.sf_types
-            if "SEMI" in source_plan.join_type.sql:  # left semi
-                result_df = left[outer_join(left)]
-            elif "ANTI" in source_plan.join_type.sql:  # left anti
-                result_df = left[~outer_join(left)]
-            elif "LEFT" in source_plan.join_type.sql:  # left outer join
-                # rows from LEFT that did not get matched
-                unmatched_left = left[~outer_join(left)]
-                unmatched_left[right.columns] = None
-                result_df = pd.concat(
-                    [result_df[condition], unmatched_left], ignore_index=True
-                )
-                for right_column in right.columns.values:
-                    ct = sf_types[right_column]
-                    sf_types[right_column] = ColumnType(ct.datatype, True)
-            elif "RIGHT" in source_plan.join_type.sql:  # right outer join
-                # rows from RIGHT that did not get matched
-                unmatched_right = right[~outer_join(right)]
-                unmatched_right[left.columns] = None
-                result_df = pd.concat(
-                    [result_df[condition], unmatched_right], ignore_index=True
-                )
-                for left_column in left.columns.values:
-                    ct = sf_types[left_column]
-                    sf_types[left_column] = ColumnType(ct.datatype, True)
-            elif "OUTER" in source_plan.join_type.sql:  # full outer join
-                # rows from LEFT that did not get matched
-                unmatched_left = left[~outer_join(left)]
-                unmatched_left[right.columns] = None
-                # rows from RIGHT that did not get matched
-                unmatched_right = right[~outer_join(right)]
-                unmatched_right[left.columns] = None
-                result_df = pd.concat(
-                    [result_df[condition], unmatched_left, unmatched_right],
-                    ignore_index=True,
-                )
-                for col_name, col_type in sf_types.items():
-                    sf_types[col_name] = ColumnType(col_type.datatype, True)
-            else:
-                result_df = result_df[condition]
-            result_df.sf_types = sf_types
-
-        return result_df.where(result_df.notna(), None)  # Swap np.nan with None
     if isinstance(source_plan, MockFileOperation):
         return execute_file_operation(source_plan, analyzer)
     if isinstance(source_plan, SnowflakeCreateTable):
@@ -944,6 +1983,8 @@ def execute_mock_plan(
 
     if isinstance(source_plan, TableUpdate):
         target = entity_registry.read_table(source_plan.table_name)
+        # the rows are updated in place, so the data shared with the entity registry is copied
+        target = target.copy()
         ROW_ID = "row_id_" + generate_random_alphanumeric()
         target.insert(0, ROW_ID, range(len(target)))
 
@@ -1036,6 +2077,8 @@ def execute_mock_plan(
         return [Row(len(target) - len(rows_to_keep))]
     elif isinstance(source_plan, TableMerge):
         target = entity_registry.read_table(source_plan.table_name)
+        # the rows are updated in place, so the data shared with the entity registry is copied
+        target = target.copy()
         ROW_ID = "row_id_" + generate_random_alphanumeric()
         SOURCE_ROW_ID = "source_row_id_" + generate_random_alphanumeric()
         # Calculate cartesian product
@@ -1276,7 +2319,12 @@ def calculate_expression(
             # expr_id maps to the projected name, but input_data might still have the exp.name
             # dealing with the KeyError here, this happens in case df.union(df)
             # TODO: check SNOW-831880 for more context
-            return input_data[exp.name]
+            try:
+                return input_data[exp.name]
+            except KeyError:
+                raise SnowparkSQLException(
+                    f"[Local Testing] invalid identifier {exp.name}"
+                )
     if isinstance(exp, (UnresolvedAttribute, Attribute)):
         if exp.is_sql_text:
             raise NotImplementedError(
@@ -1340,7 +2388,7 @@ def calculate_expression(
                 # in live session, literal of string type will have size auto inferred
                 exp.datatype = StringType(len(exp.value))
             res = ColumnEmulator(
-                data=[exp.value for _ in range(len(input_data))],
+                data=[exp.value] * len(input_data),
                 sf_type=ColumnType(exp.datatype, False),
                 dtype=object,
             )
@@ -1348,11 +2396,15 @@ def calculate_expression(
             return res
         return exp.value
     if isinstance(exp, BinaryExpression):
+        # arithmetic operators and comparisons are computed with nullable dtypes when the operands contain None
+        nullable_dtypes = isinstance(exp, NULLABLE_DTYPE_BINARY_EXPRESSIONS)
         left = fix_drift_between_column_sf_type_and_dtype(
-            calculate_expression(exp.left, input_data, analyzer, expr_to_alias)
+            calculate_expression(exp.left, input_data, analyzer, expr_to_alias),
+            nullable_dtypes,
         )
         right = fix_drift_between_column_sf_type_and_dtype(
-            calculate_expression(exp.right, input_data, analyzer, expr_to_alias)
+            calculate_expression(exp.right, input_data, analyzer, expr_to_alias),
+            nullable_dtypes,
         )
         # TODO: Address mixed type calculation here. For instance Snowflake allows to add a date to a number, but
         #  pandas doesn't allow. Type coercion will address it.
@@ -1423,10 +2475,21 @@ def calculate_expression(
             raise NotImplementedError(
                 f"[Local Testing] Binary expression {type(exp)} is not implemented."
             )
+        if nullable_dtypes and isinstance(
+            new_column.array,
+            (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray),
+        ):
+            new_column = restore_nulls_from_nullable_dtype(new_column)
         return new_column
     if isinstance(exp, UnaryMinus):
-        res = calculate_expression(exp.child, input_data, analyzer, expr_to_alias)
-        return -res
+        res = fix_drift_between_column_sf_type_and_dtype(
+            calculate_expression(exp.child, input_data, analyzer, expr_to_alias),
+            nullable_dtypes=True,
+        )
+        res = -res
+        if isinstance(res.array, (pd.arrays.IntegerArray, pd.arrays.FloatingArray)):
+            res = restore_nulls_from_nullable_dtype(res)
+        return res
     if isinstance(exp, RegExp):
         lhs = calculate_expression(exp.expr, input_data, analyzer, expr_to_alias)
         raw_pattern = calculate_expression(
@@ -1585,6 +2648,12 @@ def calculate_expression(
                 output_data.sf_type = value.sf_type
         return output_data
     if isinstance(exp, WindowExpression):
+        res_col = handle_vectorized_window_expression(
+            exp, input_data, analyzer, expr_to_alias
+        )
+        if res_col is not None:
+            return res_col
+
         window_function = exp.window_function
         window_spec = exp.window_spec
 
@@ -475,10 +475,16 @@ class ColumnEmulator(PandasSeriesType):
     def __truediv__(self, other):
         result = super().__truediv__(other)
         sf_type = calculate_type(self.sf_type, other.sf_type, op="/")
+        # the missing values of a result with a nullable dtype are kept
+        double_dtype = (
+            "Float64"
+            if isinstance(result.dtype, pd.api.extensions.ExtensionDtype)
+            else "double"
+        )
         if isinstance(sf_type.datatype, DecimalType):
-            result = result.astype("double").round(sf_type.datatype.scale)
+            result = result.astype(double_dtype).round(sf_type.datatype.scale)
         elif isinstance(sf_type.datatype, (FloatType, DoubleType)):
-            result = result.astype("double").round(16)
+            result = result.astype(double_dtype).round(16)
         result.sf_type = sf_type
 
         return result
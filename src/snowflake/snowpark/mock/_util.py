@@ -189,14 +189,55 @@ def process_string_time_with_fractional_seconds(time: str, fractional_seconds) -
     return ret
 
 
-def fix_drift_between_column_sf_type_and_dtype(col: ColumnEmulator):
+def fix_drift_between_column_sf_type_and_dtype(
+    col: ColumnEmulator, nullable_dtypes: bool = False
+):
+    """
+    Converts a column to the NumPy dtype of its Snowflake type, so operators are computed on native arrays
+    instead of on Python objects. A numeric or boolean column containing None is left as it is, unless
+    ``nullable_dtypes`` is True, in which case it is converted to a pandas nullable dtype whose missing
+    values are the None values of the column. Decimals with a scale stay Python objects to keep their precision.
+    """
     import numpy
 
-    if (
-        isinstance(col.sf_type.datatype, _NumericType)
-        and col.apply(lambda x: x is None).any()
-    ):  # non-object dtype converts None to NaN for numeric columns
+    datatype = col.sf_type.datatype
+    if isinstance(datatype, DecimalType) and datatype.scale > 0:
         return col
+    if isinstance(datatype, (_NumericType, BooleanType)) and col.dtype == object:
+        values = col.to_numpy()
+        # None and NaN are both missing values of integral and boolean columns, NaN is a valid float value
+        is_null = (
+            numpy.equal(values, None)
+            if isinstance(datatype, (FloatType, DoubleType))
+            else pd.isna(values)
+        )
+        if is_null.any():
+            if not nullable_dtypes:
+                return col
+            values = numpy.where(is_null, 0, values)
+        try:
+            if isinstance(datatype, BooleanType):
+                data = numpy.asarray(values, dtype=bool)
+                array_type = pd.arrays.BooleanArray
+            elif isinstance(datatype, (FloatType, DoubleType)):
+                data = numpy.asarray(values, dtype=numpy.float64)
+                array_type = pd.arrays.FloatingArray
+            else:
+                data = numpy.asarray(values, dtype=numpy.int64)
+                # values that are not integers, e.g., the floats of a column with an inaccurate type, are kept
+                if not numpy.array_equal(data, numpy.asarray(values, dtype=float)):
+                    return col
+                array_type = pd.arrays.IntegerArray
+        except (TypeError, ValueError, OverflowError):
+            return col
+        result = ColumnEmulator(
+            array_type(data, is_null) if is_null.any() else data,
+            index=col.index,
+            name=col.name,
+            sf_type=col.sf_type,
+        )
+        result._null_rows_idxs = col._null_rows_idxs
+        return result
     sf_type_to_dtype = {
         ArrayType: object,
         BinaryType: object,
@@ -221,6 +262,23 @@ def fix_drift_between_column_sf_type_and_dtype(col: ColumnEmulator):
     return col
 
 
+def restore_nulls_from_nullable_dtype(col: ColumnEmulator) -> ColumnEmulator:
+    """
+    Converts a column computed with pandas nullable dtypes back to a column of Python objects whose missing
+    values are None. The missing values of a boolean column become False instead, which is what comparing
+    None values returns in columns of Python objects.
+    """
+    if isinstance(col.dtype, pd.BooleanDtype):
+        data = col.to_numpy(dtype=bool, na_value=False)
+    elif col.hasnans:
+        data = col.to_numpy(dtype=object, na_value=None)
+    else:
+        data = col.to_numpy(dtype=col.dtype.numpy_dtype)
+    result = ColumnEmulator(data, index=col.index, name=col.name, sf_type=col.sf_type)
+    result._null_rows_idxs = col._null_rows_idxs
+    return result
+
+
 # More info about all allowed aliases here:
 # https://docs.snowflake.com/en/sql-reference/functions-date-time#label-supported-date-time-parts
 
@@ -4,6 +4,7 @@
 
 try:
     import numpy as np
+    import pandas as pd
     from pandas.api.indexers import BaseIndexer
 except ImportError:
     # snowflake dataframe.py imports module that indirectly depends on this window_utils.py
@@ -87,3 +88,184 @@ def is_rank_related_window_function(func):
         isinstance(func, FunctionExpression)
         and func.name in RANK_RELATED_FUNCTION_NAMES
     )
+
+
+def get_partition_bounds(partition_ids: "np.ndarray"):
+    """
+    Given the id of the partition of each row, where the rows of a partition are contiguous,
+    returns the position of the first row of the partition of each row, and the position
+    right after the last row of the partition of each row.
+    """
+    num_values = len(partition_ids)
+    is_start = np.ones(num_values, dtype=bool)
+    is_start[1:] = partition_ids[1:] != partition_ids[:-1]
+    starts = np.flatnonzero(is_start)
+    ends = np.append(starts[1:], num_values)
+    return np.repeat(starts, ends - starts), np.repeat(ends, ends - starts)
+
+
+def get_peer_ids(partition_start: "np.ndarray", order_keys: list) -> "np.ndarray":
+    """
+    Returns the id of the peer group of each row, rows are peers if they are in the same partition
+    and have equal values for all the ORDER BY expressions `order_keys`.
+    """
+    num_values = len(partition_start)
+    is_start = partition_start == np.arange(num_values)
+    for key in order_keys:
+        is_start[1:] |= np.asarray(key[1:] != key[:-1], dtype=bool)
+    return np.cumsum(is_start)
+
+
+def get_row_frame_bounds(
+    frame_spec, partition_start: "np.ndarray", partition_end: "np.ndarray"
+):
+    """Vectorized version of RowFrameIndexer, returns the bounds of the row frame of each row."""
+    positions = np.arange(len(partition_start))
+    lower, upper = frame_spec.lower, frame_spec.upper
+
+    if isinstance(lower, CurrentRow):
+        start = positions
+    elif isinstance(lower, UnboundedPreceding):
+        start = partition_start
+    else:
+        assert isinstance(lower, Literal)
+        start = np.clip(positions + lower.value, partition_start, partition_end)
+
+    if isinstance(upper, CurrentRow):
+        end = positions + 1  # + 1 to include the right endpoint
+    elif isinstance(upper, UnboundedFollowing):
+        end = partition_end
+    else:
+        assert isinstance(upper, Literal)
+        end = np.clip(
+            positions + upper.value + 1, partition_start, partition_end
+        )  # + 1 to include the right endpoint
+
+    return start, np.maximum(start, end)
+
+
+def exact_numeric_values(values: list, is_valid: "np.ndarray"):
+    """
+    Returns the numeric `values` as an int64 array if the valid values are all integers, or as a float64
+    array if they are all floats, with 0 in place of the invalid values. Returns None if the valid values
+    can't be converted without changing them, e.g., Decimals and integers that don't fit in an int64.
+    """
+    valid_values = np.array([v for v, valid in zip(values, is_valid) if valid])
+    if not len(valid_values):
+        return np.zeros(len(is_valid), dtype=np.int64)
+    if valid_values.dtype.kind not in ("i", "f"):
+        return None
+    res = np.zeros(len(is_valid), dtype=valid_values.dtype)
+    res[is_valid] = valid_values
+    return res
+
+
+def windowed_count(
+    is_valid: "np.ndarray",
+    partition_ids: "np.ndarray",
+    partition_start: "np.ndarray",
+    start: "np.ndarray",
+    end: "np.ndarray",
+):
+    """
+    Returns the number of valid rows in the frame [start, end) of each row, computed as the difference
+    of prefix counts within each partition.
+    """
+    prefix_count = (
+        pd.Series(is_valid.astype(np.int64))
+        .groupby(partition_ids, sort=False)
+        .cumsum()
+        .to_numpy()
+    )
+    is_empty = start >= end
+    last = np.where(is_empty, partition_start, end - 1)
+    has_prefix = start > partition_start
+    before = np.maximum(start - 1, 0)
+    window_count = prefix_count[last] - np.where(has_prefix, prefix_count[before], 0)
+    window_count[is_empty] = 0
+    return window_count
+
+
+def windowed_sum(
+    values: "np.ndarray",
+    partition_start: "np.ndarray",
+    partition_end: "np.ndarray",
+    start: "np.ndarray",
+    end: "np.ndarray",
+    max_frame_width: int,
+):
+    """
+    Returns the sum of the float `values` in the frame [start, end) of each row, where invalid values are 0.
+    The values of each frame are added one by one in the order of the rows, like the window by window
+    evaluation, so the sums are the same. Returns None if the frames neither all start at the beginning of
+    the partition, nor are bounded by `max_frame_width` rows.
+    """
+    is_empty = start >= end
+    if (start == partition_start).all():
+        # the frames are prefixes of their partition, a difference of prefix sums would lose the precision
+        # of small values added to large values, so the prefix sums are only read at the end of the frames
+        prefix_sum = np.empty(len(values))
+        for first, last in zip(np.unique(partition_start), np.unique(partition_end)):
+            prefix_sum[first:last] = np.cumsum(values[first:last])
+        res = prefix_sum[np.where(is_empty, partition_start, end - 1)]
+    elif max_frame_width >= 0:
+        res = np.zeros(len(values))
+        for delta in range(max_frame_width):
+            idx = start + delta
+            res = np.where(
+                idx < end, res + values[np.minimum(idx, len(values) - 1)], res
+            )
+    else:
+        return None
+    res[is_empty] = 0.0
+    return res
+
+
+def windowed_extreme(
+    values: "np.ndarray",
+    is_valid: "np.ndarray",
+    partition_ids: "np.ndarray",
+    partition_start: "np.ndarray",
+    partition_end: "np.ndarray",
+    start: "np.ndarray",
+    end: "np.ndarray",
+    max_frame_width: int,
+    is_max: bool,
+):
+    """
+    Returns the min (or the max if `is_max`) of the valid int64 or float64 `values` in the frame [start, end)
+    of each row, in the dtype of `values`. The result is undefined for frames without valid values. Returns
+    None if the frames neither all start at the beginning of the partition, nor all end at the end of the
+    partition, nor are bounded by `max_frame_width` rows.
+    """
+    if values.dtype.kind == "i":
+        info = np.iinfo(values.dtype)
+        fill_value = info.min if is_max else info.max
+    else:
+        fill_value = -np.inf if is_max else np.inf
+    filled = np.where(is_valid, values, fill_value)
+    is_empty = start >= end
+
+    def cumulative(data, ids):
+        grouped = pd.Series(data).groupby(ids, sort=False)
+        return (grouped.cummax() if is_max else grouped.cummin()).to_numpy()
+
+    if (start == partition_start).all():
+        res = cumulative(filled, partition_ids)[
+            np.where(is_empty, partition_start, end - 1)
+        ]
+    elif (end == partition_end).all():
+        res = cumulative(filled[::-1], partition_ids[::-1])[::-1][
+            np.where(is_empty, partition_start, start)
+        ]
+    elif max_frame_width >= 0:
+        func = np.maximum if is_max else np.minimum
+        res = np.full(len(values), fill_value, dtype=values.dtype)
+        for delta in range(max_frame_width):
+            idx = start + delta
+            res = np.where(
+                idx < end, func(res, filled[np.minimum(idx, len(values) - 1)]), res
+            )
+    else:
+        return None
+    return res
@@ -4,15 +4,15 @@
 #
 
 import sys
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Optional, Union
 
 # Python 3.8 needs to use typing.Iterable because collections.abc.Iterable is not subscriptable
 # Python 3.9 can use both
 # Python 3.10 needs to use collections.abc.Iterable because typing.Iterable is removed
 if sys.version_info <= (3, 9):
-    from typing import Iterable
+    from typing import Iterable, Sequence
 else:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 
 
 def _restore_row_from_pickle(values, named_values, fields):
@@ -137,6 +137,23 @@ class Row(tuple):
         row.__dict__["_case_sensitive"] = True
         return row
 
+    @classmethod
+    def _from_values_and_fields(
+        cls,
+        values: Iterable[Any],
+        fields: List[str],
+        has_duplicates: bool,
+        case_sensitive: bool = True,
+    ) -> "Row":
+        # Creates the same Row as calling a Row of field names with ``values``, but ``fields``
+        # is shared by the rows of a result instead of being copied for each row
+        row = tuple.__new__(cls, values)
+        row.__dict__["_named_values"] = None
+        row.__dict__["_fields"] = fields
+        row.__dict__["_has_duplicates"] = has_duplicates
+        row.__dict__["_case_sensitive"] = case_sensitive
+        return row
+
     def __getitem__(self, item: Union[int, str, slice]):
         if isinstance(item, int):
             return super().__getitem__(item)
@@ -318,3 +335,86 @@ class Row(tuple):
 
     # Add aliases for user code migration
     asDict = as_dict
+
+
+class RowSet(Sequence):
+    """A read-only list of :class:`Row` objects, which is returned by
+    :meth:`DataFrame.collect` with ``columnar=True``.
+
+    The values of a ``RowSet`` are stored column by column and its rows share a single list
+    of field names. A :class:`Row` object is only created when a row is accessed, so a
+    ``RowSet`` of a large result uses much less memory than a list of rows. Use :meth:`column`
+    to get the values of a column without creating any rows.
+
+    >>> rows = session.create_dataframe([[1, "a"], [2, "b"]], schema=["n", "s"]).collect(columnar=True)
+    >>> len(rows)
+    2
+    >>> rows[1]
+    Row(N=2, S='b')
+    >>> rows.column("S")
+    ['a', 'b']
+    >>> rows == [Row(N=1, S="a"), Row(N=2, S="b")]
+    True
+    """
+
+    def __init__(
+        self,
+        columns: List[List[Any]],
+        fields: Optional[List[str]] = None,
+        case_sensitive: bool = True,
+    ) -> None:
+        self._columns = columns
+        self._fields = fields
+        self._has_duplicates = fields is not None and len(set(fields)) != len(fields)
+        self._case_sensitive = case_sensitive
+        self._num_rows = len(columns[0]) if columns else 0
+
+    @property
+    def fields(self) -> Optional[List[str]]:
+        """The field names of the rows."""
+        return list(self._fields) if self._fields is not None else None
+
+    def column(self, name_or_index: Union[str, int]) -> List[Any]:
+        """Returns the values of a column, which is specified by its field name or index."""
+        if isinstance(name_or_index, str):
+            name = (
+                name_or_index
+                if self._case_sensitive
+                else canonicalize_field(name_or_index)
+            )
+            if self._fields is None or name not in self._fields:
+                raise KeyError(name_or_index)
+            name_or_index = self._fields.index(name)
+        return list(self._columns[name_or_index])
+
+    def _to_row(self, values: Iterable[Any]) -> Row:
+        if self._fields is None:
+            return Row(*values)
+        return Row._from_values_and_fields(
+            values, self._fields, self._has_duplicates, self._case_sensitive
+        )
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def __getitem__(self, item: Union[int, slice]):
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(self._num_rows))]
+        if item < 0:
+            item += self._num_rows
+        if not 0 <= item < self._num_rows:
+            raise IndexError("RowSet index out of range")
+        return self._to_row(column[item] for column in self._columns)
+
+    def __iter__(self):
+        to_row = self._to_row
+        for values in zip(*self._columns):
+            yield to_row(values)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (RowSet, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -4,8 +4,8 @@
 #
 
 import atexit
+import copy
 import datetime
-import decimal
 import inspect
 import json
 import logging
@@ -15,11 +15,23 @@ import sys
 import tempfile
 import warnings
 from array import array
-from functools import reduce
+from contextlib import contextmanager
 from logging import getLogger
 from threading import RLock
 from types import ModuleType
-from typing import Any, Dict, List, Literal, Optional, Sequence, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import cloudpickle
 import pkg_resources
@@ -63,14 +75,23 @@ from snowflake.snowpark._internal.packaging_utils import (
     pip_install_packages_to_target_folder,
     zip_directory_contents,
 )
+from snowflake.snowpark._internal.import_cache import ImportCache
+from snowflake.snowpark._internal.package_cache import (
+    DEFAULT_PACKAGE_CACHE_TTL_SECONDS,
+    CachedEnvironment,
+    PackageCache,
+)
+from snowflake.snowpark._internal.result_cache import (
+    DEFAULT_RESULT_CACHE_MAX_BYTES,
+    ResultCache,
+)
 from snowflake.snowpark._internal.server_connection import ServerConnection
 from snowflake.snowpark._internal.telemetry import set_api_call_source
 from snowflake.snowpark._internal.type_utils import (
     ColumnOrName,
     convert_sp_to_sf_type,
-    infer_schema,
+    infer_schema_from_data,
     infer_type,
-    merge_type,
 )
 from snowflake.snowpark._internal.udf_utils import generate_call_python_sp_sql
 from snowflake.snowpark._internal.utils import (
@@ -79,7 +100,6 @@ from snowflake.snowpark._internal.utils import (
     SUPPORTED_TABLE_TYPES,
     PythonObjJSONEncoder,
     TempObjectType,
-    calculate_checksum,
     deprecated,
     escape_quotes,
     experimental,
@@ -104,7 +124,7 @@ from snowflake.snowpark._internal.utils import (
     warning,
     zip_file_or_directory_to_stream,
 )
-from snowflake.snowpark.async_job import AsyncJob
+from snowflake.snowpark.async_job import AsyncJob, AsyncJobGroup
 from snowflake.snowpark.column import Column
 from snowflake.snowpark.context import _use_scoped_temp_objects
 from snowflake.snowpark.dataframe import DataFrame
@@ -148,6 +168,7 @@ from snowflake.snowpark.table_function import (
 )
 from snowflake.snowpark.types import (
     ArrayType,
+    DataType,
     DateType,
     DecimalType,
     GeographyType,
@@ -186,6 +207,7 @@ _PYTHON_SNOWPARK_USE_LOGICAL_TYPE_FOR_CREATE_DATAFRAME_STRING = (
     "PYTHON_SNOWPARK_USE_LOGICAL_TYPE_FOR_CREATE_DATAFRAME"
 )
 WRITE_PANDAS_CHUNK_SIZE: int = 100000 if is_in_stored_procedure() else None
+CREATE_DATAFRAME_UPLOAD_THRESHOLD: int = 100000
 
 
 def _get_active_session() -> "Session":
@@ -470,6 +492,19 @@ class Session:
             )
         )
         self._custom_package_usage_config: Dict = {}
+        self._create_dataframe_upload_threshold: Optional[
+            int
+        ] = CREATE_DATAFRAME_UPLOAD_THRESHOLD
+        self._result_cache: Optional[ResultCache] = None
+        self._import_cache = ImportCache()
+        self._package_versions_cache: Dict[Tuple[str, str], Optional[List[str]]] = {}
+        self._package_cache: Optional[PackageCache] = None
+        # the results of INFER_SCHEMA and the temp file formats created to infer schemas,
+        # which are shared by the DataFrameReaders of this session
+        self._infer_schema_cache: Dict[Tuple[Optional[str], ...], List[Any]] = {}
+        self._temp_file_formats: Dict[Tuple[Optional[str], ...], str] = {}
+        self._infer_schema_lock = RLock()
+        self._max_concurrent_queries: int = 1
         self._conf = self.RuntimeConfig(self, options or {})
         self._tmpdir_handler: Optional[tempfile.TemporaryDirectory] = None
         self._runtime_version_from_requirement: str = None
@@ -493,6 +528,47 @@ class Session:
         self._last_action_id += 1
         return self._last_action_id
 
+    def _with_connection(
+        self, conn: Union[ServerConnection, MockServerConnection]
+    ) -> "Session":
+        """
+        Returns a copy of this session that executes its queries with ``conn``. The copy has its own
+        analyzer, plan builder, file operation, registration objects and runtime config, which are bound
+        to the copy, and a snapshot of the imports and packages of this session. It shares the caches of
+        this session, which are thread-safe.
+        """
+        session = copy.copy(self)
+        session._conn = conn
+        session._import_paths = dict(self._import_paths)
+        session._packages = dict(self._packages)
+        session._custom_package_usage_config = dict(self._custom_package_usage_config)
+        session._udf_registration = UDFRegistration(session)
+        session._udtf_registration = UDTFRegistration(session)
+        session._udaf_registration = UDAFRegistration(session)
+        session._sp_registration = StoredProcedureRegistration(session)
+        session._plan_builder = (
+            SnowflakePlanBuilder(session)
+            if isinstance(conn, ServerConnection)
+            else MockSnowflakePlanBuilder(session)
+        )
+        session._file = FileOperation(session)
+        session._analyzer = (
+            Analyzer(session)
+            if isinstance(conn, ServerConnection)
+            else MockAnalyzer(session)
+        )
+        session._conf = copy.copy(self._conf)
+        session._conf._session = session
+        session._conf._conf = dict(self._conf._conf)
+        return session
+
+    @contextmanager
+    def _with_new_cursor(self) -> Iterator["Session"]:
+        """Returns a copy of this session (see :meth:`_with_connection`) whose queries are executed with
+        a new cursor, which is closed on exit, so other threads can execute queries concurrently."""
+        with self._conn._with_new_cursor() as connection:
+            yield self._with_connection(connection)
+
     def close(self) -> None:
         """Close this session."""
         if is_in_stored_procedure():
@@ -513,6 +589,8 @@ class Session:
                 self._conn.close()
                 _logger.info("Closed session: %s", self._session_id)
             finally:
+                if self._result_cache is not None:
+                    self._result_cache.clear()
                 _remove_session(self)
 
     @property
@@ -526,6 +604,123 @@ class Session:
         """
         return self._sql_simplifier_enabled
 
+    @property
+    def plan_resolution_stats(self) -> Dict[str, int]:
+        """Returns the number of logical plan nodes resolved into a
+        :class:`~snowflake.snowpark._internal.analyzer.snowflake_plan.SnowflakePlan` in this session,
+        and the number of nodes whose resolved plan was reused because the node was shared
+        by several parents in the same plan (e.g., when a DataFrame is joined or unioned with itself).
+
+        Example::
+
+            >>> stats = session.plan_resolution_stats
+            >>> sorted(stats)
+            ['resolved', 'reused']
+        """
+        return {
+            "resolved": self._analyzer.resolved_plan_count,
+            "reused": self._analyzer.reused_plan_count,
+        }
+
+    @property
+    def schema_query_stats(self) -> Dict[str, int]:
+        """Returns the number of describe queries issued in this session to retrieve the schema of
+        DataFrames, the number of schemas found in the session's cache of described schema queries, and
+        the number of schemas inferred on the client side from the known schema of a subquery (e.g., for
+        projections and renames of columns, filters and sorts).
+
+        The cached schemas are discarded when a statement that may change the schema of a table or a
+        view (``ALTER``, ``CREATE``, ``DROP``, ``UNDROP`` or ``REPLACE``) is executed in this session.
+        Changes made by other sessions, scheduled tasks or stored procedures are not detected, so the
+        cached schema of a table changed this way stays stale (e.g., :attr:`DataFrame.columns` misses a
+        new column) until :meth:`clear_schema_cache` is called. Set :attr:`schema_cache_enabled` to
+        ``False`` to always describe schema queries.
+
+        Example::
+
+            >>> stats = session.schema_query_stats
+            >>> sorted(stats)
+            ['cache_hits', 'describe_queries', 'inferred']
+        """
+        if not isinstance(self._conn, ServerConnection):
+            return {"describe_queries": 0, "cache_hits": 0, "inferred": 0}
+        return {
+            "describe_queries": self._conn.describe_query_count,
+            "cache_hits": self._conn.schema_cache_hit_count,
+            "inferred": self._analyzer.inferred_attributes_count,
+        }
+
+    @property
+    def schema_cache_enabled(self) -> bool:
+        """Set to ``False`` to describe every schema query instead of reusing the schemas cached in this
+        session (defaults to ``True``), see :attr:`schema_query_stats`. Disabling the cache discards the
+        cached schemas.
+        """
+        return (
+            isinstance(self._conn, ServerConnection)
+            and self._conn._schema_cache_enabled
+        )
+
+    @schema_cache_enabled.setter
+    def schema_cache_enabled(self, value: bool) -> None:
+        if isinstance(self._conn, ServerConnection):
+            self._conn._schema_cache_enabled = value
+            if not value:
+                self._conn.clear_schema_cache()
+
+    def clear_schema_cache(self) -> None:
+        """Discards the schemas of DataFrames cached in this session, see :attr:`schema_query_stats`.
+        Call it after tables or views are changed by other sessions, scheduled tasks or stored procedures.
+        """
+        if isinstance(self._conn, ServerConnection):
+            self._conn.clear_schema_cache()
+
+    @property
+    def create_dataframe_upload_threshold(self) -> Optional[int]:
+        """Get or set the number of values (the number of rows multiplied by the number of columns) from which
+        :meth:`create_dataframe` uploads the local data to a temporary stage as a Parquet file and copies it
+        into a temporary table, instead of inserting the rows into the temporary table with parameter binding
+        (defaults to 100000). Set it to ``None`` to always use parameter binding. Uploading a file requires
+        ``pyarrow``, which is installed with the ``pandas`` extra.
+
+        Example::
+
+            >>> session.create_dataframe_upload_threshold = 1000000
+            >>> session.create_dataframe_upload_threshold
+            1000000
+            >>> session.create_dataframe_upload_threshold = 100000
+        """
+        return self._create_dataframe_upload_threshold
+
+    @create_dataframe_upload_threshold.setter
+    def create_dataframe_upload_threshold(self, value: Optional[int]) -> None:
+        self._create_dataframe_upload_threshold = value
+
+    @property
+    def max_concurrent_queries(self) -> int:
+        """Get or set the maximum number of queries that are executed concurrently when a DataFrame
+        action executes multiple queries (defaults to 1, which executes them one by one). The queries
+        that run before the final query of a DataFrame, like the queries creating and populating the
+        temporary tables of the large local data used by both sides of a join or union, are submitted
+        as soon as the queries they depend on finish, each with its own cursor of the connection.
+
+        Example::
+
+            >>> session.max_concurrent_queries = 4
+            >>> session.max_concurrent_queries
+            4
+            >>> session.max_concurrent_queries = 1
+        """
+        return self._max_concurrent_queries
+
+    @max_concurrent_queries.setter
+    def max_concurrent_queries(self, value: int) -> None:
+        if not isinstance(value, int) or value < 1:
+            raise ValueError(
+                f"max_concurrent_queries must be a positive integer, but got {value}"
+            )
+        self._max_concurrent_queries = value
+
     @property
     def custom_package_usage_config(self) -> Dict:
         """Get or set configuration parameters related to usage of custom Python packages in Snowflake.
@@ -584,6 +779,126 @@ class Session:
     def custom_package_usage_config(self, config: Dict) -> None:
         self._custom_package_usage_config = {k.lower(): v for k, v in config.items()}
 
+    def enable_result_cache(
+        self,
+        max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES,
+        spill_directory: Optional[str] = None,
+    ) -> None:
+        """
+        Enables a client-side cache of query results in this session, so evaluating the same
+        DataFrame again with :meth:`DataFrame.collect` or :meth:`DataFrame.to_pandas` returns
+        the cached result instead of executing its queries again.
+
+        Only the results of read-only queries (``SELECT`` and ``WITH`` queries) are cached. A result is
+        reused when the same SQL text is executed with the same bind parameters and the current role,
+        database, schema and warehouse of the session are unchanged. Cached results that may read a table
+        are invalidated by :meth:`Table.update`, :meth:`Table.delete`, :meth:`Table.merge` and
+        :meth:`DataFrameWriter.save_as_table` on this table, when they are executed and again when
+        they finish (for an :class:`AsyncJob`, when its result is fetched), but not by changes made
+        through :meth:`sql` or by other sessions, so call :meth:`clear_result_cache` after such changes.
+        Queries calling non-deterministic functions (e.g., ``random()`` or ``current_timestamp()``)
+        also return the cached result.
+
+        Args:
+            max_bytes: The maximum estimated size of the results kept in memory (defaults to 256 MB).
+                The least recently used results are evicted first.
+            spill_directory: A local directory where the results evicted from memory are written as
+                Arrow IPC files, which requires ``pyarrow``. If it is not set, evicted results are discarded.
+
+        Example::
+
+            >>> session.enable_result_cache()
+            >>> df = session.create_dataframe([[1, 2], [3, 4]], schema=["a", "b"]).filter("a > 1")
+            >>> df.collect()
+            [Row(A=3, B=4)]
+            >>> df.collect()
+            [Row(A=3, B=4)]
+            >>> session.result_cache_stats["hits"]
+            1
+            >>> session.disable_result_cache()
+        """
+        if self._result_cache is not None:
+            self._result_cache.clear()
+        self._result_cache = ResultCache(max_bytes, spill_directory)
+
+    def disable_result_cache(self) -> None:
+        """Disables the cache of query results enabled by :meth:`enable_result_cache`
+        and discards the cached results."""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+        self._result_cache = None
+
+    def clear_result_cache(self) -> None:
+        """Discards the query results cached in this session, see :meth:`enable_result_cache`."""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    @property
+    def result_cache_stats(self) -> Dict[str, int]:
+        """Returns the number of cache hits, cache misses and evictions of the cache of query results
+        enabled by :meth:`enable_result_cache`, the number of results in memory and spilled to disk, and
+        the estimated size of the results in memory in bytes. All values are 0 if the cache is disabled.
+        """
+        if self._result_cache is None:
+            return {
+                "hits": 0,
+                "misses": 0,
+                "evictions": 0,
+                "entries": 0,
+                "spilled_entries": 0,
+                "size_bytes": 0,
+            }
+        return self._result_cache.get_stats()
+
+    def enable_package_cache(
+        self, directory: str, ttl_seconds: int = DEFAULT_PACKAGE_CACHE_TTL_SECONDS
+    ) -> None:
+        """
+        Enables a cache of package resolution results in a local directory, which is shared by the
+        sessions and processes using the same directory, e.g., later runs of a deployment script.
+
+        The cache keeps the versions of packages available in Snowflake, so the packages of UDFs, UDTFs,
+        UDAFs and stored procedures and the packages added by :meth:`add_packages` are validated without
+        querying ``information_schema.packages``. When
+        :attr:`custom_package_usage_config` is enabled, it also keeps the zip files of the packages
+        unavailable in Snowflake that were installed with ``pip``, keyed by the requested packages, the
+        Python version and the platform, so these packages are not installed and zipped again.
+
+        Args:
+            directory: The local directory where the cached results are stored. It is created if it doesn't exist.
+            ttl_seconds: The number of seconds after which a cached result expires (defaults to one day),
+                so new versions of packages are found again.
+        """
+        self._package_cache = PackageCache(directory, ttl_seconds)
+
+    def disable_package_cache(self) -> None:
+        """Disables the cache of package resolution results enabled by :meth:`enable_package_cache`.
+        The cached results are kept in the directory of the cache."""
+        self._package_cache = None
+
+    def clear_package_cache(self) -> None:
+        """Removes the package resolution results cached in the directory of the cache enabled by
+        :meth:`enable_package_cache`, and the available versions of packages cached in this session."""
+        self._package_versions_cache.clear()
+        if self._package_cache is not None:
+            self._package_cache.clear()
+
+    def _invalidate_result_cache(self, table_name: Union[str, Iterable[str]]) -> None:
+        if self._result_cache is not None:
+            self._result_cache.invalidate(table_name)
+
+    def _invalidate_infer_schema_cache(
+        self, paths: Optional[Iterable[str]] = None
+    ) -> None:
+        with self._infer_schema_lock:
+            if paths is None:
+                self._infer_schema_cache.clear()
+                return
+            paths = tuple(paths)
+            for key in list(self._infer_schema_cache):
+                if key[0].startswith(paths):
+                    self._infer_schema_cache.pop(key)
+
     def cancel_all(self) -> None:
         """
         Cancel all action methods that are running currently.
@@ -717,6 +1032,35 @@ class Session:
         """
         self._import_paths.clear()
 
+    @property
+    def import_cache_file(self) -> Optional[str]:
+        """
+        The local JSON file where the session saves the checksums of its local imports and the
+        stage files they were uploaded to, so other sessions (e.g., later runs of a deployment
+        script) can reuse them. If it is not set (the default), they are only kept in memory.
+
+        The session computes the checksum of a local file or directory again only when the size
+        or modification time of one of its files changes, and it doesn't list the stage or zip
+        and upload an import whose stage file is known to exist. The handler code of a UDF that
+        is too large to be inlined is also reused if the same code was uploaded to the stage
+        before. Call :meth:`clear_import_cache` if imports were removed from a stage by other
+        means.
+        """
+        return self._import_cache.path
+
+    @import_cache_file.setter
+    def import_cache_file(self, path: Optional[str]) -> None:
+        self._import_cache.set_path(path)
+
+    def clear_import_cache(self) -> None:
+        """
+        Discards the checksums and stage files of the local imports and the stage files of the
+        uploaded UDF handler code cached by this session, and in :attr:`import_cache_file` if it
+        is set. The stage is listed again the next time a user-defined function or stored
+        procedure is registered with local imports.
+        """
+        self._import_cache.clear()
+
     def _resolve_import_path(
         self,
         path: str,
@@ -772,9 +1116,9 @@ class Session:
             # will change and the file in the stage will be overwritten.
             return (
                 abs_path,
-                calculate_checksum(
+                self._import_cache.get_checksum(
                     abs_path,
-                    additional_info=leading_path,
+                    leading_path=leading_path,
                     chunk_size=chunk_size,
                     whole_file_hash=whole_file_hash,
                 ),
@@ -795,9 +1139,9 @@ class Session:
     ) -> List[str]:
         """Resolve the imports and upload local files (if any) to the stage."""
         resolved_stage_files = []
-        stage_file_list = self._list_files_in_stage(
-            import_only_stage, statement_params=statement_params
-        )
+        # the stage is only listed if a local import is not known to be uploaded already
+        stage_file_list = None
+        context = self._get_import_cache_context()
 
         normalized_import_only_location = unwrap_stage_location_single_quote(
             import_only_stage
@@ -818,15 +1162,37 @@ class Session:
                     else os.path.basename(path)
                 )
                 filename_with_prefix = f"{prefix}/{filename}"
+                import_only_stage_file = normalize_remote_file_or_dir(
+                    f"{normalized_import_only_location}/{filename_with_prefix}"
+                )
+                uploaded_stage_file = normalize_remote_file_or_dir(
+                    f"{normalized_upload_and_import_location}/{filename_with_prefix}"
+                )
+                # the import is either found in the import only stage, or uploaded to the upload and import stage
+                cached_stage_file = next(
+                    (
+                        stage_file
+                        for stage_file in (import_only_stage_file, uploaded_stage_file)
+                        if self._import_cache.contains_stage_file(stage_file, context)
+                    ),
+                    None,
+                )
+                if cached_stage_file is not None:
+                    _logger.debug(
+                        f"{filename} was uploaded to {cached_stage_file}, skipped"
+                    )
+                    resolved_stage_files.append(cached_stage_file)
+                    continue
+                if stage_file_list is None:
+                    stage_file_list = self._list_files_in_stage(
+                        import_only_stage, statement_params=statement_params
+                    )
                 if filename_with_prefix in stage_file_list:
                     _logger.debug(
                         f"{filename} exists on {normalized_import_only_location}, skipped"
                     )
-                    resolved_stage_files.append(
-                        normalize_remote_file_or_dir(
-                            f"{normalized_import_only_location}/{filename_with_prefix}"
-                        )
-                    )
+                    resolved_stage_files.append(import_only_stage_file)
+                    self._import_cache.add_stage_file(import_only_stage_file, context)
                 else:
                     # local directory or .py file
                     if os.path.isdir(path) or path.endswith(".py"):
@@ -854,14 +1220,21 @@ class Session:
                             overwrite=True,
                             skip_upload_on_content_match=True,
                         )
-                    resolved_stage_files.append(
-                        normalize_remote_file_or_dir(
-                            f"{normalized_upload_and_import_location}/{filename_with_prefix}"
-                        )
-                    )
+                    resolved_stage_files.append(uploaded_stage_file)
+                    self._import_cache.add_stage_file(uploaded_stage_file, context)
 
         return resolved_stage_files
 
+    def _get_import_cache_context(self) -> Tuple[Optional[str], ...]:
+        # the stage files of the import cache are only reused in the same account,
+        # database and schema, since the stage names may not be fully qualified
+        conn = getattr(self._conn, "_conn", None)
+        return (
+            getattr(conn, "account", None),
+            getattr(conn, "database", None),
+            getattr(conn, "schema", None),
+        )
+
     def _list_files_in_stage(
         self,
         stage_location: Optional[str] = None,
@@ -1316,9 +1689,7 @@ class Session:
         # Extract package names, whether they are local, and their associated Requirement objects
         package_dict = self._parse_packages(packages)
 
-        package_table = "information_schema.packages"
-        if not self.get_current_database():
-            package_table = f"snowflake.{package_table}"
+        package_table = self._get_package_table()
 
         # result_dict is a mapping of package name -> package_spec, example
         # {'pyyaml': 'pyyaml==6.0',
@@ -1399,56 +1770,40 @@ class Session:
             if not os.path.exists(target):
                 os.makedirs(target)
 
-            pip_install_packages_to_target_folder(packages, target)
-
-            # Create Requirement objects for packages installed, mapped to list of package files and folders.
-            downloaded_packages_dict = map_python_packages_to_files_and_folders(target)
-
-            # Fetch valid Snowflake Anaconda versions for all packages installed by pip (if present).
-            valid_downloaded_packages = self._get_available_versions_for_packages(
-                package_names=[
-                    package.name for package in downloaded_packages_dict.keys()
-                ],
-                package_table_name=package_table,
-            )
-
-            # Detect packages which use native code.
-            native_packages = detect_native_dependencies(
-                target, downloaded_packages_dict
-            )
-
-            # Figure out which dependencies are available in Snowflake, and which native dependencies can be dropped.
-            (
-                supported_dependencies,
-                dropped_dependencies,
-                new_dependencies,
-            ) = identify_supported_packages(
-                list(downloaded_packages_dict.keys()),
-                valid_downloaded_packages,
-                native_packages,
-                package_dict,
-            )
-
-            if len(native_packages) > 0 and not self._custom_package_usage_config.get(
-                "force_push", False
-            ):
-                raise ValueError(
-                    "Your code depends on packages that contain native code, it may not work on Snowflake! Set Session.custom_package_usage_config['force_push'] to True "
-                    "if you wish to proceed with using them anyway."
-                )
-
-            # Delete files
-            delete_files_belonging_to_packages(
-                supported_dependencies + dropped_dependencies,
-                downloaded_packages_dict,
-                target,
-            )
-
-            # Zip and add to stage
             environment_signature: str = get_signature(packages)
             zip_file = f"{IMPLICIT_ZIP_FILE_NAME}_{environment_signature}.zip"
             zip_path = os.path.join(tmpdir, zip_file)
-            zip_directory_contents(target, zip_path)
+            cached_environment = (
+                self._package_cache.get_environment(environment_signature, zip_path)
+                if self._package_cache is not None
+                else None
+            )
+            if cached_environment is not None:
+                _logger.info(
+                    f"Loading packages {packages} from the package cache in {self._package_cache.directory}."
+                )
+                if cached_environment.has_native_packages:
+                    self._check_native_packages_allowed()
+                dependencies = [
+                    pkg_resources.Requirement.parse(requirement)
+                    for requirement in cached_environment.dependencies
+                ]
+            else:
+                (
+                    dependencies,
+                    has_native_packages,
+                ) = self._install_unsupported_packages(
+                    packages, package_table, package_dict, target, zip_path
+                )
+                if self._package_cache is not None:
+                    self._package_cache.put_environment(
+                        environment_signature,
+                        zip_path,
+                        CachedEnvironment(
+                            [str(requirement) for requirement in dependencies],
+                            has_native_packages,
+                        ),
+                    )
 
             # Add packages to stage
             stage_name = self.get_session_stage()
@@ -1474,10 +1829,7 @@ class Session:
 
                 # Add a new enviroment to the metadata, avoid commas while storing list of dependencies because commas are treated as default delimiters.
                 metadata[environment_signature] = "|".join(
-                    [
-                        str(requirement)
-                        for requirement in supported_dependencies + new_dependencies
-                    ]
+                    [str(requirement) for requirement in dependencies]
                 )
                 metadata_local_path = os.path.join(
                     self._tmpdir_handler.name, metadata_file
@@ -1521,7 +1873,75 @@ class Session:
                 self._tmpdir_handler.cleanup()
                 self._tmpdir_handler = None
 
-        return supported_dependencies + new_dependencies
+        return dependencies
+
+    def _install_unsupported_packages(
+        self,
+        packages: List[str],
+        package_table: str,
+        package_dict: Dict[str, str],
+        target: str,
+        zip_path: str,
+    ) -> Tuple[List[pkg_resources.Requirement], bool]:
+        """
+        Installs Pypi packages, which are unavailable in Snowflake, to the target folder with pip and
+        zips the packages that need to be uploaded to ``zip_path``.
+
+        Returns:
+            The dependencies (present in Snowflake) that would need to be added to the package dictionary,
+            and whether the uploaded packages contain native code.
+        """
+        pip_install_packages_to_target_folder(packages, target)
+
+        # Create Requirement objects for packages installed, mapped to list of package files and folders.
+        downloaded_packages_dict = map_python_packages_to_files_and_folders(target)
+
+        # Fetch valid Snowflake Anaconda versions for all packages installed by pip (if present).
+        valid_downloaded_packages = self._get_available_versions_for_packages(
+            package_names=[package.name for package in downloaded_packages_dict.keys()],
+            package_table_name=package_table,
+        )
+
+        # Detect packages which use native code.
+        native_packages = detect_native_dependencies(target, downloaded_packages_dict)
+
+        # Figure out which dependencies are available in Snowflake, and which native dependencies can be dropped.
+        (
+            supported_dependencies,
+            dropped_dependencies,
+            new_dependencies,
+        ) = identify_supported_packages(
+            list(downloaded_packages_dict.keys()),
+            valid_downloaded_packages,
+            native_packages,
+            package_dict,
+        )
+
+        if len(native_packages) > 0:
+            self._check_native_packages_allowed()
+
+        # Delete files
+        delete_files_belonging_to_packages(
+            supported_dependencies + dropped_dependencies,
+            downloaded_packages_dict,
+            target,
+        )
+
+        zip_directory_contents(
+            target,
+            zip_path,
+            fragment_cache_directory=self._package_cache.fragments_directory
+            if self._package_cache
+            else None,
+        )
+        return supported_dependencies + new_dependencies, len(native_packages) > 0
+
+    def _check_native_packages_allowed(self) -> None:
+        if not self._custom_package_usage_config.get("force_push", False):
+            raise ValueError(
+                "Your code depends on packages that contain native code, it may not work on Snowflake! Set Session.custom_package_usage_config['force_push'] to True "
+                "if you wish to proceed with using them anyway."
+            )
 
     def _is_anaconda_terms_acknowledged(self) -> bool:
         return self._run_query("select system$are_anaconda_terms_acknowledged()")[0][0]
@@ -1600,28 +2020,72 @@ class Session:
         )
         return dependency_packages
 
+    def _get_package_table(self) -> str:
+        package_table = "information_schema.packages"
+        if not self.get_current_database():
+            package_table = f"snowflake.{package_table}"
+        return package_table
+
     def _get_available_versions_for_packages(
         self,
         package_names: List[str],
         package_table_name: str,
         validate_package: bool = True,
     ) -> Dict[str, List[str]]:
-        package_to_version_mapping = (
-            {
+        if not validate_package or len(package_names) == 0:
+            return None
+        # the available versions of packages are cached, so only the packages
+        # that were not queried yet in this session are queried
+        missing_package_names = [
+            name
+            for name in dict.fromkeys(package_names)
+            if (package_table_name, name) not in self._package_versions_cache
+        ]
+        # the available packages may differ between accounts
+        package_table_key = (
+            f"{self._get_import_cache_context()[0]}|{package_table_name}"
+        )
+        if missing_package_names and self._package_cache is not None:
+            for name, versions in self._package_cache.get_package_versions(
+                package_table_key, missing_package_names
+            ).items():
+                self._package_versions_cache[(package_table_name, name)] = versions
+            missing_package_names = [
+                name
+                for name in missing_package_names
+                if (package_table_name, name) not in self._package_versions_cache
+            ]
+        if missing_package_names:
+            package_to_version_mapping = {
                 p[0]: json.loads(p[1])
                 for p in self.table(package_table_name)
                 .filter(
                     (col("language") == "python")
-                    & (col("package_name").in_(package_names))
+                    & (col("package_name").in_(missing_package_names))
                 )
                 .group_by("package_name")
                 .agg(array_agg("version"))
                 ._internal_collect_with_tag()
             }
-            if validate_package and len(package_names) > 0
-            else None
-        )
-        return package_to_version_mapping
+            for name in missing_package_names:
+                # None means the package is not available
+                self._package_versions_cache[
+                    (package_table_name, name)
+                ] = package_to_version_mapping.get(name)
+            if self._package_cache is not None:
+                self._package_cache.put_package_versions(
+                    package_table_key,
+                    {
+                        name: package_to_version_mapping.get(name)
+                        for name in missing_package_names
+                    },
+                )
+        result = {}
+        for name in package_names:
+            versions = self._package_versions_cache.get((package_table_name, name))
+            if versions is not None:
+                result[name] = list(versions)
+        return result
 
     @property
     def query_tag(self) -> Optional[str]:
@@ -2014,6 +2478,11 @@ class Session:
     def _get_result_attributes(self, query: str) -> List[Attribute]:
         return self._conn.get_result_attributes(query)
 
+    def _get_cached_result_attributes(self, query: str) -> Optional[List[Attribute]]:
+        if isinstance(self._conn, ServerConnection):
+            return self._conn.get_cached_result_attributes(query)
+        return None
+
     def get_session_stage(self) -> str:
         """
         Returns the name of the temporary stage created by the Snowpark library
@@ -2147,6 +2616,9 @@ class Session:
                     + (schema + "." if schema else "")
                     + (table_name)
                 )
+            if isinstance(self._conn, ServerConnection):
+                # write_pandas may create or replace the table with the connector
+                self._conn.clear_schema_cache()
             signature = inspect.signature(write_pandas)
             if not ("use_logical_type" in signature.parameters):
                 # do not pass use_logical_type if write_pandas does not support it
@@ -2197,6 +2669,8 @@ class Session:
         self,
         data: Union[List, Tuple, "pandas.DataFrame"],
         schema: Optional[Union[StructType, Iterable[str]]] = None,
+        *,
+        infer_schema_sample_size: Optional[int] = None,
     ) -> DataFrame:
         """Creates a new DataFrame containing the specified values from the local data.
 
@@ -2216,6 +2690,10 @@ class Session:
                 DataFrame will be inferred from the data across all rows. To improve
                 performance, provide a schema. This avoids the need to infer data types
                 with large data sets.
+            infer_schema_sample_size: When the schema is inferred and ``data`` has more rows
+                than this number, only infer the schema from this number of rows evenly spaced in
+                ``data``, and make every column nullable. The values in the other rows must have the
+                same types as the values in the sampled rows. By default, every row is used.
 
         Examples::
 
@@ -2325,9 +2803,8 @@ class Session:
                 raise ValueError("Cannot infer schema from empty data")
             if isinstance(schema, Iterable):
                 names = list(schema)
-            new_schema = reduce(
-                merge_type,
-                (infer_schema(row, names) for row in data),
+            new_schema = infer_schema_from_data(
+                data, names, sample_size=infer_schema_sample_size
             )
         if len(new_schema.fields) == 0:
             raise ValueError(
@@ -2395,50 +2872,55 @@ class Session:
             attrs.append(Attribute(quoted_name, sf_type, field.nullable))
             data_types.append(field.datatype)
 
-        # convert all variant/time/geospatial/array/map data to string
-        converted = []
-        for row in rows:
-            converted_row = []
-            for value, data_type in zip(row, data_types):
-                if value is None:
-                    converted_row.append(None)
-                elif isinstance(value, decimal.Decimal) and isinstance(
-                    data_type, DecimalType
-                ):
-                    converted_row.append(value)
-                elif isinstance(value, datetime.datetime) and isinstance(
-                    data_type, TimestampType
-                ):
-                    converted_row.append(str(value))
-                elif isinstance(value, datetime.time) and isinstance(
-                    data_type, TimeType
-                ):
-                    converted_row.append(str(value))
-                elif isinstance(value, datetime.date) and isinstance(
-                    data_type, DateType
-                ):
-                    converted_row.append(str(value))
-                elif isinstance(data_type, _AtomicType):  # consider inheritance
-                    converted_row.append(value)
-                elif isinstance(value, (list, tuple, array)) and isinstance(
-                    data_type, ArrayType
-                ):
-                    converted_row.append(json.dumps(value, cls=PythonObjJSONEncoder))
-                elif isinstance(value, dict) and isinstance(data_type, MapType):
-                    converted_row.append(json.dumps(value, cls=PythonObjJSONEncoder))
-                elif isinstance(data_type, VariantType):
-                    converted_row.append(json.dumps(value, cls=PythonObjJSONEncoder))
-                elif isinstance(data_type, GeographyType):
-                    converted_row.append(value)
-                elif isinstance(data_type, GeometryType):
-                    converted_row.append(value)
-                elif isinstance(data_type, VectorType):
-                    converted_row.append(json.dumps(value, cls=PythonObjJSONEncoder))
-                else:
-                    raise TypeError(
-                        f"Cannot cast {type(value)}({value}) to {str(data_type)}."
-                    )
-            converted.append(Row(*converted_row))
+        # convert all variant/time/geospatial/array/map data to string,
+        # column by column with a converter chosen from the data type of the column
+        def get_value_converter(data_type: DataType) -> Optional[Callable]:
+            """Returns the function converting a non-None value of the column, or None if the values
+            are kept as they are."""
+
+            def cannot_cast(value):
+                raise TypeError(
+                    f"Cannot cast {type(value)}({value}) to {str(data_type)}."
+                )
+
+            def to_json(value):
+                return json.dumps(value, cls=PythonObjJSONEncoder)
+
+            def to_str_if_instance(value_type):
+                return lambda value: (
+                    str(value) if isinstance(value, value_type) else value
+                )
+
+            if isinstance(data_type, TimestampType):
+                return to_str_if_instance(datetime.datetime)
+            elif isinstance(data_type, TimeType):
+                return to_str_if_instance(datetime.time)
+            elif isinstance(data_type, DateType):
+                return to_str_if_instance(datetime.date)
+            elif isinstance(data_type, (_AtomicType, GeographyType, GeometryType)):
+                return None
+            elif isinstance(data_type, ArrayType):
+                return lambda value: (
+                    to_json(value)
+                    if isinstance(value, (list, tuple, array))
+                    else cannot_cast(value)
+                )
+            elif isinstance(data_type, MapType):
+                return lambda value: (
+                    to_json(value) if isinstance(value, dict) else cannot_cast(value)
+                )
+            elif isinstance(data_type, (VariantType, VectorType)):
+                return to_json
+            else:
+                return cannot_cast
+
+        converted_columns = []
+        for values, data_type in zip(zip(*rows), data_types):
+            convert = get_value_converter(data_type)
+            if convert is not None:
+                values = [None if value is None else convert(value) for value in values]
+            converted_columns.append(values)
+        converted = [Row(*row) for row in zip(*converted_columns)]
 
         # construct a project statement to convert string value back to variant
         project_columns = []
@@ -2569,6 +3051,29 @@ class Session:
             )
         return AsyncJob(query_id, None, self)
 
+    def create_async_job_group(self, max_in_flight: int = 8) -> AsyncJobGroup:
+        """
+        Creates an :class:`AsyncJobGroup` to write the data of several DataFrames concurrently,
+        with at most ``max_in_flight`` writes running at the same time.
+
+        See also:
+            :class:`AsyncJobGroup`
+        """
+        if (
+            is_in_stored_procedure()
+            and not self._conn._get_client_side_session_parameter(
+                "ENABLE_ASYNC_QUERY_IN_PYTHON_STORED_PROCS", False
+            )
+        ):  # pragma: no cover
+            raise NotImplementedError(
+                "Async query is not supported in stored procedure yet"
+            )
+        if isinstance(self._conn, MockServerConnection):
+            raise NotImplementedError(
+                "[Local Testing] Async query is currently not supported."
+            )
+        return AsyncJobGroup(self, max_in_flight)
+
     def get_current_account(self) -> Optional[str]:
         """
         Returns the name of the current account for the Python connector session attached
@@ -0,0 +1,212 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import threading
+import time
+from contextlib import contextmanager
+from logging import getLogger
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from snowflake.snowpark.session import Session
+
+_logger = getLogger(__name__)
+
+
+class SessionPool:
+    """
+    A pool of :class:`Session` objects created with the same connection parameters, which lets
+    multi-threaded workloads run queries concurrently. A cursor can only execute one query at a time,
+    so the threads sharing a session wait for each other, while each session acquired from the pool
+    has its own connection and cursor.
+
+    At most ``max_size`` sessions are open at the same time. ``min_size`` sessions are created when the
+    pool is created and are kept open. The other sessions are closed after they have been idle in the
+    pool for ``max_idle_seconds``. A session that was closed or whose connection expired is discarded
+    when it is acquired, and a new session is created instead.
+
+    Example::
+
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> from snowflake.snowpark import SessionPool
+        >>> with SessionPool(connection_parameters, max_size=4) as pool:  # doctest: +SKIP
+        ...     def count(table_name):
+        ...         with pool.session() as session:
+        ...             return session.table(table_name).count()
+        ...     with ThreadPoolExecutor(max_workers=4) as executor:
+        ...         counts = list(executor.map(count, table_names))
+
+    Note:
+        The state of a session (e.g., its current database and schema, its query tag, and the imports and
+        packages of UDFs) is kept when it is returned to the pool, so the sessions shouldn't be modified
+        unless every user of the pool modifies them in the same way.
+    """
+
+    def __init__(
+        self,
+        configs: Dict[str, Union[int, str]],
+        *,
+        max_size: int = 8,
+        min_size: int = 0,
+        max_idle_seconds: Optional[float] = 600,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        if not 0 <= min_size <= max_size:
+            raise ValueError("min_size must be between 0 and max_size")
+        if max_idle_seconds is not None and max_idle_seconds < 0:
+            raise ValueError("max_idle_seconds must be a non-negative number")
+        self._configs = dict(configs)
+        self.max_size = max_size
+        self.min_size = min_size
+        self.max_idle_seconds = max_idle_seconds
+        self._condition = threading.Condition()
+        # the idle sessions and the times they were released, the most recently used last
+        self._idle: List[Tuple[Session, float]] = []
+        self._num_sessions = 0
+        self._closed = False
+        for _ in range(min_size):
+            self._num_sessions += 1
+            self._idle.append((self._create_session(), time.monotonic()))
+
+    def __enter__(self) -> "SessionPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """The number of open sessions, and the number of sessions that are idle and in use."""
+        with self._condition:
+            return {
+                "size": self._num_sessions,
+                "idle": len(self._idle),
+                "in_use": self._num_sessions - len(self._idle),
+            }
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[Session]:
+        """Acquires a session with :meth:`acquire`, and releases it on exit."""
+        session = self.acquire(timeout)
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def acquire(self, timeout: Optional[float] = None) -> Session:
+        """
+        Returns an idle session of the pool, or a new session if none is idle and fewer than ``max_size``
+        sessions are open. Otherwise, waits until another thread releases a session, and raises a
+        ``TimeoutError`` if no session is available after ``timeout`` seconds. The session must be
+        returned to the pool with :meth:`release`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError(
+                            "Can't acquire a session from a closed SessionPool"
+                        )
+                    expired = self._evict_idle_sessions()
+                    if self._idle or self._num_sessions < self.max_size:
+                        break
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(
+                            f"No session is available after {timeout} seconds, "
+                            f"all {self.max_size} sessions are in use"
+                        )
+                    self._condition.wait(remaining)
+                if self._idle:
+                    session = self._idle.pop()[0]
+                else:
+                    session = None
+                    self._num_sessions += 1
+            # sessions are closed and created without holding the lock, because they send requests
+            self._close_sessions(expired)
+            if session is None:
+                try:
+                    return self._create_session()
+                except BaseException:
+                    with self._condition:
+                        self._num_sessions -= 1
+                        self._condition.notify()
+                    raise
+            if self._is_healthy(session):
+                return session
+            _logger.debug(
+                "Discarding a closed or expired session from the session pool"
+            )
+            self._discard(session)
+
+    def release(self, session: Session) -> None:
+        """Returns a session acquired with :meth:`acquire` to the pool."""
+        with self._condition:
+            closed = self._closed
+            if not closed:
+                self._idle.append((session, time.monotonic()))
+                expired = self._evict_idle_sessions()
+                self._condition.notify()
+        if closed:
+            self._discard(session)
+        else:
+            self._close_sessions(expired)
+
+    def close(self) -> None:
+        """Closes the idle sessions, and the sessions in use when they are released."""
+        with self._condition:
+            self._closed = True
+            idle = [session for session, _ in self._idle]
+            self._idle.clear()
+            self._num_sessions -= len(idle)
+            self._condition.notify_all()
+        self._close_sessions(idle)
+
+    def _create_session(self) -> Session:
+        # the builder removes the password from its options, so each session is created by a new builder
+        return Session.builder.configs(self._configs).create()
+
+    @staticmethod
+    def _is_healthy(session: Session) -> bool:
+        try:
+            return not session._conn.is_closed() and not getattr(
+                session._conn._conn, "expired", False
+            )
+        except Exception as ex:
+            _logger.debug("Failed to check the status of a session: %s", ex)
+            return False
+
+    def _evict_idle_sessions(self) -> List[Session]:
+        """Removes the sessions idle for longer than ``max_idle_seconds`` beyond ``min_size``
+        from the pool, and returns them. Must be called with the lock held."""
+        if self.max_idle_seconds is None:
+            return []
+        now = time.monotonic()
+        expired = []
+        # the least recently used sessions are evicted first
+        while (
+            self._idle
+            and self._num_sessions > self.min_size
+            and now - self._idle[0][1] > self.max_idle_seconds
+        ):
+            expired.append(self._idle.pop(0)[0])
+            self._num_sessions -= 1
+        return expired
+
+    def _discard(self, session: Session) -> None:
+        with self._condition:
+            self._num_sessions -= 1
+            self._condition.notify()
+        self._close_sessions([session])
+
+    @staticmethod
+    def _close_sessions(sessions: List[Session]) -> None:
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as ex:
+                _logger.debug("Failed to close a session of the session pool: %s", ex)
@@ -26,6 +26,7 @@ from snowflake.snowpark._internal.udf_utils import (
     generate_call_python_sp_sql,
     process_file_path,
     process_registration_inputs,
+    register_many,
     resolve_imports_and_packages,
 )
 from snowflake.snowpark._internal.utils import TempObjectType
@@ -568,6 +569,34 @@ class StoredProcedureRegistration:
             force_inline_code=kwargs.get("force_inline_code", False),
         )
 
+    def register_many(
+        self,
+        registrations: Iterable[Union[Callable, Dict[str, Any]]],
+        *,
+        max_workers: int = 4,
+        **kwargs,
+    ) -> List[StoredProcedure]:
+        """
+        Registers multiple stored procedures and returns them in the same order. Each registration is either a
+        Python function, or a ``dict`` of the arguments of :meth:`register` (including ``func``).
+        ``kwargs`` are the arguments of :meth:`register` used by all registrations, which can be
+        overridden by the arguments in a ``dict``.
+
+        The first stored procedure is registered alone, so the session stage is created and the session-level
+        imports are uploaded only once. The available versions of the packages of all stored procedures are queried
+        in a single query, then the other stored procedures are uploaded and created concurrently.
+
+        Args:
+            registrations: The Python functions or the ``dict`` of arguments of the stored procedures to register.
+            max_workers: The maximum number of stored procedures registered at the same time. The default is 4.
+
+        See Also:
+            - :meth:`register`
+        """
+        return register_many(
+            self._session, type(self), registrations, max_workers, kwargs
+        )
+
     def register_from_file(
         self,
         file_path: str,
@@ -467,11 +467,16 @@ class Table(DataFrame):
             )
         )
         add_api_call(new_df, "Table.update")
+        self._session._invalidate_result_cache(self.table_name)
         result = new_df._internal_collect_with_tag(
             statement_params=statement_params,
             block=block,
             data_type=snowflake.snowpark.async_job._AsyncResultType.UPDATE,
         )
+        # a query run while the write is running may have cached the previous results
+        snowflake.snowpark.async_job._call_when_done(
+            result, lambda: self._session._invalidate_result_cache(self.table_name)
+        )
         return _get_update_result(result) if block else result
 
     @overload
@@ -561,11 +566,16 @@ class Table(DataFrame):
             )
         )
         add_api_call(new_df, "Table.delete")
+        self._session._invalidate_result_cache(self.table_name)
         result = new_df._internal_collect_with_tag(
             statement_params=statement_params,
             block=block,
             data_type=snowflake.snowpark.async_job._AsyncResultType.DELETE,
         )
+        # a query run while the write is running may have cached the previous results
+        snowflake.snowpark.async_job._call_when_done(
+            result, lambda: self._session._invalidate_result_cache(self.table_name)
+        )
         return _get_delete_result(result) if block else result
 
     @overload
@@ -664,11 +674,16 @@ class Table(DataFrame):
             )
         )
         add_api_call(new_df, "Table.update")
+        self._session._invalidate_result_cache(self.table_name)
         result = new_df._internal_collect_with_tag(
             statement_params=statement_params,
             block=block,
             data_type=snowflake.snowpark.async_job._AsyncResultType.MERGE,
         )
+        # a query run while the write is running may have cached the previous results
+        snowflake.snowpark.async_job._call_when_done(
+            result, lambda: self._session._invalidate_result_cache(self.table_name)
+        )
         if not block:
             result._inserted = inserted
             result._updated = updated
@@ -7,7 +7,7 @@
 
 import sys
 from types import ModuleType
-from typing import Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import snowflake.snowpark
 from snowflake.connector import ProgrammingError
@@ -22,6 +22,7 @@ from snowflake.snowpark._internal.udf_utils import (
     create_python_udf_or_sp,
     process_file_path,
     process_registration_inputs,
+    register_many,
     resolve_imports_and_packages,
 )
 from snowflake.snowpark._internal.utils import (
@@ -441,6 +442,34 @@ class UDAFRegistration:
             secrets=secrets,
         )
 
+    def register_many(
+        self,
+        registrations: Iterable[Union[Type, Dict[str, Any]]],
+        *,
+        max_workers: int = 4,
+        **kwargs,
+    ) -> List[UserDefinedAggregateFunction]:
+        """
+        Registers multiple UDAFs and returns them in the same order. Each registration is either a
+        handler class, or a ``dict`` of the arguments of :meth:`register` (including ``handler``).
+        ``kwargs`` are the arguments of :meth:`register` used by all registrations, which can be
+        overridden by the arguments in a ``dict``.
+
+        The first UDAF is registered alone, so the session stage is created and the session-level
+        imports are uploaded only once. The available versions of the packages of all UDAFs are queried
+        in a single query, then the other UDAFs are uploaded and created concurrently.
+
+        Args:
+            registrations: The handler classes or the ``dict`` of arguments of the UDAFs to register.
+            max_workers: The maximum number of UDAFs registered at the same time. The default is 4.
+
+        See Also:
+            - :meth:`register`
+        """
+        return register_many(
+            self._session, type(self), registrations, max_workers, kwargs
+        )
+
     def register_from_file(
         self,
         file_path: str,
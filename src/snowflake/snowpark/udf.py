@@ -16,7 +16,7 @@ Refer to :class:`~snowflake.snowpark.udf.UDFRegistration` for sample code on how
 """
 import sys
 from types import ModuleType
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import snowflake.snowpark
 from snowflake.connector import ProgrammingError
@@ -31,6 +31,7 @@ from snowflake.snowpark._internal.udf_utils import (
     create_python_udf_or_sp,
     process_file_path,
     process_registration_inputs,
+    register_many,
     resolve_imports_and_packages,
 )
 from snowflake.snowpark._internal.utils import (
@@ -625,6 +626,45 @@ class UDFRegistration:
             is_permanent=is_permanent,
         )
 
+    def register_many(
+        self,
+        registrations: Iterable[Union[Callable, Dict[str, Any]]],
+        *,
+        max_workers: int = 4,
+        **kwargs,
+    ) -> List[UserDefinedFunction]:
+        """
+        Registers multiple UDFs and returns them in the same order. Each registration is either a
+        Python function, or a ``dict`` of the arguments of :meth:`register` (including ``func``).
+        ``kwargs`` are the arguments of :meth:`register` used by all registrations, which can be
+        overridden by the arguments in a ``dict``.
+
+        The first UDF is registered alone, so the session stage is created and the session-level
+        imports are uploaded only once. The available versions of the packages of all UDFs are queried
+        in a single query, then the other UDFs are uploaded and created concurrently.
+
+        Args:
+            registrations: The Python functions or the ``dict`` of arguments of the UDFs to register.
+            max_workers: The maximum number of UDFs registered at the same time. The default is 4.
+
+        Example::
+
+            >>> from snowflake.snowpark.types import IntegerType
+            >>> add_one_udf, add_two_udf = session.udf.register_many(
+            ...     [lambda x: x + 1, {"func": lambda x: x + 2, "name": "add_two"}],
+            ...     return_type=IntegerType(),
+            ...     input_types=[IntegerType()],
+            ... )
+            >>> session.range(1).select(add_one_udf("id"), add_two_udf("id")).to_df("a", "b").collect()
+            [Row(A=1, B=2)]
+
+        See Also:
+            - :meth:`register`
+        """
+        return register_many(
+            self._session, type(self), registrations, max_workers, kwargs
+        )
+
     def register_from_file(
         self,
         file_path: str,
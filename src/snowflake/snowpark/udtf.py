@@ -22,7 +22,7 @@ Refer to :class:`~snowflake.snowpark.udtf.UDTFRegistration` for details and samp
 """
 import sys
 from types import ModuleType
-from typing import Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import snowflake.snowpark
 from snowflake.connector import ProgrammingError
@@ -36,6 +36,7 @@ from snowflake.snowpark._internal.udf_utils import (
     create_python_udf_or_sp,
     process_file_path,
     process_registration_inputs,
+    register_many,
     resolve_imports_and_packages,
 )
 from snowflake.snowpark._internal.utils import TempObjectType, validate_object_name
@@ -663,6 +664,34 @@ class UDTFRegistration:
             is_permanent=is_permanent,
         )
 
+    def register_many(
+        self,
+        registrations: Iterable[Union[Type, Dict[str, Any]]],
+        *,
+        max_workers: int = 4,
+        **kwargs,
+    ) -> List[UserDefinedTableFunction]:
+        """
+        Registers multiple UDTFs and returns them in the same order. Each registration is either a
+        handler class, or a ``dict`` of the arguments of :meth:`register` (including ``handler``).
+        ``kwargs`` are the arguments of :meth:`register` used by all registrations, which can be
+        overridden by the arguments in a ``dict``.
+
+        The first UDTF is registered alone, so the session stage is created and the session-level
+        imports are uploaded only once. The available versions of the packages of all UDTFs are queried
+        in a single query, then the other UDTFs are uploaded and created concurrently.
+
+        Args:
+            registrations: The handler classes or the ``dict`` of arguments of the UDTFs to register.
+            max_workers: The maximum number of UDTFs registered at the same time. The default is 4.
+
+        See Also:
+            - :meth:`register`
+        """
+        return register_many(
+            self._session, type(self), registrations, max_workers, kwargs
+        )
+
     def register_from_file(
         self,
         file_path: str,
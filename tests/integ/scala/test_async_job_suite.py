@@ -2,6 +2,7 @@
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
 
+import asyncio
 import logging
 from collections.abc import Iterator
 from time import sleep, time
@@ -22,7 +23,10 @@ from snowflake.snowpark._internal.utils import (
     TempObjectType,
     random_name_for_temp_object,
 )
-from snowflake.snowpark.exceptions import SnowparkSQLException
+from snowflake.snowpark.exceptions import (
+    SnowparkAsyncJobGroupException,
+    SnowparkSQLException,
+)
 from snowflake.snowpark.functions import col, when_matched, when_not_matched
 from snowflake.snowpark.table import DeleteResult, MergeResult, UpdateResult
 from snowflake.snowpark.types import (
@@ -465,3 +469,51 @@ def test_async_job_to_df(session, create_async_job_from_query_id):
     new_df = async_job.to_df()
     assert "result_scan" in new_df.queries["queries"][0].lower()
     Utils.check_answer(df, new_df)
+
+
+@pytest.mark.skipif(IS_IN_STORED_PROC, reason="async query is not supported")
+def test_async_job_group(session):
+    table_names = [random_name_for_temp_object(TempObjectType.TABLE) for _ in range(5)]
+    dfs = [
+        session.create_dataframe([[i, str(i)]], schema=["a", "b"])
+        for i in range(len(table_names))
+    ]
+    try:
+        with session.create_async_job_group(max_in_flight=2) as group:
+            for df, table_name in zip(dfs, table_names):
+                group.save_as_table(df, table_name, table_type="temporary")
+        assert group.result() == [None] * len(table_names)
+        assert group.progress["succeeded"] == len(table_names)
+
+        group = session.create_async_job_group()
+        group.save_as_table(dfs[0], table_names[0], mode="errorifexists")
+        group.copy_into_location(dfs[0], f"{session.get_session_stage()}/group/")
+        with pytest.raises(SnowparkAsyncJobGroupException) as exc_info:
+            group.result()
+        assert list(exc_info.value.errors) == [0]
+        assert group.futures[1].result()[0]["rows_unloaded"] == 1
+        for i, table_name in enumerate(table_names):
+            Utils.check_answer(session.table(table_name), [Row(A=i, B=str(i))])
+    finally:
+        for table_name in table_names:
+            Utils.drop_table(session, table_name)
+
+
+@pytest.mark.skipif(IS_IN_STORED_PROC, reason="async query is not supported")
+def test_collect_async(session):
+    dfs = [session.sql(f"select {i} as a, system$wait(1)") for i in range(5)]
+
+    async def main():
+        return await asyncio.gather(*[df.collect_async() for df in dfs])
+
+    results = asyncio.run(main())
+    assert [result[0][0] for result in results] == list(range(5))
+
+
+@pytest.mark.skipif(
+    IS_IN_STORED_PROC or not is_pandas_available,
+    reason="async query is not supported, or pandas is not available",
+)
+def test_to_pandas_async(session):
+    df = session.create_dataframe([[1, "a"], [2, "b"]], schema=["a", "b"])
+    assert_frame_equal(asyncio.run(df.to_pandas_async()), df.to_pandas())
@@ -27,7 +27,7 @@ except ImportError:
 import pytest
 
 from snowflake.connector import IntegrityError, ProgrammingError
-from snowflake.snowpark import Column, Row, Window
+from snowflake.snowpark import Column, Row, RowSet, Window
 from snowflake.snowpark._internal.analyzer.analyzer_utils import result_scan_statement
 from snowflake.snowpark._internal.analyzer.expression import Attribute, Interval, Star
 from snowflake.snowpark._internal.utils import TempObjectType, warning_dict
@@ -1884,6 +1884,83 @@ def test_create_dataframe_large_without_batch_insert(session):
         analyzer.ARRAY_BIND_THRESHOLD = original_value
 
 
+@pytest.mark.skipif(not is_pandas_available, reason="pyarrow is required")
+@pytest.mark.skipif(IS_IN_STORED_PROC_LOCALFS, reason="need resources")
+def test_create_dataframe_large_with_upload(session):
+    from snowflake.snowpark._internal.analyzer import analyzer
+
+    data = [
+        [
+            i,
+            i / 3,
+            Decimal("1.25"),
+            str(i),
+            i % 2 == 0,
+            bytes([i % 256]),
+            datetime.date(2023, 1, i % 28 + 1),
+            datetime.datetime(2023, 1, 1, 1, 2, i % 60),
+            [i, "a"],
+            {"k": i},
+        ]
+        for i in range(500)
+    ] + [[None] * 10]
+    schema = StructType(
+        [
+            StructField("int", LongType()),
+            StructField("double", DoubleType()),
+            StructField("decimal", DecimalType(10, 2)),
+            StructField("str", StringType()),
+            StructField("bool", BooleanType()),
+            StructField("binary", BinaryType()),
+            StructField("date", DateType()),
+            StructField("timestamp", TimestampType(TimestampTimeZone.NTZ)),
+            StructField("array", ArrayType()),
+            StructField("map", MapType()),
+        ]
+    )
+    original_value = analyzer.ARRAY_BIND_THRESHOLD
+    original_upload_threshold = session.create_dataframe_upload_threshold
+    try:
+        analyzer.ARRAY_BIND_THRESHOLD = 2
+        session.create_dataframe_upload_threshold = None
+        expected = session.create_dataframe(data, schema=schema).collect()
+        session.create_dataframe_upload_threshold = 2
+        df = session.create_dataframe(data, schema=schema)
+        assert any("PUT" in query for query in df.queries["queries"])
+        Utils.check_answer(df, expected)
+    finally:
+        analyzer.ARRAY_BIND_THRESHOLD = original_value
+        session.create_dataframe_upload_threshold = original_upload_threshold
+
+
+@pytest.mark.localtest
+def test_collect_columnar(session):
+    df = session.create_dataframe(
+        [[1, "a", Decimal("1.5")], [2, None, None]], schema=["a", "b", "c"]
+    )
+    rows = df.collect(columnar=True)
+    assert isinstance(rows, RowSet)
+    assert rows == df.collect()
+    assert [row.as_dict() for row in rows] == [row.as_dict() for row in df.collect()]
+    assert rows.column("B") == ["a", None]
+    assert df.collect(columnar=True, case_sensitive=False)[0].a == 1
+    assert len(df.filter(col("a") > 2).collect(columnar=True)) == 0
+
+
+@pytest.mark.localtest
+def test_create_dataframe_with_infer_schema_sample_size(session):
+    data = [[i, str(i), None if i % 7 == 3 else i / 2] for i in range(100)]
+    df = session.create_dataframe(data, ["a", "b", "c"], infer_schema_sample_size=10)
+    assert [
+        (field.name, type(field.datatype), field.nullable) for field in df.schema.fields
+    ] == [
+        ("A", LongType, True),
+        ("B", StringType, True),
+        ("C", DoubleType, True),
+    ]
+    Utils.check_answer(df, [Row(*row) for row in data])
+
+
 @pytest.mark.localtest
 def test_create_dataframe_with_invalid_data(session):
     # None input
@@ -225,3 +225,43 @@ def test_to_pandas_batches(session, local_testing_mode):
     for df_batch in df.to_pandas_batches():
         assert_frame_equal(df_batch, entire_pandas_df.iloc[: len(df_batch)])
         break
+
+
+@pytest.mark.localtest
+def test_to_arrow(session, local_testing_mode):
+    df = session.create_dataframe(
+        [[1, "a", 1.5], [2, None, None]], schema=["a", "b", "c"]
+    )
+    table = df.to_arrow()
+    assert isinstance(table, pa.Table)
+    assert table.column_names == ["A", "B", "C"]
+    assert table.to_pydict() == {"A": [1, 2], "B": ["a", None], "C": [1.5, None]}
+    assert_frame_equal(table.to_pandas(), df.to_pandas(), check_dtype=False)
+
+    empty_table = df.filter(col("a") > 2).to_arrow()
+    assert empty_table.num_rows == 0
+    assert empty_table.column_names == ["A", "B", "C"]
+
+
+@pytest.mark.skipif(
+    IS_IN_STORED_PROC, reason="SNOW-507565: Need localaws for large result"
+)
+@pytest.mark.localtest
+@pytest.mark.parametrize("prefetch_batches", [0, 2])
+def test_to_arrow_batches(session, local_testing_mode, prefetch_batches):
+    df = session.range(100000).cache_result()
+    iterator = df.to_arrow_batches(prefetch_batches=prefetch_batches)
+    assert isinstance(iterator, Iterator)
+
+    batches = list(iterator)
+    assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+    if not local_testing_mode:
+        # in live session, large data result will be split into multiple chunks by snowflake
+        assert len(batches) > 1
+    assert pa.Table.from_batches(batches).equals(df.to_arrow())
+
+
+def test_to_arrow_non_select(session):
+    with pytest.raises(SnowparkFetchDataException) as ex_info:
+        session.sql("show tables").to_arrow()
+    assert "the input query can only be a SELECT statement" in str(ex_info.value)
@@ -4,13 +4,14 @@
 #
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 import pytest
 
 import snowflake.connector
 from snowflake.connector.errors import ProgrammingError
-from snowflake.snowpark import Row, Session
+from snowflake.snowpark import Row, Session, SessionPool
 from snowflake.snowpark._internal.utils import TempObjectType, parse_table_name
 from snowflake.snowpark.exceptions import (
     SnowparkClientException,
@@ -104,6 +105,20 @@ def test_multiple_active_sessions(session, db_parameters):
         assert {session, session2} == _get_active_sessions()
 
 
+@pytest.mark.skipif(IS_IN_STORED_PROC, reason="Cannot create session in SP")
+def test_session_pool(db_parameters):
+    with SessionPool(db_parameters, max_size=2) as pool:
+
+        def query(i):
+            with pool.session() as session:
+                return session.sql(f"select {i}").collect()[0][0]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(query, range(8))) == list(range(8))
+        assert pool.stats["size"] <= 2
+    assert pool.stats["size"] == 0
+
+
 def test_get_or_create(session):
     # because there is already a session it should report the same
     new_session = Session.builder.getOrCreate()
@@ -625,3 +640,30 @@ def test_create_session_from_default_config_file(monkeypatch, db_parameters):
         # sensitive information that this test needs to handle.
         # db_parameter contains passwords.
         pytest.fail("something failed", pytrace=False)
+
+
+def test_result_cache(session):
+    table_name = Utils.random_table_name()
+    session.create_dataframe([[1, 2], [3, 4]], schema=["a", "b"]).write.save_as_table(
+        table_name, table_type="temporary"
+    )
+    session.enable_result_cache()
+    try:
+        df = session.table(table_name).filter("a > 1")
+        with session.query_history() as history:
+            assert df.collect() == [Row(3, 4)]
+            assert df.collect() == [Row(3, 4)]
+        assert len(history.queries) == 1
+        assert session.result_cache_stats["hits"] == 1
+
+        # DML through the Table API invalidates the cached results of the table
+        session.table(table_name).update({"b": 5})
+        assert df.collect() == [Row(3, 5)]
+        session.create_dataframe([[5, 6]], schema=["a", "b"]).write.save_as_table(
+            table_name, mode="append"
+        )
+        Utils.check_answer(df, [Row(3, 5), Row(5, 6)])
+    finally:
+        session.disable_result_cache()
+        Utils.drop_table(session, table_name)
+    assert session.result_cache_stats["entries"] == 0
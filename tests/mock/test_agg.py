@@ -3,6 +3,8 @@
 #
 
 import math
+from decimal import Decimal
+from unittest import mock
 
 import pytest
 
@@ -14,6 +16,7 @@ from snowflake.snowpark.functions import (
     avg,
     col,
     count,
+    count_distinct,
     covar_pop,
     covar_samp,
     function,
@@ -30,7 +33,14 @@ from snowflake.snowpark.functions import (
 )
 from snowflake.snowpark.mock._connection import MockServerConnection
 from snowflake.snowpark.mock._snowflake_data_type import ColumnEmulator, ColumnType
-from snowflake.snowpark.types import DoubleType
+from snowflake.snowpark.types import (
+    DecimalType,
+    DoubleType,
+    LongType,
+    StringType,
+    StructField,
+    StructType,
+)
 from tests.utils import Utils
 
 session = Session(MockServerConnection())
@@ -278,3 +288,69 @@ def test_agg():
     Utils.check_answer(
         origin_df.select(stddev("n"), stddev_pop("m")).collect(), Row(123.0, 456.0)
     )
+
+
+@pytest.mark.localtest
+def test_group_by_vectorized_aggregates():
+    origin_df: DataFrame = session.create_dataframe(
+        [
+            ["a", 1, "x"],
+            ["b", None, None],
+            ["a", 3, "y"],
+            [None, 2, "x"],
+            ["b", 5, None],
+            ["a", 1, "x"],
+        ],
+        schema=["g", "v", "s"],
+    )
+    aggregates = [
+        sum("v"),
+        count("v"),
+        min("v"),
+        max("s"),
+        avg("v"),
+        median("v"),
+        count_distinct("v", "s"),
+        listagg("s", ","),
+    ]
+    expected = [
+        Row("a", 5, 3, 1, "y", 5 / 3, 1.0, 2, "x,y,x"),
+        Row("b", 5, 1, 5, None, 5.0, 5.0, 0, ""),
+        Row(None, 2, 1, 2, "x", 2.0, 2.0, 1, "x"),
+    ]
+    Utils.check_answer(origin_df.group_by("g").agg(*aggregates).collect(), expected)
+
+    # a patched function is evaluated for every group
+    with mock.patch.dict(snowpark_mock_functions._MOCK_FUNCTION_IMPLEMENTATION_MAP):
+
+        @snowpark_mock_functions.patch("sum")
+        def mock_sum(column: ColumnEmulator):
+            return ColumnEmulator(
+                data=len(column), sf_type=ColumnType(LongType(), False)
+            )
+
+        Utils.check_answer(
+            origin_df.group_by("g").agg(sum("v"), count("v")).collect(),
+            [Row("a", 3, 3), Row("b", 2, 1), Row(None, 1, 1)],
+        )
+    Utils.check_answer(
+        origin_df.group_by("g").agg(sum("v"), count("v")).collect(),
+        [Row("a", 5, 3), Row("b", 5, 1), Row(None, 2, 1)],
+    )
+
+
+def test_group_by_avg_decimal_is_exact():
+    origin_df: DataFrame = session.create_dataframe(
+        [
+            ["a", Decimal("0.10")],
+            ["a", Decimal("0.20")],
+            ["b", Decimal("0.30")],
+            ["b", Decimal("0.50")],
+        ],
+        schema=StructType(
+            [StructField("k", StringType()), StructField("d", DecimalType(10, 2))]
+        ),
+    )
+    # the averages of Decimals are not computed from float sums
+    result = origin_df.group_by("k").agg(avg("d")).sort("k").collect()
+    assert [row[1] for row in result] == [Decimal("0.15"), Decimal("0.4")]
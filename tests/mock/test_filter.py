@@ -2,12 +2,16 @@
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
 
+import datetime
 import math
+from decimal import Decimal
+from unittest import mock
 
 import pytest
 
+import snowflake.snowpark.mock._functions as snowpark_mock_functions
 from snowflake.snowpark import DataFrame, Row, Session
-from snowflake.snowpark.functions import col
+from snowflake.snowpark.functions import col, to_date, upper
 from snowflake.snowpark.mock._connection import MockServerConnection
 
 session = Session(MockServerConnection())
@@ -220,3 +224,91 @@ def test_regex_filter():
         Row("es#%s"),
     ]
     assert origin_df.filter(col("a").regexp("...%.")).collect() == [Row("es#%s")]
+
+
+@pytest.mark.localtest
+def test_filter_and_arithmetic_with_null_values():
+    origin_df: DataFrame = session.create_dataframe(
+        [
+            [1, 2.5, None],
+            [None, None, 3],
+            [6, math.nan, 5],
+            [8, 1.0, None],
+        ],
+        schema=["a", "b", "c"],
+    )
+
+    # comparisons with null values are false
+    assert origin_df.filter(col("a") > 2).collect() == [
+        Row(6, math.nan, 5),
+        Row(8, 1.0, None),
+    ]
+    assert origin_df.filter(col("a") < col("c")).collect() == []
+    assert origin_df.filter(col("b") <= 2.5).collect() == [
+        Row(1, 2.5, None),
+        Row(8, 1.0, None),
+    ]
+
+    # arithmetic with null values returns null, NaN is a valid float value
+    res = origin_df.select(
+        (col("a") + col("c")).alias("sum"),
+        (col("b") * 2).alias("product"),
+        (-col("a")).alias("neg"),
+        (col("c") / 2).alias("quotient"),
+    ).collect()
+    assert res[0] == Row(None, 5.0, -1, None)
+    assert res[1] == Row(None, None, None, Decimal("1.5"))
+    assert res[2][0] == 11 and math.isnan(res[2][1])
+    assert res[2][2:] == Row(-6, Decimal("2.5"))
+    assert res[3] == Row(None, 2.0, -8, None)
+
+
+@pytest.mark.localtest
+def test_filter_before_projection():
+    origin_df: DataFrame = session.create_dataframe(
+        [
+            [1, "2024-01-01", "a"],
+            [2, "invalid", "b"],
+            [3, "2024-01-03", "c"],
+            [4, "2024-01-04", "d"],
+        ],
+        schema=["a", "d", "s"],
+    )
+    # the rows are filtered before the projection is computed, so the invalid date isn't converted
+    projected_df = origin_df.select(
+        "a", to_date("d").alias("date"), upper("s").alias("u")
+    )
+    assert projected_df.filter(col("a") != 2).collect() == [
+        Row(1, datetime.date(2024, 1, 1), "A"),
+        Row(3, datetime.date(2024, 1, 3), "C"),
+        Row(4, datetime.date(2024, 1, 4), "D"),
+    ]
+    assert origin_df.select("a", upper("s").alias("u")).filter(
+        col("u") > "B"
+    ).collect() == [Row(3, "C"), Row(4, "D")]
+
+    # the columns computed from filtered and sorted rows belong to the same rows
+    valid_df = origin_df.filter(col("a") != 2)
+    assert valid_df.sort(col("a").desc()).select(
+        to_date("d").alias("date"), "a"
+    ).collect() == [
+        Row(datetime.date(2024, 1, 4), 4),
+        Row(datetime.date(2024, 1, 3), 3),
+        Row(datetime.date(2024, 1, 1), 1),
+    ]
+
+    # the computed columns that aren't used by the outer query aren't computed
+    with mock.patch.dict(snowpark_mock_functions._MOCK_FUNCTION_IMPLEMENTATION_MAP):
+        num_computed_rows = []
+
+        @snowpark_mock_functions.patch("upper")
+        def mock_upper(column):
+            num_computed_rows.append(len(column))
+            return column.str.upper()
+
+        sorted_df = valid_df.select("a", upper("s").alias("u")).sort("a")
+        num_computed_rows.clear()
+        assert sorted_df.select("a").collect() == [Row(1), Row(3), Row(4)]
+        assert num_computed_rows == []
+        assert sorted_df.select("u").collect() == [Row("A"), Row("C"), Row("D")]
+        assert num_computed_rows == [3]
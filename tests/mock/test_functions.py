@@ -3,24 +3,34 @@
 #
 import datetime
 import math
+from decimal import Decimal
 
 import pytest
 
 from snowflake.snowpark import DataFrame, Row, Session
+from snowflake.snowpark.exceptions import SnowparkSQLException
 from snowflake.snowpark.functions import (  # count,; is_null,;
     abs,
     asc,
     col,
     contains,
     count,
+    dateadd,
     desc,
+    greatest,
+    initcap,
     is_null,
+    least,
     lit,
     max,
     min,
     to_date,
+    to_timestamp,
 )
 from snowflake.snowpark.mock._connection import MockServerConnection
+from snowflake.snowpark.mock._functions import mock_to_boolean
+from snowflake.snowpark.mock._snowflake_data_type import ColumnEmulator, ColumnType
+from snowflake.snowpark.types import DecimalType, DoubleType, StringType
 
 session = Session(MockServerConnection())
 
@@ -96,6 +106,121 @@ def test_to_date():
     ]
 
 
+@pytest.mark.localtest
+def test_conversion_functions_in_bulk():
+    # the values that can't be converted in bulk are converted one by one
+    origin_df: DataFrame = session.create_dataframe(
+        [
+            ["2020-01-31 10:11:12", "2020-01-31", 1.255, datetime.date(2020, 1, 31)],
+            ["2020-1-5 1:2:3", "2020-1-2", None, datetime.date(2020, 12, 31)],
+            [None, "1700000000", -12.5, datetime.date(2020, 2, 29)],
+        ],
+        schema=["ts", "d", "f", "dt"],
+    )
+    assert origin_df.select(
+        to_timestamp("ts", lit("YYYY-MM-DD HH24:MI:SS")),
+        to_date("d"),
+        col("f").cast(DecimalType(10, 2)),
+        col("f").cast(StringType()),
+        col("dt").cast(StringType()),
+    ).collect() == [
+        Row(
+            datetime.datetime(2020, 1, 31, 10, 11, 12),
+            datetime.date(2020, 1, 31),
+            Decimal("1.25"),
+            "1.255",
+            "2020-01-31",
+        ),
+        Row(
+            datetime.datetime(2020, 1, 5, 1, 2, 3),
+            datetime.date(2020, 1, 2),
+            None,
+            None,
+            "2020-12-31",
+        ),
+        Row(None, datetime.date(2023, 11, 14), Decimal("-12.5"), "-12.5", "2020-02-29"),
+    ]
+
+    assert origin_df.select(
+        dateadd("month", lit(1), "dt"),
+        dateadd("year", lit(4), "dt"),
+        dateadd("hour", lit(25), "dt"),
+    ).collect() == [
+        Row(
+            datetime.date(2020, 2, 29),
+            datetime.date(2024, 1, 31),
+            datetime.datetime(2020, 2, 1, 1),
+        ),
+        Row(
+            datetime.date(2021, 1, 31),
+            datetime.date(2024, 12, 31),
+            datetime.datetime(2021, 1, 1, 1),
+        ),
+        Row(
+            datetime.date(2020, 3, 29),
+            datetime.date(2024, 2, 29),
+            datetime.datetime(2020, 3, 1, 1),
+        ),
+    ]
+
+
+@pytest.mark.localtest
+def test_greatest_least_initcap_in_bulk():
+    origin_df: DataFrame = session.create_dataframe(
+        [
+            [1.5, 3, "hello-world foo"],
+            [-2.0, 9, "ÄBC déf"],
+            [0.5, -1, None],
+        ],
+        schema=["f", "i", "s"],
+    )
+    assert origin_df.select(
+        greatest("f", lit(0.0)),
+        least("i", lit(5), col("i") * 2),
+        initcap("s"),
+        initcap("s", lit(" ")),
+    ).collect() == [
+        Row(1.5, 3, "Hello-World Foo", "Hello-world Foo"),
+        Row(0.0, 5, "Äbc Déf", "Äbc Déf"),
+        Row(0.5, -2, None, None),
+    ]
+
+
+@pytest.mark.localtest
+def test_to_boolean():
+    strings = ColumnEmulator(
+        ["true", "T", "yes", "0", "Off", None, "maybe"],
+        sf_type=ColumnType(StringType(), True),
+        dtype=object,
+    )
+    assert list(mock_to_boolean(strings, try_cast=True)) == [
+        True,
+        True,
+        True,
+        False,
+        False,
+        None,
+        None,
+    ]
+    with pytest.raises(SnowparkSQLException, match="Boolean value maybe"):
+        mock_to_boolean(strings)
+
+    numbers = ColumnEmulator(
+        [0, 1.5, -2, None, float("nan")],
+        sf_type=ColumnType(DoubleType(), True),
+        dtype=object,
+    )
+    assert list(mock_to_boolean(numbers, try_cast=True)) == [
+        False,
+        True,
+        True,
+        None,
+        None,
+    ]
+    with pytest.raises(SnowparkSQLException, match="Invalid value nan"):
+        mock_to_boolean(numbers)
+
+
 @pytest.mark.localtest
 def test_contains():
     origin_df: DataFrame = session.create_dataframe(
@@ -0,0 +1,151 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+from unittest import mock
+
+import pytest
+
+from snowflake.snowpark import Row, Session
+from snowflake.snowpark.functions import col, upper
+from snowflake.snowpark.mock import _functions as snowpark_mock_functions
+from snowflake.snowpark.mock._connection import MockServerConnection
+from snowflake.snowpark.mock._plan import (
+    _calculate_join_key,
+    execute_mock_plan,
+    get_join_candidate_pairs,
+)
+from tests.utils import Utils
+
+session = Session(MockServerConnection())
+
+
+@pytest.fixture(scope="module")
+def dfs():
+    df1 = session.create_dataframe(
+        [[1, 10], [2, 20], [2, 21], [3, 30], [5, 40]], schema=["a", "b"]
+    )
+    df2 = session.create_dataframe(
+        [[2, 15], [2, 25], [3, 5], [4, 50], [6, 60]], schema=["c", "d"]
+    )
+    return df1, df2
+
+
+@pytest.mark.localtest
+def test_equi_join_with_residual_condition(dfs):
+    df1, df2 = dfs
+    equi_join_condition = (col("a") == col("c")) & (col("b") < col("d"))
+    # same condition without an equality, evaluated on the Cartesian product
+    cartesian_condition = (
+        (col("a") >= col("c")) & (col("a") <= col("c")) & (col("b") < col("d"))
+    )
+    for how in ["inner", "left", "right", "full"]:
+        Utils.check_answer(
+            df1.join(df2, equi_join_condition, how=how),
+            df1.join(df2, cartesian_condition, how=how),
+        )
+
+    assert df1.join(df2, equi_join_condition).collect() == [
+        Row(2, 20, 2, 25),
+        Row(2, 21, 2, 25),
+    ]
+    Utils.check_answer(
+        df1.join(df2, equi_join_condition, how="left"),
+        [
+            Row(1, 10, None, None),
+            Row(2, 20, 2, 25),
+            Row(2, 21, 2, 25),
+            Row(3, 30, None, None),
+            Row(5, 40, None, None),
+        ],
+    )
+
+
+@pytest.mark.localtest
+def test_equi_join_keys_on_both_sides(dfs):
+    df1, df2 = dfs
+    assert df1.join(
+        df2, (col("c") == col("a")) & (col("d") + 5 == col("b"))
+    ).collect() == [Row(2, 20, 2, 15)]
+
+
+@pytest.mark.localtest
+def test_join_key_side_detection(dfs):
+    df1, _ = dfs
+    left = execute_mock_plan(df1._plan)
+    analyzer = session._analyzer
+
+    def join_key(column):
+        return _calculate_join_key(column._expression, left, analyzer, {})
+
+    assert list(join_key(col("a") + 1)) == [2, 3, 3, 4, 6]
+    # an expression referencing a column of the other input isn't a key of this input
+    assert join_key(col("c")) is None
+    assert join_key(col("a") + col("c")) is None
+
+    # other errors evaluating an expression on the columns of this input are raised
+    with mock.patch.dict(snowpark_mock_functions._MOCK_FUNCTION_IMPLEMENTATION_MAP):
+
+        @snowpark_mock_functions.patch("upper")
+        def mock_upper(column):
+            raise KeyError("missing key")
+
+        with pytest.raises(KeyError, match="missing key"):
+            join_key(upper(col("a")))
+
+
+@pytest.mark.localtest
+def test_semi_and_anti_join(dfs):
+    df1, df2 = dfs
+    assert df1.join(df2, col("a") == col("c"), how="leftsemi").collect() == [
+        Row(2, 20),
+        Row(2, 21),
+        Row(3, 30),
+    ]
+    assert df1.join(df2, col("a") == col("c"), how="leftanti").collect() == [
+        Row(1, 10),
+        Row(5, 40),
+    ]
+
+
+@pytest.mark.localtest
+def test_filter_join_inputs(dfs):
+    df1, df2 = dfs
+    condition = col("a") == col("c")
+    with mock.patch(
+        "snowflake.snowpark.mock._plan.get_join_candidate_pairs",
+        wraps=get_join_candidate_pairs,
+    ) as candidate_pairs:
+        for how in ["inner", "left", "right", "full"]:
+            Utils.check_answer(
+                df1.join(df2, condition, how=how).filter(
+                    (col("b") > 20) & (col("d") < 50)
+                ),
+                [Row(2, 21, 2, 15), Row(2, 21, 2, 25), Row(3, 30, 3, 5)],
+            )
+            # the inputs of the join are filtered before joining
+            left, right = candidate_pairs.call_args[0][:2]
+            assert (len(left), len(right)) == {
+                "inner": (3, 3),
+                "left": (3, 5),
+                "right": (5, 3),
+                "full": (5, 5),
+            }[how]
+
+        # the conditions on the columns of an input whose rows are padded with nulls are evaluated after joining
+        for how, expected in [
+            ("inner", []),
+            ("left", [Row(5, 40, None, None)]),
+            ("right", []),
+            ("full", [Row(5, 40, None, None)]),
+        ]:
+            Utils.check_answer(
+                df1.join(df2, condition, how=how).filter(
+                    (col("b") > 20) & col("d").is_null()
+                ),
+                expected,
+            )
+        Utils.check_answer(
+            df1.join(df2, condition, how="leftanti").filter(col("b") > 20),
+            [Row(5, 40)],
+        )
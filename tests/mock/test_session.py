@@ -2,6 +2,8 @@
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
 
+import numpy
+
 import snowflake.snowpark.mock._constants
 from snowflake.snowpark.mock._connection import MockServerConnection
 from snowflake.snowpark.mock._constants import (
@@ -106,3 +108,32 @@ def test_session_use_object():
     assert session.get_current_schema() == '"TEST_SCHEMA"'
     assert session.get_current_database() == '"TEST_DATABASE"'
     assert session.get_current_role() == '"TEST_ROLE"'
+
+
+def test_table_registry_append_and_read():
+    session = Session(MockServerConnection())
+    registry = session._conn.entity_registry
+    df = session.create_dataframe([[1, "a"]], schema=["a", "b"])
+    df.write.save_as_table("t", mode="overwrite")
+    for i in range(2, 11):
+        session.create_dataframe([[i, str(i)]], schema=["x", "y"]).write.save_as_table(
+            "t", mode="append"
+        )
+    storage = registry.table_registry[registry.get_fully_qualified_name("t")]
+    # the appended tables are only concatenated when the table is read
+    assert len(storage._chunks) == 10 and storage._snapshot is None
+    table = session.table("t")
+    assert [row[0] for row in table.collect()] == list(range(1, 11))
+    assert len(storage._chunks) == 1
+    # the reads share the data of the same snapshot until the next write
+    snapshot = storage._snapshot
+    for _ in range(2):
+        assert numpy.shares_memory(
+            registry.read_table("t")['"A"'].values, snapshot['"A"'].values
+        )
+
+    # updating a table doesn't modify the data of the previous reads
+    rows_before_update = table.collect()
+    table.update({"b": "z"}, table["a"] > 5)
+    assert table.filter(table["b"] == "z").count() == 5
+    assert snapshot['"B"'].tolist() == [row[1] for row in rows_before_update]
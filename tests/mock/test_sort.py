@@ -2,11 +2,14 @@
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
 
+from unittest import mock
+
 import pytest
 
 from snowflake.snowpark import DataFrame, Row, Session
 from snowflake.snowpark.functions import col
 from snowflake.snowpark.mock._connection import MockServerConnection
+from snowflake.snowpark.mock._plan import _top_k_candidates
 from tests.utils import Utils
 
 session = Session(MockServerConnection())
@@ -174,3 +177,48 @@ def test_sort_multiple_column():
         ],
         sort=False,
     )
+
+
+@pytest.mark.localtest
+def test_sort_with_limit():
+    origin_df: DataFrame = session.create_dataframe(
+        [
+            [3.0, "c"],
+            [None, "a"],
+            [1.0, "b"],
+            [float("nan"), "d"],
+            [3.0, "a"],
+            [2.0, None],
+            [1.0, "a"],
+            [None, "e"],
+            [1.0, "bb"],
+        ],
+        schema=["m", "n"],
+    )
+    orders = [
+        col("m"),
+        col("m").desc(),
+        col("m").asc_nulls_last(),
+        col("m").desc_nulls_first(),
+        col("n"),
+        col("n").desc(),
+        col("n").asc_nulls_last(),
+    ]
+    # only the rows tied with or before the last row of the limit are sorted
+    with mock.patch(
+        "snowflake.snowpark.mock._plan._top_k_candidates", wraps=_top_k_candidates
+    ) as top_k_candidates:
+        for order in orders:
+            sorted_rows = origin_df.sort(order).collect()
+            for n in range(len(sorted_rows) + 1):
+                Utils.check_answer(
+                    origin_df.sort(order).limit(n).collect(),
+                    sorted_rows[:n],
+                    sort=False,
+                )
+            Utils.check_answer(
+                origin_df.sort(order, col("m").desc()).limit(3, offset=2).collect(),
+                origin_df.sort(order, col("m").desc()).collect()[2:5],
+                sort=False,
+            )
+    assert top_k_candidates.call_count == len(orders) * len(sorted_rows) + len(orders)
@@ -1,6 +1,7 @@
 #
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
+import asyncio
 import datetime
 import decimal
 
@@ -164,3 +165,15 @@ def test_df_to_pandas_df():
         }
     )
     assert_frame_equal(df.to_pandas(), pandas_df)
+
+
+@pytest.mark.localtest
+def test_to_pandas_async():
+    df = session.create_dataframe([[1, "a"], [2, "b"]], schema=["a", "b"])
+
+    async def main():
+        return await asyncio.gather(df.to_pandas_async(), df.collect_async())
+
+    pandas_df, rows = asyncio.run(main())
+    assert_frame_equal(pandas_df, df.to_pandas())
+    assert rows == df.collect()
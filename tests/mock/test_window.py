@@ -0,0 +1,216 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import math
+
+import pytest
+
+from snowflake.snowpark import Row, Session, Window
+from snowflake.snowpark.functions import (
+    avg,
+    col,
+    count,
+    cume_dist,
+    dense_rank,
+    first_value,
+    lag,
+    last_value,
+    lead,
+    lit,
+    max as max_,
+    min as min_,
+    percent_rank,
+    rank,
+    row_number,
+    sum as sum_,
+)
+from snowflake.snowpark.mock import _plan
+from snowflake.snowpark.mock._connection import MockServerConnection
+
+session = Session(MockServerConnection())
+
+
+@pytest.fixture(scope="module")
+def df():
+    return session.create_dataframe(
+        [
+            [1, 1, 2, 1.5],
+            [1, 2, None, None],
+            [2, 3, 5, -2.25],
+            [1, 3, 7, 3.0],
+            [1, 3, 1, 1.5],
+            [2, 1, -3, None],
+            [3, 4, 12, 0.5],
+        ],
+        schema=["g", "o", "v", "f"],
+    )
+
+
+def collect_window_by_window(dataframe, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(_plan, "handle_vectorized_window_expression", lambda *args: None)
+        rows = dataframe.collect()
+    # min and max of a window without values are NaN instead of NULL when computed window by window
+    return [
+        Row(*(None if isinstance(v, float) and math.isnan(v) else v for v in row))
+        for row in rows
+    ]
+
+
+@pytest.mark.localtest
+def test_vectorized_window_functions_match_window_by_window_evaluation(df, monkeypatch):
+    window = Window.partition_by("g").order_by("o")
+    windows = [
+        window,
+        Window.partition_by("g"),
+        Window.order_by(col("o").desc(), "v"),
+        window.rows_between(-1, 1),
+        window.rows_between(2, 3),
+        window.rows_between(Window.UNBOUNDED_PRECEDING, 1),
+        window.rows_between(-1, Window.UNBOUNDED_FOLLOWING),
+        window.range_between(Window.CURRENT_ROW, Window.UNBOUNDED_FOLLOWING),
+    ]
+    for w in windows:
+        for c in ["v", "f"]:
+            dataframe = df.select(
+                "g",
+                "o",
+                c,
+                sum_(c).over(w),
+                min_(c).over(w),
+                max_(c).over(w),
+                avg(c).over(w),
+                count(c).over(w),
+                count(col(c) + 1).over(w),
+            )
+            assert dataframe.collect() == collect_window_by_window(
+                dataframe, monkeypatch
+            )
+    for w in windows[:3]:
+        if w is windows[1]:
+            continue
+        dataframe = df.select(
+            "g",
+            "o",
+            "v",
+            row_number().over(w),
+            first_value("v").over(w),
+            last_value("v").over(w),
+            lead(col("v") * 2).over(w),
+            lag("f", 2).over(w),
+        )
+        assert dataframe.collect() == collect_window_by_window(dataframe, monkeypatch)
+
+
+@pytest.mark.localtest
+def test_vectorized_running_aggregates(df):
+    window = Window.partition_by("g").order_by("o")
+    assert df.select(
+        "g",
+        "o",
+        sum_("v").over(window),
+        count("v").over(window),
+        min_("v").over(window.rows_between(-1, 0)),
+        row_number().over(window),
+    ).collect() == [
+        Row(1, 1, 2, 1, 2, 1),
+        Row(1, 2, 2, 1, 2, 2),
+        Row(2, 3, 2, 2, -3, 2),
+        # rows with the same ORDER BY value are peers of the default RANGE frame
+        Row(1, 3, 10, 3, 7, 3),
+        Row(1, 3, 10, 3, 1, 4),
+        Row(2, 1, -3, 1, -3, 1),
+        Row(3, 4, 12, 1, 12, 1),
+    ]
+
+
+@pytest.mark.localtest
+def test_vectorized_aggregates_are_exact(monkeypatch):
+    window = Window.partition_by("g").order_by("o")
+    sliding_window = window.rows_between(-1, 0)
+    df = session.create_dataframe(
+        [
+            [1, 1, 1e20, 2**60 + 1],
+            [1, 2, 1.0, 3],
+            [1, 3, 1.0, 2**60 + 5],
+            [1, 4, 1.0, 7],
+        ],
+        schema=["g", "o", "f", "i"],
+    )
+    # small values added to large values are not lost by sliding frames
+    dataframe = df.select(sum_("f").over(sliding_window), avg("f").over(sliding_window))
+    assert dataframe.collect() == [
+        Row(1e20, 1e20),
+        Row(1e20, 5e19),
+        Row(2.0, 1.0),
+        Row(2.0, 1.0),
+    ]
+    assert dataframe.collect() == collect_window_by_window(dataframe, monkeypatch)
+    assert df.select(sum_("f").over(window)).collect() == [Row(1e20)] * 4
+
+    # integers are not converted to floats
+    assert df.select(
+        min_("i").over(window),
+        max_("i").over(window),
+        min_("i").over(sliding_window),
+        max_("i").over(window.rows_between(0, Window.UNBOUNDED_FOLLOWING)),
+    ).collect() == [
+        Row(2**60 + 1, 2**60 + 1, 2**60 + 1, 2**60 + 5),
+        Row(3, 2**60 + 1, 3, 2**60 + 5),
+        Row(3, 2**60 + 5, 3, 2**60 + 5),
+        Row(3, 2**60 + 5, 7, 7),
+    ]
+    # the integers that can't be added exactly as floats, and Decimals, are computed window by window
+    for dataframe in [
+        df.select(sum_("i").over(window)),
+        df.select(max_(col("i").cast("decimal(38, 2)")).over(window)),
+    ]:
+        with monkeypatch.context() as m:
+            m.setattr(
+                _plan,
+                "windowed_sum",
+                lambda *args: pytest.fail("computed with prefix sums"),
+            )
+            m.setattr(
+                _plan,
+                "windowed_extreme",
+                lambda *args: pytest.fail("computed with cumulative extremes"),
+            )
+            assert dataframe.collect() == collect_window_by_window(
+                dataframe, monkeypatch
+            )
+
+
+@pytest.mark.localtest
+def test_lag_with_default_of_same_type(df):
+    window = Window.partition_by("g").order_by("o")
+    assert df.select(lag("v", 1, lit(0)).over(window)).collect() == [
+        Row(0),
+        Row(2),
+        Row(-3),
+        Row(None),
+        Row(7),
+        Row(0),
+        Row(0),
+    ]
+
+
+@pytest.mark.localtest
+def test_rank_functions():
+    df = session.create_dataframe(
+        [[1, 1], [1, 2], [1, 2], [1, 3], [2, 5]], schema=["g", "o"]
+    )
+    window = Window.partition_by("g").order_by("o")
+    assert df.select(
+        rank().over(window),
+        dense_rank().over(window),
+        percent_rank().over(window),
+        cume_dist().over(window),
+    ).collect() == [
+        Row(1, 1, 0.0, 0.25),
+        Row(2, 2, 1 / 3, 0.75),
+        Row(2, 2, 1 / 3, 0.75),
+        Row(4, 3, 1.0, 1.0),
+        Row(1, 1, 0.0, 1.0),
+    ]
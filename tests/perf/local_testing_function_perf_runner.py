@@ -0,0 +1,141 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import argparse
+import datetime
+import time
+
+from snowflake.snowpark.mock import _functions
+from snowflake.snowpark.mock._snowflake_data_type import ColumnEmulator, ColumnType
+from snowflake.snowpark.types import (
+    DateType,
+    DoubleType,
+    LongType,
+    StringType,
+    TimestampType,
+)
+
+
+def column(values: list, datatype) -> ColumnEmulator:
+    return ColumnEmulator(values, sf_type=ColumnType(datatype, True), dtype=object)
+
+
+def literal(value, nrows: int, datatype) -> ColumnEmulator:
+    return column([value] * nrows, datatype)
+
+
+def strings(nrows: int) -> ColumnEmulator:
+    return column(
+        [f"hello world-{i % 1000}.snowpark" for i in range(nrows)], StringType()
+    )
+
+
+def doubles(nrows: int) -> ColumnEmulator:
+    return column([(i % 10007) * 1.25 - 5000 for i in range(nrows)], DoubleType())
+
+
+def longs(nrows: int) -> ColumnEmulator:
+    return column([i % 10007 for i in range(nrows)], LongType())
+
+
+def dates(nrows: int) -> ColumnEmulator:
+    start = datetime.date(2000, 1, 1)
+    return column(
+        [start + datetime.timedelta(days=i % 10000) for i in range(nrows)], DateType()
+    )
+
+
+def timestamps(nrows: int) -> ColumnEmulator:
+    start = datetime.datetime(2000, 1, 1)
+    return column(
+        [start + datetime.timedelta(seconds=i * 37) for i in range(nrows)],
+        TimestampType(),
+    )
+
+
+def date_strings(nrows: int) -> ColumnEmulator:
+    return column([str(d) for d in dates(nrows)], StringType())
+
+
+def timestamp_strings(nrows: int) -> ColumnEmulator:
+    return column(
+        [t.strftime("%Y-%m-%d %H:%M:%S") for t in timestamps(nrows)], StringType()
+    )
+
+
+# each benchmark creates its input columns and returns a function calling the local testing implementation
+BENCHMARKS = {
+    "to_date": lambda n: partial_call(_functions.mock_to_date, date_strings(n)),
+    "to_date_format": lambda n: partial_call(
+        _functions.mock_to_date,
+        column([d.strftime("%d/%m/%Y") for d in dates(n)], StringType()),
+        "DD/MM/YYYY",
+    ),
+    "to_timestamp": lambda n: partial_call(
+        _functions.mock_to_timestamp,
+        timestamp_strings(n),
+        literal("YYYY-MM-DD HH24:MI:SS", n, StringType()),
+    ),
+    "to_decimal": lambda n: partial_call(_functions.mock_to_decimal, doubles(n), 38, 2),
+    "to_char": lambda n: partial_call(_functions.mock_to_char, doubles(n)),
+    "to_char_date": lambda n: partial_call(_functions.mock_to_char, dates(n)),
+    "to_boolean": lambda n: partial_call(
+        _functions.mock_to_boolean,
+        column([["true", "f", "YES", "0"][i % 4] for i in range(n)], StringType()),
+    ),
+    "dateadd_day": lambda n: partial_call(
+        _functions.mock_dateadd, "day", longs(n), dates(n)
+    ),
+    "dateadd_month": lambda n: partial_call(
+        _functions.mock_dateadd, "month", literal(3, n, LongType()), dates(n)
+    ),
+    "dateadd_hour": lambda n: partial_call(
+        _functions.mock_dateadd, "hour", longs(n), timestamps(n)
+    ),
+    "initcap": lambda n: partial_call(
+        _functions.mock_initcap, strings(n), literal(None, n, StringType())
+    ),
+    "greatest": lambda n: partial_call(
+        _functions.mock_greatest,
+        doubles(n),
+        column([float(v) for v in longs(n)], DoubleType()),
+    ),
+    "least": lambda n: partial_call(
+        _functions.mock_least, longs(n), column(list(longs(n))[::-1], LongType())
+    ),
+    "to_boolean_numeric": lambda n: partial_call(
+        _functions.mock_to_boolean,
+        column([i % 3 for i in range(n)], LongType()),
+    ),
+}
+
+
+def partial_call(func, *args):
+    return lambda: func(*args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Snowpark Python local testing function performance test"
+    )
+    parser.add_argument(
+        "function",
+        nargs="*",
+        help=f"the functions to test, all by default: {', '.join(BENCHMARKS)}.",
+    )
+    parser.add_argument(
+        "-n",
+        "--nrows",
+        type=int,
+        default=1000000,
+        help="number of rows of the input columns.",
+    )
+    args = parser.parse_args()
+    print("Snowpark Python Local Testing Function Performance Test")
+    print("Parameters: ", args)
+    for name in args.function or BENCHMARKS:
+        call = BENCHMARKS[name](args.nrows)
+        t0 = time.perf_counter()
+        call()
+        print(f"{name}: {time.perf_counter() - t0:.3f} secs")
@@ -0,0 +1,179 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import argparse
+import time
+
+from snowflake.snowpark import DataFrame, Window
+from snowflake.snowpark.functions import (
+    avg,
+    col,
+    count,
+    max as max_,
+    sum as sum_,
+    upper,
+)
+from snowflake.snowpark.mock._connection import MockServerConnection
+from snowflake.snowpark.session import Session
+
+
+def join(session: Session, nrows: int) -> DataFrame:
+    """Equi-join, executed as a hash join by the local testing engine."""
+    df1 = session.create_dataframe([[i, i % 100] for i in range(nrows)], ["a", "b"])
+    df2 = session.create_dataframe([[i, i % 7] for i in range(nrows)], ["c", "d"])
+    return df1.join(df2, (col("a") == col("c")) & (col("b") > col("d")))
+
+
+def join_cartesian(session: Session, nrows: int) -> DataFrame:
+    """Same result as ``join``, but the condition has no equality, so the local testing engine
+    evaluates it on the Cartesian product of the inputs."""
+    df1 = session.create_dataframe([[i, i % 100] for i in range(nrows)], ["a", "b"])
+    df2 = session.create_dataframe([[i, i % 7] for i in range(nrows)], ["c", "d"])
+    return df1.join(
+        df2, (col("a") >= col("c")) & (col("a") <= col("c")) & (col("b") > col("d"))
+    )
+
+
+def semi_join(session: Session, nrows: int) -> DataFrame:
+    df1 = session.create_dataframe([[i, i % 100] for i in range(nrows)], ["a", "b"])
+    df2 = session.create_dataframe([[i * 2] for i in range(nrows)], ["c"])
+    return df1.join(df2, col("a") == col("c"), how="leftsemi")
+
+
+def anti_join(session: Session, nrows: int) -> DataFrame:
+    df1 = session.create_dataframe([[i, i % 100] for i in range(nrows)], ["a", "b"])
+    df2 = session.create_dataframe([[i * 2] for i in range(nrows)], ["c"])
+    return df1.join(df2, col("a") == col("c"), how="leftanti")
+
+
+def window_running_sum(session: Session, nrows: int) -> DataFrame:
+    """Running sum over partitions, computed with prefix sums by the local testing engine."""
+    df = session.create_dataframe(
+        [[i % 10, i, i % 100] for i in range(nrows)], ["g", "o", "v"]
+    )
+    return df.select("g", "o", sum_("v").over(Window.partition_by("g").order_by("o")))
+
+
+def window_sliding_sum(session: Session, nrows: int) -> DataFrame:
+    df = session.create_dataframe(
+        [[i % 10, i, i % 100] for i in range(nrows)], ["g", "o", "v"]
+    )
+    return df.select(
+        "g",
+        "o",
+        sum_("v").over(Window.partition_by("g").order_by("o").rows_between(-5, 5)),
+    )
+
+
+def arithmetic(session: Session, nrows: int) -> DataFrame:
+    """Arithmetic operators and comparisons on columns where every tenth value is null."""
+    df = session.create_dataframe(
+        [[i, i * 0.5, None if i % 10 == 0 else i] for i in range(nrows)],
+        ["a", "b", "c"],
+    )
+    return df.filter(col("c") * 2 > col("a")).select(
+        (col("a") + col("c") * 3 - 1) % 7, col("b") / col("a")
+    )
+
+
+def group_by_agg(session: Session, nrows: int) -> DataFrame:
+    """Aggregates ``nrows`` rows into ``nrows / 20`` groups."""
+    df = session.create_dataframe(
+        [[i % max(nrows // 20, 1), i] for i in range(nrows)], ["g", "v"]
+    )
+    return df.group_by("g").agg(sum_("v"), count("v"), avg("v"), max_("v"))
+
+
+def table_appends(session: Session, nrows: int) -> DataFrame:
+    """Appends ``nrows`` single-row DataFrames to a table, and counts its rows after every 100 appends."""
+    session.create_dataframe([[0, "0"]], ["a", "b"]).write.save_as_table(
+        "appends", mode="overwrite"
+    )
+    for i in range(1, nrows):
+        session.create_dataframe([[i, str(i)]], ["a", "b"]).write.save_as_table(
+            "appends", mode="append"
+        )
+        if i % 100 == 0:
+            session.table("appends").count()
+    return session.table("appends")
+
+
+def table_reads(session: Session, nrows: int) -> DataFrame:
+    """Reads a table of ``nrows`` rows 100 times."""
+    session.create_dataframe(
+        [[i, str(i)] for i in range(nrows)], ["a", "b"]
+    ).write.save_as_table("reads", mode="overwrite")
+    for _ in range(100):
+        session.table("reads").filter(col("a") < 10).collect()
+    return session.table("reads")
+
+
+def wide_table_filter(session: Session, nrows: int) -> DataFrame:
+    """Filters a table of 50 columns and computes 2 columns from the selected rows."""
+    session.create_dataframe(
+        [[i] + [f"{i}-{j}" for j in range(49)] for i in range(nrows)],
+        ["a"] + [f"c{j}" for j in range(49)],
+    ).write.save_as_table("wide", mode="overwrite")
+    return (
+        session.table("wide")
+        .select("a", "c0", upper(col("c1")).as_("u"))
+        .filter(col("a") % 100 == 0)
+        .select("a", "u")
+    )
+
+
+def join_filter(session: Session, nrows: int) -> DataFrame:
+    """Filters the result of a join on a column of each input, evaluated on the inputs before joining."""
+    df1 = session.create_dataframe([[i, i % 100] for i in range(nrows)], ["a", "b"])
+    df2 = session.create_dataframe(
+        [[i % 1000, i % 7] for i in range(nrows)], ["c", "d"]
+    )
+    return df1.join(df2, col("b") == col("d")).filter(
+        (col("a") < 100) & (col("c") == 1)
+    )
+
+
+def sort_limit(session: Session, nrows: int) -> DataFrame:
+    """Top 10 rows, computed without sorting all rows."""
+    df = session.create_dataframe(
+        [[(i * 7919) % nrows, str(i)] for i in range(nrows)], ["a", "b"]
+    )
+    return df.sort(col("a").desc(), col("b")).limit(10)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Snowpark Python local testing performance test"
+    )
+    parser.add_argument(
+        "api",
+        help="the API to test: join, join_cartesian, semi_join, anti_join, window_running_sum, "
+        "window_sliding_sum, arithmetic, group_by_agg, table_appends, table_reads, wide_table_filter, "
+        "join_filter, sort_limit.",
+    )
+    parser.add_argument("nrows", type=int, help="number of rows of the input data.")
+    parser.add_argument(
+        "-m", "--memory", action="store_true", default=False, help="Do memory profiling"
+    )
+    args = parser.parse_args()
+
+    session = Session(MockServerConnection())
+    print("Snowpark Python Local Testing Performance Test")
+    print("Parameters: ", args)
+    try:
+        func = eval(args.api)
+        if args.memory:
+            import memory_profiler
+
+            func = memory_profiler.profile(func)
+        t0 = time.time()
+        dataframe = func(session, args.nrows)
+        t1 = time.time()
+        print("Client side time elapsed: ", t1 - t0)
+        dataframe.collect()
+        t2 = time.time()
+        print("Local execution time elapsed: ", t2 - t1)
+        print("Total execution time elapsed: ", t2 - t0)
+    finally:
+        session.close()
@@ -81,10 +81,36 @@ def join(session: Session, ncalls: int, num_of_cols: int) -> DataFrame:
     return df
 
 
+def generate_data(nrows: int, num_of_cols: int) -> List[List]:
+    return [
+        [i if j % 2 == 0 else f"{'a' * 10}{i}" for j in range(num_of_cols)]
+        for i in range(nrows)
+    ]
+
+
+def create_dataframe_batch_insert(
+    session: Session, nrows: int, num_of_cols: int
+) -> DataFrame:
+    """Inserts the local data into a temp table with parameter binding."""
+    session.create_dataframe_upload_threshold = None
+    return session.create_dataframe(generate_data(nrows, num_of_cols))
+
+
+def create_dataframe_upload(
+    session: Session, nrows: int, num_of_cols: int
+) -> DataFrame:
+    """Uploads the local data as a Parquet file and copies it into a temp table."""
+    session.create_dataframe_upload_threshold = 0
+    return session.create_dataframe(generate_data(nrows, num_of_cols))
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Snowpark Python API performance test")
     parser.add_argument(
-        "api", help="the API to test: with_column, drop, union, union_by_name, join."
+        "api",
+        help="the API to test: with_column, drop, union, union_by_name, join, "
+        "create_dataframe_batch_insert, create_dataframe_upload. "
+        "For create_dataframe_*, ncalls is the number of rows.",
     )
     parser.add_argument("ncalls", type=int, help="number of calls.")
     parser.add_argument(
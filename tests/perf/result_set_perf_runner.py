@@ -0,0 +1,66 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from snowflake.connector.cursor import ResultMetadata
+from snowflake.snowpark._internal.utils import result_set_to_row_set, result_set_to_rows
+
+
+def generate_result_set(nrows: int, ncols: int):
+    """Rows of integers, floats and strings, like the ones returned by ``SnowflakeCursor.fetchall``."""
+    result_meta = [
+        ResultMetadata(f"C{i}", i % 3, None, None, None, None, True)
+        for i in range(ncols)
+    ]
+    converters = [int, float, str]
+    result_set = [
+        tuple(converters[i % 3](r * ncols + i) for i in range(ncols))
+        for r in range(nrows)
+    ]
+    return result_set, result_meta
+
+
+def measure(name: str, func, *args) -> None:
+    gc.collect()
+    t0 = time.perf_counter()
+    result = func(*args)
+    t1 = time.perf_counter()
+    for _ in result:
+        pass
+    t2 = time.perf_counter()
+    del result
+    gc.collect()
+    # measure the memory in a second run, since tracing memory allocations slows down the first one
+    tracemalloc.start()
+    result = func(*args)
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    print(
+        f"{name}: build {t1 - t0:.3f} secs, iterate {t2 - t1:.3f} secs, "
+        f"retained {size / 2**20:.1f} MB, peak {peak / 2**20:.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compares the memory and latency of collect() and collect(columnar=True) "
+        "for a result of the given size"
+    )
+    parser.add_argument("nrows", type=int, help="number of rows of the result.")
+    parser.add_argument(
+        "-c", "--ncols", type=int, default=3, help="number of columns of the result."
+    )
+    args = parser.parse_args()
+
+    result_set, result_meta = generate_result_set(args.nrows, args.ncols)
+    print("Parameters: ", args)
+    # the values are shared with result_set, so only the memory used by the rows and
+    # columns themselves is measured
+    measure("List[Row]", result_set_to_rows, result_set, result_meta)
+    measure("RowSet", result_set_to_row_set, result_set, result_meta)
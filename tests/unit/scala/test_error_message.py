@@ -4,6 +4,7 @@
 
 from snowflake.snowpark._internal.error_message import SnowparkClientExceptionMessages
 from snowflake.snowpark.exceptions import (
+    SnowparkAsyncJobGroupException,
     SnowparkColumnException,
     SnowparkCreateDynamicTableException,
     SnowparkCreateViewException,
@@ -400,6 +401,25 @@ def test_server_failed_fetch_pandas():
     assert ex.message == f"Failed to fetch a pandas Dataframe. The error is: {message}"
 
 
+def test_server_failed_fetch_arrow():
+    message = "unknown"
+    ex = SnowparkClientExceptionMessages.SERVER_FAILED_FETCH_ARROW(message)
+    assert isinstance(ex, SnowparkFetchDataException)
+    assert ex.error_code == "1412"
+    assert ex.message == f"Failed to fetch a pyarrow Table. The error is: {message}"
+
+
+def test_server_async_job_group_failed():
+    errors = {3: ValueError("bad"), 1: KeyError("missing")}
+    ex = SnowparkClientExceptionMessages.SERVER_ASYNC_JOB_GROUP_FAILED(errors, 5)
+    assert isinstance(ex, SnowparkAsyncJobGroupException)
+    assert ex.error_code == "1413"
+    assert ex.errors == errors
+    assert (
+        ex.message == "2 of 5 jobs failed. The error of job 1 is: KeyError('missing')"
+    )
+
+
 def test_server_udf_upload_file_stream_closed():
     dest_filename = "file"
     ex = SnowparkClientExceptionMessages.SERVER_UDF_UPLOAD_FILE_STREAM_CLOSED(
@@ -5,10 +5,12 @@
 
 import logging
 import os
+import threading
 import zipfile
 
 import pytest
 
+from snowflake.connector.cursor import ResultMetadata
 from snowflake.snowpark._internal.utils import (
     SCOPED_TEMPORARY_STRING,
     TEMPORARY_STRING,
@@ -22,8 +24,10 @@ from snowflake.snowpark._internal.utils import (
     is_snowflake_unquoted_suffix_case_insensitive,
     is_sql_select_statement,
     normalize_path,
+    prefetch_iterator,
     private_preview,
     result_set_to_iter,
+    result_set_to_row_set,
     result_set_to_rows,
     unwrap_stage_location_single_quote,
     validate_object_name,
@@ -571,10 +575,71 @@ def test_private_preview_decorator(caplog):
         warning_dict.clear()
 
 
-@pytest.mark.parametrize("function", [result_set_to_iter, result_set_to_rows])
+@pytest.mark.parametrize(
+    "function", [result_set_to_iter, result_set_to_rows, result_set_to_row_set]
+)
 def test_result_set_none(function):
     data = [[1], None, []]
     with pytest.raises(
         ValueError, match="Result returned from Python connector is None"
     ):
         list(function(data))
+
+
+@pytest.mark.parametrize("max_prefetched", [0, 1, 3])
+def test_prefetch_iterator(max_prefetched):
+    fetched = []
+
+    def items():
+        for i in range(10):
+            fetched.append(i)
+            yield i
+
+    iterator = prefetch_iterator(items(), max_prefetched)
+    assert next(iterator) == 0
+    assert list(iterator) == list(range(1, 10))
+    assert fetched == list(range(10))
+
+    def failing_items():
+        yield 1
+        raise ValueError("fetch failed")
+
+    iterator = prefetch_iterator(failing_items(), max_prefetched)
+    assert next(iterator) == 1
+    with pytest.raises(ValueError, match="fetch failed"):
+        next(iterator)
+
+
+def test_prefetch_iterator_bounded():
+    fetched = threading.Semaphore(0)
+
+    def items():
+        for i in range(100):
+            yield i
+            fetched.release()
+
+    iterator = prefetch_iterator(items(), 2)
+    assert next(iterator) == 0
+    # the background thread stops fetching when 2 items are waiting to be consumed
+    num_fetched = 0
+    while fetched.acquire(timeout=0.5):
+        num_fetched += 1
+    assert num_fetched <= 3
+    iterator.close()
+
+
+@pytest.mark.parametrize("case_sensitive", [True, False])
+def test_result_set_to_row_set(case_sensitive):
+    result_meta = [
+        ResultMetadata("A", 0, None, None, 10, 0, True),
+        ResultMetadata("B", 2, None, None, None, None, True),
+    ]
+    result_set = [(i, str(i)) for i in range(25)]
+    row_set = result_set_to_row_set(
+        result_set, result_meta, case_sensitive=case_sensitive
+    )
+    rows = result_set_to_rows(result_set, result_meta, case_sensitive=case_sensitive)
+    assert row_set == rows
+    assert [row.as_dict() for row in row_set] == [row.as_dict() for row in rows]
+    assert row_set.column("A") == list(range(25))
+    assert len(result_set_to_row_set([], result_meta)) == 0
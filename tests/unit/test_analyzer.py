@@ -0,0 +1,40 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+from unittest import mock
+
+import snowflake.snowpark.session
+from snowflake.snowpark._internal.analyzer.binary_plan_node import Union
+from snowflake.snowpark._internal.analyzer.snowflake_plan_node import (
+    UnresolvedRelation,
+)
+from snowflake.snowpark._internal.server_connection import ServerConnection
+
+
+def test_resolve_shared_subplans_once():
+    mock_connection = mock.create_autospec(ServerConnection)
+    mock_connection._conn = mock.MagicMock()
+    session = snowflake.snowpark.session.Session(mock_connection)
+    analyzer = session._analyzer
+
+    depth = 10
+    plan = UnresolvedRelation("T")
+    for _ in range(depth):
+        # both children are the same node, so the plan is a DAG with
+        # 2 ** depth paths from the root to the leaf
+        plan = Union(plan, plan, is_all=True)
+
+    stats_before = session.plan_resolution_stats
+    resolved = analyzer.resolve(plan)
+    stats_after = session.plan_resolution_stats
+
+    assert resolved.queries[-1].sql.count("FROM (T)") == 2**depth
+    assert stats_after["resolved"] - stats_before["resolved"] == depth + 1
+    assert stats_after["reused"] - stats_before["reused"] == depth
+    # the memo only lives for a single call of resolve()
+    assert analyzer._resolved_plans is None
+    analyzer.resolve(plan)
+    assert session.plan_resolution_stats["resolved"] == stats_after["resolved"] + (
+        depth + 1
+    )
@@ -0,0 +1,300 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from snowflake.snowpark import Session
+from snowflake.snowpark._internal.server_connection import ServerConnection
+from snowflake.snowpark.async_job import (
+    AsyncJob,
+    AsyncJobGroup,
+    _AsyncResultType,
+    _call_when_done,
+)
+from snowflake.snowpark.exceptions import (
+    SnowparkAsyncJobGroupException,
+    SnowparkSQLException,
+)
+
+
+@pytest.fixture
+def fake_session():
+    fake_connection = mock.create_autospec(ServerConnection)
+    fake_connection._conn = mock.Mock()
+    fake_connection._telemetry_client = mock.Mock()
+    fake_connection._with_new_cursor.return_value.__enter__.return_value = (
+        fake_connection
+    )
+    return Session(fake_connection)
+
+
+def test_async_job_group(fake_session):
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def execute(plan, block, data_type, _statement_params):
+        assert not block
+        # the plan is executed with a copy of the session
+        assert plan.session is not fake_session
+        assert plan.session._analyzer.session is plan.session
+        assert plan.session._plan_builder.session is plan.session
+        query = plan.queries[-1].sql
+
+        def result():
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            if "bad_table" in query.lower():
+                raise SnowparkSQLException("failed")
+            return None if data_type == _AsyncResultType.NO_RESULT else [query]
+
+        return mock.Mock(query_id="id", result=result)
+
+    fake_session._conn.execute.side_effect = execute
+    df = fake_session.sql("select 1 as a")
+    with fake_session.create_async_job_group(max_in_flight=3) as group:
+        futures = [
+            group.save_as_table(df, f"table{i}", mode="overwrite") for i in range(10)
+        ]
+        futures.append(
+            group.copy_into_location(df, "@stage/prefix", file_format_type="parquet")
+        )
+    assert group.is_done()
+    assert group.futures == futures
+    assert max_running <= 3
+    results = group.result()
+    assert results[:10] == [None] * 10
+    assert "COPY  INTO '@stage/prefix'" in results[10][0]
+    assert group.progress == {
+        "total": 11,
+        "pending": 0,
+        "running": 0,
+        "succeeded": 11,
+        "failed": 0,
+        "cancelled": 0,
+    }
+
+    # the errors of all failed writes are raised together
+    group = AsyncJobGroup(fake_session, max_in_flight=2)
+    for name in ["table1", "bad_table", "table2", "bad_table"]:
+        group.save_as_table(df, name)
+    assert group.wait(timeout=10)
+    with pytest.raises(SnowparkAsyncJobGroupException) as exc_info:
+        group.result()
+    assert exc_info.value.error_code == "1413"
+    assert sorted(exc_info.value.errors) == [1, 3]
+    assert "2 of 4 jobs failed" in exc_info.value.message
+    assert group.progress["failed"] == 2
+
+    with pytest.raises(ValueError, match="max_in_flight must be a positive integer"):
+        fake_session.create_async_job_group(max_in_flight=0)
+
+
+def test_async_job_group_cancel(fake_session):
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    def execute(plan, block, data_type, _statement_params):
+        def result():
+            started.set()
+            assert cancelled.wait(timeout=10)
+            raise SnowparkSQLException("cancelled")
+
+        return mock.Mock(query_id="running_id", result=result)
+
+    fake_session._conn.execute.side_effect = execute
+    df = fake_session.sql("select 1 as a")
+    group = fake_session.create_async_job_group(max_in_flight=1)
+    for i in range(3):
+        group.save_as_table(df, f"table{i}")
+    assert started.wait(timeout=10)
+
+    with mock.patch("snowflake.snowpark.async_job.AsyncJob") as mock_async_job:
+        mock_async_job.return_value.cancel.side_effect = cancelled.set
+        group.cancel()
+    # the running query is cancelled, and the pending writes are never submitted
+    mock_async_job.assert_called_once_with("running_id", None, fake_session)
+    with pytest.raises(SnowparkAsyncJobGroupException) as exc_info:
+        group.result()
+    assert sorted(exc_info.value.errors) == [0, 1, 2]
+    assert group.progress["cancelled"] == 2
+    assert fake_session._conn.execute.call_count == 1
+    with pytest.raises(RuntimeError, match="cancelled AsyncJobGroup"):
+        group.save_as_table(df, "table3")
+
+
+def create_jobs(num_checks_until_done):
+    """Creates jobs whose queries finish after the given numbers of status checks."""
+    session = mock.Mock()
+    session._conn._conn._done_async_sfqids = {"done_id": None}
+    num_checks = {}
+
+    def get_query_status(query_id):
+        num_checks[query_id] = num_checks.get(query_id, 0) + 1
+        return num_checks[query_id] >= num_checks_until_done[query_id]
+
+    session._conn._conn.get_query_status.side_effect = get_query_status
+    session._conn._conn.is_still_running.side_effect = lambda is_done: not is_done
+    jobs = [AsyncJob(query_id, None, session) for query_id in num_checks_until_done]
+    return jobs, num_checks
+
+
+@mock.patch("snowflake.snowpark.async_job._POLL_INITIAL_INTERVAL_SECONDS", 0.001)
+def test_as_completed():
+    jobs, num_checks = create_jobs({"a": 3, "b": 1, "c": 2, "done_id": 10})
+    with mock.patch("time.sleep") as mock_sleep:
+        completed = list(AsyncJob.as_completed(jobs + [jobs[0]]))
+    assert [job.query_id for job in completed] == ["b", "done_id", "c", "a"]
+    # the finished queries known by the connector are not checked
+    assert num_checks == {"a": 3, "b": 1, "c": 2}
+    assert mock_sleep.call_count == 2
+    # done jobs are not checked again
+    assert all(job.is_done() for job in jobs)
+    assert num_checks == {"a": 3, "b": 1, "c": 2}
+
+
+@mock.patch("snowflake.snowpark.async_job._POLL_INITIAL_INTERVAL_SECONDS", 0.001)
+@mock.patch("snowflake.snowpark.async_job._POLL_MAX_INTERVAL_SECONDS", 0.004)
+def test_wait_all_backoff_and_timeout():
+    jobs, num_checks = create_jobs({"a": 6, "b": 1})
+    with mock.patch("time.sleep") as mock_sleep:
+        assert AsyncJob.wait_all(jobs)
+    # the interval is reset after the round in which a query finished, and is capped
+    assert [c[0][0] for c in mock_sleep.call_args_list] == [
+        0.001,
+        0.002,
+        0.004,
+        0.004,
+        0.004,
+    ]
+
+    jobs, _ = create_jobs({"a": 1000})
+    assert not AsyncJob.wait_all(jobs, timeout=0.01)
+    with pytest.raises(TimeoutError, match="1 queries haven't finished"):
+        list(AsyncJob.as_completed(jobs, timeout=0))
+
+
+@mock.patch("snowflake.snowpark.async_job._POLL_INITIAL_INTERVAL_SECONDS", 0.001)
+def test_await_async_job():
+    jobs, num_checks = create_jobs({"a": 3, "b": 1})
+    for job in jobs:
+        job.result = mock.Mock(return_value=job.query_id)
+
+    async def main():
+        return await asyncio.gather(*jobs)
+
+    assert asyncio.run(main()) == ["a", "b"]
+    assert num_checks == {"a": 3, "b": 1}
+
+
+@mock.patch("snowflake.snowpark.async_job._POLL_INITIAL_INTERVAL_SECONDS", 0.001)
+def test_collect_async(fake_session):
+    num_checks = {}
+
+    def get_query_status(query_id):
+        num_checks[query_id] = num_checks.get(query_id, 0) + 1
+        return num_checks[query_id] >= 3
+
+    fake_session._conn._conn._done_async_sfqids = {}
+    fake_session._conn._conn.get_query_status.side_effect = get_query_status
+    fake_session._conn._conn.is_still_running.side_effect = lambda is_done: not is_done
+
+    def execute(plan, block, data_type, _statement_params, **kwargs):
+        assert not block and data_type == _AsyncResultType.ROW
+        # the plan is executed with a copy of the session
+        assert plan.session is not fake_session
+        query = plan.queries[-1].sql
+        job = AsyncJob(query, None, plan.session)
+        job.result = mock.Mock(return_value=[query])
+        return job
+
+    fake_session._conn.execute.side_effect = execute
+    dfs = [fake_session.sql(f"select {i} as a") for i in range(100)]
+    threads = set()
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=4)
+        loop.set_default_executor(executor)
+        original_submit = executor.submit
+
+        def submit(fn, *args, **kwargs):
+            def run():
+                threads.add(threading.get_ident())
+                return fn(*args, **kwargs)
+
+            return original_submit(run)
+
+        executor.submit = submit
+        return await asyncio.gather(*[df.collect_async() for df in dfs])
+
+    results = asyncio.run(main())
+    assert [result[0] for result in results] == [f"select {i} as a" for i in range(100)]
+    # all queries run concurrently with the threads of the default executor
+    assert len(threads) <= 4
+    assert all(n == 3 for n in num_checks.values())
+    # the cursors are closed after the results are fetched
+    assert fake_session._conn._with_new_cursor.return_value.__exit__.call_count == 100
+    # the telemetry of each coroutine only records the query of its own job
+    telemetry_calls = (
+        fake_session._conn._telemetry_client.send_function_usage_telemetry.call_args_list
+    )
+    assert sorted(c.kwargs["sfqids"] for c in telemetry_calls) == sorted(
+        [f"select {i} as a"] for i in range(100)
+    )
+
+
+def test_collect_async_cancel(fake_session):
+    fake_session._conn._conn._done_async_sfqids = {}
+    fake_session._conn._conn.is_still_running.return_value = True
+    job = AsyncJob("running_id", None, fake_session)
+    fake_session._conn.execute.return_value = job
+    df = fake_session.sql("select 1 as a")
+
+    async def main():
+        task = asyncio.create_task(df.collect_async())
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with mock.patch.object(job, "cancel") as mock_cancel:
+        asyncio.run(main())
+    mock_cancel.assert_called_once()
+
+
+def test_call_when_done(fake_session):
+    callback = mock.Mock()
+    _call_when_done([], callback)
+    assert callback.call_count == 1
+    job = AsyncJob("query_id", None, fake_session, _AsyncResultType.NO_RESULT)
+    _call_when_done(job, callback)
+    assert callback.call_count == 1
+    job.result()
+    assert callback.call_count == 2
+
+
+def test_async_write_invalidates_result_cache_when_done(fake_session):
+    fake_session._conn.execute.side_effect = (
+        lambda plan, block, data_type, **kwargs: AsyncJob(
+            "query_id", None, fake_session, _AsyncResultType.NO_RESULT
+        )
+    )
+    fake_session.enable_result_cache()
+    job = fake_session.table("t").update({"a": 1}, block=False)
+    with mock.patch.object(fake_session._result_cache, "invalidate") as invalidate:
+        # the result of a query run during the update is removed when the update is done
+        job.result()
+    invalidate.assert_called_once_with("t")
@@ -3,11 +3,13 @@
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
 
+from threading import RLock
 from unittest import mock
 
 import pytest
 
 import snowflake.snowpark.session
+from snowflake.connector.cursor import ResultMetadata
 from snowflake.snowpark import (
     DataFrame,
     DataFrameNaFunctions,
@@ -20,8 +22,15 @@ from snowflake.snowpark._internal.analyzer.snowflake_plan import SnowflakePlanBu
 from snowflake.snowpark._internal.server_connection import ServerConnection
 from snowflake.snowpark.dataframe import _get_unaliased
 from snowflake.snowpark.exceptions import SnowparkCreateDynamicTableException
+from snowflake.snowpark.functions import col
 from snowflake.snowpark.session import Session
-from snowflake.snowpark.types import IntegerType, StringType
+from snowflake.snowpark.types import (
+    IntegerType,
+    LongType,
+    StringType,
+    StructField,
+    StructType,
+)
 
 
 def test_get_unaliased():
@@ -108,6 +117,8 @@ def test_copy_into_format_name_syntax(format_type, sql_simplifier_enabled):
     fake_session = mock.create_autospec(snowflake.snowpark.session.Session)
     fake_session.sql_simplifier_enabled = sql_simplifier_enabled
     fake_session._cte_optimization_enabled = False
+    fake_session._infer_schema_cache = {}
+    fake_session._infer_schema_lock = RLock()
     fake_session._conn = mock.create_autospec(ServerConnection)
     fake_session._plan_builder = SnowflakePlanBuilder(fake_session)
     fake_session._analyzer = Analyzer(fake_session)
@@ -303,3 +314,44 @@ def test_session():
 
     assert df.session == fake_session
     assert df.session._session_id == fake_session._session_id
+
+
+def test_infer_attributes_of_simplified_query(mock_server_connection):
+    mock_server_connection._cursor._describe_internal.return_value = [
+        ResultMetadata("A", 0, None, None, 10, 0, True),
+        ResultMetadata("B", 2, None, 100, None, None, False),
+    ]
+    session = Session(mock_server_connection)
+    df = session.table("t")
+    assert df.schema == StructType(
+        [
+            StructField("A", LongType(), nullable=True),
+            StructField("B", StringType(100), nullable=False),
+        ]
+    )
+    assert session.schema_query_stats == {
+        "describe_queries": 1,
+        "cache_hits": 0,
+        "inferred": 0,
+    }
+
+    # projections, renames, filters and sorts of columns are inferred from the known schema
+    df2 = (
+        df.filter(col("a") > 1)
+        .select(col("b"), col("a").alias("x"))
+        .sort("b")
+        .with_column_renamed("b", "y")
+        .limit(5)
+    )
+    assert df2.schema == StructType(
+        [
+            StructField("Y", StringType(100), nullable=False),
+            StructField("X", LongType(), nullable=True),
+        ]
+    )
+    assert session.schema_query_stats["describe_queries"] == 1
+    assert session.schema_query_stats["inferred"] == 1
+
+    # the type of a new column is decided by Snowflake
+    df.with_column("c", col("a") + 1).schema
+    assert session.schema_query_stats["describe_queries"] == 2
@@ -0,0 +1,126 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+from unittest import mock
+
+import pytest
+
+from snowflake.snowpark import Session
+from snowflake.snowpark._internal.server_connection import ServerConnection
+from snowflake.snowpark.async_job import AsyncJob, _AsyncResultType
+from snowflake.snowpark.exceptions import SnowparkSQLException
+from snowflake.snowpark.types import LongType, StringType, StructField, StructType
+
+
+@pytest.fixture
+def fake_session():
+    fake_connection = mock.create_autospec(ServerConnection)
+    fake_connection._conn = mock.Mock(account="account", database="db", schema="sc")
+    fake_connection._get_current_parameter.return_value = '"DB"'
+    fake_connection._telemetry_client = mock.Mock()
+    fake_connection._with_new_cursor.return_value.__enter__.return_value = (
+        fake_connection
+    )
+
+    def run_query(query, **kwargs):
+        if "INFER_SCHEMA" in query:
+            if "missing" in query:
+                raise SnowparkSQLException("does not exist")
+            return {
+                "data": [
+                    ("id", "NUMBER(38, 0)", True, "$1::NUMBER(38, 0)", "f.csv"),
+                    ("name", "TEXT", True, "$2::TEXT", "f.csv"),
+                ]
+            }
+        return {"data": []}
+
+    fake_connection.run_query.side_effect = run_query
+    return Session(fake_connection)
+
+
+def get_queries(session, keyword):
+    return [
+        call[0][0]
+        for call in session._conn.run_query.call_args_list
+        if keyword in call[0][0]
+    ]
+
+
+def test_infer_schema_cache_and_file_format_reuse(fake_session):
+    expected_schema = StructType(
+        [StructField('"id"', LongType()), StructField('"name"', StringType())]
+    )
+    for _ in range(2):
+        df = fake_session.read.option("infer_schema", True).csv("@stage/a.csv")
+        assert df._reader._user_schema == expected_schema
+    fake_session.read.option("infer_schema", True).csv("@stage/b.csv")
+    # the schema of a path is only inferred once, and one file format is created and never dropped
+    assert len(get_queries(fake_session, "INFER_SCHEMA")) == 2
+    assert len(get_queries(fake_session, "FILE  FORMAT")) == 1
+
+    # different options create another file format and infer the schema again
+    fake_session.read.options({"infer_schema": True, "skip_blank_lines": True}).csv(
+        "@stage/a.csv"
+    )
+    assert len(get_queries(fake_session, "INFER_SCHEMA")) == 3
+    assert len(get_queries(fake_session, "FILE  FORMAT")) == 2
+
+    fake_session.read.clear_infer_schema_cache("@stage/a")
+    fake_session.read.option("infer_schema", True).csv("@stage/a.csv")
+    fake_session.read.option("infer_schema", True).csv("@stage/b.csv")
+    assert len(get_queries(fake_session, "INFER_SCHEMA")) == 4
+
+    # uploading files clears the cache
+    with mock.patch(
+        "snowflake.snowpark.dataframe.DataFrame._internal_collect_with_tag",
+        return_value=[],
+    ):
+        fake_session.file.put("c.csv", "@stage")
+    fake_session.read.option("infer_schema", True).csv("@stage/b.csv")
+    assert len(get_queries(fake_session, "INFER_SCHEMA")) == 5
+    assert len(get_queries(fake_session, "FILE  FORMAT")) == 2
+
+    # a schema inferred while files are unloaded is discarded when the unload finishes
+    job = AsyncJob("query_id", None, fake_session, _AsyncResultType.NO_RESULT)
+    with mock.patch(
+        "snowflake.snowpark.dataframe.DataFrame._internal_collect_with_tag",
+        return_value=job,
+    ):
+        fake_session.create_dataframe([[1]]).write.copy_into_location(
+            "@stage", block=False
+        )
+    fake_session.read.option("infer_schema", True).csv("@stage/b.csv")
+    assert len(get_queries(fake_session, "INFER_SCHEMA")) == 6
+    job.result()
+    fake_session.read.option("infer_schema", True).csv("@stage/b.csv")
+    assert len(get_queries(fake_session, "INFER_SCHEMA")) == 7
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_infer_schemas(fake_session, max_workers):
+    reader = fake_session.read.option("infer_schema", True)
+    paths = [f"@stage/{i}.csv" for i in range(10)]
+    schemas = reader.infer_schemas(paths, "csv", max_workers=max_workers)
+    assert list(schemas) == paths
+    assert all(schema.names == ['"id"', '"name"'] for schema in schemas.values())
+    assert len(get_queries(fake_session, "INFER_SCHEMA")) == 10
+    assert len(get_queries(fake_session, "FILE  FORMAT")) == 1
+
+    # the inferred schemas are reused when the files are read
+    reader.csv("@stage/3.csv")
+    assert len(get_queries(fake_session, "INFER_SCHEMA")) == 10
+
+    with pytest.raises(SnowparkSQLException, match="does not exist"):
+        reader.infer_schemas(
+            ["@stage/new.csv", "@stage/missing.csv"], "csv", max_workers=max_workers
+        )
+    assert len(get_queries(fake_session, "INFER_SCHEMA")) == 12
+    # the schemas inferred before the failure are cached
+    reader.infer_schemas(["@stage/new.csv"], "csv")
+    assert len(get_queries(fake_session, "INFER_SCHEMA")) == 12
+
+    with pytest.raises(ValueError, match="format must be one of"):
+        reader.infer_schemas(paths, "xml")
+    with pytest.raises(ValueError, match="max_workers must be a positive integer"):
+        reader.infer_schemas(paths, "csv", max_workers=0)
@@ -0,0 +1,93 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import os
+from unittest import mock
+
+from snowflake.snowpark._internal import import_cache
+from snowflake.snowpark._internal.import_cache import ImportCache, get_fingerprint
+from snowflake.snowpark._internal.utils import calculate_checksum
+
+
+def test_get_fingerprint(tmp_path):
+    (tmp_path / "a.py").write_text("a = 1")
+    fingerprint = get_fingerprint(str(tmp_path))
+    assert get_fingerprint(str(tmp_path)) == fingerprint
+
+    # __pycache__ is ignored
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "a.pyc").write_text("")
+    assert get_fingerprint(str(tmp_path)) == fingerprint
+
+    (tmp_path / "b.py").write_text("b = 1")
+    assert get_fingerprint(str(tmp_path)) != fingerprint
+    file_fingerprint = get_fingerprint(str(tmp_path / "a.py"))
+    (tmp_path / "a.py").write_text("a = 10")
+    assert get_fingerprint(str(tmp_path / "a.py")) != file_fingerprint
+
+
+def test_get_checksum(tmp_path):
+    (tmp_path / "a.py").write_text("a = 1")
+    path = str(tmp_path)
+    cache = ImportCache()
+    with mock.patch.object(
+        import_cache, "calculate_checksum", wraps=calculate_checksum
+    ) as mock_calculate_checksum:
+        checksum = cache.get_checksum(path, leading_path="lead")
+        assert checksum == calculate_checksum(path, additional_info="lead")
+        assert cache.get_checksum(path, leading_path="lead") == checksum
+        assert mock_calculate_checksum.call_count == 1
+
+        # a different leading path or a modified file is computed again
+        cache.get_checksum(path)
+        assert mock_calculate_checksum.call_count == 2
+        (tmp_path / "a.py").write_text("a = 10")
+        assert cache.get_checksum(path, leading_path="lead") != checksum
+        assert mock_calculate_checksum.call_count == 3
+
+
+def test_stage_files_and_persistence(tmp_path):
+    path = str(tmp_path / "cache" / "imports.json")
+    (tmp_path / "a.py").write_text("a = 1")
+    cache = ImportCache(path)
+    assert os.path.exists(path)
+    checksum = cache.get_checksum(str(tmp_path / "a.py"))
+    cache.add_stage_file("@stage/abc/a.py.zip", ("account", "db", "schema"))
+    assert cache.contains_stage_file("@stage/abc/a.py.zip", ("account", "db", "schema"))
+    assert not cache.contains_stage_file(
+        "@stage/abc/a.py.zip", ("account", "db", "other_schema")
+    )
+
+    other_cache = ImportCache(path)
+    assert other_cache.contains_stage_file(
+        "@stage/abc/a.py.zip", ("account", "db", "schema")
+    )
+    with mock.patch.object(
+        import_cache, "calculate_checksum"
+    ) as mock_calculate_checksum:
+        assert other_cache.get_checksum(str(tmp_path / "a.py")) == checksum
+        mock_calculate_checksum.assert_not_called()
+
+    other_cache.clear()
+    assert not ImportCache(path).contains_stage_file(
+        "@stage/abc/a.py.zip", ("account", "db", "schema")
+    )
+
+    # a corrupted file is ignored
+    with open(path, "w") as f:
+        f.write("{")
+    assert not ImportCache(path).contains_stage_file("@stage/abc/a.py.zip")
+
+
+def test_uploaded_code(tmp_path):
+    path = str(tmp_path / "imports.json")
+    cache = ImportCache(path)
+    cache.add_uploaded_code("checksum", "@stage", "'@stage/a/udf_py_1.zip'", "udf_py_1")
+    assert ImportCache(path).get_uploaded_code("checksum", "@stage") == (
+        "'@stage/a/udf_py_1.zip'",
+        "udf_py_1",
+    )
+    assert cache.get_uploaded_code("checksum", "@other_stage") is None
+    cache.remove_uploaded_code("'@stage/a/udf_py_1.zip'")
+    assert ImportCache(path).get_uploaded_code("checksum", "@stage") is None
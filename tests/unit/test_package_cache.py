@@ -0,0 +1,67 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+from snowflake.snowpark._internal import package_cache
+from snowflake.snowpark._internal.package_cache import (
+    CachedEnvironment,
+    PackageCache,
+    get_environment_key,
+)
+
+
+def test_package_versions(tmp_path):
+    cache = PackageCache(str(tmp_path))
+    cache.put_package_versions("account|table", {"numpy": ["1.26.0"], "foo": None})
+    # another cache in the same directory shares the cached versions
+    other_cache = PackageCache(str(tmp_path))
+    assert other_cache.get_package_versions(
+        "account|table", ["numpy", "foo", "bar"]
+    ) == {
+        "numpy": ["1.26.0"],
+        "foo": None,
+    }
+    assert other_cache.get_package_versions("other|table", ["numpy"]) == {}
+
+    with mock.patch.object(package_cache.time, "time", return_value=1e12):
+        assert cache.get_package_versions("account|table", ["numpy"]) == {}
+
+    cache.clear()
+    assert cache.get_package_versions("account|table", ["numpy"]) == {}
+
+    with pytest.raises(ValueError, match="ttl_seconds must be a non-negative integer"):
+        PackageCache(str(tmp_path), -1)
+
+
+def test_environment(tmp_path):
+    cache = PackageCache(str(tmp_path / "cache"))
+    zip_path = str(tmp_path / "packages.zip")
+    with open(zip_path, "wb") as f:
+        f.write(b"zip content")
+    assert cache.get_environment("signature", str(tmp_path / "out.zip")) is None
+
+    environment = CachedEnvironment(["numpy==1.26.0"], False)
+    cache.put_environment("signature", zip_path, environment)
+    out_path = str(tmp_path / "out.zip")
+    assert cache.get_environment("signature", out_path) == environment
+    with open(out_path, "rb") as f:
+        assert f.read() == b"zip content"
+    assert cache.get_environment("other_signature", out_path) is None
+
+    with mock.patch.object(package_cache.time, "time", return_value=1e12):
+        assert cache.get_environment("signature", out_path) is None
+
+    # the environment depends on the Python version
+    key = get_environment_key("signature")
+    with mock.patch.object(sys, "version_info", (2, 7, 0)):
+        assert get_environment_key("signature") != key
+
+    cache.clear()
+    assert cache.get_environment("signature", out_path) is None
+    assert os.path.isdir(str(tmp_path / "cache"))
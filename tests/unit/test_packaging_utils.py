@@ -4,6 +4,7 @@
 
 import os
 import zipfile
+from pathlib import Path
 from subprocess import TimeoutExpired
 from unittest.mock import patch
 
@@ -20,6 +21,8 @@ from snowflake.snowpark._internal.packaging_utils import (
     identify_supported_packages,
     map_python_packages_to_files_and_folders,
     pip_install_packages_to_target_folder,
+    _build_zip_fragment,
+    get_package_files,
     zip_directory_contents,
 )
 from tests.utils import IS_IN_STORED_PROC
@@ -211,6 +214,128 @@ def test_zip_directory_contents(temp_directory):
         assert f.read() == "zero_content"
 
 
+def create_fake_package(target: str, name: str, content: str) -> None:
+    os.makedirs(os.path.join(target, name))
+    with open(os.path.join(target, name, "__init__.py"), "w") as f:
+        f.write(content)
+    dist_info = os.path.join(target, f"{name}-1.0.dist-info")
+    os.makedirs(dist_info)
+    with open(os.path.join(dist_info, "METADATA"), "w") as f:
+        f.write(f"Name: {name}\nVersion: 1.0\n")
+    with open(os.path.join(dist_info, "RECORD"), "w") as f:
+        f.write(
+            f"{name}/__init__.py,sha256=abc,{len(content)}\n"
+            f"{name}-1.0.dist-info/METADATA,,\n"
+            f"{name}-1.0.dist-info/RECORD,,\n"
+            f"../../bin/{name},,\n"
+        )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_zip_directory_contents_with_fragments(temp_directory, max_workers):
+    target = os.path.join(temp_directory, "target")
+    create_fake_package(target, "package1", "x = 1")
+    create_fake_package(target, "package2", "y = 2")
+    with open(os.path.join(target, "other.py"), "w") as f:
+        f.write("z = 3")
+
+    package_files, remaining_files = get_package_files(Path(target))
+    assert [files for _, files in package_files] == [
+        [
+            "package1/__init__.py",
+            "package1-1.0.dist-info/METADATA",
+            "package1-1.0.dist-info/RECORD",
+        ],
+        [
+            "package2/__init__.py",
+            "package2-1.0.dist-info/METADATA",
+            "package2-1.0.dist-info/RECORD",
+        ],
+    ]
+    assert remaining_files == ["other.py"]
+
+    fragment_directory = os.path.join(temp_directory, "fragments")
+    os.makedirs(fragment_directory)
+    expected = {
+        "package1/__init__.py": b"x = 1",
+        "package2/__init__.py": b"y = 2",
+        "other.py": b"z = 3",
+    }
+    for _ in range(2):
+        zip_path = os.path.join(temp_directory, "env.zip")
+        zip_directory_contents(target, zip_path, fragment_directory, max_workers)
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.testzip() is None
+            # 7 files and 4 directories
+            assert len(zipf.namelist()) == 11
+            for name, content in expected.items():
+                assert zipf.read(name) == content
+        fragments = os.listdir(fragment_directory)
+        assert len(fragments) == 2
+        # the cached fragments are reused, and the files in them are not zipped again
+        with patch(
+            "snowflake.snowpark._internal.packaging_utils._build_zip_fragment",
+            wraps=_build_zip_fragment,
+        ) as mock_build:
+            zip_directory_contents(target, zip_path, fragment_directory, 1)
+        assert mock_build.call_count == 1
+        assert mock_build.call_args[0][1] == ["other.py"]
+
+    # a package with different content gets a new fragment
+    with open(os.path.join(target, "package2", "__init__.py"), "w") as f:
+        f.write("y = 22")
+    zip_directory_contents(target, zip_path, fragment_directory, max_workers)
+    with zipfile.ZipFile(zip_path) as zipf:
+        assert zipf.read("package2/__init__.py") == b"y = 22"
+    assert len(os.listdir(fragment_directory)) == 3
+
+
+@pytest.mark.parametrize("zip64_limit", [zipfile.ZIP64_LIMIT, 10])
+def test_zip_directory_contents_round_trip(temp_directory, zip64_limit):
+    target = os.path.join(temp_directory, "target")
+    create_fake_package(target, "package1", "x = 1")
+    os.makedirs(os.path.join(target, "package1", "sub", "data"))
+    with open(os.path.join(target, "package1", "sub", "__init__.py"), "w") as f:
+        f.write("y = 2" * 100)
+    with open(os.path.join(target, "package1", "sub", "data", "blob.bin"), "wb") as f:
+        f.write(os.urandom(1000))
+    with open(os.path.join(target, "package1-1.0.dist-info", "RECORD"), "a") as f:
+        f.write("package1/sub/__init__.py,,\npackage1/sub/data/blob.bin,,\n")
+    os.makedirs(os.path.join(target, "empty"))
+
+    def zip_without_fragments(output_path):
+        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            for file in Path(target).rglob("*"):
+                zipf.write(file, file.relative_to(target))
+
+    # a small zip64 limit makes every member need zip64 records, like members of a zip file larger than 4 GiB
+    with patch.object(zipfile, "ZIP64_LIMIT", zip64_limit):
+        zip_path = os.path.join(temp_directory, "env.zip")
+        zip_directory_contents(target, zip_path, max_workers=1)
+        expected_path = os.path.join(temp_directory, "expected.zip")
+        zip_without_fragments(expected_path)
+
+        with zipfile.ZipFile(zip_path) as zipf, zipfile.ZipFile(
+            expected_path
+        ) as expected:
+            assert zipf.testzip() is None
+            assert sorted(zipf.namelist()) == sorted(expected.namelist())
+            assert "package1/sub/data/" in zipf.namelist()
+            assert "empty/" in zipf.namelist()
+            for info in expected.infolist():
+                assert zipf.getinfo(info.filename).is_dir() == info.is_dir()
+                assert zipf.read(info.filename) == expected.read(info.filename)
+            extract_path = os.path.join(temp_directory, "extracted")
+            zipf.extractall(extract_path)
+    assert os.path.isdir(os.path.join(extract_path, "empty"))
+    with open(
+        os.path.join(extract_path, "package1", "sub", "data", "blob.bin"), "rb"
+    ) as f, open(
+        os.path.join(target, "package1", "sub", "data", "blob.bin"), "rb"
+    ) as expected_file:
+        assert f.read() == expected_file.read()
+
+
 def test_identify_supported_packages_vanilla():
     """
     Assert that the most straightforward usage of identify_supported_packages() works
@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import datetime
+import os
+from decimal import Decimal
+
+import pytest
+
+from snowflake.snowpark._internal.analyzer.snowflake_plan import (
+    BatchInsertQuery,
+    Query,
+)
+from snowflake.snowpark._internal.result_cache import ResultCache, is_cacheable_query
+
+try:
+    import pandas as pd
+
+    is_pandas_available = True
+except ImportError:
+    is_pandas_available = False
+
+
+def put(cache: ResultCache, sql: str, data) -> str:
+    key = ResultCache.get_key([Query(sql)], False, ("role", "db", "schema", "wh"))
+    cache.put(key, sql, {"data": data, "sfqid": "id"}, ["meta"])
+    return key
+
+
+def test_is_cacheable_query():
+    assert is_cacheable_query(Query("SELECT * FROM t"))
+    assert is_cacheable_query(Query(" ( select 1 )"))
+    assert is_cacheable_query(Query("with a as (select 1) select * from a"))
+    assert not is_cacheable_query(Query("insert into t values (1)"))
+    assert not is_cacheable_query(Query("CREATE TEMP TABLE t AS SELECT 1"))
+    assert not is_cacheable_query(BatchInsertQuery("select ?", [[1]]))
+
+
+def test_get_key():
+    context = ("role", "db", "schema", "wh")
+    key = ResultCache.get_key([Query("select ?", params=[1])], False, context)
+    assert key == ResultCache.get_key([Query("select ?", params=[1])], False, context)
+    assert key != ResultCache.get_key([Query("select ?", params=[2])], False, context)
+    assert key != ResultCache.get_key([Query("select ?", params=[1])], True, context)
+    assert key != ResultCache.get_key(
+        [Query("select ?", params=[1])], False, ("role", "db", "other_schema", "wh")
+    )
+
+
+def test_lru_eviction():
+    rows = [(i, str(i)) for i in range(100)]
+    cache = ResultCache()
+    key1 = put(cache, "select 1", rows)
+    entry_size = cache.size
+    cache.max_bytes = entry_size * 2
+    key2 = put(cache, "select 2", rows)
+
+    result, result_meta = cache.get(key1)
+    assert result == {"data": rows, "sfqid": "id"}
+    assert result_meta == ["meta"]
+    # the result is a copy of the cached result
+    result["data"].clear()
+    assert cache.get(key1)[0]["data"] == rows
+
+    # key2 is the least recently used result
+    key3 = put(cache, "select 3", rows)
+    assert cache.get(key2) is None
+    assert cache.get(key1) is not None
+    assert cache.get(key3) is not None
+    assert cache.get_stats() == {
+        "hits": 4,
+        "misses": 1,
+        "evictions": 1,
+        "entries": 2,
+        "spilled_entries": 0,
+        "size_bytes": entry_size * 2,
+    }
+
+    # a result larger than the cache is not kept
+    cache.max_bytes = entry_size - 1
+    assert cache.get(put(cache, "select 4", rows)) is None
+    assert cache.get_stats()["entries"] == 0
+
+    with pytest.raises(ValueError, match="max_bytes must be a non-negative integer"):
+        ResultCache(-1)
+
+
+def test_invalidate():
+    cache = ResultCache()
+    key1 = put(cache, 'SELECT * FROM ( SELECT * FROM "MY_TABLE")', [(1,)])
+    key2 = put(cache, "SELECT * FROM other_table", [(2,)])
+    key3 = put(cache, 'SELECT * FROM "db"."schema"."Mixed"', [(3,)])
+    cache.invalidate("db.schema.my_table")
+    assert cache.get(key1) is None
+    assert cache.get(key2) is not None
+    cache.invalidate(["db", "schema", '"Mixed"'])
+    assert cache.get(key3) is None
+    cache.clear()
+    assert cache.get(key2) is None
+
+
+@pytest.mark.skipif(not is_pandas_available, reason="pandas is not available")
+def test_spill_to_directory(tmp_path):
+    rows = [
+        (i, str(i), Decimal("1.25"), datetime.date(2024, 1, 1), None)
+        for i in range(100)
+    ]
+    cache = ResultCache(0, str(tmp_path))
+    key1 = put(cache, "select 1", rows)
+    assert cache.get_stats()["spilled_entries"] == 1
+    assert len(os.listdir(tmp_path)) == 1
+    assert cache.get(key1)[0]["data"] == rows
+
+    df = pd.DataFrame({"A": [1, 2], "B": ["x", None]})
+    key2 = ResultCache.get_key([Query("select 2")], True, ())
+    cache.put(key2, "select 2", {"data": df, "sfqid": "id"}, [])
+    assert cache.get(key2)[0]["data"].equals(df)
+
+    # an Arrow column can't hold timestamps with different time zones
+    tz_rows = [
+        (datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),),
+        (
+            datetime.datetime(
+                2024, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=1))
+            ),
+        ),
+    ]
+    key3 = put(cache, "select 3", tz_rows)
+    assert cache.get(key3) is None
+
+    cache.clear()
+    assert os.listdir(tmp_path) == []
@@ -8,7 +8,7 @@ from copy import copy
 
 import pytest
 
-from snowflake.snowpark import Row
+from snowflake.snowpark import Row, RowSet
 
 
 def test_row_with_only_values():
@@ -310,3 +310,39 @@ def test_case_sensitive():
         Employee = (
             Row._builder.build("'name'", "salary").set_case_sensitive(False).to_row()
         )
+
+
+def test_row_set():
+    rows = RowSet([[1, 2, 3], ["a", "b", None]], ["N", "S"])
+    assert len(rows) == 3
+    assert rows[0] == Row(N=1, S="a")
+    assert rows[-1].S is None
+    assert rows[1:] == [Row(N=2, S="b"), Row(N=3, S=None)]
+    assert rows == [Row(1, "a"), Row(2, "b"), Row(3, None)]
+    assert rows != [Row(1, "a")]
+    assert list(rows) == [Row(N=1, S="a"), Row(N=2, S="b"), Row(N=3, S=None)]
+    assert repr(rows) == "[Row(N=1, S='a'), Row(N=2, S='b'), Row(N=3, S=None)]"
+    assert Row(N=2, S="b") in rows
+    assert rows.fields == ["N", "S"]
+    assert rows.column("S") == ["a", "b", None]
+    assert rows.column(0) == [1, 2, 3]
+    # the rows share the same field names
+    assert rows[0]._fields is rows[1]._fields
+    assert pickle.loads(pickle.dumps(rows[0])) == Row(N=1, S="a")
+    with pytest.raises(IndexError):
+        _ = rows[3]
+    with pytest.raises(KeyError):
+        rows.column("X")
+
+    # case insensitive and duplicate fields
+    rows = RowSet([[1], [2]], ["a", "a"], case_sensitive=False)
+    assert rows[0].A == 1
+    assert rows[0]["a"] == 1
+    assert rows.column("A") == [1]
+    with pytest.raises(ValueError, match="duplicate fields"):
+        rows[0](a=3)
+
+    rows = RowSet([[1, 2]])
+    assert rows == [Row(1), Row(2)]
+    assert rows.fields is None
+    assert len(RowSet([])) == 0
@@ -4,13 +4,25 @@
 
 import io
 import logging
+import threading
 from unittest import mock
 
 import pytest
 
+from snowflake.connector.cursor import ResultMetadata
+from snowflake.connector.errors import NotSupportedError
 from snowflake.connector.network import ReauthenticationRequest
 from snowflake.snowpark import Session
-from snowflake.snowpark._internal.analyzer.snowflake_plan import Query, SnowflakePlan
+from snowflake.snowpark._internal.analyzer.expression import Attribute
+from snowflake.snowpark._internal.analyzer.snowflake_plan import (
+    BulkUploadQuery,
+    Query,
+    SnowflakePlan,
+    add_chain_dependencies,
+    get_query_dependencies,
+)
+from snowflake.snowpark import Row
+from snowflake.snowpark._internal.result_cache import ResultCache
 from snowflake.snowpark.exceptions import (
     SnowparkFetchDataException,
     SnowparkQueryCancelledException,
@@ -19,6 +31,7 @@ from snowflake.snowpark.exceptions import (
     SnowparkUploadFileException,
     SnowparkUploadUdfFileException,
 )
+from snowflake.snowpark.types import BooleanType, LongType, StringType
 
 
 def test_wrap_exception(mock_server_connection):
@@ -79,6 +92,32 @@ def test_upload_stream_exceptions(mock_server_connection):
             )
 
 
+def test_run_bulk_upload(mock_server_connection):
+    pytest.importorskip("pyarrow")
+    query = BulkUploadQuery(
+        "PUT 'file://f.parquet' '@stage'",
+        [Row(1, "a", True), Row(None, None, None)],
+        [
+            Attribute('"A"', LongType()),
+            Attribute('"b"', StringType()),
+            Attribute('"C"', BooleanType()),
+        ],
+        "@stage",
+        "f.parquet",
+    )
+    with mock.patch.object(mock_server_connection, "upload_stream") as upload_stream:
+        mock_server_connection.run_bulk_upload(query)
+    upload_stream.assert_called_once()
+    input_stream, stage_location, file_name = upload_stream.call_args.args
+    assert (stage_location, file_name) == ("@stage", "f.parquet")
+    assert upload_stream.call_args.kwargs == {
+        "compress_data": False,
+        "overwrite": True,
+    }
+    content = input_stream.read()
+    assert content[:4] == b"PAR1" and content[-4:] == b"PAR1"
+
+
 def test_run_query_exceptions(mock_server_connection, caplog):
     with mock.patch.object(
         mock_server_connection._cursor,
@@ -118,6 +157,7 @@ def test_get_result_set_exception(mock_server_connection):
     fake_session._last_canceled_id = 100
     fake_session._conn = mock_server_connection
     fake_session._cte_optimization_enabled = False
+    fake_session._result_cache = None
     fake_plan = SnowflakePlan(
         queries=[Query("fake query 1"), Query("fake query 2")],
         schema_query="fake schema query",
@@ -139,3 +179,165 @@ def test_get_result_set_exception(mock_server_connection):
     with mock.patch.object(mock_server_connection, "run_query", return_value=None):
         with pytest.raises(SnowparkSQLException, match="doesn't return a ResultSet"):
             mock_server_connection.get_result_set(fake_plan, block=False)
+
+
+def test_get_result_set_with_result_cache(mock_server_connection):
+    fake_session = mock.create_autospec(Session)
+    fake_session._generate_new_action_id.return_value = 1
+    fake_session._last_canceled_id = 0
+    fake_session._conn = mock_server_connection
+    fake_session._cte_optimization_enabled = False
+    fake_session._result_cache = ResultCache()
+    select_plan = SnowflakePlan(
+        queries=[Query("select * from t")],
+        schema_query="fake schema query",
+        session=fake_session,
+    )
+    insert_plan = SnowflakePlan(
+        queries=[Query("insert into t values (1)")],
+        schema_query="fake schema query",
+        session=fake_session,
+    )
+    with mock.patch.object(
+        mock_server_connection,
+        "run_query",
+        return_value={"data": [(1,)], "sfqid": "fake id"},
+    ) as run_query:
+        for _ in range(2):
+            result, _ = mock_server_connection.get_result_set(select_plan)
+            assert result["data"] == [(1,)]
+        assert run_query.call_count == 1
+        # non-blocking queries, iterators and DML are not cached
+        mock_server_connection.get_result_set(select_plan, to_iter=True)
+        mock_server_connection.get_result_set(insert_plan)
+        mock_server_connection.get_result_set(insert_plan)
+        assert run_query.call_count == 4
+
+        fake_session._result_cache.invalidate("t")
+        mock_server_connection.get_result_set(select_plan)
+        assert run_query.call_count == 5
+    assert fake_session._result_cache.get_stats()["hits"] == 1
+
+
+def test_get_result_set_with_concurrent_queries(mock_server_connection):
+    fake_session = mock.create_autospec(Session)
+    fake_session._generate_new_action_id.return_value = 1
+    fake_session._last_canceled_id = 0
+    fake_session._conn = mock_server_connection
+    fake_session._cte_optimization_enabled = False
+    fake_session._result_cache = None
+    fake_session._max_concurrent_queries = 2
+    create_a = Query("create temp table a")
+    scan_a = Query(
+        f"select * from table(result_scan('{create_a.query_id_place_holder}'))"
+    )
+    create_b = Query("create temp table b")
+    insert_b = Query("insert into b values (1)")
+    add_chain_dependencies([create_a, scan_a])
+    add_chain_dependencies([create_b, insert_b])
+    final_query = Query("select * from a join b")
+    queries = [create_a, scan_a, create_b, insert_b, create_a, final_query]
+    distinct_queries, dependencies = get_query_dependencies(queries)
+    assert distinct_queries == queries[:4] + [final_query]
+    assert dependencies == [set(), {0}, set(), {2}, {0, 1, 2, 3}]
+
+    # both tables are created at the same time
+    barrier = threading.Barrier(2, timeout=10)
+    executed_queries = []
+
+    def run_query(query, *args, **kwargs):
+        executed_queries.append(query)
+        if query.startswith("create"):
+            barrier.wait()
+        return {"data": [], "sfqid": f"id of {query}"}
+
+    plan = SnowflakePlan(queries, "fake schema query", session=fake_session)
+    with mock.patch.object(mock_server_connection, "run_query", side_effect=run_query):
+        mock_server_connection.get_result_set(plan)
+    assert sorted(executed_queries[:2]) == [create_a.sql, create_b.sql]
+    assert len(executed_queries) == 5
+    assert (
+        "select * from table(result_scan('id of create temp table a'))"
+        in executed_queries
+    )
+    assert executed_queries.index(insert_b.sql) > executed_queries.index(create_b.sql)
+    assert executed_queries[-1] == final_query.sql
+    assert mock_server_connection._conn.cursor.return_value.close.call_count == 4
+
+
+def test_to_data_or_iter_with_arrow(mock_server_connection):
+    pa = pytest.importorskip("pyarrow")
+    cursor = mock_server_connection._cursor
+    table = pa.table({"A": [1, 2, 3]})
+    cursor.fetch_arrow_all.return_value = table
+    cursor.fetch_arrow_batches.return_value = iter(
+        [pa.Table.from_batches(table.to_batches(max_chunksize=2)), table]
+    )
+    result = mock_server_connection._to_data_or_iter(cursor, to_arrow=True)
+    assert result["data"] is table
+    cursor.fetch_arrow_all.assert_called_once_with(force_return_table=True)
+    batches = mock_server_connection._to_data_or_iter(
+        cursor, to_iter=True, to_arrow=True
+    )["data"]
+    assert [batch.num_rows for batch in batches] == [2, 1, 3]
+
+    cursor.fetch_arrow_all.side_effect = NotSupportedError()
+    with pytest.raises(SnowparkFetchDataException, match="Failed to fetch a pyarrow"):
+        mock_server_connection._to_data_or_iter(cursor, to_arrow=True)
+
+
+def test_get_result_attributes_with_schema_cache(mock_server_connection):
+    mock_server_connection._cursor._describe_internal.return_value = [
+        ResultMetadata("A", 0, None, None, 10, 0, True)
+    ]
+    attributes = mock_server_connection.get_result_attributes(" SELECT  *  FROM (t)")
+    assert [(a.name, a.datatype, a.nullable) for a in attributes] == [
+        ('"A"', LongType(), True)
+    ]
+    # the same table in a simplified query
+    cached_attributes = mock_server_connection.get_result_attributes(
+        " SELECT  *  FROM t"
+    )
+    assert [a.name for a in cached_attributes] == ['"A"']
+    assert cached_attributes[0].expr_id != attributes[0].expr_id
+    assert mock_server_connection._cursor._describe_internal.call_count == 1
+    assert mock_server_connection.get_cached_result_attributes("SELECT 1") is None
+
+    # statements that may change the schema of a table clear the cache
+    mock_server_connection.run_query("select * from t")
+    mock_server_connection.get_result_attributes("SELECT * FROM t")
+    assert mock_server_connection._cursor._describe_internal.call_count == 1
+    mock_server_connection.run_query("alter table t add column b int")
+    mock_server_connection.get_result_attributes("SELECT * FROM t")
+    assert mock_server_connection._cursor._describe_internal.call_count == 2
+
+    # the cache is keyed by the current context
+    mock_server_connection._conn.schema = "other_schema"
+    mock_server_connection.get_result_attributes("SELECT * FROM t")
+    assert mock_server_connection._cursor._describe_internal.call_count == 3
+    assert mock_server_connection.describe_query_count == 3
+    assert mock_server_connection.schema_cache_hit_count == 2
+
+
+def test_session_schema_cache_opt_out(mock_server_connection):
+    mock_server_connection._cursor._describe_internal.return_value = [
+        ResultMetadata("A", 0, None, None, 10, 0, True)
+    ]
+    session = Session(mock_server_connection)
+    assert session.schema_cache_enabled
+    mock_server_connection.get_result_attributes("SELECT * FROM t")
+    # e.g., after the table is altered by another session
+    session.clear_schema_cache()
+    mock_server_connection.get_result_attributes("SELECT * FROM t")
+    assert mock_server_connection._cursor._describe_internal.call_count == 2
+
+    session.schema_cache_enabled = False
+    assert not session.schema_cache_enabled
+    for _ in range(2):
+        mock_server_connection.get_result_attributes("SELECT * FROM t")
+        assert (
+            mock_server_connection.get_cached_result_attributes("SELECT * FROM t")
+            is None
+        )
+    assert mock_server_connection._cursor._describe_internal.call_count == 4
+    assert session.schema_query_stats["cache_hits"] == 0
@@ -7,6 +7,7 @@ from typing import Optional
 from unittest import mock
 from unittest.mock import MagicMock
 
+import pkg_resources
 import pytest
 
 import snowflake.snowpark.session
@@ -19,7 +20,12 @@ try:
 except ImportError:
     is_pandas_available = False
 
-from snowflake.snowpark import Session
+from snowflake.snowpark import Row, Session
+from snowflake.snowpark._internal.analyzer.snowflake_plan import (
+    BatchInsertQuery,
+    BulkUploadQuery,
+    Query,
+)
 from snowflake.snowpark._internal.server_connection import ServerConnection
 from snowflake.snowpark._internal.utils import parse_table_name
 from snowflake.snowpark.exceptions import (
@@ -141,6 +147,161 @@ def test_resolve_import_path_ignore_import_path(tmp_path_factory):
         os.remove(a_temp_file)
 
 
+def test_resolve_imports_with_import_cache(tmp_path):
+    fake_connection = mock.create_autospec(ServerConnection)
+    fake_connection._conn = mock.Mock(account="account", database="db", schema="sc")
+    session = Session(fake_connection)
+    (tmp_path / "module").mkdir()
+    (tmp_path / "module" / "a.py").write_text("a = 1")
+    path = str(tmp_path / "module")
+    session.add_import(path)
+    checksum = session._import_paths[path][0]
+
+    with mock.patch.object(
+        session, "_list_files_in_stage", return_value=set()
+    ) as mock_list_files:
+        stage_files = session._resolve_imports("@stage", "@stage")
+        assert stage_files == [f"'@stage/{checksum}/module.zip'"]
+        assert mock_list_files.call_count == 1
+        assert fake_connection.upload_stream.call_count == 1
+
+        # the import is already uploaded, so the stage isn't listed again
+        assert session._resolve_imports("@stage", "@stage") == stage_files
+        assert mock_list_files.call_count == 1
+        assert fake_connection.upload_stream.call_count == 1
+
+        # a different schema or a cleared cache lists the stage again
+        fake_connection._conn.schema = "other_sc"
+        session._resolve_imports("@stage", "@stage")
+        assert mock_list_files.call_count == 2
+        fake_connection._conn.schema = "sc"
+        session.clear_import_cache()
+        session._resolve_imports("@stage", "@stage")
+        assert mock_list_files.call_count == 3
+
+    cache_file = str(tmp_path / "imports.json")
+    session.import_cache_file = cache_file
+    assert session.import_cache_file == cache_file
+    other_session = Session(fake_connection)
+    other_session.import_cache_file = cache_file
+    other_session.add_import(path)
+    with mock.patch.object(other_session, "_list_files_in_stage") as mock_list_files:
+        assert other_session._resolve_imports("@stage", "@stage") == stage_files
+        mock_list_files.assert_not_called()
+
+    # an import uploaded to a different stage than the import only stage is reused as well
+    session.clear_import_cache()
+    with mock.patch.object(
+        session, "_list_files_in_stage", return_value=set()
+    ) as mock_list_files:
+        for _ in range(2):
+            assert session._resolve_imports("@stage", "@session_stage") == [
+                f"'@session_stage/{checksum}/module.zip'"
+            ]
+        mock_list_files.assert_called_once_with("@stage", statement_params=None)
+
+
+def test_with_connection():
+    fake_connection = mock.create_autospec(ServerConnection)
+    fake_connection._conn = mock.Mock()
+    new_connection = mock.create_autospec(ServerConnection)
+    new_connection._conn = mock.Mock()
+    fake_connection._with_new_cursor.return_value.__enter__.return_value = (
+        new_connection
+    )
+    session = Session(fake_connection)
+    session._import_paths["/tmp/a.py"] = ("checksum", None)
+    session._packages["numpy"] = "numpy"
+
+    with session._with_new_cursor() as worker_session:
+        assert worker_session._conn is new_connection
+        # the objects bound to the session use the new connection
+        for bound in [
+            worker_session._analyzer,
+            worker_session._plan_builder,
+            worker_session._analyzer.plan_builder,
+        ]:
+            assert bound.session is worker_session
+        for bound in [
+            worker_session._file,
+            worker_session.udf,
+            worker_session.udtf,
+            worker_session.udaf,
+            worker_session.sproc,
+            worker_session.conf,
+        ]:
+            assert bound._session is worker_session
+        # the imports and packages are a snapshot, and the caches are shared
+        assert worker_session._import_paths == session._import_paths
+        worker_session._import_paths.clear()
+        worker_session._packages.clear()
+        assert "/tmp/a.py" in session._import_paths and "numpy" in session._packages
+        assert worker_session._import_cache is session._import_cache
+        assert worker_session._infer_schema_cache is session._infer_schema_cache
+        worker_session.conf.set("use_constant_subquery_alias", False)
+        assert session.conf._conf["use_constant_subquery_alias"] is True
+    fake_connection._with_new_cursor.return_value.__exit__.assert_called_once()
+
+
+def test_package_cache(tmp_path):
+    fake_connection = mock.create_autospec(ServerConnection)
+    fake_connection._conn = mock.Mock(account="account")
+    session = Session(fake_connection)
+    session.enable_package_cache(str(tmp_path))
+    with mock.patch.object(session, "table") as mock_table:
+        collect = (
+            mock_table.return_value.filter.return_value.group_by.return_value.agg.return_value._internal_collect_with_tag
+        )
+        collect.return_value = [("numpy", '["1.26.0"]')]
+        assert session._get_available_versions_for_packages(
+            ["numpy", "foo"], "information_schema.packages"
+        ) == {"numpy": ["1.26.0"]}
+        collect.assert_called_once()
+
+    # a new session finds the available versions in the cache directory
+    other_session = Session(fake_connection)
+    other_session.enable_package_cache(str(tmp_path))
+    with mock.patch.object(other_session, "table") as mock_table:
+        assert other_session._get_available_versions_for_packages(
+            ["numpy", "foo"], "information_schema.packages"
+        ) == {"numpy": ["1.26.0"]}
+        mock_table.assert_not_called()
+
+    # packages installed with pip are zipped once
+    def install(packages, package_table, package_dict, target, zip_path):
+        with open(zip_path, "w") as f:
+            f.write("zip")
+        return [pkg_resources.Requirement.parse("numpy==1.26.0")], True
+
+    other_session.custom_package_usage_config = {"enabled": True, "force_push": True}
+    with mock.patch.object(
+        other_session, "_install_unsupported_packages", side_effect=install
+    ) as mock_install:
+        for _ in range(2):
+            dependencies = other_session._upload_unsupported_packages(
+                ["my-package"], "information_schema.packages", {}
+            )
+            assert [str(d) for d in dependencies] == ["numpy==1.26.0"]
+        mock_install.assert_called_once()
+        assert fake_connection.upload_file.call_count == 2
+
+        # the cached packages contain native code
+        other_session.custom_package_usage_config = {"enabled": True}
+        with pytest.raises(
+            RuntimeError, match="depends on packages that contain native code"
+        ):
+            other_session._upload_unsupported_packages(
+                ["my-package"], "information_schema.packages", {}
+            )
+
+    other_session.clear_package_cache()
+    with mock.patch.object(other_session, "table") as mock_table:
+        other_session._get_available_versions_for_packages(
+            ["numpy"], "information_schema.packages"
+        )
+        mock_table.assert_called_once()
+
+
 @pytest.mark.parametrize("has_current_database", (True, False))
 def test_resolve_package_current_database(has_current_database):
     def mock_get_current_parameter(param: str, quoted: bool = True) -> Optional[str]:
@@ -225,6 +386,38 @@ def test_create_dataframe_empty_schema():
         session.create_dataframe([[1]], schema=StructType([]))
 
 
+@pytest.mark.skipif(not is_pandas_available, reason="requires pyarrow for uploading")
+def test_create_dataframe_upload_threshold():
+    fake_connection = mock.create_autospec(ServerConnection)
+    fake_connection._conn = mock.Mock()
+    session = Session(fake_connection)
+    data = [[i, str(i)] for i in range(300)]
+
+    session.create_dataframe_upload_threshold = 601
+    df = session.create_dataframe(data, schema=["a", "b"])
+    assert [type(q) for q in df._plan.queries] == [Query, BatchInsertQuery, Query]
+
+    session.create_dataframe_upload_threshold = 600
+    df = session.create_dataframe(data, schema=["a", "b"])
+    queries = df._plan.queries
+    assert [type(q) for q in queries] == [
+        Query,
+        Query,
+        BulkUploadQuery,
+        Query,
+        Query,
+    ]
+    assert "STAGE" in queries[1].sql
+    assert queries[2].rows == [Row(i, str(i)) for i in range(300)]
+    assert queries[3].sql.strip().startswith("COPY  INTO")
+    assert queries[2].file_name in queries[3].sql
+    assert len(df._plan.post_actions) == 2
+
+    session.create_dataframe_upload_threshold = None
+    df = session.create_dataframe(data, schema=["a", "b"])
+    assert BatchInsertQuery in [type(q) for q in df._plan.queries]
+
+
 def test_create_dataframe_wrong_type():
     fake_connection = mock.create_autospec(ServerConnection)
     fake_connection._conn = mock.Mock()
@@ -0,0 +1,111 @@
+#
+# Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
+#
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from snowflake.snowpark import Session, SessionPool
+
+
+def create_fake_session():
+    session = mock.create_autospec(Session)
+    session._conn = mock.Mock()
+    session._conn.is_closed.return_value = False
+    session._conn._conn.expired = False
+    session.close.side_effect = lambda: setattr(
+        session._conn.is_closed, "return_value", True
+    )
+    return session
+
+
+@pytest.fixture
+def mock_create():
+    with mock.patch.object(
+        Session.SessionBuilder, "create", side_effect=create_fake_session
+    ) as mock_create:
+        yield mock_create
+
+
+def test_session_pool(mock_create):
+    configs = {"account": "account", "password": "password"}
+    pool = SessionPool(configs, max_size=3, min_size=1)
+    assert mock_create.call_count == 1
+    assert pool.stats == {"size": 1, "idle": 1, "in_use": 0}
+
+    running = 0
+    max_running = 0
+    sessions = set()
+    lock = threading.Lock()
+
+    def work(_):
+        nonlocal running, max_running
+        with pool.session() as session:
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+                sessions.add(session)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(work, range(50)))
+    # at most max_size sessions are created and used at the same time
+    assert max_running <= 3
+    assert len(sessions) == mock_create.call_count <= 3
+    assert pool.stats == {"size": len(sessions), "idle": len(sessions), "in_use": 0}
+    # the password isn't removed from the configs of the pool
+    assert pool._configs == configs
+
+    # a closed or expired session is replaced
+    session = pool.acquire()
+    session._conn._conn.expired = True
+    pool.release(session)
+    new_session = pool.acquire()
+    assert new_session is not session
+    session.close.assert_called_once()
+
+    pool.close()
+    assert all(s.close.called for s in sessions if s is not new_session)
+    assert not new_session.close.called
+    # a session in use is closed when it's released to a closed pool
+    pool.release(new_session)
+    new_session.close.assert_called_once()
+    assert pool.stats["size"] == 0
+    with pytest.raises(RuntimeError, match="closed SessionPool"):
+        pool.acquire()
+
+
+def test_session_pool_timeout_and_idle_eviction(mock_create):
+    with SessionPool({}, max_size=2, min_size=1, max_idle_seconds=0.1) as pool:
+        sessions = [pool.acquire(), pool.acquire()]
+        with pytest.raises(TimeoutError, match="all 2 sessions are in use"):
+            pool.acquire(timeout=0.01)
+
+        # a thread waiting for a session gets the session released by another thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(pool.acquire, 10)
+            time.sleep(0.05)
+            assert not future.done()
+            pool.release(sessions[0])
+            assert future.result() is sessions[0]
+
+        # the least recently used idle sessions are closed, but min_size sessions are kept
+        pool.release(sessions[0])
+        pool.release(sessions[1])
+        time.sleep(0.2)
+        with pool.session() as session:
+            assert session is sessions[1]
+        assert pool.stats == {"size": 1, "idle": 1, "in_use": 0}
+        assert sessions[0].close.called
+        assert not sessions[1].close.called
+
+    with pytest.raises(ValueError, match="max_size must be a positive integer"):
+        SessionPool({}, max_size=0)
+    with pytest.raises(ValueError, match="min_size must be between 0 and max_size"):
+        SessionPool({}, max_size=1, min_size=2)
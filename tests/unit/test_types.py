@@ -10,6 +10,7 @@ from array import array
 from collections import defaultdict
 from datetime import date, datetime, time, timezone
 from decimal import Decimal
+from functools import reduce
 
 import pytest
 
@@ -35,6 +36,7 @@ from snowflake.snowpark._internal.type_utils import (
     convert_sp_to_sf_type,
     get_number_precision_scale,
     infer_schema,
+    infer_schema_from_data,
     infer_type,
     merge_type,
     python_type_to_snow_type,
@@ -803,6 +805,44 @@ def test_infer_schema_exceptions():
         infer_schema([IntegerType()])
 
 
+def test_infer_schema_from_data():
+    def merge_row_schemas(data):
+        return reduce(merge_type, (infer_schema(row, None) for row in data))
+
+    for data in [
+        [[1, "a"], [None, "b"], [2, None]],
+        [[1, datetime.now()], [2, datetime.now(timezone.utc)]],
+        [[Decimal("1.5"), [1]], [Decimal("12.25"), [2]]],
+        [[1], [2, 3]],
+        [1, None, 2],
+        [date(2024, 1, 1), None],
+        [{"a": 1}, {"a": 2, "b": "c"}],
+    ]:
+        assert infer_schema_from_data(data) == merge_row_schemas(data)
+
+    names = ["a"]
+    assert infer_schema_from_data([[1, "x"], [2, "y"]], names) == StructType(
+        [StructField("a", LongType(), False), StructField("_2", StringType(), False)]
+    )
+    assert names == ["a", "_2"]
+
+    with pytest.raises(TypeError, match="field _1: Cannot merge type"):
+        infer_schema_from_data([[1, "a"], [2.5, "b"]])
+    with pytest.raises(TypeError, match="Unable to infer the type of the field _2"):
+        infer_schema_from_data([[1, IntegerType()]])
+
+
+def test_infer_schema_from_data_with_sample_size():
+    data = [[i, str(i)] for i in range(100)]
+    data[1][0] = 1.5
+    # the sampled rows are evenly spaced, so the row with a float is skipped
+    assert infer_schema_from_data(data, sample_size=10) == StructType(
+        [StructField("_1", LongType(), True), StructField("_2", StringType(), True)]
+    )
+    with pytest.raises(TypeError, match="Cannot merge type"):
+        infer_schema_from_data(data, sample_size=100)
+
+
 def test_string_type_eq():
     st0 = StringType()
     st1 = StringType(1)
@@ -2,12 +2,14 @@
 # Copyright (c) 2012-2023 Snowflake Computing Inc. All rights reserved.
 #
 
+import contextlib
 from unittest import mock
 
 import pytest
 
 from snowflake.connector import ProgrammingError
 from snowflake.snowpark import Session
+from snowflake.snowpark._internal.server_connection import ServerConnection
 from snowflake.snowpark.exceptions import SnowparkSQLException
 from snowflake.snowpark.functions import udf
 from snowflake.snowpark.types import IntegerType
@@ -35,3 +37,99 @@ def test_do_register_sp_negative(cleanup_registration_patch):
     with pytest.raises(BaseException, match="Test BaseException code path"):
         udf(lambda: 1, session=fake_session, return_type=IntegerType(), packages=[])
     cleanup_registration_patch.assert_called()
+
+
+def test_register_many():
+    fake_connection = mock.create_autospec(ServerConnection)
+    fake_connection._conn = mock.Mock()
+    fake_connection._with_new_cursor = mock.Mock(
+        side_effect=lambda: contextlib.nullcontext(fake_connection)
+    )
+    fake_connection._get_current_parameter.return_value = '"DB"'
+    fake_connection._telemetry_client = mock.Mock()
+    session = Session(fake_connection)
+    mock_table = mock.patch.object(session, "table").start()
+    collect = (
+        mock_table.return_value.filter.return_value.group_by.return_value.agg.return_value._internal_collect_with_tag
+    )
+    collect.return_value = [("numpy", '["1.26.0"]'), ("pandas", '["2.1.0"]')]
+
+    udfs = session.udf.register_many(
+        [
+            lambda x: x + 1,
+            {"func": lambda x: x + 2, "name": "add_two", "packages": ["pandas"]},
+            {"func": lambda x: x + 3, "name": "add_three"},
+        ],
+        return_type=IntegerType(),
+        input_types=[IntegerType()],
+        packages=["numpy"],
+    )
+    mock.patch.stopall()
+    assert [f.name for f in udfs][1:] == ["add_two", "add_three"]
+    # the versions of the packages are queried once for all UDFs
+    collect.assert_called_once()
+    assert fake_connection._with_new_cursor.call_count == 2
+    create_queries = [
+        c.args[0]
+        for c in fake_connection.run_query.call_args_list
+        if "FUNCTION" in c.args[0]
+    ]
+    assert len(create_queries) == 3
+    # the packages of a registration override the default packages
+    add_two_query = next(q for q in create_queries if "add_two" in q)
+    assert "'pandas'" in add_two_query and "'numpy'" not in add_two_query
+    add_three_query = next(q for q in create_queries if "add_three" in q)
+    assert "'numpy'" in add_three_query
+
+    assert session.udf.register_many([]) == []
+    with pytest.raises(ValueError, match="max_workers must be a positive integer"):
+        session.udf.register_many([lambda: 1], max_workers=0)
+
+
+def test_register_reuses_uploaded_handler_code():
+    fake_connection = mock.create_autospec(ServerConnection)
+    fake_connection._conn = mock.Mock(account="account", database="db", schema="sc")
+    fake_connection._get_current_parameter.return_value = '"DB"'
+    fake_connection._telemetry_client = mock.Mock()
+    session = Session(fake_connection)
+    # the closure is too large to be inlined in the CREATE FUNCTION statement
+    data = "x" * 10000
+
+    def get_length() -> int:
+        return len(data)
+
+    session.udf.register(get_length, name="length1", packages=[])
+    session.udf.register(get_length, name="length2", packages=[])
+    assert fake_connection.upload_stream.call_count == 1
+    create_queries = [
+        c.args[0]
+        for c in fake_connection.run_query.call_args_list
+        if "FUNCTION" in c.args[0]
+    ]
+    imports = [q[q.index("IMPORTS") :].split("\n")[0] for q in create_queries]
+    assert imports[0] == imports[1]
+
+    session.clear_import_cache()
+    session.udf.register(get_length, name="length3", packages=[])
+    assert fake_connection.upload_stream.call_count == 2
+
+    # permanent objects only reuse handler code uploaded under their own prefix
+    session.udf.register(
+        get_length, name="length4", is_permanent=True, stage_location="@st", packages=[]
+    )
+    session.udf.register(
+        get_length, name="length5", is_permanent=True, stage_location="@st", packages=[]
+    )
+    assert fake_connection.upload_stream.call_count == 4
+    session.udf.register(
+        get_length,
+        name="length4",
+        is_permanent=True,
+        replace=True,
+        stage_location="@st",
+        packages=[],
+    )
+    assert fake_connection.upload_stream.call_count == 4
+    assert [
+        c.kwargs["dest_prefix"] for c in fake_connection.upload_stream.call_args_list
+    ] == ["length1", "length3", "length4", "length5"]
@@ -10,6 +10,7 @@ import pytest
 
 from snowflake.snowpark import Session
 from snowflake.snowpark._internal.udf_utils import (
+    GeneratedCodeCache,
     cleanup_failed_permanent_registration,
     generate_python_code,
     get_error_message_abbr,
@@ -65,3 +66,43 @@ def test_generate_python_code_exception():
             source_code_display=True,
         )
         assert "Source code comment could not be generated" in generated_code
+
+
+def test_generated_code_cache():
+    cache = GeneratedCodeCache(max_bytes=10)
+    cache.put("a", "12345")
+    cache.put("b", "12345")
+    assert cache.get("a") == "12345"
+    # "b" is the least recently used entry
+    cache.put("c", "1")
+    assert cache.get("b") is None
+    assert cache.get("a") == "12345" and cache.get("c") == "1"
+    # code larger than the cache is not kept
+    cache.put("d", "12345678901")
+    assert cache.get("d") is None
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_generate_python_code_cache():
+    def add_one(x):
+        return x + 1
+
+    with mock.patch(
+        "snowflake.snowpark._internal.code_generation.generate_source_code",
+        return_value="",
+    ) as mock_generate_source_code:
+        codes = [
+            generate_python_code(
+                func=add_one,
+                arg_names=["arg1"],
+                object_type=TempObjectType.FUNCTION,
+                is_pandas_udf=is_pandas_udf,
+                is_dataframe_input=False,
+                source_code_display=True,
+            )
+            for is_pandas_udf in (False, False, True)
+        ]
+    assert codes[0] == codes[1] != codes[2]
+    # the code is only generated again for different registration options
+    assert mock_generate_source_code.call_count == 2